@@ -5,6 +5,8 @@ from app.modules.discovery.models.onet import (
     OnetGwa,
     OnetIwa,
     OnetDwa,
+    dwa_effective_exposure,
+    onet_exposure_state,
     OnetTask,
     OnetSkill,
     OnetTechnologySkill,
@@ -29,6 +31,8 @@ __all__ = [
     "OnetGwa",
     "OnetIwa",
     "OnetDwa",
+    "dwa_effective_exposure",
+    "onet_exposure_state",
     "OnetTask",
     "OnetSkill",
     "OnetTechnologySkill",
@@ -15,7 +15,18 @@ DWA can optionally override this with ai_exposure_override.
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Float,
+    ForeignKey,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    column,
+    table,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -115,6 +126,30 @@ class OnetDwa(Base):
     iwa: Mapped["OnetIwa"] = relationship("OnetIwa", back_populates="dwas")
 
 
+# Materialized view (migration 074) of each DWA's effective AI exposure: the
+# DWA override if set, else the parent GWA's score. Declared as a lightweight
+# table construct so it stays out of Base.metadata.
+#
+# The backend never writes onet_gwas/onet_iwas/onet_dwas at runtime; they are
+# loaded by migrations (e.g. 073). A migration that changes them, including
+# DWA overrides, must end with REFRESH MATERIALIZED VIEW dwa_effective_exposure
+# and bump onet_exposure_state.version.
+dwa_effective_exposure = table(
+    "dwa_effective_exposure",
+    column("dwa_id", String),
+    column("gwa_id", String),
+    column("exposure", Float),
+)
+
+# Single-row version of dwa_effective_exposure's contents (migration 075),
+# owned by migrations like the view itself.
+onet_exposure_state = table(
+    "onet_exposure_state",
+    column("id", SmallInteger),
+    column("version", BigInteger),
+)
+
+
 class OnetTask(Base):
     """O*NET occupation task.
 
@@ -227,6 +227,42 @@ class DiscoveryActivitySelectionRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_selected_dwa_ids_by_role_mapping(
+        self, session_id: UUID
+    ) -> dict[UUID, list[str]]:
+        """Get the selected DWA IDs of every role mapping in a session.
+
+        Loads the whole session in one query, for scoring every role at once.
+
+        Args:
+            session_id: UUID of the session to get selected activities for.
+
+        Returns:
+            Dict mapping role mapping ID to its selected DWA IDs, ordered by
+            DWA ID. Role mappings without selections are omitted.
+        """
+        stmt = (
+            select(
+                DiscoveryActivitySelection.role_mapping_id,
+                DiscoveryActivitySelection.dwa_id,
+            )
+            .where(
+                and_(
+                    DiscoveryActivitySelection.session_id == session_id,
+                    DiscoveryActivitySelection.selected.is_(True),
+                )
+            )
+            .order_by(
+                DiscoveryActivitySelection.role_mapping_id,
+                DiscoveryActivitySelection.dwa_id,
+            )
+        )
+        result = await self.session.execute(stmt)
+        selected: dict[UUID, list[str]] = {}
+        for role_mapping_id, dwa_id in result.all():
+            selected.setdefault(role_mapping_id, []).append(dwa_id)
+        return selected
+
     async def get_user_modified(
         self, session_id: UUID
     ) -> list[DiscoveryActivitySelection]:
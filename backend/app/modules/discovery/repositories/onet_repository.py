@@ -4,10 +4,11 @@ Provides repositories for O*NET data including:
 - OnetOccupationRepository: CRUD for occupation records
 - OnetGwaRepository: Generalized Work Activity operations
 - OnetIwaRepository: Intermediate Work Activity operations
-- OnetDwaRepository: Detailed Work Activity operations with exposure score inheritance
+- OnetDwaRepository: Detailed Work Activity operations with exposure score inheritance,
+  read from the dwa_effective_exposure materialized view
 """
 
-from sqlalchemy import or_, select
+from sqlalchemy import Row, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,6 +17,8 @@ from app.modules.discovery.models.onet import (
     OnetGwa,
     OnetIwa,
     OnetOccupation,
+    dwa_effective_exposure,
+    onet_exposure_state,
 )
 
 
@@ -303,8 +306,8 @@ class OnetDwaRepository:
     async def get_effective_exposure_score(self, dwa_id: str) -> float | None:
         """Get the effective AI exposure score for a DWA.
 
-        If the DWA has an override score, returns that value.
-        Otherwise, returns the parent GWA's exposure score.
+        Reads the dwa_effective_exposure materialized view, which holds the
+        DWA's override score if set, otherwise the parent GWA's score.
 
         Args:
             dwa_id: DWA identifier.
@@ -313,17 +316,41 @@ class OnetDwaRepository:
             The effective exposure score (0.0-1.0), or None if the DWA
             is not found or has no score available.
         """
-        dwa = await self.get_by_id(dwa_id)
+        stmt = select(dwa_effective_exposure.c.exposure).where(
+            dwa_effective_exposure.c.dwa_id == dwa_id
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
-        if dwa is None:
-            return None
+    async def get_exposure_version(self) -> int | None:
+        """Get the version of the current effective exposure data.
 
-        # If DWA has an override, use it
-        if dwa.ai_exposure_override is not None:
-            return dwa.ai_exposure_override
+        Reads the single onet_exposure_state row, which migrations bump
+        whenever they refresh dwa_effective_exposure (an O*NET reload, GWA
+        rescoring or a DWA override), so it identifies the data version an
+        in-memory exposure map was built from with a primary-key lookup.
+
+        Returns:
+            The exposure data version, or None if it has not been recorded.
+        """
+        stmt = select(onet_exposure_state.c.version).where(onet_exposure_state.c.id == 1)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
-        # Otherwise, inherit from GWA via IWA relationship
-        if dwa.iwa and dwa.iwa.gwa:
-            return dwa.iwa.gwa.ai_exposure_score
+    async def get_all_effective_exposures(self) -> list[Row]:
+        """Get every DWA with its name and effective AI exposure.
 
-        return None
+        Returns:
+            Rows of (dwa_id, name, exposure), where exposure is None if
+            neither the DWA nor its GWA has a score.
+        """
+        stmt = select(
+            OnetDwa.id.label("dwa_id"),
+            OnetDwa.name,
+            dwa_effective_exposure.c.exposure,
+        ).join(
+            dwa_effective_exposure,
+            dwa_effective_exposure.c.dwa_id == OnetDwa.id,
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
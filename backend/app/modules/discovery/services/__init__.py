@@ -3,11 +3,12 @@
 from app.modules.discovery.services.file_upload_service import FileUploadService
 from app.modules.discovery.services.onet_client import OnetApiClient
 from app.modules.discovery.services.onet_sync import OnetSyncJob
-from app.modules.discovery.services.scoring import ScoringService
+from app.modules.discovery.services.scoring import DwaExposureCache, ScoringService
 from app.modules.discovery.services.session_service import DiscoverySessionService
 
 __all__ = [
     "DiscoverySessionService",
+    "DwaExposureCache",
     "FileUploadService",
     "OnetApiClient",
     "OnetSyncJob",
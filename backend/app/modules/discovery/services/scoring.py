@@ -5,11 +5,14 @@ role headcount and AI exposure scores. Impact scores help prioritize
 which roles have the highest potential for AI agent automation.
 """
 
+import asyncio
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+import numpy as np
+
 from app.modules.discovery.enums import AnalysisDimension
 from app.modules.discovery.schemas.scoring import (
     AnalysisScores,
@@ -40,6 +43,64 @@ class _DwaWithExposure:
     dwa_name: str
 
 
+class DwaExposureCache:
+    """In-memory map of every DWA's effective exposure, shared across requests.
+
+    The map is built with one query and kept for as long as the exposure
+    data version reported by OnetDwaRepository.get_exposure_version stays
+    the same, so scoring a session needs no per-DWA lookups.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._version: int | None = None
+        self._exposures: dict[str, _DwaWithExposure] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, dwa_repo: "OnetDwaRepository") -> dict[str, _DwaWithExposure]:
+        """Get the exposure map for the current data version.
+
+        Args:
+            dwa_repo: Repository used to check the version and, when it
+                changed, to reload the map.
+
+        Returns:
+            Dict mapping DWA ID to its effective exposure (0.0 when no
+            score is available).
+        """
+        version = await dwa_repo.get_exposure_version()
+        if version is not None and version == self._version:
+            return self._exposures
+
+        async with self._lock:
+            if version is None or version != self._version:
+                rows = await dwa_repo.get_all_effective_exposures()
+                self._exposures = {
+                    row.dwa_id: _DwaWithExposure(
+                        ai_exposure_override=(
+                            row.exposure if row.exposure is not None else 0.0
+                        ),
+                        dwa_id=row.dwa_id,
+                        dwa_name=row.name,
+                    )
+                    for row in rows
+                }
+                self._version = version
+            return self._exposures
+
+    def clear(self) -> None:
+        """Drop the cached map so the next get reloads it."""
+        self._version = None
+        self._exposures = {}
+
+
+# Shared by every ScoringService that is not given its own cache
+_dwa_exposure_cache = DwaExposureCache()
+
+# Role score keys, in the column order used for columnar aggregation
+_SCORE_KEYS = ("exposure", "impact", "complexity", "priority")
+
+
 class ScoringService:
     """Service for calculating impact and priority scores.
 
@@ -52,10 +113,20 @@ class ScoringService:
 
     Attributes:
         DEFAULT_MAX_HEADCOUNT: Default maximum headcount for normalization (1000).
+        exposure_cache: Shared DWA exposure map used by score_session.
     """
 
     DEFAULT_MAX_HEADCOUNT = 1000
 
+    def __init__(self, exposure_cache: DwaExposureCache | None = None) -> None:
+        """Initialize the service.
+
+        Args:
+            exposure_cache: DWA exposure map used by score_session. Defaults
+                to the process-wide cache.
+        """
+        self.exposure_cache = exposure_cache or _dwa_exposure_cache
+
     def calculate_impact_score(
         self,
         role_mapping: Any,
@@ -545,8 +616,11 @@ class ScoringService:
     ) -> dict[AnalysisDimension, list[dict[str, Any]]]:
         """Aggregate scores across all 5 dimensions in one call.
 
-        Convenience method that calls aggregate_by_dimension for each
-        AnalysisDimension value.
+        Produces the same results as calling aggregate_by_dimension for each
+        AnalysisDimension value, but columnar: dimension values are coded
+        as integer group keys, and every group of every dimension is reduced
+        at once with NumPy weighted bincounts. Breakdown entries of a role
+        are shared between the groups it belongs to.
 
         Args:
             role_mappings: List of role mapping objects with id, source_role,
@@ -566,15 +640,134 @@ class ScoringService:
             >>> results[AnalysisDimension.DEPARTMENT]
             [{"dimension": DEPARTMENT, "dimension_value": "Technology", ...}]
         """
-        return {
-            dim: self.aggregate_by_dimension(
-                role_mappings=role_mappings,
-                scores=scores,
-                dimension=dim,
-                dwa_selections=dwa_selections,
-            )
-            for dim in AnalysisDimension
+        results: dict[AnalysisDimension, list[dict[str, Any]]] = {
+            dim: [] for dim in AnalysisDimension
         }
+        if not role_mappings:
+            return results
+
+        # Group registry: group code -> (dimension, value), in first-seen order
+        group_dims: list[AnalysisDimension] = []
+        group_values: list[Any] = []
+        # One membership per (role, group) pair, in the order roles join groups
+        member_roles: list[np.ndarray] = []
+        member_groups: list[np.ndarray] = []
+
+        all_roles = np.arange(len(role_mappings), dtype=np.int64)
+        for dim in AnalysisDimension:
+            if dim == AnalysisDimension.TASK:
+                continue
+            codes: dict[Any, int] = {}
+            role_codes = [
+                codes.setdefault(self._get_dimension_value(rm, dim), len(codes))
+                for rm in role_mappings
+            ]
+            member_roles.append(all_roles)
+            member_groups.append(np.array(role_codes, dtype=np.int64) + len(group_values))
+            group_dims.extend([dim] * len(codes))
+            group_values.extend(codes)
+
+        # TASK groups by DWA name; roles missing from role_mappings are ignored
+        role_index = {rm.id: i for i, rm in enumerate(role_mappings)}
+        task_codes: dict[str, int] = {}
+        task_roles: list[int] = []
+        task_groups: list[int] = []
+        for role_id, dwas in (dwa_selections or {}).items():
+            i = role_index.get(role_id)
+            for dwa in dwas:
+                code = task_codes.setdefault(dwa.dwa_name, len(task_codes))
+                if i is not None:
+                    task_roles.append(i)
+                    task_groups.append(code)
+        member_roles.append(np.array(task_roles, dtype=np.int64))
+        member_groups.append(np.array(task_groups, dtype=np.int64) + len(group_values))
+        group_dims.extend([AnalysisDimension.TASK] * len(task_codes))
+        group_values.extend(task_codes)
+
+        n_groups = len(group_values)
+        roles = np.concatenate(member_roles)
+        groups = np.concatenate(member_groups)
+        member_count = np.bincount(groups, minlength=n_groups)
+
+        # Columns of every role that has scores
+        role_scores = [scores.get(rm.id) for rm in role_mappings]
+        scored = np.array([rs is not None for rs in role_scores], dtype=bool)
+        headcounts = np.array([rm.row_count or 0 for rm in role_mappings], dtype=np.int64)
+        score_columns = np.array(
+            [
+                [rs.get(key, 0.0) for key in _SCORE_KEYS] if rs is not None else [0.0] * 4
+                for rs in role_scores
+            ],
+            dtype=np.float64,
+        ).reshape(len(role_mappings), len(_SCORE_KEYS))
+
+        # Vectorized group reductions over the scored memberships
+        contributing = scored[roles]
+        roles, groups = roles[contributing], groups[contributing]
+        weights = headcounts[roles].astype(np.float64)
+        role_count = np.bincount(groups, minlength=n_groups)
+        total_headcount = np.bincount(groups, weights=weights, minlength=n_groups).astype(np.float64)
+        weighted_sums = np.stack(
+            [
+                np.bincount(groups, weights=score_columns[roles, k] * weights, minlength=n_groups)
+                for k in range(len(_SCORE_KEYS))
+            ],
+            axis=1,
+        ).astype(np.float64)
+        averages = np.zeros_like(weighted_sums)
+        np.divide(
+            weighted_sums,
+            total_headcount[:, None],
+            out=averages,
+            where=total_headcount[:, None] > 0,
+        )
+
+        # Breakdown entries, built once per role and listed in membership order
+        entries: list[dict[str, Any] | None] = [
+            {
+                "role_id": rm.id,
+                "role_name": rm.source_role,
+                "headcount": rm.row_count or 0,
+                "ai_exposure_score": rs.get("exposure", 0.0),
+                "impact_score": rs.get("impact", 0.0),
+                "complexity_score": rs.get("complexity", 0.0),
+                "priority_score": rs.get("priority", 0.0),
+            }
+            if rs is not None
+            else None
+            for rm, rs in zip(role_mappings, role_scores)
+        ]
+        ordered_roles = roles[np.argsort(groups, kind="stable")].tolist()
+        starts = np.concatenate(([0], np.cumsum(role_count)[:-1])).tolist()
+
+        for code, (dim, value, members, count, start, headcount, avg) in enumerate(
+            zip(
+                group_dims,
+                group_values,
+                member_count.tolist(),
+                role_count.tolist(),
+                starts,
+                total_headcount.astype(np.int64).tolist(),
+                averages.tolist(),
+            )
+        ):
+            if dim == AnalysisDimension.TASK and members == 0:
+                continue
+            results[dim].append({
+                "dimension": dim,
+                "dimension_value": value,
+                "ai_exposure_score": avg[0],
+                "impact_score": avg[1],
+                "complexity_score": avg[2],
+                "priority_score": avg[3],
+                "total_headcount": headcount,
+                "role_count": count,
+                "breakdown": {
+                    "roles": [entries[i] for i in ordered_roles[start:start + count]]
+                },
+            })
+
+        return results
 
     async def score_session(
         self,
@@ -589,8 +782,8 @@ class ScoringService:
 
         This method orchestrates the complete scoring workflow:
         1. Get all role mappings for the session
-        2. For each role, get selected activity DWAs
-        3. Get DWA objects to compute exposure scores
+        2. Get the selected DWA IDs of every role in one query
+        3. Look up their effective exposure in the shared DWA exposure map
         4. Calculate all scores for each role
         5. Aggregate by all dimensions
         6. Optionally persist results to the database
@@ -598,13 +791,14 @@ class ScoringService:
         Exposure score calculation:
         - Uses dwa.ai_exposure_override if set
         - Falls back to dwa.iwa.gwa.ai_exposure_score otherwise
+          (both resolved by the dwa_effective_exposure view)
         - Averages across all selected DWAs for the role
 
         Args:
             session: The discovery session to score.
             role_mapping_repo: Repository for role mapping queries.
             activity_selection_repo: Repository for activity selection queries.
-            dwa_repo: Repository for DWA queries with IWA/GWA relationships.
+            dwa_repo: Repository for DWA effective exposure queries.
             analysis_result_repo: Optional repository for persisting results.
                 Required if persist=True.
             persist: Whether to persist results to the database. If True,
@@ -655,41 +849,25 @@ class ScoringService:
         # Calculate total headcount
         total_headcount = sum(rm.row_count or 0 for rm in role_mappings)
 
-        # For each role, get selected DWAs and calculate scores
+        # Calculate scores for each role
         role_scores: dict[str, AnalysisScores] = {}
         scores_for_aggregation: dict[str, dict[str, float]] = {}
         dwa_selections_for_aggregation: dict[str, list[Any]] = {}
 
+        # Selected DWAs of every role and their exposures, without per-DWA queries
+        exposures = await self.exposure_cache.get(dwa_repo)
+        selected_dwa_ids = await activity_selection_repo.get_selected_dwa_ids_by_role_mapping(
+            session.id
+        )
+
         for role_mapping in role_mappings:
             role_id = str(role_mapping.id)
 
-            # Get selected activities for this role
-            selections = await activity_selection_repo.get_selected_for_role_mapping(
-                role_mapping.id
-            )
-
-            # Get DWA objects for exposure calculation
-            dwas = []
-            dwa_info_list = []
-            for selection in selections:
-                dwa = await dwa_repo.get_by_id(selection.dwa_id)
-                if dwa:
-                    # Calculate effective exposure score
-                    if dwa.ai_exposure_override is not None:
-                        effective_exposure = dwa.ai_exposure_override
-                    elif dwa.iwa and dwa.iwa.gwa and dwa.iwa.gwa.ai_exposure_score is not None:
-                        effective_exposure = dwa.iwa.gwa.ai_exposure_score
-                    else:
-                        effective_exposure = 0.0
-
-                    # Create a dataclass instance with the effective exposure
-                    dwa_with_exposure = _DwaWithExposure(
-                        ai_exposure_override=effective_exposure,
-                        dwa_id=dwa.id,
-                        dwa_name=dwa.name,
-                    )
-                    dwas.append(dwa_with_exposure)
-                    dwa_info_list.append(dwa_with_exposure)
+            dwas = [
+                exposures[dwa_id]
+                for dwa_id in selected_dwa_ids.get(role_mapping.id, [])
+                if dwa_id in exposures
+            ]
 
             # Calculate all scores for this role
             scores = self.calculate_all_scores_for_role(
@@ -708,7 +886,7 @@ class ScoringService:
 
             # Store for aggregation
             scores_for_aggregation[role_id] = scores
-            dwa_selections_for_aggregation[role_id] = dwa_info_list
+            dwa_selections_for_aggregation[role_id] = dwas
 
         # Aggregate by all dimensions
         all_aggregations = self.aggregate_all_dimensions(
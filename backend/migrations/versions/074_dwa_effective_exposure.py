@@ -0,0 +1,52 @@
+"""Materialized effective DWA exposure view.
+
+Creates dwa_effective_exposure, holding each DWA's ai_exposure_override or,
+when unset, its parent GWA's ai_exposure_score, so scoring reads one indexed
+relation instead of joining onet_dwas -> onet_iwas -> onet_gwas.
+
+The view is populated on creation. The O*NET tables are only written by
+migrations, so any later migration that changes GWA scores or DWA overrides
+must refresh it.
+
+Revision ID: 074_dwa_effective_exposure
+Revises: 073_discovery_gwa_seed
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "074_dwa_effective_exposure"
+down_revision: str | None = "073_discovery_gwa_seed"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the dwa_effective_exposure materialized view."""
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW dwa_effective_exposure AS
+        SELECT
+            d.id AS dwa_id,
+            i.gwa_id AS gwa_id,
+            COALESCE(d.ai_exposure_override, g.ai_exposure_score) AS exposure
+        FROM onet_dwas d
+        LEFT JOIN onet_iwas i ON i.id = d.iwa_id
+        LEFT JOIN onet_gwas g ON g.id = i.gwa_id
+        """
+    )
+    # Unique index serves lookups by DWA and allows concurrent refreshes
+    op.execute(
+        """
+        CREATE UNIQUE INDEX ix_dwa_effective_exposure_dwa_id
+        ON dwa_effective_exposure (dwa_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the dwa_effective_exposure materialized view."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS dwa_effective_exposure")
@@ -0,0 +1,47 @@
+"""Exposure data version for dwa_effective_exposure.
+
+Adds onet_exposure_state, a single-row counter identifying the current
+contents of dwa_effective_exposure. Scoring compares it to decide whether
+its in-memory exposure map is still current, which is far cheaper than
+fingerprinting the whole view on every request.
+
+Any later migration that refreshes dwa_effective_exposure must also run
+UPDATE onet_exposure_state SET version = version + 1, refreshed_at = now().
+
+Revision ID: 075_onet_exposure_version
+Revises: 074_dwa_effective_exposure
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "075_onet_exposure_version"
+down_revision: str | None = "074_dwa_effective_exposure"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create onet_exposure_state with its single row."""
+    op.create_table(
+        "onet_exposure_state",
+        sa.Column("id", sa.SmallInteger(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint("id = 1", name="ck_onet_exposure_state_single_row"),
+    )
+    op.execute("INSERT INTO onet_exposure_state (id, version) VALUES (1, 1)")
+
+
+def downgrade() -> None:
+    """Drop onet_exposure_state."""
+    op.drop_table("onet_exposure_state")
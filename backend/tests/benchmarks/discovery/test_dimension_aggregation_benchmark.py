@@ -0,0 +1,87 @@
+# backend/tests/benchmarks/discovery/test_dimension_aggregation_benchmark.py
+"""Scaling benchmark for columnar multi-dimension aggregation.
+
+Times ScoringService.aggregate_all_dimensions on synthetic sessions of
+1k, 10k and 100k role mappings, next to the per-dimension
+aggregate_by_dimension loop it replaces. Kept out of tests/unit so the
+unit suite stays fast; run it explicitly with -s to see the timings:
+
+    pytest tests/benchmarks -s
+"""
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.discovery.enums import AnalysisDimension
+from app.modules.discovery.services.scoring import ScoringService
+
+
+def build_session(n_roles: int, seed: int = 0):
+    """Build synthetic role mappings, scores and DWA selections."""
+    rng = random.Random(seed)
+    role_mappings = [
+        SimpleNamespace(
+            id=f"role-{i}",
+            source_role=f"Role {i % 5000}",
+            row_count=rng.randint(0, 500),
+            metadata={
+                "department": f"Dept {rng.randrange(200)}",
+                "lob": f"LOB {rng.randrange(30)}",
+                "geography": f"Geo {rng.randrange(50)}",
+            },
+        )
+        for i in range(n_roles)
+    ]
+    scores = {
+        rm.id: {
+            "exposure": rng.random(),
+            "impact": rng.random(),
+            "complexity": rng.random(),
+            "priority": rng.random(),
+        }
+        for rm in role_mappings
+    }
+    dwas = [SimpleNamespace(dwa_id=f"dwa-{d}", dwa_name=f"Task {d}") for d in range(2000)]
+    dwa_selections = {rm.id: rng.sample(dwas, 3) for rm in role_mappings}
+    return role_mappings, scores, dwa_selections
+
+
+def time_call(fn) -> float:
+    """Wall-clock seconds of one call."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("n_roles", [1_000, 10_000, 100_000])
+def test_aggregate_all_dimensions_scaling(n_roles):
+    """Columnar aggregation covers every role in every dimension at scale."""
+    service = ScoringService()
+    role_mappings, scores, dwa_selections = build_session(n_roles)
+
+    results = {}
+    elapsed = time_call(
+        lambda: results.update(
+            service.aggregate_all_dimensions(role_mappings, scores, dwa_selections)
+        )
+    )
+    print(f"\n{n_roles:>7} roles: columnar {elapsed * 1000:8.1f} ms", end="")
+
+    total = sum(rm.row_count for rm in role_mappings)
+    for dim in AnalysisDimension:
+        if dim == AnalysisDimension.TASK:
+            continue
+        assert sum(agg["role_count"] for agg in results[dim]) == n_roles
+        assert sum(agg["total_headcount"] for agg in results[dim]) == total
+    assert sum(agg["role_count"] for agg in results[AnalysisDimension.TASK]) == 3 * n_roles
+
+    if n_roles <= 10_000:
+        baseline = time_call(
+            lambda: [
+                service.aggregate_by_dimension(role_mappings, scores, dim, dwa_selections)
+                for dim in AnalysisDimension
+            ]
+        )
+        print(f", per-dimension {baseline * 1000:8.1f} ms", end="")
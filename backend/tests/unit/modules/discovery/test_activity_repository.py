@@ -176,6 +176,9 @@ async def test_dwa_inherits_gwa_score(mock_db_session):
 
     dwa = await dwa_repo.get_by_id("some_dwa_id")
     if dwa and dwa.ai_exposure_override is None:
+        # dwa_effective_exposure holds the inherited GWA score
+        mock_result.scalar_one_or_none.return_value = mock_gwa.ai_exposure_score
+
         # Should be able to get inherited score
         effective_score = await dwa_repo.get_effective_exposure_score(dwa.id)
         assert effective_score is not None
@@ -213,8 +216,9 @@ async def test_dwa_uses_override_score(mock_db_session):
     mock_iwa.gwa = mock_gwa
     mock_dwa.iwa = mock_iwa
 
+    # dwa_effective_exposure holds the override in place of the GWA score
     mock_result = mock_db_session.execute.return_value
-    mock_result.scalar_one_or_none.return_value = mock_dwa
+    mock_result.scalar_one_or_none.return_value = mock_dwa.ai_exposure_override
 
     effective_score = await dwa_repo.get_effective_exposure_score("override_dwa_id")
     assert effective_score == 0.85
@@ -282,3 +286,55 @@ async def test_effective_score_returns_none_for_missing_dwa(mock_db_session):
 
     effective_score = await dwa_repo.get_effective_exposure_score("nonexistent")
     assert effective_score is None
+
+
+@pytest.mark.asyncio
+async def test_effective_score_reads_materialized_view(mock_db_session):
+    """Effective score should come from dwa_effective_exposure in one query."""
+    dwa_repo = OnetDwaRepository(mock_db_session)
+
+    mock_result = mock_db_session.execute.return_value
+    mock_result.scalar_one_or_none.return_value = 0.4
+
+    effective_score = await dwa_repo.get_effective_exposure_score("some_dwa_id")
+
+    assert effective_score == 0.4
+    mock_db_session.execute.assert_called_once()
+    sql = str(mock_db_session.execute.call_args[0][0])
+    assert "FROM dwa_effective_exposure" in sql
+    assert "onet_gwas" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_all_effective_exposures(mock_db_session):
+    """All DWA exposures should load with names in one query."""
+    dwa_repo = OnetDwaRepository(mock_db_session)
+
+    mock_result = mock_db_session.execute.return_value
+    mock_result.all.return_value = [("dwa_1", "Analyze data", 0.7)]
+
+    rows = await dwa_repo.get_all_effective_exposures()
+
+    assert rows == [("dwa_1", "Analyze data", 0.7)]
+    mock_db_session.execute.assert_called_once()
+    sql = str(mock_db_session.execute.call_args[0][0])
+    assert "JOIN dwa_effective_exposure" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_exposure_version_reads_state_row(mock_db_session):
+    """The exposure version should be a primary-key read of onet_exposure_state."""
+    from sqlalchemy.dialects import postgresql
+
+    dwa_repo = OnetDwaRepository(mock_db_session)
+
+    mock_result = mock_db_session.execute.return_value
+    mock_result.scalar_one_or_none.return_value = 4
+
+    assert await dwa_repo.get_exposure_version() == 4
+    sql = str(
+        mock_db_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+    )
+    assert "SELECT onet_exposure_state.version" in sql
+    assert "WHERE onet_exposure_state.id =" in sql
+    assert "dwa_effective_exposure" not in sql
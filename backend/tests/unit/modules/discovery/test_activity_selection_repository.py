@@ -460,6 +460,28 @@ async def test_get_selected_activities_empty(mock_db_session):
     assert len(selections) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_selected_dwa_ids_by_role_mapping(mock_db_session):
+    """Should group a session's selected DWA IDs by role mapping in one query."""
+    repo = DiscoveryActivitySelectionRepository(mock_db_session)
+    role_a, role_b = uuid4(), uuid4()
+
+    mock_result = mock_db_session.execute.return_value
+    mock_result.all.return_value = [
+        (role_a, "4.A.1.a.1"),
+        (role_a, "4.A.2.b.3"),
+        (role_b, "4.A.1.a.1"),
+    ]
+
+    selected = await repo.get_selected_dwa_ids_by_role_mapping(uuid4())
+
+    assert selected == {role_a: ["4.A.1.a.1", "4.A.2.b.3"], role_b: ["4.A.1.a.1"]}
+    mock_db_session.execute.assert_called_once()
+    sql = str(mock_db_session.execute.call_args[0][0])
+    assert "discovery_activity_selections.session_id" in sql
+    assert "ORDER BY" in sql
+
+
 @pytest.mark.asyncio
 async def test_get_user_modified_selections(mock_db_session):
     """Should get only user_modified=True selections for a session."""
@@ -395,6 +395,66 @@ class TestAggregateAllDimensions:
         assert len(results[AnalysisDimension.DEPARTMENT]) == 2
 
 
+    def test_matches_per_dimension_aggregation(self, scoring_service):
+        """Columnar aggregation should equal aggregate_by_dimension for every dimension."""
+        import random
+        from types import SimpleNamespace
+
+        rng = random.Random(7)
+        role_mappings = [
+            SimpleNamespace(
+                id=f"role-{i}",
+                source_role=rng.choice(["Engineer", "Analyst", "Clerk", None]),
+                row_count=rng.choice([0, None, rng.randint(1, 500)]),
+                metadata={
+                    "department": rng.choice(["Technology", "HR", None]),
+                    "lob": rng.choice(["Retail", "Banking", None]),
+                    "geography": rng.choice(["US", "UK"]),
+                },
+            )
+            for i in range(200)
+        ]
+        scores = {
+            rm.id: {
+                "exposure": rng.random(),
+                "impact": rng.random(),
+                "complexity": rng.random(),
+                "priority": rng.random(),
+            }
+            for rm in role_mappings
+            if rng.random() > 0.1  # Some roles are unscored
+        }
+        dwa_selections = {
+            rm.id: [
+                SimpleNamespace(dwa_id=f"dwa-{d}", dwa_name=f"Task {d % 15}")
+                for d in rng.sample(range(40), rng.randint(0, 5))
+            ]
+            for rm in role_mappings
+        }
+        dwa_selections["role-unknown"] = [SimpleNamespace(dwa_id="dwa-x", dwa_name="Orphan")]
+
+        results = scoring_service.aggregate_all_dimensions(
+            role_mappings=role_mappings,
+            scores=scores,
+            dwa_selections=dwa_selections,
+        )
+
+        for dim in AnalysisDimension:
+            expected = scoring_service.aggregate_by_dimension(
+                role_mappings=role_mappings,
+                scores=scores,
+                dimension=dim,
+                dwa_selections=dwa_selections,
+            )
+            assert results[dim] == expected
+
+    def test_empty_role_mappings(self, scoring_service):
+        """No role mappings should give an empty list for every dimension."""
+        results = scoring_service.aggregate_all_dimensions(role_mappings=[], scores={})
+
+        assert results == {dim: [] for dim in AnalysisDimension}
+
+
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
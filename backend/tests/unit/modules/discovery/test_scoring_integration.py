@@ -6,6 +6,7 @@ Tests cover:
 - AnalysisScores, DimensionAggregation, SessionScoringResult dataclasses
 - Persistence with bulk_create
 - Edge cases like empty DWAs
+- Batch DWA loading through the shared exposure cache
 """
 
 import uuid
@@ -19,13 +20,13 @@ from app.modules.discovery.schemas.scoring import (
     DimensionAggregation,
     SessionScoringResult,
 )
-from app.modules.discovery.services.scoring import ScoringService
+from app.modules.discovery.services.scoring import DwaExposureCache, ScoringService
 
 
 @pytest.fixture
 def scoring_service():
-    """Create a ScoringService instance."""
-    return ScoringService()
+    """Create a ScoringService instance with its own exposure cache."""
+    return ScoringService(exposure_cache=DwaExposureCache())
 
 
 @pytest.fixture
@@ -48,7 +49,7 @@ def mock_role_mapping_repo():
 def mock_activity_selection_repo():
     """Create a mock activity selection repository."""
     repo = MagicMock()
-    repo.get_selected_for_role_mapping = AsyncMock()
+    repo.get_selected_dwa_ids_by_role_mapping = AsyncMock(return_value={})
     return repo
 
 
@@ -56,7 +57,8 @@ def mock_activity_selection_repo():
 def mock_dwa_repo():
     """Create a mock DWA repository."""
     repo = MagicMock()
-    repo.get_by_id = AsyncMock()
+    repo.get_exposure_version = AsyncMock(return_value=1)
+    repo.get_all_effective_exposures = AsyncMock(return_value=[])
     return repo
 
 
@@ -88,35 +90,13 @@ def create_mock_role_mapping(
     return mapping
 
 
-def create_mock_dwa(
-    dwa_id: str,
-    name: str,
-    ai_exposure_override: float | None = None,
-    gwa_exposure: float | None = None,
-):
-    """Helper to create a mock DWA with IWA/GWA chain."""
-    dwa = MagicMock()
-    dwa.id = dwa_id
-    dwa.name = name
-    dwa.ai_exposure_override = ai_exposure_override
-
-    # Create IWA -> GWA chain
-    gwa = MagicMock()
-    gwa.ai_exposure_score = gwa_exposure
-
-    iwa = MagicMock()
-    iwa.gwa = gwa
-
-    dwa.iwa = iwa
-
-    return dwa
-
-
-def create_mock_selection(dwa_id: str):
-    """Helper to create a mock activity selection."""
-    selection = MagicMock()
-    selection.dwa_id = dwa_id
-    return selection
+def create_exposure_row(dwa_id: str, name: str, exposure: float | None):
+    """Helper to create a (dwa_id, name, exposure) row of effective exposures."""
+    row = MagicMock()
+    row.dwa_id = dwa_id
+    row.name = name
+    row.exposure = exposure
+    return row
 
 
 class TestScoreSessionReturnsCompleteResult:
@@ -135,14 +115,13 @@ class TestScoreSessionReturnsCompleteResult:
         role_mapping = create_mock_role_mapping(source_role="Developer", row_count=50)
         mock_role_mapping_repo.get_by_session_id.return_value = [role_mapping]
 
-        selection = create_mock_selection("dwa-1")
-        mock_activity_selection_repo.get_selected_for_role_mapping.return_value = [
-            selection
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {
+            role_mapping.id: ["dwa-1"]
+        }
+        mock_dwa_repo.get_all_effective_exposures.return_value = [
+            create_exposure_row("dwa-1", "Analyze data", 0.7)
         ]
 
-        dwa = create_mock_dwa("dwa-1", "Analyze data", ai_exposure_override=0.7)
-        mock_dwa_repo.get_by_id.return_value = dwa
-
         result = await scoring_service.score_session(
             session=mock_session,
             role_mapping_repo=mock_role_mapping_repo,
@@ -175,14 +154,13 @@ class TestScoreSessionCalculatesAllRoleScores:
         role_mapping = create_mock_role_mapping(source_role="Developer", row_count=100)
         mock_role_mapping_repo.get_by_session_id.return_value = [role_mapping]
 
-        selection = create_mock_selection("dwa-1")
-        mock_activity_selection_repo.get_selected_for_role_mapping.return_value = [
-            selection
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {
+            role_mapping.id: ["dwa-1"]
+        }
+        mock_dwa_repo.get_all_effective_exposures.return_value = [
+            create_exposure_row("dwa-1", "Analyze data", 0.8)
         ]
 
-        dwa = create_mock_dwa("dwa-1", "Analyze data", ai_exposure_override=0.8)
-        mock_dwa_repo.get_by_id.return_value = dwa
-
         result = await scoring_service.score_session(
             session=mock_session,
             role_mapping_repo=mock_role_mapping_repo,
@@ -225,14 +203,13 @@ class TestScoreSessionAggregatesAllDimensions:
         )
         mock_role_mapping_repo.get_by_session_id.return_value = [role_mapping]
 
-        selection = create_mock_selection("dwa-1")
-        mock_activity_selection_repo.get_selected_for_role_mapping.return_value = [
-            selection
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {
+            role_mapping.id: ["dwa-1"]
+        }
+        mock_dwa_repo.get_all_effective_exposures.return_value = [
+            create_exposure_row("dwa-1", "Analyze data", 0.7)
         ]
 
-        dwa = create_mock_dwa("dwa-1", "Analyze data", ai_exposure_override=0.7)
-        mock_dwa_repo.get_by_id.return_value = dwa
-
         result = await scoring_service.score_session(
             session=mock_session,
             role_mapping_repo=mock_role_mapping_repo,
@@ -265,14 +242,13 @@ class TestScoreSessionPersistsResults:
         role_mapping = create_mock_role_mapping(source_role="Developer", row_count=50)
         mock_role_mapping_repo.get_by_session_id.return_value = [role_mapping]
 
-        selection = create_mock_selection("dwa-1")
-        mock_activity_selection_repo.get_selected_for_role_mapping.return_value = [
-            selection
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {
+            role_mapping.id: ["dwa-1"]
+        }
+        mock_dwa_repo.get_all_effective_exposures.return_value = [
+            create_exposure_row("dwa-1", "Analyze data", 0.7)
         ]
 
-        dwa = create_mock_dwa("dwa-1", "Analyze data", ai_exposure_override=0.7)
-        mock_dwa_repo.get_by_id.return_value = dwa
-
         await scoring_service.score_session(
             session=mock_session,
             role_mapping_repo=mock_role_mapping_repo,
@@ -305,7 +281,7 @@ class TestScoreSessionHandlesEmptyDwas:
         mock_role_mapping_repo.get_by_session_id.return_value = [role_mapping]
 
         # No selections for this role
-        mock_activity_selection_repo.get_selected_for_role_mapping.return_value = []
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {}
 
         result = await scoring_service.score_session(
             session=mock_session,
@@ -433,7 +409,7 @@ class TestGetSessionMaxHeadcount:
         role_3 = create_mock_role_mapping(source_role="Analyst", row_count=200)
 
         mock_role_mapping_repo.get_by_session_id.return_value = [role_1, role_2, role_3]
-        mock_activity_selection_repo.get_selected_for_role_mapping.return_value = []
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {}
 
         result = await scoring_service.score_session(
             session=mock_session,
@@ -463,7 +439,7 @@ class TestRescoreSessionClearsOldResults:
         """Calls delete_by_session_id before saving new results."""
         role_mapping = create_mock_role_mapping(source_role="Developer", row_count=50)
         mock_role_mapping_repo.get_by_session_id.return_value = [role_mapping]
-        mock_activity_selection_repo.get_selected_for_role_mapping.return_value = []
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {}
 
         # Track call order
         call_order = []
@@ -486,6 +462,88 @@ class TestRescoreSessionClearsOldResults:
         )
 
 
+class TestScoreSessionBatchLoadsDwas:
+    """Test that score_session loads selections and exposures in bulk."""
+
+    @pytest.mark.asyncio
+    async def test_score_session_uses_one_selection_query(
+        self,
+        scoring_service,
+        mock_session,
+        mock_role_mapping_repo,
+        mock_activity_selection_repo,
+        mock_dwa_repo,
+    ):
+        """Selections of all roles come from one call; unknown DWAs are skipped."""
+        developer = create_mock_role_mapping(source_role="Developer", row_count=100)
+        manager = create_mock_role_mapping(source_role="Manager", row_count=50)
+        mock_role_mapping_repo.get_by_session_id.return_value = [developer, manager]
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {
+            developer.id: ["dwa-1", "dwa-2"],
+            manager.id: ["dwa-2", "dwa-missing"],
+        }
+        mock_dwa_repo.get_all_effective_exposures.return_value = [
+            create_exposure_row("dwa-1", "Analyze data", 0.8),
+            create_exposure_row("dwa-2", "Write reports", None),  # No score anywhere
+        ]
+
+        result = await scoring_service.score_session(
+            session=mock_session,
+            role_mapping_repo=mock_role_mapping_repo,
+            activity_selection_repo=mock_activity_selection_repo,
+            dwa_repo=mock_dwa_repo,
+        )
+
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.assert_awaited_once_with(
+            mock_session.id
+        )
+        assert result.role_scores[str(developer.id)].exposure == pytest.approx(0.4)
+        assert result.role_scores[str(manager.id)].exposure == 0.0
+
+    @pytest.mark.asyncio
+    async def test_exposure_map_shared_until_version_changes(
+        self,
+        scoring_service,
+        mock_session,
+        mock_role_mapping_repo,
+        mock_activity_selection_repo,
+        mock_dwa_repo,
+    ):
+        """The DWA exposure map is reloaded only when the data version changes."""
+        role_mapping = create_mock_role_mapping(source_role="Developer", row_count=100)
+        mock_role_mapping_repo.get_by_session_id.return_value = [role_mapping]
+        mock_activity_selection_repo.get_selected_dwa_ids_by_role_mapping.return_value = {
+            role_mapping.id: ["dwa-1"]
+        }
+        mock_dwa_repo.get_all_effective_exposures.return_value = [
+            create_exposure_row("dwa-1", "Analyze data", 0.8)
+        ]
+
+        async def score():
+            result = await scoring_service.score_session(
+                session=mock_session,
+                role_mapping_repo=mock_role_mapping_repo,
+                activity_selection_repo=mock_activity_selection_repo,
+                dwa_repo=mock_dwa_repo,
+            )
+            return result.role_scores[str(role_mapping.id)].exposure
+
+        assert await score() == pytest.approx(0.8)
+        assert await score() == pytest.approx(0.8)
+        assert mock_dwa_repo.get_all_effective_exposures.await_count == 1
+
+        mock_dwa_repo.get_exposure_version.return_value = 2
+        mock_dwa_repo.get_all_effective_exposures.return_value = [
+            create_exposure_row("dwa-1", "Analyze data", 0.3)
+        ]
+        assert await score() == pytest.approx(0.3)
+        assert mock_dwa_repo.get_all_effective_exposures.await_count == 2
+
+    def test_default_cache_is_shared(self):
+        """ScoringService instances share the process-wide cache by default."""
+        assert ScoringService().exposure_cache is ScoringService().exposure_cache
+
+
 class TestScoringServiceExportedFromServicesInit:
     """Test that ScoringService is importable from services."""
 
@@ -3,15 +3,27 @@
 This agent replaces fuzzy string matching with Claude-based semantic
 understanding for mapping job titles to O*NET occupations.
 """
+import asyncio
 import json
 import logging
+import random
+import re
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from app.exceptions import LLMRateLimitError
 from app.models.onet_occupation import OnetOccupation
 from app.repositories.onet_repository import OnetRepository
+from app.services.llm_client import LLMClientPool
 from app.services.llm_service import LLMService
+from app.services.onet_search_index import tokenize
+from app.services.onet_title_index import get_onet_title_index
+
+if TYPE_CHECKING:
+    from app.services.onet_search_index import OnetSearchIndex
+    from app.services.onet_title_index import OnetTitleIndex
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +61,7 @@ class RoleMappingResult:
         onet_title: Matched O*NET occupation title.
         confidence: Confidence tier (HIGH, MEDIUM, LOW).
         reasoning: Brief explanation of the match.
+        fallback: True when the result was not produced by the LLM.
     """
 
     source_role: str
@@ -56,6 +69,7 @@ class RoleMappingResult:
     onet_title: str | None
     confidence: ConfidenceTier
     reasoning: str
+    fallback: bool = False
 
     @property
     def confidence_score(self) -> float:
@@ -67,9 +81,13 @@ class RoleMappingResult:
         return self.confidence.to_score()
 
 
+# Reasoning prefix for mappings resolved by exact title match, without the LLM
+DETERMINISTIC_REASONING_TAG = "[deterministic]"
+
 SYSTEM_PROMPT = """You are an expert at mapping job titles to O*NET occupations.
 
-For each role provided, select the best matching O*NET occupation from the candidates listed.
+Candidate occupations are listed once in a shared catalog. For each role provided, select the
+best matching O*NET occupation from the candidate codes listed for that role.
 
 Return your confidence level:
 - HIGH: Clear, unambiguous match (the role title clearly describes this occupation)
@@ -86,6 +104,137 @@ Respond with a JSON array containing objects with these fields:
 If no candidates are a good match, use onet_code: null and confidence: LOW."""
 
 
+class _JsonArrayStreamParser:
+    """Incrementally extract the objects of a streamed JSON array.
+
+    The array must begin the response, after optional whitespace or a
+    markdown code fence; a response that opens with prose is rejected
+    rather than parsed from a bracket inside the prose. Each top-level
+    object is decoded as soon as its closing brace arrives; objects that
+    fail to decode are logged and skipped.
+
+    Attributes:
+        found_array: Whether the opening bracket has been seen.
+    """
+
+    # Text that may precede the array, and prefixes that may still become it
+    _ARRAY_START = re.compile(r"\s*(?:```[A-Za-z]*\s*)?\[")
+    _PARTIAL_START = re.compile(r"\s*(?:`{1,2}|```[A-Za-z]*\s*)?")
+
+    def __init__(self) -> None:
+        self.found_array = False
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._start: int | None = None
+        self._in_string = False
+        self._escaped = False
+        self._closed = False
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Consume a chunk of text.
+
+        Args:
+            chunk: Next piece of the response.
+
+        Returns:
+            Objects completed by this chunk, in order.
+        """
+        if self._closed:
+            return []
+        self._buffer += chunk
+        objects: list[dict[str, Any]] = []
+
+        if not self.found_array:
+            match = self._ARRAY_START.match(self._buffer)
+            if match is None:
+                if not self._PARTIAL_START.fullmatch(self._buffer):
+                    logger.warning("LLM response does not start with a JSON array")
+                    self._closed = True
+                return []
+            self.found_array = True
+            self._pos = match.end()
+
+        while self._pos < len(self._buffer):
+            char = self._buffer[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._start = self._pos
+                self._depth += 1
+            elif char == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0 and self._start is not None:
+                    obj = self._decode(self._buffer[self._start:self._pos + 1])
+                    if obj is not None:
+                        objects.append(obj)
+                    self._start = None
+            elif char == "]" and self._depth == 0:
+                self._closed = True
+                break
+            self._pos += 1
+
+        # Drop consumed text outside any pending object
+        keep_from = self._start if self._start is not None else self._pos
+        self._buffer = self._buffer[keep_from:]
+        self._pos -= keep_from
+        if self._start is not None:
+            self._start = 0
+        return objects
+
+    @staticmethod
+    def _decode(text: str) -> dict[str, Any] | None:
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping malformed object in LLM response: {e}")
+            return None
+        return obj if isinstance(obj, dict) else None
+
+
+class _AdaptiveConcurrencyLimiter:
+    """Concurrency limiter that shrinks on rate limits and recovers on success.
+
+    Starts with ``max_concurrency`` permits. Every rate-limited call halves
+    the permit count (never below 1) and every successful call grows it
+    back by one until the configured maximum is reached again.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until a permit is available under the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self, rate_limited: bool = False) -> None:
+        """Return a permit and adjust the limit based on the call outcome.
+
+        Args:
+            rate_limited: Whether the call was rejected by the rate limiter.
+        """
+        async with self._condition:
+            self._active -= 1
+            if rate_limited:
+                self.limit = max(1, self.limit // 2)
+            elif self.limit < self.max_concurrency:
+                self.limit += 1
+            self._condition.notify_all()
+
+
 class RoleMappingAgent:
     """LLM-powered agent for semantic role-to-O*NET mapping.
 
@@ -95,12 +244,41 @@ class RoleMappingAgent:
     Attributes:
         llm_service: LLM service for Claude API calls.
         onet_repository: Repository for O*NET data.
-        batch_size: Number of roles per LLM call.
+        batch_size: Maximum number of roles per LLM call.
         candidates_per_role: Number of O*NET candidates to retrieve per role.
+        max_concurrency: Maximum number of batches in flight at once.
+        search_index: In-memory candidate index used instead of the
+            database when set.
+        prompt_token_budget: Estimated input tokens allowed per batch prompt.
+        title_index: Exact title lookup used to resolve roles without the
+            LLM when set.
+        use_title_index: Whether the process-wide title index is resolved
+            when roles are first mapped, if no title_index is given.
+        rate_limit_retries: Retries for a rate-limited batch; 0 when the
+            LLM service's client pool retries instead.
     """
 
     DEFAULT_BATCH_SIZE = 12
     DEFAULT_CANDIDATES_PER_ROLE = 20
+    DEFAULT_MAX_CONCURRENCY = 4
+    # A role with 20 distinct candidates at DESCRIPTION_MAX_CHARS costs about
+    # 1,400 estimated tokens, so a full DEFAULT_BATCH_SIZE batch fits even
+    # when roles share no candidates; the budget only bites on outliers
+    DEFAULT_PROMPT_TOKEN_BUDGET = 18000
+
+    # Prompt packing: candidates kept for roles whose top candidate's title
+    # already contains every word of the role, and the floor when trimming
+    # candidates to fit the token budget
+    MIN_CANDIDATES_PER_ROLE = 5
+    DESCRIPTION_MAX_CHARS = 200
+    CHARS_PER_TOKEN = 4  # Rough estimate for English text
+
+    # Retry policy for batches rejected with LLMRateLimitError. Only used when
+    # the LLM service has no client pool; a pool already retries rate limits,
+    # and retrying here as well would multiply the attempts per batch
+    MAX_RATE_LIMIT_RETRIES = 5
+    RATE_LIMIT_BACKOFF_BASE = 1.0  # seconds
+    RATE_LIMIT_BACKOFF_MAX = 30.0  # seconds
 
     def __init__(
         self,
@@ -108,19 +286,47 @@ class RoleMappingAgent:
         onet_repository: OnetRepository,
         batch_size: int = DEFAULT_BATCH_SIZE,
         candidates_per_role: int = DEFAULT_CANDIDATES_PER_ROLE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        search_index: "OnetSearchIndex | None" = None,
+        prompt_token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET,
+        title_index: "OnetTitleIndex | None" = None,
+        use_title_index: bool = False,
     ) -> None:
         """Initialize the role mapping agent.
 
         Args:
             llm_service: LLM service for Claude API calls.
             onet_repository: Repository for O*NET data.
-            batch_size: Number of roles per LLM call.
+            batch_size: Maximum number of roles per LLM call.
             candidates_per_role: Number of O*NET candidates to retrieve per role.
+            max_concurrency: Maximum number of batches sent to the LLM at once.
+                Use 1 to process batches sequentially.
+            search_index: Optional in-memory index for candidate retrieval.
+                When omitted, candidates come from database full-text search.
+            prompt_token_budget: Estimated input tokens allowed per batch
+                prompt. Batches close early when the next role would exceed it.
+            title_index: Optional exact title lookup. Roles that exactly
+                name an O*NET occupation or alternate title are mapped HIGH
+                directly and never sent to the LLM.
+            use_title_index: If True and no title_index is given, the
+                process-wide title index is resolved on the first
+                map_roles or map_roles_stream call, so agents that never
+                map roles don't pay for it.
         """
         self.llm_service = llm_service
         self.onet_repository = onet_repository
         self.batch_size = batch_size
         self.candidates_per_role = candidates_per_role
+        self.max_concurrency = max(1, max_concurrency)
+        self.search_index = search_index
+        self.prompt_token_budget = prompt_token_budget
+        self.title_index = title_index
+        self.use_title_index = use_title_index
+        pool = getattr(llm_service, "client_pool", None)
+        self.rate_limit_retries = (
+            0 if isinstance(pool, LLMClientPool) and pool.max_retries > 0
+            else self.MAX_RATE_LIMIT_RETRIES
+        )
 
     async def map_roles(self, roles: list[str]) -> list[RoleMappingResult]:
         """Map a list of role titles to O*NET occupations.
@@ -129,35 +335,245 @@ class RoleMappingAgent:
             roles: List of role titles to map.
 
         Returns:
-            List of RoleMappingResult objects.
+            List of RoleMappingResult objects, in input order.
         """
         if not roles:
             return []
 
         logger.info(f"Mapping {len(roles)} roles to O*NET occupations")
 
+        # Resolve exact title matches without the LLM
+        order = {role: i for i, role in enumerate(roles)}
+        exact_results, roles = await self._resolve_exact_matches(roles)
+        if not roles:
+            return exact_results
+
         # Get candidates for all roles
         candidates = await self._get_candidates(roles)
 
         # Chunk into batches
         batches = self._chunk_roles(roles, candidates)
 
-        # Process each batch
-        results = []
-        for i, batch in enumerate(batches):
-            logger.info(f"Processing batch {i + 1}/{len(batches)}")
-            batch_results = await self._process_batch(batch)
-            results.extend(batch_results)
+        # Dispatch batches concurrently; gather preserves batch order
+        limiter = _AdaptiveConcurrencyLimiter(self.max_concurrency)
+        batch_results = await asyncio.gather(*(
+            self._process_batch_with_backoff(batch, i, len(batches), limiter)
+            for i, batch in enumerate(batches)
+        ))
 
+        results = exact_results + [result for results in batch_results for result in results]
+        results.sort(key=lambda r: order.get(r.source_role, len(order)))
         return results
 
+    async def map_roles_stream(
+        self,
+        roles: list[str],
+    ) -> AsyncIterator[list[RoleMappingResult]]:
+        """Map role titles, yielding results as soon as the LLM produces them.
+
+        Exact title matches are yielded first as one list. LLM batches are
+        dispatched concurrently as in map_roles and their responses parsed
+        as they stream, so each role's result is available as soon as its
+        JSON object closes. Results that arrive while the consumer is busy
+        are yielded together in the next list. Outstanding batches are
+        cancelled if the consumer stops iterating.
+
+        Args:
+            roles: List of role titles to map.
+
+        Yields:
+            Non-empty lists of RoleMappingResult objects, in completion order.
+        """
+        if not roles:
+            return
+
+        logger.info(f"Streaming mapping of {len(roles)} roles to O*NET occupations")
+
+        exact_results, roles = await self._resolve_exact_matches(roles)
+        if exact_results:
+            yield exact_results
+        if not roles:
+            return
+
+        candidates = await self._get_candidates(roles)
+        batches = self._chunk_roles(roles, candidates)
+
+        limiter = _AdaptiveConcurrencyLimiter(self.max_concurrency)
+        # Each batch pushes results as they stream in, then None when done
+        queue: asyncio.Queue[RoleMappingResult | Exception | None] = asyncio.Queue()
+
+        async def pump(batch: list[tuple[str, list[OnetOccupation]]], index: int) -> None:
+            try:
+                async for result in self._stream_batch_with_backoff(
+                    batch, index, len(batches), limiter,
+                ):
+                    queue.put_nowait(result)
+            except Exception as e:
+                queue.put_nowait(e)
+            finally:
+                queue.put_nowait(None)
+
+        tasks = [
+            asyncio.ensure_future(pump(batch, i))
+            for i, batch in enumerate(batches)
+        ]
+        running = len(tasks)
+        try:
+            while running:
+                items = [await queue.get()]
+                while not queue.empty():
+                    items.append(queue.get_nowait())
+
+                results = []
+                for item in items:
+                    if item is None:
+                        running -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        results.append(item)
+                if results:
+                    yield results
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _resolve_exact_matches(
+        self,
+        roles: list[str],
+    ) -> tuple[list[RoleMappingResult], list[str]]:
+        """Map roles that exactly name an O*NET title, without the LLM.
+
+        Args:
+            roles: List of role titles.
+
+        Returns:
+            Tuple of (HIGH-confidence results for exact matches, roles
+            still needing the LLM in input order).
+        """
+        if self.title_index is None and self.use_title_index:
+            self.title_index = await get_onet_title_index(self.onet_repository)
+        if self.title_index is None:
+            return [], roles
+
+        matches = self.title_index.match_batch(roles)
+        results = []
+        for role, match in matches.items():
+            kind = "alternate title" if match.alternate else "occupation title"
+            results.append(RoleMappingResult(
+                source_role=role,
+                onet_code=match.occupation.code,
+                onet_title=match.occupation.title,
+                confidence=ConfidenceTier.HIGH,
+                reasoning=f"{DETERMINISTIC_REASONING_TAG} Exact match to O*NET {kind} \"{match.matched_title}\"",
+            ))
+
+        if results:
+            logger.info(f"Resolved {len(results)} of {len(roles)} roles by exact title match")
+
+        return results, [role for role in roles if role not in matches]
+
+    async def _process_batch_with_backoff(
+        self,
+        batch: list[tuple[str, list[OnetOccupation]]],
+        index: int,
+        total: int,
+        limiter: _AdaptiveConcurrencyLimiter,
+    ) -> list[RoleMappingResult]:
+        """Process a batch under the concurrency limiter, retrying on rate limits.
+
+        Args:
+            batch: List of (role, candidates) tuples.
+            index: Zero-based position of the batch, for logging.
+            total: Total number of batches, for logging.
+            limiter: Shared limiter for the current map_roles call.
+
+        Returns:
+            One RoleMappingResult per role in the batch.
+        """
+        return [
+            result
+            async for result in self._stream_batch_with_backoff(batch, index, total, limiter)
+        ]
+
+    async def _stream_batch_with_backoff(
+        self,
+        batch: list[tuple[str, list[OnetOccupation]]],
+        index: int,
+        total: int,
+        limiter: _AdaptiveConcurrencyLimiter,
+    ) -> AsyncIterator[RoleMappingResult]:
+        """Stream a batch under the concurrency limiter, retrying on rate limits.
+
+        A retry only re-sends the roles that have not been yielded yet.
+
+        Args:
+            batch: List of (role, candidates) tuples.
+            index: Zero-based position of the batch, for logging.
+            total: Total number of batches, for logging.
+            limiter: Shared limiter for the current map_roles call.
+
+        Yields:
+            One RoleMappingResult per role in the batch. Roles still pending
+            once the retry budget is exhausted get low-confidence fallbacks.
+        """
+        remaining = batch
+        done: set[str] = set()
+        for attempt in range(self.rate_limit_retries + 1):
+            await limiter.acquire()
+            rate_limited = False
+            try:
+                logger.info(f"Processing batch {index + 1}/{total}")
+                async for result in self._stream_batch(remaining):
+                    done.add(result.source_role)
+                    yield result
+                return
+            except LLMRateLimitError as e:
+                rate_limited = True
+                error = e
+            finally:
+                await limiter.release(rate_limited=rate_limited)
+
+            remaining = [(role, candidates) for role, candidates in remaining if role not in done]
+            if attempt == self.rate_limit_retries:
+                break
+
+            delay = self._backoff_delay(attempt, error.retry_after)
+            logger.warning(
+                f"Rate limited on batch {index + 1}/{total}, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{self.rate_limit_retries}, "
+                f"concurrency now {limiter.limit})"
+            )
+            await asyncio.sleep(delay)
+
+        logger.error(f"Batch {index + 1}/{total} still rate limited after retries")
+        for result in self._create_fallback_results(remaining, str(error)):
+            yield result
+
+    def _backoff_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Calculate how long to wait before retrying a rate-limited batch.
+
+        Args:
+            attempt: Zero-based retry attempt number.
+            retry_after: Server-suggested delay in seconds, if provided.
+
+        Returns:
+            Delay in seconds, with jitter to avoid synchronized retries.
+        """
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.RATE_LIMIT_BACKOFF_MAX, self.RATE_LIMIT_BACKOFF_BASE * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
     async def _get_candidates(
         self,
         roles: list[str],
     ) -> dict[str, list[OnetOccupation]]:
         """Retrieve O*NET candidates for each role.
 
-        Uses full-text search to find potential matches.
+        Uses the in-memory search index when configured. Otherwise runs a
+        single batched full-text search for all roles, falling back to
+        searching each role individually if the batch query fails.
 
         Args:
             roles: List of role titles.
@@ -165,6 +581,18 @@ class RoleMappingAgent:
         Returns:
             Dict mapping role to list of candidate occupations.
         """
+        if self.search_index is not None:
+            return self.search_index.search_batch(roles, limit=self.candidates_per_role)
+
+        try:
+            candidates = await self.onet_repository.search_with_full_text_batch(
+                queries=roles,
+                limit=self.candidates_per_role,
+            )
+            return {role: candidates.get(role, []) for role in roles}
+        except Exception as e:
+            logger.warning(f"Batched candidate search failed, searching per role: {e}")
+
         candidates: dict[str, list[OnetOccupation]] = {}
 
         for role in roles:
@@ -184,7 +612,12 @@ class RoleMappingAgent:
         roles: list[str],
         candidates: dict[str, list[OnetOccupation]],
     ) -> list[list[tuple[str, list[OnetOccupation]]]]:
-        """Chunk roles into batches for LLM processing.
+        """Pack roles into batches against the prompt token budget.
+
+        Roles are added in order until the batch reaches batch_size or the
+        next role's estimated cost would exceed prompt_token_budget. A role's
+        cost counts only catalog entries not already in the batch, so roles
+        sharing candidates pack more densely.
 
         Args:
             roles: List of role titles.
@@ -195,47 +628,152 @@ class RoleMappingAgent:
         """
         batches: list[list[tuple[str, list[OnetOccupation]]]] = []
         current_batch: list[tuple[str, list[OnetOccupation]]] = []
+        current_codes: set[str] = set()
+        current_tokens = 0
 
         for role in roles:
-            current_batch.append((role, candidates.get(role, [])))
-            if len(current_batch) >= self.batch_size:
+            role_candidates = self._select_candidates(role, candidates.get(role, []))
+            cost = self._estimate_role_tokens(role, role_candidates, current_codes)
+
+            if current_batch and (
+                len(current_batch) >= self.batch_size
+                or current_tokens + cost > self.prompt_token_budget
+            ):
                 batches.append(current_batch)
                 current_batch = []
+                current_codes = set()
+                current_tokens = 0
+                cost = self._estimate_role_tokens(role, role_candidates, current_codes)
+
+            current_batch.append((role, role_candidates))
+            current_codes.update(occ.code for occ in role_candidates)
+            current_tokens += cost
 
         if current_batch:
             batches.append(current_batch)
 
         return batches
 
-    async def _process_batch(
+    def _select_candidates(
+        self,
+        role: str,
+        candidates: list[OnetOccupation],
+    ) -> list[OnetOccupation]:
+        """Choose how many of a role's ranked candidates to send to the LLM.
+
+        Roles whose top candidate's title already contains every word of
+        the role keep only MIN_CANDIDATES_PER_ROLE. Any role that would not
+        fit in an otherwise empty prompt is trimmed toward that floor.
+
+        Args:
+            role: Role title.
+            candidates: Candidates in rank order.
+
+        Returns:
+            Leading slice of candidates.
+        """
+        limit = self.candidates_per_role
+        if candidates:
+            role_terms = set(tokenize(role))
+            if role_terms and role_terms <= set(tokenize(candidates[0].title)):
+                limit = min(limit, self.MIN_CANDIDATES_PER_ROLE)
+
+        selected = candidates[:limit]
+        while (
+            len(selected) > self.MIN_CANDIDATES_PER_ROLE
+            and self._estimate_role_tokens(role, selected, set()) > self.prompt_token_budget
+        ):
+            selected = selected[:-1]
+        return selected
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Estimate the token count of prompt text."""
+        return len(text) // self.CHARS_PER_TOKEN + 1
+
+    def _estimate_role_tokens(
+        self,
+        role: str,
+        candidates: list[OnetOccupation],
+        catalog_codes: set[str],
+    ) -> int:
+        """Estimate the prompt tokens added by one role.
+
+        Args:
+            role: Role title.
+            candidates: Candidates sent for the role.
+            catalog_codes: Codes already in the batch's shared catalog.
+
+        Returns:
+            Estimated tokens for the role's section plus new catalog entries.
+        """
+        tokens = self._estimate_tokens(self._format_role(0, role, candidates))
+        for occ in candidates:
+            if occ.code not in catalog_codes:
+                tokens += self._estimate_tokens(self._format_catalog_entry(occ))
+        return tokens
+
+    def _format_catalog_entry(self, occ: OnetOccupation) -> str:
+        """Format an occupation's line in the shared candidate catalog."""
+        desc = (occ.description or "")[:self.DESCRIPTION_MAX_CHARS]
+        return f"  - {occ.code}: {occ.title} - {desc}"
+
+    def _format_role(
+        self,
+        number: int,
+        role: str,
+        candidates: list[OnetOccupation],
+    ) -> str:
+        """Format a role's section, referencing candidates by code."""
+        codes = ", ".join(occ.code for occ in candidates) if candidates else "(No candidates found)"
+        return f"Role {number}: \"{role}\"\nCandidates: {codes}\n"
+
+    async def _stream_batch(
         self,
         batch: list[tuple[str, list[OnetOccupation]]],
-    ) -> list[RoleMappingResult]:
-        """Process a batch of roles through the LLM.
+    ) -> AsyncIterator[RoleMappingResult]:
+        """Stream a batch of roles through the LLM.
+
+        The response is parsed as it streams; each role's result is yielded
+        as soon as its JSON object closes. Roles missing from the response
+        (or left unanswered when the call fails part-way) get low-confidence
+        fallbacks once the stream ends.
 
         Args:
             batch: List of (role, candidates) tuples.
 
-        Returns:
-            List of RoleMappingResult objects.
+        Yields:
+            One RoleMappingResult per role in the batch.
+
+        Raises:
+            LLMRateLimitError: If the LLM rejects the call due to rate limits.
         """
-        # Build prompt
         prompt = self._build_prompt(batch)
+        pending = dict(batch)
+        parser = _JsonArrayStreamParser()
+        error_msg = None
 
         try:
-            # Call LLM
-            response = await self.llm_service.generate_response(
+            async for chunk in self.llm_service.stream_response(
                 system_prompt=SYSTEM_PROMPT,
                 user_message=prompt,
-            )
-
-            # Parse response
-            return self._parse_response(response, batch)
-
+            ):
+                for item in parser.feed(chunk):
+                    result = self._result_from_item(item, pending)
+                    if result is not None:
+                        yield result
+        except LLMRateLimitError:
+            # Let the dispatcher back off and retry the remaining roles
+            raise
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
-            # Return low-confidence fallbacks
-            return self._create_fallback_results(batch, str(e))
+            error_msg = str(e)
+
+        if pending:
+            for result in self._create_fallback_results(
+                list(pending.items()),
+                error_msg or self._missing_reason(parser),
+            ):
+                yield result
 
     def _build_prompt(
         self,
@@ -243,27 +781,30 @@ class RoleMappingAgent:
     ) -> str:
         """Build the user prompt for the LLM.
 
+        Each candidate occupation appears once in a shared catalog; roles
+        reference their candidates by code.
+
         Args:
             batch: List of (role, candidates) tuples.
 
         Returns:
             Formatted prompt string.
         """
-        lines = []
+        catalog: dict[str, OnetOccupation] = {}
+        for _, candidates in batch:
+            for occ in candidates:
+                catalog.setdefault(occ.code, occ)
 
-        for i, (role, candidates) in enumerate(batch, 1):
-            lines.append(f"Role {i}: \"{role}\"")
-            lines.append("Candidates:")
-
-            if candidates:
-                for occ in candidates:
-                    desc = (occ.description or "")[:200]
-                    lines.append(f"  - {occ.code}: {occ.title} - {desc}")
-            else:
-                lines.append("  (No candidates found)")
+        lines = []
 
+        if catalog:
+            lines.append("Candidate occupations:")
+            lines.extend(self._format_catalog_entry(occ) for occ in catalog.values())
             lines.append("")
 
+        for i, (role, candidates) in enumerate(batch, 1):
+            lines.append(self._format_role(i, role, candidates))
+
         return "\n".join(lines)
 
     def _parse_response(
@@ -271,53 +812,76 @@ class RoleMappingAgent:
         response: str,
         batch: list[tuple[str, list[OnetOccupation]]],
     ) -> list[RoleMappingResult]:
-        """Parse LLM response into RoleMappingResult objects.
+        """Parse a complete LLM response into RoleMappingResult objects.
 
         Args:
-            response: LLM response text (should be JSON).
-            batch: Original batch for fallback data.
+            response: LLM response text (should be a JSON array).
+            batch: Original batch, for matching roles and fallback data.
 
         Returns:
-            List of RoleMappingResult objects.
+            One RoleMappingResult per role in the batch; roles missing from
+            the response get low-confidence fallbacks.
         """
-        try:
-            # Extract JSON from response (handle markdown code blocks)
-            json_str = response.strip()
-            if json_str.startswith("```"):
-                json_str = json_str.split("```")[1]
-                if json_str.startswith("json"):
-                    json_str = json_str[4:]
-
-            data = json.loads(json_str)
-
-            results = []
-
-            for item in data:
-                role = item.get("role", "")
-                onet_code = item.get("onet_code")
-                onet_title = item.get("onet_title")
-                confidence_str = item.get("confidence", "LOW")
-                reasoning = item.get("reasoning", "")
-
-                # Parse confidence tier
-                try:
-                    confidence = ConfidenceTier(confidence_str.upper())
-                except ValueError:
-                    confidence = ConfidenceTier.LOW
+        pending = dict(batch)
+        parser = _JsonArrayStreamParser()
+        results = [
+            result
+            for item in parser.feed(response)
+            if (result := self._result_from_item(item, pending)) is not None
+        ]
+        if pending:
+            results.extend(self._create_fallback_results(
+                list(pending.items()), self._missing_reason(parser),
+            ))
+        return results
 
-                results.append(RoleMappingResult(
-                    source_role=role,
-                    onet_code=onet_code,
-                    onet_title=onet_title,
-                    confidence=confidence,
-                    reasoning=reasoning,
-                ))
+    def _result_from_item(
+        self,
+        item: dict[str, Any],
+        pending: dict[str, list[OnetOccupation]],
+    ) -> RoleMappingResult | None:
+        """Build a result from one response object and mark its role done.
+
+        Args:
+            item: Decoded JSON object from the response.
+            pending: Roles not yet answered, mapped to their candidates.
+                The matched role is removed.
 
-            return results
+        Returns:
+            RoleMappingResult, or None if the object names no pending role.
+        """
+        role = item.get("role")
+        if not isinstance(role, str):
+            return None
+
+        # Tolerate case and whitespace changes in the echoed title
+        if role not in pending:
+            key = role.strip().casefold()
+            role = next((r for r in pending if r.strip().casefold() == key), None)
+            if role is None:
+                logger.warning(f"Ignoring unexpected role in LLM response: {item.get('role')!r}")
+                return None
+        del pending[role]
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.error(f"Failed to parse LLM response: {e}")
-            return self._create_fallback_results(batch, f"Parse error: {e}")
+        try:
+            confidence = ConfidenceTier(str(item.get("confidence", "LOW")).upper())
+        except ValueError:
+            confidence = ConfidenceTier.LOW
+
+        return RoleMappingResult(
+            source_role=role,
+            onet_code=item.get("onet_code"),
+            onet_title=item.get("onet_title"),
+            confidence=confidence,
+            reasoning=item.get("reasoning", ""),
+        )
+
+    @staticmethod
+    def _missing_reason(parser: _JsonArrayStreamParser) -> str:
+        """Describe why roles are missing from a parsed response."""
+        if not parser.found_array:
+            return "Parse error: no JSON array in LLM response"
+        return "Parse error: role missing from LLM response"
 
     def _create_fallback_results(
         self,
@@ -345,6 +909,7 @@ class RoleMappingAgent:
                     onet_title=first.title,
                     confidence=ConfidenceTier.LOW,
                     reasoning=f"Fallback match - {error_msg}",
+                    fallback=True,
                 ))
             else:
                 results.append(RoleMappingResult(
@@ -353,6 +918,7 @@ class RoleMappingAgent:
                     onet_title=None,
                     confidence=ConfidenceTier.LOW,
                     reasoning=f"No candidates found - {error_msg}",
+                    fallback=True,
                 ))
 
         return results
@@ -4,6 +4,7 @@ This module provides centralized configuration management using pydantic-setting
 loading values from environment variables with sensible defaults.
 """
 from functools import lru_cache
+from typing import Literal
 from urllib.parse import quote_plus
 
 from pydantic import SecretStr, computed_field
@@ -33,6 +34,14 @@ class Settings(BaseSettings):
     # Redis configuration
     redis_url: str = "redis://localhost:6379/0"
 
+    # Background job configuration
+    job_backend: Literal["memory", "redis"] = "memory"  # "redis" uses redis_url
+    job_worker_in_process: bool = True  # Run a worker inside the API process
+    job_worker_concurrency: int = 2
+    job_max_attempts: int = 3
+    job_result_ttl_seconds: int = 86400
+    job_lease_seconds: int = 60  # Running jobs without a heartbeat this long are requeued
+
     # S3 storage configuration
     s3_endpoint_url: str | None = None
     s3_bucket: str = "discovery-uploads"
@@ -48,6 +57,33 @@ class Settings(BaseSettings):
     anthropic_api_key: SecretStr = SecretStr("")
     anthropic_model: str = "claude-sonnet-4-20250514"
 
+    # LLM response cache: "none", "memory" (per process), "sqlite" (per host) or "redis"
+    llm_cache_backend: Literal["none", "memory", "sqlite", "redis"] = "none"
+    llm_cache_ttl_seconds: int = 7 * 24 * 3600
+    llm_cache_max_entries: int = 10000  # memory and sqlite backends
+    llm_cache_sqlite_path: str = "llm_cache.sqlite3"
+
+    # LLM client pool shared by all requests in a process
+    llm_max_concurrency: int = 8  # In-flight Anthropic requests per process
+    # Pacing is per process and disabled by default; set from your account's
+    # API limits divided by the number of API/worker processes
+    llm_requests_per_minute: int = 0  # 0 disables request pacing
+    llm_tokens_per_minute: int = 0  # Estimated tokens; 0 disables token pacing
+    llm_max_retries: int = 3  # The only retry layer for rate-limit/connection errors
+    llm_retry_backoff_base: float = 1.0  # seconds
+    llm_retry_backoff_max: float = 30.0  # seconds
+
+    # Role mapping configuration
+    role_mapping_max_concurrency: int = 4  # Concurrent LLM batches per mapping run
+    role_mapping_prompt_token_budget: int = 18000  # Estimated input tokens per LLM batch
+    role_mapping_cache_enabled: bool = True  # Reuse confident mappings across sessions
+    role_mapping_exact_match_enabled: bool = True  # Map exact O*NET titles without the LLM
+    # Candidate retrieval: PostgreSQL full-text search or in-memory BM25 index
+    role_mapping_candidate_source: Literal["database", "memory"] = "database"
+
+    # What-if scenario scoring
+    scenario_cache_max_sessions: int = 128  # Sessions whose score arrays stay in memory
+
     # Application settings
     api_host: str = "0.0.0.0"
     api_port: int = 8000
@@ -1,5 +1,39 @@
 # discovery/app/jobs/__init__.py
-"""Background job scheduling."""
+"""Background job scheduling and execution."""
+from app.jobs.handlers import (
+    ANALYSIS_JOB,
+    JOB_HANDLERS,
+    ONET_SYNC_JOB,
+    ROLE_MAPPING_JOB,
+    PermanentJobError,
+    job_handler,
+)
+from app.jobs.queue import (
+    InMemoryJobBackend,
+    Job,
+    JobQueue,
+    JobStatus,
+    RedisJobBackend,
+    create_job_queue,
+    get_job_queue,
+)
 from app.jobs.scheduler import JobScheduler
+from app.jobs.worker import JobWorker
 
-__all__ = ["JobScheduler"]
+__all__ = [
+    "ANALYSIS_JOB",
+    "InMemoryJobBackend",
+    "JOB_HANDLERS",
+    "Job",
+    "JobQueue",
+    "JobScheduler",
+    "JobStatus",
+    "JobWorker",
+    "ONET_SYNC_JOB",
+    "PermanentJobError",
+    "ROLE_MAPPING_JOB",
+    "RedisJobBackend",
+    "create_job_queue",
+    "get_job_queue",
+    "job_handler",
+]
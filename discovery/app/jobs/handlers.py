@@ -0,0 +1,171 @@
+# discovery/app/jobs/handlers.py
+"""Handlers for background jobs.
+
+Each handler receives the job's params and a progress callback and
+returns a JSON-serializable result. Handlers build their own services
+and database sessions, since they run outside any HTTP request.
+"""
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import Any
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[float, str | None], Awaitable[None]]
+JobHandler = Callable[[dict[str, Any], ProgressCallback], Awaitable[Any]]
+
+ROLE_MAPPING_JOB = "role_mapping"
+ANALYSIS_JOB = "analysis"
+ONET_SYNC_JOB = "onet_sync"
+
+JOB_HANDLERS: dict[str, JobHandler] = {}
+
+
+class PermanentJobError(Exception):
+    """Job failure that retrying cannot fix (e.g., missing session)."""
+
+    pass
+
+
+def job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """Register a function as the handler for a job type.
+
+    Args:
+        job_type: Name jobs are enqueued under.
+
+    Returns:
+        Decorator that registers and returns the handler.
+    """
+    def decorator(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[job_type] = handler
+        return handler
+    return decorator
+
+
+@job_handler(ROLE_MAPPING_JOB)
+async def run_role_mapping_job(
+    params: dict[str, Any],
+    report_progress: ProgressCallback,
+) -> dict[str, Any]:
+    """Create role mappings from an upload, reporting per-batch progress.
+
+    Args:
+        params: Keyword arguments for RoleMappingService.stream_mappings_from_upload,
+            with session_id and upload_id as strings.
+        report_progress: Progress callback.
+
+    Returns:
+        Summary from the final "done" event (created_count and tier counts).
+    """
+    from app.services.role_mapping_service import get_role_mapping_service
+
+    kwargs = {
+        **params,
+        "session_id": UUID(params["session_id"]),
+        "upload_id": UUID(params["upload_id"]),
+    }
+    summary: dict[str, Any] = {}
+
+    async with asynccontextmanager(get_role_mapping_service)() as service:
+        async for event in service.stream_mappings_from_upload(**kwargs):
+            if event["type"] == "started":
+                await report_progress(0.0, f"Mapping {event['total_roles']} roles")
+            elif event["type"] == "batch":
+                completed, total = event["completed_roles"], event["total_roles"]
+                await report_progress(
+                    completed / total if total else 1.0,
+                    f"Mapped {completed} of {total} roles",
+                )
+            elif event["type"] == "done":
+                summary = {k: v for k, v in event.items() if k != "type"}
+
+    return summary
+
+
+@job_handler(ANALYSIS_JOB)
+async def run_analysis_job(
+    params: dict[str, Any],
+    report_progress: ProgressCallback,
+) -> dict[str, Any]:
+    """Run scoring analysis for a session, then generate roadmap candidates.
+
+    Args:
+        params: session_id (string), optional source ("tasks" or "activities")
+            and optional incremental flag.
+        report_progress: Progress callback.
+
+    Returns:
+        Dict with analysis status and the number of candidates generated.
+
+    Raises:
+        PermanentJobError: If the session does not exist.
+    """
+    from app.services.analysis_service import get_analysis_service
+    from app.services.roadmap_service import get_roadmap_service
+
+    session_id = UUID(params["session_id"])
+    await report_progress(0.0, "Scoring roles")
+
+    async with asynccontextmanager(get_analysis_service)() as service:
+        incremental = bool(params.get("incremental", False))
+        if params.get("source", "tasks") == "tasks":
+            result = await service.trigger_analysis_from_tasks(
+                session_id=session_id, incremental=incremental
+            )
+        else:
+            result = await service.trigger_analysis(
+                session_id=session_id, incremental=incremental
+            )
+
+    if result is None:
+        raise PermanentJobError(f"Session with ID {session_id} not found")
+
+    candidate_count = None
+    if result.get("status") == "completed":
+        await report_progress(0.8, "Generating roadmap candidates")
+        try:
+            async with asynccontextmanager(get_roadmap_service)() as roadmap_service:
+                candidates = await roadmap_service.generate_candidates(session_id=session_id)
+            candidate_count = len(candidates)
+        except Exception as e:
+            # Don't fail the analysis if candidate generation fails
+            logger.error(f"Failed to generate candidates for session {session_id}: {e}")
+
+    return {"status": result["status"], "candidate_count": candidate_count}
+
+
+@job_handler(ONET_SYNC_JOB)
+async def run_onet_sync_job(
+    params: dict[str, Any],
+    report_progress: ProgressCallback,
+) -> dict[str, Any]:
+    """Download and import an O*NET release.
+
+    Args:
+        params: version (e.g., "30_1").
+        report_progress: Progress callback.
+
+    Returns:
+        SyncResult fields.
+
+    Raises:
+        PermanentJobError: If the release files cannot be parsed.
+    """
+    from app.models.base import async_session_maker
+    from app.repositories.onet_repository import OnetRepository
+    from app.services.onet_file_sync_service import OnetFileSyncService, OnetParseError
+
+    version = params.get("version", "30_1")
+    await report_progress(0.0, f"Syncing O*NET {version.replace('_', '.')}")
+
+    async with async_session_maker() as db:
+        service = OnetFileSyncService(repository=OnetRepository(db))
+        try:
+            result = await service.sync(version=version)
+        except OnetParseError as e:
+            raise PermanentJobError(str(e)) from e
+
+    return asdict(result)
@@ -0,0 +1,419 @@
+# discovery/app/jobs/queue.py
+"""Background job queue with Redis and in-process backends.
+
+Long-running work (role mapping, analysis, O*NET sync) is enqueued here by
+the API and executed by JobWorker, either in a separate worker process
+(Redis backend) or inside the API process (in-memory backend, used for
+local development and tests).
+"""
+import asyncio
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job has reached a terminal state."""
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class Job:
+    """A background job and its progress.
+
+    Attributes:
+        id: Unique job ID.
+        type: Registered handler name (e.g., "role_mapping").
+        params: JSON-serializable handler parameters.
+        status: Current lifecycle state.
+        progress: Completion fraction between 0 and 1.
+        message: Latest human-readable progress message.
+        result: JSON-serializable handler result once succeeded.
+        error: Error message of the last failed attempt.
+        attempts: Number of attempts started so far.
+        max_attempts: Attempts allowed before the job is marked failed.
+        created_at: ISO timestamp when the job was enqueued.
+        started_at: ISO timestamp when the latest attempt started.
+        finished_at: ISO timestamp when the job reached a terminal state.
+    """
+
+    id: str
+    type: str
+    params: dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    message: str | None = None
+    result: Any = None
+    error: str | None = None
+    attempts: int = 0
+    max_attempts: int = 3
+    created_at: str = field(default_factory=_now)
+    started_at: str | None = None
+    finished_at: str | None = None
+
+    def to_json(self) -> str:
+        """Serialize the job for storage."""
+        data = asdict(self)
+        data["status"] = self.status.value
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "Job":
+        """Deserialize a stored job."""
+        data = json.loads(raw)
+        data["status"] = JobStatus(data["status"])
+        return cls(**data)
+
+
+class JobBackend(ABC):
+    """Storage and queue primitives used by JobQueue."""
+
+    @abstractmethod
+    async def save(self, job: Job) -> None:
+        """Persist the job's current state."""
+
+    @abstractmethod
+    async def load(self, job_id: str) -> Job | None:
+        """Load a job by ID, or None if unknown or expired."""
+
+    @abstractmethod
+    async def push(self, job_id: str) -> None:
+        """Append a job ID to the pending queue."""
+
+    @abstractmethod
+    async def pop(self, timeout: float) -> str | None:
+        """Take the next pending job ID, waiting up to timeout seconds."""
+
+    async def heartbeat(self, job_id: str) -> None:
+        """Extend the lease on a job taken with pop()."""
+
+    async def ack(self, job_id: str) -> None:
+        """Release a job taken with pop() once its attempt is over."""
+
+    async def reap_expired(self) -> list[str]:
+        """Release jobs whose lease expired and return their IDs.
+
+        Backends without leases never expire jobs.
+        """
+        return []
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+class InMemoryJobBackend(JobBackend):
+    """In-process backend for development and tests.
+
+    Jobs are stored serialized, so handlers see the same JSON round trip
+    as with Redis. Jobs are lost when the process exits.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, str] = {}
+        self._pending: asyncio.Queue[str] = asyncio.Queue()
+
+    async def save(self, job: Job) -> None:
+        self._jobs[job.id] = job.to_json()
+
+    async def load(self, job_id: str) -> Job | None:
+        raw = self._jobs.get(job_id)
+        return Job.from_json(raw) if raw else None
+
+    async def push(self, job_id: str) -> None:
+        await self._pending.put(job_id)
+
+    async def pop(self, timeout: float) -> str | None:
+        try:
+            return await asyncio.wait_for(self._pending.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class RedisJobBackend(JobBackend):
+    """Redis backend shared by API and worker processes.
+
+    Jobs are stored as JSON strings with a TTL. Pending job IDs are kept in
+    a list; pop() moves an ID atomically into a processing list with BLMOVE
+    and leases it in a sorted set scored by expiry time. Workers heartbeat
+    while a job runs, so a job whose lease expires belonged to a dead worker
+    and is handed back by reap_expired().
+    """
+
+    KEY_PREFIX = "discovery:jobs:"
+    QUEUE_KEY = "discovery:jobs:pending"
+    PROCESSING_KEY = "discovery:jobs:processing"
+    LEASES_KEY = "discovery:jobs:leases"
+
+    def __init__(self, redis_url: str, ttl_seconds: int, lease_seconds: int = 60) -> None:
+        """Initialize the backend.
+
+        Args:
+            redis_url: Redis connection URL.
+            ttl_seconds: How long job records are kept after their last update.
+            lease_seconds: How long a taken job stays leased without a heartbeat.
+
+        Raises:
+            RuntimeError: If the redis package is not installed.
+        """
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis package is required for JOB_BACKEND=redis"
+            ) from e
+
+        self._redis = redis.from_url(redis_url)
+        self._ttl_seconds = ttl_seconds
+        self._lease_seconds = lease_seconds
+
+    async def save(self, job: Job) -> None:
+        await self._redis.set(self.KEY_PREFIX + job.id, job.to_json(), ex=self._ttl_seconds)
+
+    async def load(self, job_id: str) -> Job | None:
+        raw = await self._redis.get(self.KEY_PREFIX + job_id)
+        return Job.from_json(raw) if raw else None
+
+    async def push(self, job_id: str) -> None:
+        await self._redis.lpush(self.QUEUE_KEY, job_id)
+
+    async def pop(self, timeout: float) -> str | None:
+        # BLMOVE takes whole seconds; 0 would block forever
+        job_id = await self._redis.blmove(
+            self.QUEUE_KEY,
+            self.PROCESSING_KEY,
+            timeout=max(1, int(timeout)),
+            src="RIGHT",
+            dest="LEFT",
+        )
+        if job_id is None:
+            return None
+        job_id = job_id.decode() if isinstance(job_id, bytes) else job_id
+        await self._redis.zadd(self.LEASES_KEY, {job_id: self._lease_expiry()})
+        return job_id
+
+    async def heartbeat(self, job_id: str) -> None:
+        # XX: never re-lease a job the reaper already handed back
+        await self._redis.zadd(self.LEASES_KEY, {job_id: self._lease_expiry()}, xx=True)
+
+    async def ack(self, job_id: str) -> None:
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.lrem(self.PROCESSING_KEY, 0, job_id)
+        pipe.zrem(self.LEASES_KEY, job_id)
+        await pipe.execute()
+
+    async def reap_expired(self) -> list[str]:
+        # A worker that died between BLMOVE and leasing leaves an unleased
+        # entry; lease it now (NX keeps live leases) so it expires normally
+        processing = await self._redis.lrange(self.PROCESSING_KEY, 0, -1)
+        if processing:
+            await self._redis.zadd(
+                self.LEASES_KEY,
+                {job_id: self._lease_expiry() for job_id in processing},
+                nx=True,
+            )
+
+        reaped = []
+        for job_id in await self._redis.zrangebyscore(self.LEASES_KEY, "-inf", time.time()):
+            # Only the reaper whose ZREM succeeds releases the job
+            if not await self._redis.zrem(self.LEASES_KEY, job_id):
+                continue
+            await self._redis.lrem(self.PROCESSING_KEY, 0, job_id)
+            reaped.append(job_id.decode() if isinstance(job_id, bytes) else job_id)
+        return reaped
+
+    def _lease_expiry(self) -> float:
+        return time.time() + self._lease_seconds
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class JobQueue:
+    """Enqueue jobs and track their state.
+
+    Attributes:
+        backend: Storage and queue backend.
+        default_max_attempts: Attempts allowed per job unless overridden.
+    """
+
+    def __init__(self, backend: JobBackend, default_max_attempts: int = 3) -> None:
+        """Initialize the queue.
+
+        Args:
+            backend: Storage and queue backend.
+            default_max_attempts: Attempts allowed per job unless overridden.
+        """
+        self.backend = backend
+        self.default_max_attempts = max(1, default_max_attempts)
+
+    async def enqueue(
+        self,
+        job_type: str,
+        params: dict[str, Any] | None = None,
+        max_attempts: int | None = None,
+    ) -> Job:
+        """Create a job and add it to the pending queue.
+
+        Args:
+            job_type: Registered handler name.
+            params: JSON-serializable handler parameters.
+            max_attempts: Attempts allowed before the job is marked failed.
+
+        Returns:
+            The queued Job.
+        """
+        job = Job(
+            id=str(uuid.uuid4()),
+            type=job_type,
+            params=params or {},
+            max_attempts=max_attempts or self.default_max_attempts,
+        )
+        await self.backend.save(job)
+        await self.backend.push(job.id)
+        logger.info(f"Enqueued {job_type} job {job.id}")
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        """Get a job by ID.
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            The Job, or None if unknown or expired.
+        """
+        return await self.backend.load(job_id)
+
+    async def save(self, job: Job) -> None:
+        """Persist a job's updated state."""
+        await self.backend.save(job)
+
+    async def requeue(self, job: Job) -> None:
+        """Mark a job queued again and add it back to the pending queue."""
+        job.status = JobStatus.QUEUED
+        await self.backend.save(job)
+        await self.backend.push(job.id)
+
+    async def next_job_id(self, timeout: float = 1.0) -> str | None:
+        """Take the next pending job ID, waiting up to timeout seconds.
+
+        The job stays leased to the caller until ack() is called.
+        """
+        return await self.backend.pop(timeout)
+
+    async def heartbeat(self, job_id: str) -> None:
+        """Extend the caller's lease on a job it is running."""
+        await self.backend.heartbeat(job_id)
+
+    async def ack(self, job_id: str) -> None:
+        """Release the caller's lease once a job attempt is over."""
+        await self.backend.ack(job_id)
+
+    async def recover_expired(self) -> list[Job]:
+        """Requeue jobs whose worker stopped heartbeating.
+
+        A job whose lost attempt was its last is marked failed instead.
+
+        Returns:
+            The recovered jobs in their updated state.
+        """
+        recovered = []
+        for job_id in await self.backend.reap_expired():
+            job = await self.backend.load(job_id)
+            if job is None or job.status.is_finished:
+                continue
+            if job.status is JobStatus.RUNNING and job.attempts >= job.max_attempts:
+                job.status = JobStatus.FAILED
+                job.error = "Worker lease expired"
+                job.finished_at = _now()
+                await self.backend.save(job)
+                logger.error(f"Job {job.id} failed: worker lease expired on its last attempt")
+            else:
+                job.message = "Requeued after worker lease expired"
+                await self.requeue(job)
+                logger.warning(f"Requeued job {job.id} after its worker lease expired")
+            recovered.append(job)
+        return recovered
+
+    async def report_progress(
+        self,
+        job_id: str,
+        progress: float,
+        message: str | None = None,
+    ) -> None:
+        """Update a running job's progress.
+
+        Args:
+            job_id: Job ID.
+            progress: Completion fraction; clamped to [0, 1].
+            message: Optional progress message.
+        """
+        job = await self.backend.load(job_id)
+        if job is None:
+            return
+        job.progress = min(1.0, max(0.0, progress))
+        if message is not None:
+            job.message = message
+        await self.backend.save(job)
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        await self.backend.close()
+
+
+def create_job_queue(settings: Settings) -> JobQueue:
+    """Create a job queue for the configured backend.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        JobQueue using Redis when JOB_BACKEND=redis, otherwise in-memory.
+    """
+    if settings.job_backend == "redis":
+        backend: JobBackend = RedisJobBackend(
+            settings.redis_url,
+            ttl_seconds=settings.job_result_ttl_seconds,
+            lease_seconds=settings.job_lease_seconds,
+        )
+    else:
+        backend = InMemoryJobBackend()
+    return JobQueue(backend, default_max_attempts=settings.job_max_attempts)
+
+
+_job_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue (FastAPI dependency).
+
+    Returns:
+        Shared JobQueue for the configured backend.
+    """
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = create_job_queue(get_settings())
+    return _job_queue
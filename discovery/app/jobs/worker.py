@@ -0,0 +1,280 @@
+# discovery/app/jobs/worker.py
+"""Background job worker.
+
+Runs inside the API process when JOB_WORKER_IN_PROCESS is set, or as a
+dedicated process:
+
+    python -m app.jobs.worker
+"""
+import asyncio
+import logging
+import random
+import signal
+from datetime import datetime, timezone
+from functools import partial
+
+from app.config import get_settings
+from app.jobs.handlers import JOB_HANDLERS, JobHandler, PermanentJobError
+from app.jobs.queue import Job, JobQueue, JobStatus, get_job_queue
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """Pulls jobs from a JobQueue and runs their handlers.
+
+    Failed attempts are retried with jittered exponential backoff until
+    the job's max_attempts is reached. PermanentJobError fails the job
+    immediately. Running jobs are heartbeated so their lease outlives the
+    attempt, and jobs whose lease expired (their worker died) are
+    periodically requeued.
+
+    Attributes:
+        queue: Queue to consume.
+        handlers: Mapping of job type to handler.
+        concurrency: Maximum number of jobs run at once.
+        lease_seconds: Lease length; heartbeats and reaping run well within it.
+    """
+
+    RETRY_BACKOFF_BASE = 2.0  # seconds
+    RETRY_BACKOFF_MAX = 60.0  # seconds
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: dict[str, JobHandler] | None = None,
+        concurrency: int = 1,
+        poll_timeout: float = 1.0,
+        lease_seconds: float = 60.0,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            queue: Queue to consume.
+            handlers: Mapping of job type to handler (defaults to all registered).
+            concurrency: Maximum number of jobs run at once.
+            poll_timeout: Seconds to wait for a job before re-checking for stop.
+            lease_seconds: Lease length configured on the queue backend.
+        """
+        self.queue = queue
+        self.handlers = handlers if handlers is not None else JOB_HANDLERS
+        self.concurrency = max(1, concurrency)
+        self.poll_timeout = poll_timeout
+        self.lease_seconds = lease_seconds
+        self._next_reap = 0.0
+        self._running = False
+        self._tasks: set[asyncio.Task] = set()
+        self._retry_tasks: set[asyncio.Task] = set()
+
+    async def run(self) -> None:
+        """Consume jobs until stop() is called."""
+        self._running = True
+        slots = asyncio.Semaphore(self.concurrency)
+        logger.info(f"Job worker started (concurrency={self.concurrency})")
+
+        while self._running:
+            await self._reap_if_due()
+            await slots.acquire()
+            try:
+                job_id = await self.queue.next_job_id(self.poll_timeout)
+            except Exception as e:
+                slots.release()
+                logger.error(f"Failed to poll job queue: {e}")
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            if job_id is None:
+                slots.release()
+                continue
+
+            self._spawn(self._execute_and_release(job_id, slots))
+
+        logger.info("Job worker stopped")
+
+    async def stop(self) -> None:
+        """Stop polling and wait for running jobs to finish.
+
+        Jobs waiting out a retry delay are requeued immediately so another
+        worker can pick them up.
+        """
+        self._running = False
+        for task in self._retry_tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def execute(self, job_id: str) -> Job | None:
+        """Run one attempt of a job.
+
+        Args:
+            job_id: ID of the job to run.
+
+        Returns:
+            The job's state after the attempt, or None if the job is unknown.
+        """
+        job = await self.queue.get(job_id)
+        if job is None or job.status.is_finished:
+            return job
+
+        handler = self.handlers.get(job.type)
+        if handler is None:
+            job.status = JobStatus.FAILED
+            job.error = f"Unknown job type: {job.type}"
+            job.finished_at = _now()
+            await self.queue.save(job)
+            return job
+
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.started_at = _now()
+        job.error = None
+        await self.queue.save(job)
+        logger.info(f"Running {job.type} job {job.id} (attempt {job.attempts}/{job.max_attempts})")
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            result = await handler(job.params, partial(self.queue.report_progress, job.id))
+        except Exception as e:
+            return await self._handle_failure(job_id, e)
+        finally:
+            heartbeat.cancel()
+
+        # Reload to keep progress written by the handler
+        job = await self.queue.get(job_id) or job
+        job.status = JobStatus.SUCCEEDED
+        job.progress = 1.0
+        job.result = result
+        job.finished_at = _now()
+        await self.queue.save(job)
+        logger.info(f"Job {job.id} succeeded")
+        return job
+
+    async def _handle_failure(self, job_id: str, error: Exception) -> Job | None:
+        """Schedule a retry or mark the job failed.
+
+        Args:
+            job_id: ID of the failed job.
+            error: Exception raised by the handler.
+
+        Returns:
+            The job's updated state.
+        """
+        job = await self.queue.get(job_id)
+        if job is None:
+            return None
+
+        job.error = str(error) or type(error).__name__
+
+        if isinstance(error, PermanentJobError) or job.attempts >= job.max_attempts:
+            job.status = JobStatus.FAILED
+            job.finished_at = _now()
+            await self.queue.save(job)
+            logger.error(f"Job {job.id} failed after {job.attempts} attempt(s): {error}")
+            return job
+
+        delay = self._retry_delay(job.attempts)
+        job.status = JobStatus.QUEUED
+        job.message = f"Retrying in {delay:.0f}s"
+        await self.queue.save(job)
+        logger.warning(f"Job {job.id} attempt {job.attempts} failed, retrying in {delay:.1f}s: {error}")
+
+        self._retry_tasks.add(self._spawn(self._requeue_later(job, delay)))
+        return job
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Jittered exponential backoff delay for a retry.
+
+        Args:
+            attempt: Number of attempts made so far (1-based).
+
+        Returns:
+            Delay in seconds.
+        """
+        delay = min(self.RETRY_BACKOFF_MAX, self.RETRY_BACKOFF_BASE * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _requeue_later(self, job: Job, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._retry_tasks.discard(asyncio.current_task())
+            await self.queue.requeue(job)
+
+    async def _heartbeat(self, job_id: str) -> None:
+        """Keep extending a running job's lease."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await self.queue.heartbeat(job_id)
+            except Exception as e:
+                logger.warning(f"Failed to heartbeat job {job_id}: {e}")
+
+    async def _reap_if_due(self) -> None:
+        """Requeue jobs with expired leases, at most every half lease."""
+        now = asyncio.get_running_loop().time()
+        if now < self._next_reap:
+            return
+        self._next_reap = now + self.lease_seconds / 2
+        try:
+            await self.queue.recover_expired()
+        except Exception as e:
+            logger.error(f"Failed to recover expired jobs: {e}")
+
+    async def _execute_and_release(self, job_id: str, slots: asyncio.Semaphore) -> None:
+        try:
+            await self.execute(job_id)
+        except Exception as e:
+            logger.error(f"Unexpected error running job {job_id}: {e}")
+        finally:
+            slots.release()
+            try:
+                await self.queue.ack(job_id)
+            except Exception as e:
+                logger.error(f"Failed to release job {job_id}: {e}")
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+async def run_worker() -> None:
+    """Run a dedicated worker process until SIGINT/SIGTERM."""
+    settings = get_settings()
+    if settings.job_backend != "redis":
+        logger.warning(
+            "JOB_BACKEND is not 'redis'; a separate worker process cannot see "
+            "jobs enqueued by the API"
+        )
+
+    queue = get_job_queue()
+    worker = JobWorker(
+        queue,
+        concurrency=settings.job_worker_concurrency,
+        lease_seconds=settings.job_lease_seconds,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: asyncio.ensure_future(worker.stop()))
+
+    try:
+        await worker.run()
+    finally:
+        await worker.stop()
+        await queue.close()
+
+
+def main() -> None:
+    """Entry point for python -m app.jobs.worker."""
+    logging.basicConfig(level=get_settings().log_level)
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
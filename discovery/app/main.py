@@ -1,4 +1,5 @@
 """Main FastAPI application for the Discovery module."""
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -6,6 +7,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
+from app.jobs.queue import get_job_queue
+from app.jobs.worker import JobWorker
 from app.middleware.error_handler import add_exception_handlers
 from app.middleware.session_save import AutoSaveMiddleware
 from app.routers import (
@@ -16,7 +19,9 @@ from app.routers import (
     exports_router,
     handoff_router,
     industry_router,
+    jobs_router,
     lob_mappings_router,
+    portfolio_router,
     roadmap_router,
     role_mappings_router,
     sessions_router,
@@ -29,6 +34,10 @@ logger = logging.getLogger(__name__)
 # Global middleware instance for dependency injection
 _auto_save_middleware: AutoSaveMiddleware | None = None
 
+# In-process background job worker (when JOB_WORKER_IN_PROCESS is set)
+_job_worker: JobWorker | None = None
+_job_worker_task: asyncio.Task | None = None
+
 
 def get_auto_save_middleware() -> AutoSaveMiddleware | None:
     """Get the auto-save middleware instance."""
@@ -42,14 +51,33 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events, including flushing
     pending session saves on shutdown.
     """
-    global _auto_save_middleware
+    global _auto_save_middleware, _job_worker, _job_worker_task
 
     # Startup: Initialize auto-save middleware
     # Note: In production, SessionService would be properly initialized with DB session
     # For now, we initialize with a placeholder that can be replaced via dependency injection
     logger.info("Starting Discovery API")
+
+    # Startup: Run background jobs in this process unless a separate worker handles them
+    settings = get_settings()
+    if settings.job_worker_in_process:
+        _job_worker = JobWorker(
+            get_job_queue(),
+            concurrency=settings.job_worker_concurrency,
+            lease_seconds=settings.job_lease_seconds,
+        )
+        _job_worker_task = asyncio.create_task(_job_worker.run())
+
     yield
 
+    # Shutdown: Let running jobs finish
+    if _job_worker is not None:
+        await _job_worker.stop()
+        if _job_worker_task is not None:
+            await _job_worker_task
+        _job_worker = None
+        _job_worker_task = None
+
     # Shutdown: Flush any pending session saves
     if _auto_save_middleware is not None:
         try:
@@ -99,6 +127,8 @@ app.include_router(activities_router)
 app.include_router(tasks_router)
 app.include_router(analysis_router)
 app.include_router(roadmap_router)
+app.include_router(portfolio_router)
 app.include_router(chat_router)
 app.include_router(exports_router)
 app.include_router(handoff_router)
+app.include_router(jobs_router)
@@ -4,16 +4,24 @@ from app.models.onet_occupation import OnetAlternateTitle, OnetOccupation, OnetS
 from app.models.onet_occupation_industry import OnetOccupationIndustry
 from app.models.naics_code import NaicsCode
 from app.models.lob_naics_mapping import LobNaicsMapping
-from app.models.onet_work_activities import OnetGWA, OnetIWA, OnetDWA
+from app.models.onet_work_activities import (
+    OnetDWA,
+    OnetExposureState,
+    OnetGWA,
+    OnetIWA,
+    dwa_effective_exposure,
+)
 from app.models.onet_task import OnetTask, OnetTaskToDWA
 from app.models.onet_skills import OnetSkill, OnetTechnologySkill
 from app.models.discovery_session import DiscoverySession, SessionStatus
 from app.models.discovery_upload import DiscoveryUpload
 from app.models.discovery_role_mapping import DiscoveryRoleMapping
+from app.models.role_mapping_cache import RoleMappingCacheEntry
 from app.models.discovery_activity_selection import DiscoveryActivitySelection
 from app.models.discovery_task_selection import DiscoveryTaskSelection
 from app.models.discovery_analysis import DiscoveryAnalysisResult, AnalysisDimension
 from app.models.agentification_candidate import AgentificationCandidate, PriorityTier
+from app.models.portfolio_rollup import DiscoveryPortfolioRollup, RollupDimension
 
 __all__ = [
     # Base
@@ -30,6 +38,8 @@ __all__ = [
     "OnetGWA",
     "OnetIWA",
     "OnetDWA",
+    "dwa_effective_exposure",
+    "OnetExposureState",
     "OnetTask",
     "OnetTaskToDWA",
     "OnetSkill",
@@ -39,10 +49,13 @@ __all__ = [
     "SessionStatus",
     "DiscoveryUpload",
     "DiscoveryRoleMapping",
+    "RoleMappingCacheEntry",
     "DiscoveryActivitySelection",
     "DiscoveryTaskSelection",
     "DiscoveryAnalysisResult",
     "AnalysisDimension",
     "AgentificationCandidate",
     "PriorityTier",
+    "DiscoveryPortfolioRollup",
+    "RollupDimension",
 ]
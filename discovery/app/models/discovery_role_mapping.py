@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import String, DateTime, Float, Boolean, Integer, ForeignKey, func
+from sqlalchemy import BigInteger, String, DateTime, Float, Boolean, Integer, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,13 +42,25 @@ class DiscoveryRoleMapping(Base):
     row_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     # LOB-aware matching fields
     lob_value: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    department_value: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    geography_value: Mapped[str | None] = mapped_column(String(255), nullable=True)
     naics_codes: Mapped[list[str] | None] = mapped_column(ARRAY(String(6)), nullable=True)
     industry_match_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Session selection_version at which this mapping's selections last changed
+    selection_version: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
 
     # Relationships
     session: Mapped["DiscoverySession"] = relationship(back_populates="role_mappings")
@@ -3,7 +3,7 @@ import enum
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import String, DateTime, Integer, Enum, func, CheckConstraint
+from sqlalchemy import BigInteger, String, DateTime, Integer, Enum, func, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -44,6 +44,15 @@ class DiscoverySession(Base):
     industry_naics_sector: Mapped[str | None] = mapped_column(
         String(2), nullable=True, index=True
     )
+    # Bumped on every task/activity selection write (see selection_tracking)
+    selection_version: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", nullable=False
+    )
+    # selection_version reflected by the stored analysis, and its source
+    analyzed_version: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    analysis_source: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    # OnetExposureState.version the stored analysis was scored against
+    analyzed_exposure_version: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
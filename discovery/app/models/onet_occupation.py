@@ -5,8 +5,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import Computed, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -34,6 +34,16 @@ class OnetOccupation(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+    # Full-text search document: title weighted A, description weighted B
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Relationships
     alternate_titles: Mapped[list["OnetAlternateTitle"]] = relationship(
@@ -75,6 +85,12 @@ class OnetAlternateTitle(Base):
         index=True,
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    # Full-text search document for the alternate title
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', title)", persisted=True),
+        deferred=True,
+    )
 
     # Relationships
     occupation: Mapped["OnetOccupation"] = relationship(back_populates="alternate_titles")
@@ -1,7 +1,19 @@
 """O*NET Work Activity models (GWA, IWA, DWA hierarchy)."""
 from datetime import datetime
 
-from sqlalchemy import String, Text, DateTime, Float, ForeignKey, func
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    Float,
+    ForeignKey,
+    SmallInteger,
+    String,
+    Text,
+    column,
+    func,
+    table,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -94,3 +106,39 @@ class OnetDWA(Base):
 
     def __repr__(self) -> str:
         return f"<OnetDWA(id={self.id}, name={self.name})>"
+
+
+# Materialized view of each DWA's effective AI exposure: its override, else
+# its parent GWA's score (NULL if neither is set). Read-only and kept out of
+# Base.metadata; created by migration 021 and refreshed through
+# OnetRepository.refresh_dwa_effective_exposure.
+dwa_effective_exposure = table(
+    "dwa_effective_exposure",
+    column("dwa_id", String),
+    column("gwa_id", String),
+    column("exposure", Float),
+)
+
+
+class OnetExposureState(Base):
+    """Version of the effective DWA exposure data (a single row).
+
+    Bumped by OnetRepository.refresh_dwa_effective_exposure, so anything
+    scored from dwa_effective_exposure can record the version it saw and
+    detect later GWA score or DWA override changes.
+    """
+    __tablename__ = "onet_exposure_state"
+    __table_args__ = (CheckConstraint("id = 1", name="ck_onet_exposure_state_single_row"),)
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", nullable=False
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<OnetExposureState(version={self.version})>"
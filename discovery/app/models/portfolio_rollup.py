@@ -0,0 +1,64 @@
+"""Organization portfolio rollup model."""
+import enum
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class RollupDimension(str, enum.Enum):
+    """Dimension a portfolio rollup row groups roles by."""
+    OCCUPATION = "occupation"
+    LOB = "lob"
+
+
+class DiscoveryPortfolioRollup(Base):
+    """Additive per-session partial sums of role analysis results.
+
+    One row per (session, dimension, dimension value, priority tier). Rows
+    of a session are rebuilt whenever its analysis results are replaced, so
+    organization-wide portfolio views only sum these rows instead of
+    scanning every session's results and role mappings.
+    """
+    __tablename__ = "discovery_portfolio_rollups"
+    __table_args__ = (
+        Index("idx_portfolio_rollups_org_dimension", "organization_id", "dimension"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    organization_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
+    session_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("discovery_sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    dimension: Mapped[str] = mapped_column(String(20), nullable=False)
+    # O*NET code or LOB value; None for unmapped roles or roles without a LOB
+    dimension_value: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # O*NET occupation title for the occupation dimension
+    label: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    priority_tier: Mapped[str] = mapped_column(String(20), nullable=False)
+    role_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    headcount: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Sums of scores weighted by headcount, and unweighted sums for groups
+    # without headcount
+    exposure_weighted_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    priority_weighted_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    exposure_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    priority_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<DiscoveryPortfolioRollup(session={self.session_id}, "
+            f"{self.dimension}={self.dimension_value}, tier={self.priority_tier})>"
+        )
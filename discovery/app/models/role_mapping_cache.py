@@ -0,0 +1,57 @@
+"""Role mapping cache model."""
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class RoleMappingCacheEntry(Base):
+    """Cached LLM role-to-O*NET mapping shared across discovery sessions.
+
+    Keyed by normalized role title. Entries are versioned by O*NET release
+    and LLM model so a mapping is only reused while both are unchanged.
+    Only confident (HIGH/MEDIUM) LLM answers are stored.
+    """
+
+    __tablename__ = "role_mapping_cache"
+    __table_args__ = (
+        UniqueConstraint(
+            "normalized_title",
+            "onet_version",
+            "model",
+            name="uq_role_mapping_cache_key",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    normalized_title: Mapped[str] = mapped_column(String(255), nullable=False)
+    onet_version: Mapped[str] = mapped_column(String(20), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    onet_code: Mapped[str] = mapped_column(
+        String(10),
+        ForeignKey("onet_occupations.code", ondelete="CASCADE"),
+        nullable=False,
+    )
+    onet_title: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    confidence: Mapped[str] = mapped_column(String(10), nullable=False)
+    reasoning: Mapped[str | None] = mapped_column(Text, nullable=True)
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    last_hit_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RoleMappingCacheEntry(title={self.normalized_title}, "
+            f"onet={self.onet_code}, version={self.onet_version})>"
+        )
@@ -3,20 +3,24 @@ from app.repositories.onet_repository import OnetRepository
 from app.repositories.session_repository import SessionRepository
 from app.repositories.upload_repository import UploadRepository
 from app.repositories.role_mapping_repository import RoleMappingRepository
+from app.repositories.role_mapping_cache_repository import RoleMappingCacheRepository
 from app.repositories.analysis_repository import AnalysisRepository
 from app.repositories.activity_selection_repository import ActivitySelectionRepository
 from app.repositories.task_selection_repository import TaskSelectionRepository
 from app.repositories.candidate_repository import CandidateRepository
 from app.repositories.lob_mapping_repository import LobMappingRepository
+from app.repositories.portfolio_repository import PortfolioRepository
 
 __all__ = [
     "OnetRepository",
     "SessionRepository",
     "UploadRepository",
     "RoleMappingRepository",
+    "RoleMappingCacheRepository",
     "AnalysisRepository",
     "ActivitySelectionRepository",
     "TaskSelectionRepository",
     "CandidateRepository",
     "LobMappingRepository",
+    "PortfolioRepository",
 ]
@@ -3,10 +3,19 @@
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.discovery_activity_selection import DiscoveryActivitySelection
+from app.models.onet_work_activities import dwa_effective_exposure
+from app.repositories.selection_tracking import (
+    mark_selections_changed,
+    mark_session_selections_changed,
+)
+
+# Exposure assumed for a DWA without an effective exposure score
+DEFAULT_DWA_EXPOSURE = 0.5
 
 
 class ActivitySelectionRepository:
@@ -22,6 +31,9 @@ class ActivitySelectionRepository:
         """Create multiple activity selections."""
         db_selections = [DiscoveryActivitySelection(**s) for s in selections]
         self.session.add_all(db_selections)
+        await mark_selections_changed(
+            self.session, [s.role_mapping_id for s in db_selections]
+        )
         await self.session.commit()
         for s in db_selections:
             await self.session.refresh(s)
@@ -51,6 +63,59 @@ class ActivitySelectionRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def get_exposure_summaries(
+        self,
+        session_id: UUID,
+        sample_size: int = 5,
+        role_mapping_ids: list[UUID] | None = None,
+    ) -> Sequence[Row]:
+        """Summarize selected-DWA exposure per role mapping in one query.
+
+        Each DWA's effective exposure is read from dwa_effective_exposure
+        (its override, else its parent GWA's score), falling back to
+        DEFAULT_DWA_EXPOSURE, also for DWAs missing from O*NET. Mappings
+        without selected DWAs are not returned.
+
+        Args:
+            session_id: Discovery session ID.
+            sample_size: Number of exposure scores to include per mapping.
+            role_mapping_ids: Restrict to these mappings; None for all.
+
+        Returns:
+            Rows of (role_mapping_id, dwa_count, avg_exposure, sample_scores),
+            with sample_scores ordered by DWA ID.
+        """
+        exposure = func.coalesce(
+            dwa_effective_exposure.c.exposure,
+            DEFAULT_DWA_EXPOSURE,
+        )
+        sample_scores = func.array_agg(
+            aggregate_order_by(exposure, DiscoveryActivitySelection.dwa_id)
+        )[1:sample_size]
+
+        stmt = (
+            select(
+                DiscoveryActivitySelection.role_mapping_id,
+                func.count().label("dwa_count"),
+                func.avg(exposure).label("avg_exposure"),
+                sample_scores.label("sample_scores"),
+            )
+            .select_from(DiscoveryActivitySelection)
+            .outerjoin(
+                dwa_effective_exposure,
+                dwa_effective_exposure.c.dwa_id == DiscoveryActivitySelection.dwa_id,
+            )
+            .where(
+                DiscoveryActivitySelection.session_id == session_id,
+                DiscoveryActivitySelection.selected.is_(True),
+            )
+            .group_by(DiscoveryActivitySelection.role_mapping_id)
+        )
+        if role_mapping_ids is not None:
+            stmt = stmt.where(DiscoveryActivitySelection.role_mapping_id.in_(role_mapping_ids))
+        result = await self.session.execute(stmt)
+        return result.all()
+
     async def update_selection(
         self,
         selection_id: UUID,
@@ -66,6 +131,7 @@ class ActivitySelectionRepository:
         if selection:
             selection.selected = selected
             selection.user_modified = True
+            await mark_selections_changed(self.session, [selection.role_mapping_id])
             await self.session.commit()
             await self.session.refresh(selection)
         return selection
@@ -81,5 +147,6 @@ class ActivitySelectionRepository:
         count = len(selections)
         for s in selections:
             await self.session.delete(s)
+        await mark_session_selections_changed(self.session, session_id)
         await self.session.commit()
         return count
@@ -2,10 +2,13 @@
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.discovery_analysis import DiscoveryAnalysisResult, AnalysisDimension
+from app.models.discovery_session import DiscoverySession
+from app.models.onet_work_activities import OnetExposureState
+from app.repositories.portfolio_repository import PortfolioRepository
 
 
 class AnalysisRepository:
@@ -32,6 +35,113 @@ class AnalysisRepository:
             await self.session.refresh(result)
         return db_results
 
+    async def replace_results(
+        self,
+        session_id: UUID,
+        role_results: list[dict],
+        dimension_results: list[dict],
+        analyzed_version: int,
+        analysis_source: str,
+        role_mapping_ids: list[UUID] | None = None,
+        analyzed_exposure_version: int | None = None,
+    ) -> int:
+        """Replace analysis results and record what the analysis reflects.
+
+        Deletes the session's ROLE results (only those of role_mapping_ids
+        when given) and all of its other dimension results, bulk inserts
+        the new ones, stores analyzed_version, analyzed_exposure_version
+        and analysis_source on the session and rebuilds the session's
+        portfolio rollup rows, all in one transaction.
+
+        Args:
+            session_id: Discovery session ID.
+            role_results: New ROLE result dicts.
+            dimension_results: New result dicts for every other dimension,
+                covering all of the session's mappings.
+            analyzed_version: Session selection_version the results reflect.
+            analysis_source: "tasks" or "activities".
+            role_mapping_ids: Mappings being re-scored, or None for all.
+            analyzed_exposure_version: Exposure version the results were
+                scored against.
+
+        Returns:
+            Number of results inserted.
+        """
+        stmt = delete(DiscoveryAnalysisResult).where(
+            DiscoveryAnalysisResult.session_id == session_id
+        )
+        if role_mapping_ids is not None:
+            stmt = stmt.where(
+                or_(
+                    DiscoveryAnalysisResult.dimension != AnalysisDimension.ROLE,
+                    DiscoveryAnalysisResult.role_mapping_id.in_(role_mapping_ids),
+                )
+            )
+        await self.session.execute(stmt)
+
+        results = role_results + dimension_results
+        if results:
+            await self.session.execute(insert(DiscoveryAnalysisResult), results)
+
+        await self.session.execute(
+            update(DiscoverySession)
+            .where(DiscoverySession.id == session_id)
+            .values(
+                analyzed_version=analyzed_version,
+                analyzed_exposure_version=analyzed_exposure_version,
+                analysis_source=analysis_source,
+            )
+        )
+        await PortfolioRepository(self.session).refresh_session(session_id)
+        await self.session.commit()
+        return len(results)
+
+    async def get_analysis_state(self, session_id: UUID) -> Row | None:
+        """Get a session's selection version and what its analysis reflects.
+
+        Args:
+            session_id: Discovery session ID.
+
+        Returns:
+            Row of (selection_version, analyzed_version, analysis_source,
+            analyzed_exposure_version, exposure_version), where
+            exposure_version is the current OnetExposureState version, or
+            None if the session does not exist.
+        """
+        exposure_version = (
+            select(OnetExposureState.version)
+            .where(OnetExposureState.id == 1)
+            .scalar_subquery()
+        )
+        stmt = select(
+            DiscoverySession.selection_version,
+            DiscoverySession.analyzed_version,
+            DiscoverySession.analysis_source,
+            DiscoverySession.analyzed_exposure_version,
+            exposure_version.label("exposure_version"),
+        ).where(DiscoverySession.id == session_id)
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
+    async def get_role_row_counts(self, session_id: UUID) -> dict[UUID, int | None]:
+        """Get the headcount each stored ROLE result was scored with.
+
+        Args:
+            session_id: Discovery session ID.
+
+        Returns:
+            Dict of role mapping ID to the row_count of its ROLE result.
+        """
+        stmt = select(
+            DiscoveryAnalysisResult.role_mapping_id,
+            DiscoveryAnalysisResult.row_count,
+        ).where(
+            DiscoveryAnalysisResult.session_id == session_id,
+            DiscoveryAnalysisResult.dimension == AnalysisDimension.ROLE,
+        )
+        result = await self.session.execute(stmt)
+        return {row.role_mapping_id: row.row_count for row in result.all()}
+
     async def get_for_session(
         self,
         session_id: UUID,
@@ -3,12 +3,19 @@ import logging
 from typing import Any, Sequence
 import uuid
 
-from sqlalchemy import delete, func, select, text
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Text, bindparam, delete, func, literal, select, text, true, union_all, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models import OnetOccupation, OnetGWA, OnetIWA, OnetDWA
+from app.models import (
+    OnetDWA,
+    OnetExposureState,
+    OnetGWA,
+    OnetIWA,
+    OnetOccupation,
+    dwa_effective_exposure,
+)
 from app.models.onet_occupation import OnetAlternateTitle, OnetSyncLog
 from app.models.onet_occupation_industry import OnetOccupationIndustry
 from app.models.onet_task import OnetTask, OnetTaskToDWA
@@ -19,6 +26,9 @@ logger = logging.getLogger(__name__)
 # With 3-4 columns per row, 5000 rows uses 15000-20000 parameters (safely under limit)
 BULK_INSERT_BATCH_SIZE = 5000
 
+# Number of queries sent per batched full-text search statement
+BATCH_SEARCH_CHUNK_SIZE = 500
+
 
 def _escape_ilike(value: str) -> str:
     """Escape special characters for ILIKE pattern matching.
@@ -91,12 +101,13 @@ class OnetRepository:
     ) -> list[OnetOccupation]:
         """Search occupations using PostgreSQL full-text search.
 
-        Searches occupation titles and descriptions using GIN indexes.
-        If fewer than `limit` results are found, also searches alternate
-        titles to backfill remaining slots.
+        Searches the stored, GIN-indexed search vectors of occupation titles
+        and descriptions. If fewer than `limit` results are found, also
+        searches alternate titles to backfill remaining slots.
 
-        Results are ranked by PostgreSQL's text search ranking algorithm
-        based on term frequency and document position.
+        Results are ordered by ts_rank. Title terms carry weight A and
+        description terms weight B, so title matches rank first; backfilled
+        occupations are ordered by their best-matching alternate title.
 
         Args:
             query: Search query string (max 500 characters).
@@ -122,14 +133,11 @@ class OnetRepository:
         search_query = func.plainto_tsquery("english", query)
 
         # Search main occupations by title and description
+        rank = func.ts_rank(OnetOccupation.search_vector, search_query)
         stmt = (
             select(OnetOccupation)
-            .where(
-                func.to_tsvector(
-                    "english",
-                    OnetOccupation.title + " " + func.coalesce(OnetOccupation.description, "")
-                ).op("@@")(search_query)
-            )
+            .where(OnetOccupation.search_vector.op("@@")(search_query))
+            .order_by(rank.desc(), OnetOccupation.code)
             .limit(limit)
         )
 
@@ -141,28 +149,153 @@ class OnetRepository:
             remaining = limit - len(occupations)
             existing_codes = {occ.code for occ in occupations}
 
+            alt_rank = func.max(func.ts_rank(OnetAlternateTitle.search_vector, search_query))
             alt_stmt = (
                 select(OnetOccupation)
                 .join(OnetAlternateTitle)
-                .where(
-                    func.to_tsvector("english", OnetAlternateTitle.title).op("@@")(search_query)
-                )
+                .where(OnetAlternateTitle.search_vector.op("@@")(search_query))
+                .group_by(OnetOccupation.code)
             )
             if existing_codes:
                 alt_stmt = alt_stmt.where(OnetOccupation.code.notin_(existing_codes))
-            alt_stmt = alt_stmt.limit(remaining)
+            alt_stmt = alt_stmt.order_by(alt_rank.desc(), OnetOccupation.code).limit(remaining)
 
             alt_result = await self.session.execute(alt_stmt)
             occupations.extend(alt_result.scalars().all())
 
         return occupations
 
+    async def search_with_full_text_batch(
+        self,
+        queries: list[str],
+        limit: int = 20,
+    ) -> dict[str, list[OnetOccupation]]:
+        """Search occupations for many queries in a single round trip.
+
+        Batched equivalent of search_with_full_text: the queries are sent
+        as one array, unnested with their ordinal, and each row is joined
+        LATERAL to the title/description search plus the alternate-title
+        backfill. Matching occupations are then loaded in one query, so a
+        chunk of up to BATCH_SEARCH_CHUNK_SIZE queries costs two statements.
+
+        Args:
+            queries: Search query strings (each max 500 characters).
+            limit: Maximum number of results per query.
+
+        Returns:
+            Dict mapping each input query to its matching OnetOccupation
+            objects. Empty/whitespace-only queries map to an empty list.
+
+        Raises:
+            ValueError: If any query exceeds MAX_QUERY_LENGTH.
+        """
+        results: dict[str, list[OnetOccupation]] = {query: [] for query in queries}
+
+        # Input validation; identical stripped queries are searched once
+        stripped: dict[str, str] = {}
+        for query in queries:
+            if not query or not query.strip():
+                continue
+            if len(query.strip()) > self.MAX_QUERY_LENGTH:
+                raise ValueError(
+                    f"Query exceeds maximum length of {self.MAX_QUERY_LENGTH} characters"
+                )
+            stripped[query] = query.strip()
+
+        unique_queries = list(dict.fromkeys(stripped.values()))
+        codes_by_query: dict[str, list[str]] = {}
+
+        for i in range(0, len(unique_queries), BATCH_SEARCH_CHUNK_SIZE):
+            chunk = unique_queries[i:i + BATCH_SEARCH_CHUNK_SIZE]
+            rows = await self.session.execute(self._build_batch_search_stmt(chunk, limit))
+
+            # Main matches come before alternate-title backfill, as in
+            # search_with_full_text, each ordered by rank; duplicates keep
+            # their first position
+            ordered: dict[int, list[str]] = {}
+            rows_by_rank = sorted(rows.all(), key=lambda r: (r[0], r[2], -r[3], r[1]))
+            for ordinal, code, _source, _rank in rows_by_rank:
+                codes = ordered.setdefault(ordinal, [])
+                if code not in codes and len(codes) < limit:
+                    codes.append(code)
+
+            for ordinal, codes in ordered.items():
+                codes_by_query[chunk[ordinal - 1]] = codes
+
+        all_codes = {code for codes in codes_by_query.values() for code in codes}
+        if not all_codes:
+            return results
+
+        occ_result = await self.session.execute(
+            select(OnetOccupation).where(OnetOccupation.code.in_(all_codes))
+        )
+        occupations_by_code = {occ.code: occ for occ in occ_result.scalars().all()}
+
+        for query, key in stripped.items():
+            results[query] = [
+                occupations_by_code[code]
+                for code in codes_by_query.get(key, [])
+                if code in occupations_by_code
+            ]
+
+        return results
+
+    def _build_batch_search_stmt(self, queries: list[str], limit: int):
+        """Build the LATERAL full-text search statement for a query chunk.
+
+        Args:
+            queries: Stripped, validated query strings.
+            limit: Maximum number of results per query and source.
+
+        Returns:
+            Select yielding (ordinal, code, source, rank) rows, where ordinal
+            is the 1-based query position and source is 0 for
+            title/description matches and 1 for alternate-title matches.
+        """
+        query_rows = (
+            func.unnest(bindparam("queries", value=queries, type_=ARRAY(Text)))
+            .table_valued("query", with_ordinality="ordinal")
+            .render_derived(name="q")
+        )
+        search_query = func.plainto_tsquery("english", query_rows.c.query)
+
+        main_rank = func.ts_rank(OnetOccupation.search_vector, search_query)
+        main_stmt = (
+            select(
+                OnetOccupation.code.label("code"),
+                literal(0).label("source"),
+                main_rank.label("rank"),
+            )
+            .where(OnetOccupation.search_vector.op("@@")(search_query))
+            .order_by(main_rank.desc(), OnetOccupation.code)
+            .limit(limit)
+        )
+        alt_rank = func.max(func.ts_rank(OnetAlternateTitle.search_vector, search_query))
+        alt_stmt = (
+            select(
+                OnetAlternateTitle.onet_code.label("code"),
+                literal(1).label("source"),
+                alt_rank.label("rank"),
+            )
+            .where(OnetAlternateTitle.search_vector.op("@@")(search_query))
+            .group_by(OnetAlternateTitle.onet_code)
+            .order_by(alt_rank.desc(), OnetAlternateTitle.onet_code)
+            .limit(limit)
+        )
+        matches = union_all(main_stmt, alt_stmt).subquery("matches").lateral()
+
+        return (
+            select(query_rows.c.ordinal, matches.c.code, matches.c.source, matches.c.rank)
+            .select_from(query_rows)
+            .join(matches, true())
+        )
+
     async def search_alternate_titles(
         self,
         query: str,
         limit: int = 20,
     ) -> Sequence[OnetAlternateTitle]:
-        """Search alternate titles using full-text search.
+        """Search alternate titles using full-text search, best matches first.
 
         Args:
             query: Search query string (max 500 characters).
@@ -189,8 +322,10 @@ class OnetRepository:
 
         stmt = (
             select(OnetAlternateTitle)
-            .where(
-                func.to_tsvector("english", OnetAlternateTitle.title).op("@@")(search_query)
+            .where(OnetAlternateTitle.search_vector.op("@@")(search_query))
+            .order_by(
+                func.ts_rank(OnetAlternateTitle.search_vector, search_query).desc(),
+                OnetAlternateTitle.title,
             )
             .limit(limit)
         )
@@ -248,6 +383,21 @@ class OnetRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def get_all_alternate_titles(self) -> list[tuple[str, str]]:
+        """Get all alternate titles as (occupation_code, title) pairs.
+
+        Selects only the two columns, for building in-memory search indexes.
+
+        Returns:
+            List of (onet_code, title) tuples ordered by occupation code.
+        """
+        stmt = (
+            select(OnetAlternateTitle.onet_code, OnetAlternateTitle.title)
+            .order_by(OnetAlternateTitle.onet_code, OnetAlternateTitle.title)
+        )
+        result = await self.session.execute(stmt)
+        return [(code, title) for code, title in result.all()]
+
     async def get_gwas(self) -> Sequence[OnetGWA]:
         """Get all Generalized Work Activities.
 
@@ -292,7 +442,8 @@ class OnetRepository:
             dwa_ids: List of DWA IDs to retrieve.
 
         Returns:
-            List of dicts with DWA and GWA data.
+            List of dicts with DWA and GWA data. ai_exposure_score is the
+            DWA's effective exposure from dwa_effective_exposure.
         """
         if not dwa_ids:
             return []
@@ -307,9 +458,14 @@ class OnetRepository:
                 OnetGWA.id.label("gwa_id"),
                 OnetGWA.name.label("gwa_name"),
                 OnetGWA.ai_exposure_score.label("gwa_ai_exposure_score"),
+                dwa_effective_exposure.c.exposure.label("ai_exposure_score"),
             )
             .join(OnetIWA, OnetDWA.iwa_id == OnetIWA.id)
             .join(OnetGWA, OnetIWA.gwa_id == OnetGWA.id)
+            .outerjoin(
+                dwa_effective_exposure,
+                dwa_effective_exposure.c.dwa_id == OnetDWA.id,
+            )
             .where(OnetDWA.id.in_(dwa_ids))
             .order_by(OnetGWA.name, OnetDWA.name)
         )
@@ -327,6 +483,7 @@ class OnetRepository:
                 "gwa_id": row.gwa_id,
                 "gwa_name": row.gwa_name,
                 "gwa_ai_exposure_score": row.gwa_ai_exposure_score,
+                "ai_exposure_score": row.ai_exposure_score,
             }
             for row in rows
         ]
@@ -563,6 +720,69 @@ class OnetRepository:
             await self.session.execute(stmt)
         return len(dwas)
 
+    async def update_dwa_exposure_overrides(
+        self,
+        overrides: dict[str, float | None],
+    ) -> int:
+        """Set or clear AI exposure overrides on DWAs.
+
+        Refreshes dwa_effective_exposure afterwards so scoring sees the
+        new values.
+
+        Note: Does NOT commit. Caller must manage transaction.
+
+        Args:
+            overrides: Map of DWA ID to override score; None clears the
+                override so the DWA inherits its GWA's score again.
+
+        Returns:
+            Number of DWAs updated.
+        """
+        if not overrides:
+            return 0
+
+        dwa_table = OnetDWA.__table__
+        stmt = (
+            update(dwa_table)
+            .where(dwa_table.c.id == bindparam("b_id"))
+            .values(ai_exposure_override=bindparam("b_override"), updated_at=func.now())
+        )
+        await self.session.execute(
+            stmt,
+            [{"b_id": dwa_id, "b_override": score} for dwa_id, score in overrides.items()],
+        )
+        await self.refresh_dwa_effective_exposure()
+        return len(overrides)
+
+    async def refresh_dwa_effective_exposure(self) -> None:
+        """Recompute the dwa_effective_exposure materialized view.
+
+        Must run after GWA scores or DWA overrides change. The refresh is
+        concurrent, so analyses reading the view are not blocked. Bumps
+        the exposure version so analyses scored earlier are seen as stale.
+
+        Note: Does NOT commit. Caller must manage transaction.
+        """
+        await self.session.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY dwa_effective_exposure")
+        )
+        await self.session.execute(
+            update(OnetExposureState)
+            .where(OnetExposureState.id == 1)
+            .values(version=OnetExposureState.version + 1, refreshed_at=func.now())
+        )
+
+    async def get_exposure_version(self) -> int:
+        """Get the version of the effective DWA exposure data.
+
+        Returns:
+            Counter bumped by every refresh_dwa_effective_exposure.
+        """
+        result = await self.session.execute(
+            select(OnetExposureState.version).where(OnetExposureState.id == 1)
+        )
+        return result.scalar_one_or_none() or 0
+
     # ==========================================================================
     # Sync Log Methods (Transaction managed by caller)
     # ==========================================================================
@@ -639,6 +859,21 @@ class OnetRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_all_industries(self) -> list[tuple[str, str]]:
+        """Get all occupation-industry pairs as (occupation_code, naics_code).
+
+        Selects only the two columns, for building in-memory industry indexes.
+
+        Returns:
+            List of (occupation_code, naics_code) tuples.
+        """
+        stmt = select(
+            OnetOccupationIndustry.occupation_code,
+            OnetOccupationIndustry.naics_code,
+        )
+        result = await self.session.execute(stmt)
+        return [(code, naics) for code, naics in result.all()]
+
     async def calculate_industry_score(
         self,
         occupation_code: str,
@@ -0,0 +1,165 @@
+"""Organization portfolio rollup repository."""
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import Row, Select, delete, func, insert, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.discovery_analysis import AnalysisDimension, DiscoveryAnalysisResult
+from app.models.discovery_role_mapping import DiscoveryRoleMapping
+from app.models.discovery_session import DiscoverySession
+from app.models.onet_occupation import OnetOccupation
+from app.models.portfolio_rollup import DiscoveryPortfolioRollup, RollupDimension
+
+
+class PortfolioRepository:
+    """Repository for organization portfolio rollups.
+
+    Rollup rows are rebuilt per session from its ROLE analysis results
+    (see refresh_session) and summed per organization on read.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def _session_rollup_select(
+        self,
+        session_id: UUID,
+        dimension: RollupDimension,
+    ) -> Select:
+        """Build the grouped SELECT of a session's rollup rows for a dimension."""
+        result = DiscoveryAnalysisResult
+        mapping = DiscoveryRoleMapping
+        if dimension == RollupDimension.OCCUPATION:
+            value = mapping.onet_code
+            label = OnetOccupation.title
+        else:
+            value = func.nullif(mapping.lob_value, "")
+            label = null().cast(OnetOccupation.title.type)
+        roles = (
+            select(
+                DiscoverySession.organization_id,
+                result.session_id,
+                value.label("dimension_value"),
+                label.label("label"),
+                func.coalesce(result.breakdown["priority_tier"].astext, "future").label(
+                    "priority_tier"
+                ),
+                func.coalesce(result.row_count, 0).label("headcount"),
+                result.ai_exposure_score.label("exposure"),
+                func.coalesce(result.priority_score, 0.0).label("priority"),
+            )
+            .select_from(result)
+            .join(mapping, mapping.id == result.role_mapping_id)
+            .join(DiscoverySession, DiscoverySession.id == result.session_id)
+            .outerjoin(OnetOccupation, OnetOccupation.code == mapping.onet_code)
+            .where(
+                result.session_id == session_id,
+                result.dimension == AnalysisDimension.ROLE,
+            )
+            .subquery()
+        )
+        return select(
+            roles.c.organization_id,
+            roles.c.session_id,
+            literal(dimension.value),
+            roles.c.dimension_value,
+            roles.c.label,
+            roles.c.priority_tier,
+            func.count(),
+            func.sum(roles.c.headcount),
+            func.sum(roles.c.exposure * roles.c.headcount),
+            func.sum(roles.c.priority * roles.c.headcount),
+            func.sum(roles.c.exposure),
+            func.sum(roles.c.priority),
+        ).group_by(
+            roles.c.organization_id,
+            roles.c.session_id,
+            roles.c.dimension_value,
+            roles.c.label,
+            roles.c.priority_tier,
+        )
+
+    async def refresh_session(self, session_id: UUID) -> None:
+        """Rebuild a session's rollup rows from its ROLE analysis results.
+
+        Runs as INSERT ... SELECT per dimension, so no results leave the
+        database. Doesn't commit: callers run it in the transaction that
+        replaces the session's results (see AnalysisRepository.replace_results)
+        or changes its role mappings (see RoleMappingRepository).
+
+        Args:
+            session_id: Discovery session ID.
+        """
+        await self.session.execute(
+            delete(DiscoveryPortfolioRollup).where(
+                DiscoveryPortfolioRollup.session_id == session_id
+            )
+        )
+        columns = [
+            "organization_id",
+            "session_id",
+            "dimension",
+            "dimension_value",
+            "label",
+            "priority_tier",
+            "role_count",
+            "headcount",
+            "exposure_weighted_sum",
+            "priority_weighted_sum",
+            "exposure_sum",
+            "priority_sum",
+        ]
+        for dimension in RollupDimension:
+            await self.session.execute(
+                insert(DiscoveryPortfolioRollup).from_select(
+                    columns, self._session_rollup_select(session_id, dimension)
+                )
+            )
+
+    async def get_organization_rollup(self, organization_id: UUID) -> Sequence[Row]:
+        """Sum the rollup rows of every session in an organization.
+
+        Args:
+            organization_id: Organization ID.
+
+        Returns:
+            Rows of (dimension, dimension_value, label, priority_tier,
+            role_count, headcount, exposure_weighted_sum,
+            priority_weighted_sum, exposure_sum, priority_sum), one per
+            dimension value and tier.
+        """
+        rollup = DiscoveryPortfolioRollup
+        stmt = (
+            select(
+                rollup.dimension,
+                rollup.dimension_value,
+                func.max(rollup.label).label("label"),
+                rollup.priority_tier,
+                func.sum(rollup.role_count).label("role_count"),
+                func.sum(rollup.headcount).label("headcount"),
+                func.sum(rollup.exposure_weighted_sum).label("exposure_weighted_sum"),
+                func.sum(rollup.priority_weighted_sum).label("priority_weighted_sum"),
+                func.sum(rollup.exposure_sum).label("exposure_sum"),
+                func.sum(rollup.priority_sum).label("priority_sum"),
+            )
+            .where(rollup.organization_id == organization_id)
+            .group_by(rollup.dimension, rollup.dimension_value, rollup.priority_tier)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def count_sessions(self, organization_id: UUID) -> int:
+        """Count an organization's sessions with rolled-up analysis results.
+
+        Args:
+            organization_id: Organization ID.
+
+        Returns:
+            Number of analyzed sessions.
+        """
+        stmt = select(func.count(func.distinct(DiscoveryPortfolioRollup.session_id))).where(
+            DiscoveryPortfolioRollup.organization_id == organization_id
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
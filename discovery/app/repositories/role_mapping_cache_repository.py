@@ -0,0 +1,184 @@
+"""Repository for the cross-session role mapping cache."""
+import logging
+from typing import Any
+
+from sqlalchemy import and_, delete, func, not_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.onet_occupation import OnetOccupation
+from app.models.role_mapping_cache import RoleMappingCacheEntry
+
+logger = logging.getLogger(__name__)
+
+# Batch size for bulk inserts to stay under PostgreSQL's parameter limit
+BULK_INSERT_BATCH_SIZE = 2000
+
+
+class RoleMappingCacheRepository:
+    """Repository for role mapping cache operations.
+
+    Entries are keyed by (normalized_title, onet_version, model); lookups
+    and writes are always scoped to a single version/model pair.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+
+    async def get_entries(
+        self,
+        normalized_titles: list[str],
+        onet_version: str,
+        model: str,
+    ) -> dict[str, RoleMappingCacheEntry]:
+        """Get cache entries for the given normalized titles.
+
+        Args:
+            normalized_titles: Normalized role titles to look up.
+            onet_version: O*NET release the entries must belong to.
+            model: LLM model the entries must have been produced by.
+
+        Returns:
+            Dict mapping normalized title to its cache entry (hits only).
+        """
+        if not normalized_titles:
+            return {}
+
+        stmt = select(RoleMappingCacheEntry).where(
+            RoleMappingCacheEntry.normalized_title.in_(normalized_titles),
+            RoleMappingCacheEntry.onet_version == onet_version,
+            RoleMappingCacheEntry.model == model,
+        )
+        result = await self.session.execute(stmt)
+        return {entry.normalized_title: entry for entry in result.scalars().all()}
+
+    async def record_hits(self, entry_ids: list[int]) -> None:
+        """Increment hit counters for entries served from the cache.
+
+        Args:
+            entry_ids: IDs of the entries that were hit.
+        """
+        if not entry_ids:
+            return
+
+        stmt = (
+            update(RoleMappingCacheEntry)
+            .where(RoleMappingCacheEntry.id.in_(entry_ids))
+            .values(
+                hit_count=RoleMappingCacheEntry.hit_count + 1,
+                last_hit_at=func.now(),
+            )
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def upsert_entries(self, entries: list[dict[str, Any]]) -> int:
+        """Insert or refresh cache entries.
+
+        Uses ON CONFLICT on the (normalized_title, onet_version, model)
+        unique constraint so concurrent sessions can write the same key.
+        Entries whose onet_code is not a known occupation (e.g. one the LLM
+        made up) are skipped, so they can't fail the whole batch on the
+        onet_code foreign key.
+
+        Args:
+            entries: List of entry dicts with normalized_title, onet_version,
+                model, onet_code, onet_title, confidence, reasoning.
+
+        Returns:
+            Number of entries written.
+        """
+        if not entries:
+            return 0
+
+        codes = {entry["onet_code"] for entry in entries}
+        result = await self.session.execute(
+            select(OnetOccupation.code).where(OnetOccupation.code.in_(codes))
+        )
+        known = set(result.scalars().all())
+        if len(known) < len(codes):
+            logger.warning(
+                f"Not caching role mappings to unknown O*NET codes: {sorted(codes - known)}"
+            )
+            entries = [entry for entry in entries if entry["onet_code"] in known]
+            if not entries:
+                return 0
+
+        for i in range(0, len(entries), BULK_INSERT_BATCH_SIZE):
+            batch = entries[i:i + BULK_INSERT_BATCH_SIZE]
+            stmt = insert(RoleMappingCacheEntry).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_role_mapping_cache_key",
+                set_={
+                    "onet_code": stmt.excluded.onet_code,
+                    "onet_title": stmt.excluded.onet_title,
+                    "confidence": stmt.excluded.confidence,
+                    "reasoning": stmt.excluded.reasoning,
+                    "created_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+
+        await self.session.commit()
+        return len(entries)
+
+    async def delete_stale(self, onet_version: str, model: str) -> int:
+        """Delete entries that belong to another O*NET version or model.
+
+        Args:
+            onet_version: Current O*NET release.
+            model: Current LLM model.
+
+        Returns:
+            Number of entries deleted.
+        """
+        stmt = delete(RoleMappingCacheEntry).where(
+            not_(
+                and_(
+                    RoleMappingCacheEntry.onet_version == onet_version,
+                    RoleMappingCacheEntry.model == model,
+                )
+            )
+        )
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        deleted = result.rowcount or 0
+        if deleted:
+            logger.info(
+                f"Evicted {deleted} stale role mapping cache entries "
+                f"(current version={onet_version}, model={model})"
+            )
+        return deleted
+
+    async def get_stats(self, onet_version: str, model: str) -> dict[str, int]:
+        """Get entry and hit counts for the cache.
+
+        Args:
+            onet_version: Current O*NET release.
+            model: Current LLM model.
+
+        Returns:
+            Dict with total_entries, current_entries, and total_hits
+            (hits are counted for current entries only).
+        """
+        is_current = and_(
+            RoleMappingCacheEntry.onet_version == onet_version,
+            RoleMappingCacheEntry.model == model,
+        )
+        stmt = select(
+            func.count(),
+            func.count().filter(is_current),
+            func.coalesce(func.sum(RoleMappingCacheEntry.hit_count).filter(is_current), 0),
+        ).select_from(RoleMappingCacheEntry)
+        result = await self.session.execute(stmt)
+        total, current, hits = result.one()
+        return {
+            "total_entries": total,
+            "current_entries": current,
+            "total_hits": hits,
+        }
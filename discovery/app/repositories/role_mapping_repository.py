@@ -1,15 +1,33 @@
 """Discovery role mapping repository."""
 import logging
-from typing import Sequence
+from datetime import datetime
+from typing import Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, select
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    Row,
+    String,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    literal_column,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import lazyload
 
 from app.models.discovery_role_mapping import DiscoveryRoleMapping
+from app.models.onet_occupation import OnetOccupation
+from app.repositories.portfolio_repository import PortfolioRepository
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +37,22 @@ MAX_ROW_COUNT = 2_147_483_647
 # The unique constraint name for duplicate detection
 UNIQUE_CONSTRAINT_NAME = "uq_role_mapping_session_role_lob"
 
+# Rows per INSERT ... ON CONFLICT statement (keeps bind parameters under
+# PostgreSQL's 32,767 limit)
+UPSERT_CHUNK_SIZE = 1000
+
+# Rows per UPDATE ... FROM (VALUES ...) statement in bulk_update
+UPDATE_CHUNK_SIZE = 1000
+
+# Fields overwritten on conflict when a non-None value is provided
+UPSERT_UPDATE_FIELDS = (
+    "onet_code",
+    "confidence_score",
+    "industry_match_score",
+    "department_value",
+    "geography_value",
+)
+
 
 def _normalize_lob_value(lob_value: str | None) -> str | None:
     """Normalize LOB value to match database COALESCE behavior.
@@ -38,12 +72,96 @@ def _normalize_lob_value(lob_value: str | None) -> str | None:
     return lob_value
 
 
+def _mapping_key(session_id: UUID, source_role: str, lob_value: str | None) -> tuple:
+    """Unique key of a role mapping as enforced by the database index."""
+    return (session_id, source_role, lob_value or "")
+
+
+def _merge_duplicate_mappings(mappings: list[dict], replace_counts: bool) -> list[dict]:
+    """Merge mapping dicts that share a unique key.
+
+    A single INSERT ... ON CONFLICT cannot update the same row twice, so
+    duplicates are folded in order, matching what sequential upserts would
+    store: provided fields overwrite, and row counts replace or add.
+
+    Args:
+        mappings: Mapping dicts with session_id and source_role.
+        replace_counts: If True, later row_count values replace earlier ones.
+            If False, they are summed.
+
+    Returns:
+        One dict per unique key, in first-seen order, with lob_value
+        normalized and row_count capped at MAX_ROW_COUNT.
+    """
+    merged: dict[tuple, dict] = {}
+    for m in mappings:
+        row = {**m, "lob_value": _normalize_lob_value(m.get("lob_value"))}
+        if row.get("row_count") is not None:
+            row["row_count"] = min(row["row_count"], MAX_ROW_COUNT)
+
+        key = _mapping_key(row["session_id"], row["source_role"], row["lob_value"])
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = row
+            continue
+
+        for field in UPSERT_UPDATE_FIELDS:
+            if row.get(field) is not None:
+                existing[field] = row[field]
+        if row.get("row_count") is not None:
+            if replace_counts or existing.get("row_count") is None:
+                existing["row_count"] = row["row_count"]
+            else:
+                existing["row_count"] = min(existing["row_count"] + row["row_count"], MAX_ROW_COUNT)
+
+    return list(merged.values())
+
+
+def _fill_missing_columns(rows: list[dict]) -> list[dict]:
+    """Give every row the same keys for a multi-row INSERT.
+
+    A multi-row VALUES clause takes its columns from the first row, so
+    keys that only later rows carry would be dropped. Missing keys get the
+    column's scalar default, else None; the upsert's COALESCE keeps the
+    existing value for None.
+
+    Args:
+        rows: Merged mapping dicts.
+
+    Returns:
+        Rows sharing one key set.
+    """
+    table = DiscoveryRoleMapping.__table__
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    fill = {}
+    for key in columns:
+        default = table.c[key].default
+        fill[key] = default.arg if default is not None and default.is_scalar else None
+    return [{**fill, **row} for row in rows]
+
+
 class RoleMappingRepository:
     """Repository for role mapping operations."""
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    async def _refresh_rollups(self, session_ids: Iterable[UUID]) -> None:
+        """Rebuild the portfolio rollups of sessions whose mappings changed.
+
+        Rollups group ROLE results by their mapping's O*NET code and LOB,
+        and a mapping's results cascade away with it, so every write that
+        changes onet_code or deletes mappings refreshes them in its own
+        transaction.
+
+        Args:
+            session_ids: Sessions whose mappings changed.
+        """
+        await self.session.flush()
+        portfolio = PortfolioRepository(self.session)
+        for session_id in dict.fromkeys(session_ids):
+            await portfolio.refresh_session(session_id)
+
     async def create(
         self,
         session_id: UUID,
@@ -107,16 +225,19 @@ class RoleMappingRepository:
     ) -> Sequence[DiscoveryRoleMapping]:
         """Create or update multiple role mappings using upsert.
 
-        Uses row-level locking (SELECT FOR UPDATE) to handle duplicates based on
-        (session_id, source_role, lob_value) unique constraint.
-        On conflict, updates all mapping fields.
+        Runs a set-based INSERT ... ON CONFLICT against the
+        (session_id, source_role, COALESCE(lob_value, '')) unique index, so
+        concurrent requests for the same mapping resolve atomically in the
+        database. On conflict, provided (non-None) fields overwrite the
+        existing values. Duplicate keys within the input are merged first,
+        in order, with the same semantics.
 
         Args:
             mappings: List of mapping dicts with session_id, source_role, etc.
             replace_counts: If True, replace row_count values. If False, add to existing.
 
         Returns:
-            List of created/updated role mappings.
+            List of created/updated role mappings, one per unique key, in input order.
 
         Raises:
             ValueError: If required fields are missing from mapping dicts.
@@ -131,106 +252,95 @@ class RoleMappingRepository:
             if "source_role" not in m:
                 raise ValueError(f"Mapping at index {i} missing required field: source_role")
 
-        # Use SELECT FOR UPDATE to prevent race conditions when multiple
-        # requests try to upsert the same role mapping concurrently.
-        # SQLAlchemy's insert().on_conflict_do_update() doesn't work well
-        # with functional indexes (COALESCE), so we use explicit locking.
-        created_mappings: list[DiscoveryRoleMapping] = []
-
-        for m in mappings:
-            # Normalize lob_value to match database COALESCE behavior
-            # The unique constraint treats NULL and '' as equivalent
-            lob_value = _normalize_lob_value(m.get("lob_value"))
-
-            # Check if mapping exists with row-level lock to prevent races
-            # Use consistent NULL/empty string handling for lookup
-            if lob_value is None:
-                # Match both NULL and empty string in the database
-                # since COALESCE(lob_value, '') treats them as equivalent
-                lob_condition = (
-                    (DiscoveryRoleMapping.lob_value.is_(None)) |
-                    (DiscoveryRoleMapping.lob_value == "")
-                )
-            else:
-                lob_condition = DiscoveryRoleMapping.lob_value == lob_value
+        rows = _fill_missing_columns(_merge_duplicate_mappings(mappings, replace_counts))
 
+        # Lock rows in a consistent order so concurrent upserts can't deadlock
+        ordered_rows = sorted(
+            rows,
+            key=lambda r: (str(r["session_id"]), r["source_role"], r["lob_value"] or ""),
+        )
+
+        ids_by_key: dict[tuple, UUID] = {}
+        for i in range(0, len(ordered_rows), UPSERT_CHUNK_SIZE):
+            chunk = ordered_rows[i:i + UPSERT_CHUNK_SIZE]
+            result = await self.session.execute(
+                self._build_upsert_stmt(chunk, replace_counts)
+            )
+            for mapping_id, session_id, source_role, lob_value in result.all():
+                ids_by_key[_mapping_key(session_id, source_role, lob_value)] = mapping_id
+
+        await self._refresh_rollups(r["session_id"] for r in rows)
+        await self.session.commit()
+
+        # Load the final rows (with their occupations) in input order
+        ids = [
+            ids_by_key[_mapping_key(r["session_id"], r["source_role"], r["lob_value"])]
+            for r in rows
+        ]
+        by_id: dict[UUID, DiscoveryRoleMapping] = {}
+        for i in range(0, len(ids), UPSERT_CHUNK_SIZE):
             stmt = (
                 select(DiscoveryRoleMapping)
-                .where(
-                    DiscoveryRoleMapping.session_id == m["session_id"],
-                    DiscoveryRoleMapping.source_role == m["source_role"],
-                    lob_condition,
-                )
-                # Use lazyload to prevent eager loading of relationships
-                # This avoids "FOR UPDATE cannot be applied to outer join" error
-                .options(lazyload("*"))
-                .with_for_update()
+                .where(DiscoveryRoleMapping.id.in_(ids[i:i + UPSERT_CHUNK_SIZE]))
+                .execution_options(populate_existing=True)
             )
             result = await self.session.execute(stmt)
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                # Update existing mapping with all provided fields
-                if m.get("onet_code") is not None:
-                    existing.onet_code = m["onet_code"]
-                if m.get("confidence_score") is not None:
-                    existing.confidence_score = m["confidence_score"]
-                if m.get("row_count") is not None:
-                    if replace_counts:
-                        # Replace with new value (used after delete)
-                        existing.row_count = min(m["row_count"], MAX_ROW_COUNT)
-                    else:
-                        # Add to existing (incremental update)
-                        new_count = (existing.row_count or 0) + m["row_count"]
-                        existing.row_count = min(new_count, MAX_ROW_COUNT)
-                if m.get("industry_match_score") is not None:
-                    existing.industry_match_score = m["industry_match_score"]
-                if m.get("department_value") is not None:
-                    existing.department_value = m["department_value"]
-                if m.get("geography_value") is not None:
-                    existing.geography_value = m["geography_value"]
-                created_mappings.append(existing)
-            else:
-                # Create new mapping with normalized lob_value
-                mapping_data = m.copy()
-                mapping_data["lob_value"] = lob_value
-                try:
-                    db_mapping = DiscoveryRoleMapping(**mapping_data)
-                    self.session.add(db_mapping)
-                    # Flush to detect constraint violations early
-                    await self.session.flush()
-                    created_mappings.append(db_mapping)
-                except IntegrityError as e:
-                    # Handle race condition: another transaction inserted first
-                    if UNIQUE_CONSTRAINT_NAME in str(e.orig):
-                        logger.warning(
-                            f"Race condition detected for role mapping: "
-                            f"session={m['session_id']}, role={m['source_role']}, lob={lob_value}. "
-                            "Fetching existing record."
-                        )
-                        await self.session.rollback()
-                        # Re-fetch the existing record that was just inserted
-                        result = await self.session.execute(stmt)
-                        existing = result.scalar_one_or_none()
-                        if existing:
-                            created_mappings.append(existing)
-                        else:
-                            # This shouldn't happen, but log and continue
-                            logger.error(
-                                f"Failed to find existing mapping after race condition: "
-                                f"session={m['session_id']}, role={m['source_role']}, lob={lob_value}"
-                            )
-                    else:
-                        # Different integrity error - re-raise
-                        raise
+            by_id.update((m.id, m) for m in result.unique().scalars().all())
 
-        await self.session.commit()
+        return [by_id[mapping_id] for mapping_id in ids if mapping_id in by_id]
 
-        # Refresh all created/updated mappings to get database-generated fields
-        for mapping in created_mappings:
-            await self.session.refresh(mapping)
+    def _build_upsert_stmt(self, rows: list[dict], replace_counts: bool):
+        """Build the INSERT ... ON CONFLICT statement for a chunk of mappings.
+
+        Args:
+            rows: Merged mapping dicts with unique keys and normalized lob_value.
+            replace_counts: If True, replace row_count values. If False, add to existing.
+
+        Returns:
+            Insert statement returning (id, session_id, source_role, lob_value).
+        """
+        table = DiscoveryRoleMapping.__table__
+        stmt = insert(DiscoveryRoleMapping).values(rows)
+        excluded = stmt.excluded
+
+        # Only overwrite fields with provided values; keep existing otherwise
+        columns = {key for row in rows for key in row}
+        set_ = {
+            field: func.coalesce(excluded[field], table.c[field])
+            for field in UPSERT_UPDATE_FIELDS
+            if field in columns
+        }
+        if "row_count" in columns:
+            if replace_counts:
+                set_["row_count"] = func.coalesce(excluded.row_count, table.c.row_count)
+            else:
+                added = func.least(
+                    cast(func.coalesce(table.c.row_count, 0), BigInteger) + excluded.row_count,
+                    MAX_ROW_COUNT,
+                )
+                set_["row_count"] = case(
+                    (excluded.row_count.is_(None), table.c.row_count),
+                    else_=added,
+                )
 
-        return created_mappings
+        # ON CONFLICT skips the column's onupdate; set it explicitly (this
+        # also keeps RETURNING yielding rows that have nothing else to update)
+        set_["updated_at"] = func.now()
+
+        return stmt.on_conflict_do_update(
+            index_elements=[
+                table.c.session_id,
+                table.c.source_role,
+                # Must match the index expression literally for inference
+                func.coalesce(table.c.lob_value, literal_column("''")),
+            ],
+            set_=set_,
+        ).returning(
+            table.c.id,
+            table.c.session_id,
+            table.c.source_role,
+            table.c.lob_value,
+        )
 
     async def get_for_session(
         self,
@@ -245,6 +355,131 @@ class RoleMappingRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def get_grouped_rows(
+        self,
+        session_id: UUID,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Sequence[Row]:
+        """Get a session's mappings aggregated per LOB and role.
+
+        Rows sharing a role within a LOB are collapsed into one. The
+        primary mapping (confirmed first, then highest confidence) provides
+        the ID, O*NET code/title and confidence score.
+
+        Args:
+            session_id: Session ID.
+            limit: Maximum rows to return; None returns all.
+            offset: Rows to skip.
+
+        Returns:
+            Rows with lob, source_role, id, onet_code, onet_title,
+            confidence_score, is_confirmed and employee_count, ordered by
+            LOB (no LOB last) and role.
+        """
+        roles = self._role_aggregate_subquery(session_id)
+        stmt = select(roles).order_by(roles.c.lob.asc().nulls_last(), roles.c.source_role)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def get_group_summaries(
+        self,
+        session_id: UUID,
+        low_confidence_threshold: float,
+    ) -> Sequence[Row]:
+        """Get per-LOB and overall review counts in one GROUPING SETS query.
+
+        Counts are over the aggregated rows of get_grouped_rows.
+
+        Args:
+            session_id: Session ID.
+            low_confidence_threshold: Unconfirmed rows scoring below this
+                count as low confidence.
+
+        Returns:
+            Rows with lob, is_overall, total_roles, confirmed_count,
+            pending_count, low_confidence_count and total_employees. The
+            overall row has is_overall set; the row with lob None and
+            is_overall unset covers mappings without a LOB.
+        """
+        roles = self._role_aggregate_subquery(session_id)
+        low_confidence = and_(
+            roles.c.is_confirmed.is_(False),
+            roles.c.confidence_score < low_confidence_threshold,
+        )
+        stmt = (
+            select(
+                roles.c.lob,
+                (func.grouping(roles.c.lob) == 1).label("is_overall"),
+                func.count().label("total_roles"),
+                func.count().filter(roles.c.is_confirmed.is_(True)).label("confirmed_count"),
+                func.count().filter(roles.c.is_confirmed.is_(False)).label("pending_count"),
+                func.count().filter(low_confidence).label("low_confidence_count"),
+                func.coalesce(func.sum(roles.c.employee_count), 0).label("total_employees"),
+            )
+            .group_by(func.grouping_sets(tuple_(roles.c.lob), tuple_()))
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    def _role_aggregate_subquery(self, session_id: UUID):
+        """Build the per-(LOB, role) aggregate used by the grouped views."""
+        # literal_column keeps the select and GROUP BY expressions identical
+        lob = func.nullif(DiscoveryRoleMapping.lob_value, literal_column("''"))
+        primary_first = (
+            DiscoveryRoleMapping.user_confirmed.is_(True).desc(),
+            DiscoveryRoleMapping.confidence_score.desc().nulls_last(),
+            DiscoveryRoleMapping.id,
+        )
+
+        def primary(col):
+            return func.array_agg(aggregate_order_by(col, *primary_first))[1]
+
+        return (
+            select(
+                lob.label("lob"),
+                DiscoveryRoleMapping.source_role,
+                primary(DiscoveryRoleMapping.id).label("id"),
+                primary(DiscoveryRoleMapping.onet_code).label("onet_code"),
+                primary(OnetOccupation.title).label("onet_title"),
+                func.coalesce(primary(DiscoveryRoleMapping.confidence_score), 0.0)
+                .label("confidence_score"),
+                func.coalesce(func.bool_or(DiscoveryRoleMapping.user_confirmed), False)
+                .label("is_confirmed"),
+                func.sum(func.coalesce(func.nullif(DiscoveryRoleMapping.row_count, 0), 1))
+                .label("employee_count"),
+            )
+            .select_from(DiscoveryRoleMapping)
+            .outerjoin(OnetOccupation, OnetOccupation.code == DiscoveryRoleMapping.onet_code)
+            .where(DiscoveryRoleMapping.session_id == session_id)
+            .group_by(lob, DiscoveryRoleMapping.source_role)
+            .subquery("role_groups")
+        )
+
+    async def get_fingerprint(self, session_id: UUID) -> tuple[int, datetime | None]:
+        """Get a cheap fingerprint of a session's mappings.
+
+        Every mapping write bumps updated_at (and deletes lower the count),
+        so the fingerprint changes whenever the mappings do.
+
+        Args:
+            session_id: Discovery session ID.
+
+        Returns:
+            Tuple of (mapping count, latest updated_at or None).
+        """
+        stmt = select(
+            func.count(DiscoveryRoleMapping.id),
+            func.max(DiscoveryRoleMapping.updated_at),
+        ).where(DiscoveryRoleMapping.session_id == session_id)
+        result = await self.session.execute(stmt)
+        count, updated_at = result.one()
+        return count, updated_at
+
     async def get_by_id(
         self,
         mapping_id: UUID,
@@ -280,6 +515,7 @@ class RoleMappingRepository:
         if mapping:
             mapping.onet_code = onet_code
             mapping.user_confirmed = True
+            await self._refresh_rollups([mapping.session_id])
             await self.session.commit()
             await self.session.refresh(mapping)
         return mapping
@@ -313,10 +549,117 @@ class RoleMappingRepository:
                 mapping.user_confirmed = user_confirmed
             if confidence_score is not None:
                 mapping.confidence_score = confidence_score
+            if onet_code is not None:
+                await self._refresh_rollups([mapping.session_id])
             await self.session.commit()
             await self.session.refresh(mapping)
         return mapping
 
+    async def bulk_confirm(
+        self,
+        session_id: UUID,
+        threshold: float,
+        lob_value: str | None = None,
+        mapping_ids: list[UUID] | None = None,
+    ) -> int:
+        """Confirm all qualifying mappings of a session in one UPDATE.
+
+        A mapping qualifies when it is unconfirmed, has an O*NET code and
+        its confidence score is at least the threshold.
+
+        Args:
+            session_id: Session whose mappings to confirm.
+            threshold: Minimum confidence score.
+            lob_value: Only confirm mappings with this LOB value.
+            mapping_ids: Only confirm mappings with these IDs.
+
+        Returns:
+            Number of mappings confirmed.
+        """
+        if mapping_ids is not None and not mapping_ids:
+            return 0
+
+        stmt = (
+            update(DiscoveryRoleMapping)
+            .where(
+                DiscoveryRoleMapping.session_id == session_id,
+                DiscoveryRoleMapping.user_confirmed.is_not(True),
+                DiscoveryRoleMapping.onet_code.is_not(None),
+                DiscoveryRoleMapping.confidence_score >= threshold,
+            )
+            .values(user_confirmed=True)
+            .execution_options(synchronize_session=False)
+        )
+        if lob_value is not None:
+            stmt = stmt.where(DiscoveryRoleMapping.lob_value == lob_value)
+        if mapping_ids is not None:
+            stmt = stmt.where(DiscoveryRoleMapping.id.in_(mapping_ids))
+
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.rowcount or 0
+
+    async def bulk_update(
+        self,
+        session_id: UUID,
+        updates: list[dict],
+    ) -> int:
+        """Update O*NET codes and confidence scores of many mappings.
+
+        Each chunk of updates is applied with a single
+        ``UPDATE ... FROM (VALUES ...)`` statement. As in update(), a None
+        onet_code or confidence_score leaves the stored value unchanged.
+
+        Args:
+            session_id: Session the mappings must belong to.
+            updates: Dicts with "id" and optional "onet_code" and
+                "confidence_score".
+
+        Returns:
+            Number of mappings updated.
+        """
+        if not updates:
+            return 0
+
+        updated = 0
+        for start in range(0, len(updates), UPDATE_CHUNK_SIZE):
+            chunk = updates[start:start + UPDATE_CHUNK_SIZE]
+            result = await self.session.execute(self._build_update_stmt(session_id, chunk))
+            updated += result.rowcount or 0
+        if updated:
+            await self._refresh_rollups([session_id])
+        await self.session.commit()
+        return updated
+
+    def _build_update_stmt(self, session_id: UUID, updates: list[dict]):
+        """Build an UPDATE ... FROM (VALUES ...) statement for bulk_update."""
+        rows = values(
+            column("id", PGUUID(as_uuid=True)),
+            column("onet_code", String),
+            column("confidence_score", Float),
+            name="v",
+        ).data([
+            (u["id"], u.get("onet_code"), u.get("confidence_score"))
+            for u in updates
+        ])
+        return (
+            update(DiscoveryRoleMapping)
+            .where(
+                DiscoveryRoleMapping.id == rows.c.id,
+                DiscoveryRoleMapping.session_id == session_id,
+            )
+            .values(
+                # Casts keep all-NULL VALUES columns (typed text) comparable
+                onet_code=func.coalesce(
+                    cast(rows.c.onet_code, String), DiscoveryRoleMapping.onet_code,
+                ),
+                confidence_score=func.coalesce(
+                    cast(rows.c.confidence_score, Float), DiscoveryRoleMapping.confidence_score,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     async def delete_for_session(
         self,
         session_id: UUID,
@@ -333,5 +676,6 @@ class RoleMappingRepository:
             DiscoveryRoleMapping.session_id == session_id
         )
         result = await self.session.execute(stmt)
+        await self._refresh_rollups([session_id])
         await self.session.commit()
         return result.rowcount or 0
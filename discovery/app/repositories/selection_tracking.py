@@ -0,0 +1,85 @@
+# discovery/app/repositories/selection_tracking.py
+"""Dirty tracking for task and activity selections.
+
+Selection repositories call mark_selections_changed with every write, so
+analysis can tell which role mappings changed since it last ran: each
+write bumps the owning session's selection_version and stamps the new
+version on the affected role mappings. Mappings whose selection_version is
+above the session's analyzed_version need re-scoring.
+"""
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.discovery_role_mapping import DiscoveryRoleMapping
+from app.models.discovery_session import DiscoverySession
+
+
+async def mark_selections_changed(
+    session: AsyncSession,
+    role_mapping_ids: Iterable[UUID],
+) -> None:
+    """Record that the selections of some role mappings changed.
+
+    Runs as a single statement in the caller's transaction and does NOT
+    commit.
+
+    Args:
+        session: Database session of the selection write.
+        role_mapping_ids: Role mappings whose selections were written.
+    """
+    ids = list(dict.fromkeys(role_mapping_ids))
+    if not ids:
+        return
+
+    owning_sessions = (
+        select(DiscoveryRoleMapping.session_id)
+        .where(DiscoveryRoleMapping.id.in_(ids))
+        .distinct()
+        .scalar_subquery()
+    )
+    bumped = (
+        update(DiscoverySession)
+        .where(DiscoverySession.id.in_(owning_sessions))
+        .values(selection_version=DiscoverySession.selection_version + 1)
+        .returning(DiscoverySession.id, DiscoverySession.selection_version)
+        .cte("bumped_sessions")
+    )
+    stmt = (
+        update(DiscoveryRoleMapping)
+        .where(
+            DiscoveryRoleMapping.session_id == bumped.c.id,
+            DiscoveryRoleMapping.id.in_(ids),
+        )
+        .values(selection_version=bumped.c.selection_version)
+    )
+    await session.execute(stmt)
+
+
+async def mark_session_selections_changed(
+    session: AsyncSession,
+    session_id: UUID,
+) -> None:
+    """Record that selections of every role mapping in a session changed.
+
+    Does NOT commit.
+
+    Args:
+        session: Database session of the selection write.
+        session_id: Discovery session ID.
+    """
+    bumped = (
+        update(DiscoverySession)
+        .where(DiscoverySession.id == session_id)
+        .values(selection_version=DiscoverySession.selection_version + 1)
+        .returning(DiscoverySession.selection_version)
+        .cte("bumped_session")
+    )
+    stmt = (
+        update(DiscoveryRoleMapping)
+        .where(DiscoveryRoleMapping.session_id == session_id)
+        .values(selection_version=bumped.c.selection_version)
+    )
+    await session.execute(stmt)
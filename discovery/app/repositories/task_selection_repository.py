@@ -3,11 +3,18 @@
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import Row, func, select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.discovery_task_selection import DiscoveryTaskSelection
+from app.models.onet_task import OnetTaskToDWA
+from app.models.onet_work_activities import dwa_effective_exposure
+from app.repositories.activity_selection_repository import DEFAULT_DWA_EXPOSURE
+from app.repositories.selection_tracking import (
+    mark_selections_changed,
+    mark_session_selections_changed,
+)
 
 
 class TaskSelectionRepository:
@@ -23,6 +30,9 @@ class TaskSelectionRepository:
         """Create multiple task selections."""
         db_selections = [DiscoveryTaskSelection(**s) for s in selections]
         self.session.add_all(db_selections)
+        await mark_selections_changed(
+            self.session, [s.role_mapping_id for s in db_selections]
+        )
         await self.session.commit()
         for s in db_selections:
             await self.session.refresh(s)
@@ -70,6 +80,51 @@ class TaskSelectionRepository:
         result = await self.session.execute(stmt)
         return result.scalars().unique().all()
 
+    async def get_dwa_exposure_edges(
+        self,
+        session_id: UUID,
+        role_mapping_ids: list[UUID] | None = None,
+    ) -> Sequence[Row]:
+        """Get every selected task's DWAs and their exposure in one query.
+
+        Each DWA's effective exposure is read from dwa_effective_exposure
+        (its override, else its parent GWA's score), falling back to
+        DEFAULT_DWA_EXPOSURE. Selected tasks without DWAs are returned once
+        with a NULL dwa_id.
+
+        Args:
+            session_id: Discovery session ID.
+            role_mapping_ids: Restrict to these mappings; None for all.
+
+        Returns:
+            Rows of (role_mapping_id, task_id, dwa_id, exposure).
+        """
+        stmt = (
+            select(
+                DiscoveryTaskSelection.role_mapping_id,
+                DiscoveryTaskSelection.task_id,
+                OnetTaskToDWA.dwa_id,
+                func.coalesce(
+                    dwa_effective_exposure.c.exposure,
+                    DEFAULT_DWA_EXPOSURE,
+                ).label("exposure"),
+            )
+            .select_from(DiscoveryTaskSelection)
+            .outerjoin(OnetTaskToDWA, OnetTaskToDWA.task_id == DiscoveryTaskSelection.task_id)
+            .outerjoin(
+                dwa_effective_exposure,
+                dwa_effective_exposure.c.dwa_id == OnetTaskToDWA.dwa_id,
+            )
+            .where(
+                DiscoveryTaskSelection.session_id == session_id,
+                DiscoveryTaskSelection.selected.is_(True),
+            )
+        )
+        if role_mapping_ids is not None:
+            stmt = stmt.where(DiscoveryTaskSelection.role_mapping_id.in_(role_mapping_ids))
+        result = await self.session.execute(stmt)
+        return result.all()
+
     async def update_selection(
         self,
         selection_id: UUID,
@@ -87,6 +142,7 @@ class TaskSelectionRepository:
         if selection:
             selection.selected = selected
             selection.user_modified = True
+            await mark_selections_changed(self.session, [selection.role_mapping_id])
             await self.session.commit()
             await self.session.refresh(selection, attribute_names=["selected", "user_modified"])
         return selection
@@ -114,6 +170,8 @@ class TaskSelectionRepository:
             s.user_modified = True
             count += 1
 
+        if count:
+            await mark_selections_changed(self.session, [role_mapping_id])
         await self.session.commit()
         return count
 
@@ -123,6 +181,7 @@ class TaskSelectionRepository:
             DiscoveryTaskSelection.session_id == session_id
         )
         result = await self.session.execute(stmt)
+        await mark_session_selections_changed(self.session, session_id)
         await self.session.commit()
         return result.rowcount
 
@@ -132,6 +191,7 @@ class TaskSelectionRepository:
             DiscoveryTaskSelection.role_mapping_id == role_mapping_id
         )
         result = await self.session.execute(stmt)
+        await mark_selections_changed(self.session, [role_mapping_id])
         await self.session.commit()
         return result.rowcount
 
@@ -179,5 +239,7 @@ class TaskSelectionRepository:
             s.user_modified = True
             count += 1
 
+        if count:
+            await mark_selections_changed(self.session, role_mapping_ids)
         await self.session.commit()
         return count
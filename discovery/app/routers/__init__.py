@@ -6,7 +6,9 @@ from app.routers.chat import router as chat_router
 from app.routers.exports import router as exports_router
 from app.routers.handoff import router as handoff_router
 from app.routers.industry import router as industry_router
+from app.routers.jobs import router as jobs_router
 from app.routers.lob_mappings import router as lob_mappings_router
+from app.routers.portfolio import router as portfolio_router
 from app.routers.roadmap import router as roadmap_router
 from app.routers.role_mappings import router as role_mappings_router
 from app.routers.sessions import router as sessions_router
@@ -21,7 +23,9 @@ __all__ = [
     "exports_router",
     "handoff_router",
     "industry_router",
+    "jobs_router",
     "lob_mappings_router",
+    "portfolio_router",
     "roadmap_router",
     "role_mappings_router",
     "sessions_router",
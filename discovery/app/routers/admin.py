@@ -4,13 +4,27 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from app.jobs.handlers import ONET_SYNC_JOB
+from app.jobs.queue import JobQueue, get_job_queue
 from app.models.base import async_session_maker
 from app.repositories.onet_repository import OnetRepository
-from app.schemas.admin import OnetSyncRequest, OnetSyncResponse, OnetSyncStatus
+from app.routers.jobs import job_to_response
+from app.schemas.admin import (
+    DwaExposureOverrideRequest,
+    DwaExposureOverrideResponse,
+    LLMCacheStats,
+    OnetSyncRequest,
+    OnetSyncResponse,
+    OnetSyncStatus,
+    RoleMappingCacheStats,
+)
+from app.schemas.job import JobResponse
+from app.services.llm_cache import get_llm_cache
 from app.services.onet_file_sync_service import (
     OnetFileSyncService,
     OnetSyncError,
 )
+from app.services.role_mapping_cache import RoleMappingCache, get_role_mapping_cache
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +41,12 @@ async def get_onet_sync_service() -> OnetFileSyncService:
         yield OnetFileSyncService(repository=repository)
 
 
+async def get_onet_repository() -> OnetRepository:
+    """Get O*NET repository dependency."""
+    async with async_session_maker() as db:
+        yield OnetRepository(db)
+
+
 @router.post(
     "/onet/sync",
     response_model=OnetSyncResponse,
@@ -63,6 +83,40 @@ async def sync_onet_database(
         )
 
 
+@router.post(
+    "/onet/sync/jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Sync O*NET database in the background",
+    description="Enqueues an O*NET download and import as a background job and returns immediately.",
+)
+async def enqueue_onet_sync_job(
+    request: OnetSyncRequest,
+    queue: Annotated[JobQueue, Depends(get_job_queue)],
+) -> JobResponse:
+    """Enqueue an O*NET database sync."""
+    job = await queue.enqueue(ONET_SYNC_JOB, {"version": request.version})
+    return job_to_response(job)
+
+
+@router.put(
+    "/onet/dwa-exposure-overrides",
+    response_model=DwaExposureOverrideResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Set DWA AI exposure overrides",
+    description="Sets or clears AI exposure overrides on DWAs and refreshes the effective "
+    "exposure that analyses read.",
+)
+async def update_dwa_exposure_overrides(
+    request: DwaExposureOverrideRequest,
+    repository: Annotated[OnetRepository, Depends(get_onet_repository)],
+) -> DwaExposureOverrideResponse:
+    """Set or clear DWA exposure overrides and refresh effective exposure."""
+    updated = await repository.update_dwa_exposure_overrides(request.overrides)
+    await repository.session.commit()
+    return DwaExposureOverrideResponse(updated=updated)
+
+
 @router.get(
     "/onet/status",
     response_model=OnetSyncStatus,
@@ -81,3 +135,35 @@ async def get_onet_sync_status(
         synced_at=status_data["synced_at"],
         occupation_count=status_data["occupation_count"],
     )
+
+
+@router.get(
+    "/llm-cache/stats",
+    response_model=LLMCacheStats,
+    status_code=status.HTTP_200_OK,
+    summary="Get LLM response cache statistics",
+    description="Returns hit-rate metrics for this process's LLM response cache.",
+)
+async def get_llm_cache_stats() -> LLMCacheStats:
+    """Get LLM response cache hit/miss counts and hit rate."""
+    cache = get_llm_cache()
+    if cache is None:
+        return LLMCacheStats(enabled=False)
+    return LLMCacheStats(enabled=True, **cache.get_stats())
+
+
+@router.get(
+    "/role-mapping-cache/stats",
+    response_model=RoleMappingCacheStats,
+    status_code=status.HTTP_200_OK,
+    summary="Get role mapping cache statistics",
+    description="Returns persisted entry counts and this process's hit rate for the "
+    "cross-session role mapping cache.",
+)
+async def get_role_mapping_cache_stats(
+    cache: Annotated[RoleMappingCache | None, Depends(get_role_mapping_cache)],
+) -> RoleMappingCacheStats:
+    """Get role mapping cache entry counts and hit rate."""
+    if cache is None:
+        return RoleMappingCacheStats(enabled=False)
+    return RoleMappingCacheStats(enabled=True, **await cache.get_stats())
@@ -1,10 +1,13 @@
 """Analysis router for the Discovery module."""
 import logging
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from app.jobs.handlers import ANALYSIS_JOB
+from app.jobs.queue import JobQueue, get_job_queue
+from app.routers.jobs import job_to_response
 from app.schemas.analysis import (
     AllDimensionsResponse,
     AnalysisDimension,
@@ -12,8 +15,14 @@ from app.schemas.analysis import (
     DimensionAnalysisResponse,
     DimensionSummary,
     PriorityTier,
+    ScenarioComparisonResponse,
+    ScenarioDimensionScore,
+    ScenarioRequest,
+    ScenarioResult,
+    ScenarioRoleScore,
     TriggerAnalysisResponse,
 )
+from app.schemas.job import JobResponse
 from app.services.analysis_service import (
     AnalysisService,
     get_analysis_service,
@@ -113,14 +122,20 @@ async def trigger_analysis(
         default="tasks",
         description="Analysis source: 'tasks' (recommended) or 'activities' (legacy DWA-based)",
     ),
+    incremental: Annotated[
+        bool,
+        Query(description="Re-score only roles whose selections changed since the last analysis"),
+    ] = False,
     service: AnalysisService = Depends(get_analysis_service),
     roadmap_service: RoadmapService = Depends(get_roadmap_service),
 ) -> TriggerAnalysisResponse:
     """Trigger scoring analysis for a session and generate roadmap candidates."""
     if source == "tasks":
-        result = await service.trigger_analysis_from_tasks(session_id=session_id)
+        result = await service.trigger_analysis_from_tasks(
+            session_id=session_id, incremental=incremental
+        )
     else:
-        result = await service.trigger_analysis(session_id=session_id)
+        result = await service.trigger_analysis(session_id=session_id, incremental=incremental)
 
     if result is None:
         raise HTTPException(
@@ -140,6 +155,111 @@ async def trigger_analysis(
     return TriggerAnalysisResponse(status=result["status"])
 
 
+@router.post(
+    "/sessions/{session_id}/analyze/jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Trigger analysis for session in the background",
+    description="Enqueues scoring analysis and roadmap candidate generation as a background job "
+    "and returns immediately. Poll GET /discovery/jobs/{job_id} for progress.",
+)
+async def enqueue_analysis_job(
+    session_id: UUID,
+    source: str = Query(
+        default="tasks",
+        description="Analysis source: 'tasks' (recommended) or 'activities' (legacy DWA-based)",
+    ),
+    incremental: Annotated[
+        bool,
+        Query(description="Re-score only roles whose selections changed since the last analysis"),
+    ] = False,
+    queue: JobQueue = Depends(get_job_queue),
+) -> JobResponse:
+    """Enqueue scoring analysis and roadmap candidate generation."""
+    job = await queue.enqueue(
+        ANALYSIS_JOB,
+        {"session_id": str(session_id), "source": source, "incremental": incremental},
+    )
+    return job_to_response(job)
+
+
+def _dict_to_scenario_result(data: dict) -> ScenarioResult:
+    """Convert a scored scenario dictionary to ScenarioResult.
+
+    Args:
+        data: Dictionary returned by AnalysisService.score_scenarios.
+
+    Returns:
+        ScenarioResult instance.
+    """
+    tier_counts = {tier: 0 for tier in PriorityTier}
+    for db_tier, count in data["tier_counts"].items():
+        tier_counts[_convert_priority_tier(db_tier)] += count
+
+    return ScenarioResult(
+        name=data["name"],
+        weights=data["weights"],
+        thresholds=data["thresholds"],
+        tier_counts=tier_counts,
+        roles=[
+            ScenarioRoleScore(
+                id=r["role_mapping_id"],
+                name=r["name"],
+                ai_exposure_score=r["ai_exposure_score"],
+                impact_score=r["impact_score"],
+                complexity_score=r["complexity_score"],
+                priority_score=r["priority_score"],
+                priority_tier=_convert_priority_tier(r["priority_tier"]),
+                row_count=r["row_count"],
+            )
+            for r in data["roles"]
+        ],
+        dimensions={
+            AnalysisDimension(dimension.value): [
+                ScenarioDimensionScore(
+                    **{**g, "priority_tier": _convert_priority_tier(g["priority_tier"])}
+                )
+                for g in groups
+            ]
+            for dimension, groups in data["dimensions"].items()
+        },
+    )
+
+
+@router.post(
+    "/sessions/{session_id}/analysis/scenarios",
+    response_model=ScenarioComparisonResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Compare what-if scoring scenarios",
+    description="Re-scores and re-tiers every role and LOB/department/geography aggregate "
+    "under alternative priority weights and tier thresholds, side by side. Nothing is "
+    "stored; scoring inputs are cached per session until its selections change.",
+)
+async def score_scenarios(
+    session_id: UUID,
+    request: ScenarioRequest,
+    service: AnalysisService = Depends(get_analysis_service),
+) -> ScenarioComparisonResponse:
+    """Score a session under several what-if scenarios."""
+    results = await service.score_scenarios(
+        session_id=session_id,
+        scenarios=[s.model_dump(exclude_none=True) for s in request.scenarios],
+        source=request.source,
+    )
+
+    if results is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session with ID {session_id} not found",
+        )
+
+    return ScenarioComparisonResponse(
+        session_id=session_id,
+        source=request.source,
+        scenarios=[_dict_to_scenario_result(r) for r in results],
+    )
+
+
 @router.get(
     "/sessions/{session_id}/analysis/{dimension}",
     response_model=DimensionAnalysisResponse,
@@ -0,0 +1,88 @@
+"""Background jobs router for the Discovery module."""
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.jobs.queue import Job, JobQueue, get_job_queue
+from app.schemas.job import JobResponse, JobResultResponse
+
+router = APIRouter(
+    prefix="/discovery/jobs",
+    tags=["discovery-jobs"],
+)
+
+
+def job_to_response(job: Job) -> JobResponse:
+    """Convert a Job to its API response.
+
+    Args:
+        job: Job to convert.
+
+    Returns:
+        JobResponse for the job.
+    """
+    return JobResponse(
+        id=job.id,
+        type=job.type,
+        status=job.status.value,
+        progress=job.progress,
+        message=job.message,
+        error=job.error,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+async def _get_job_or_404(job_id: str, queue: JobQueue) -> Job:
+    job = await queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found",
+        )
+    return job
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get job status",
+    description="Returns the status and progress of a background job.",
+)
+async def get_job(
+    job_id: str,
+    queue: Annotated[JobQueue, Depends(get_job_queue)],
+) -> JobResponse:
+    """Get a background job's status and progress."""
+    return job_to_response(await _get_job_or_404(job_id, queue))
+
+
+@router.get(
+    "/{job_id}/result",
+    response_model=JobResultResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get job result",
+    description="Returns the result of a finished background job. "
+    "Returns 409 while the job is still queued or running.",
+)
+async def get_job_result(
+    job_id: str,
+    queue: Annotated[JobQueue, Depends(get_job_queue)],
+) -> JobResultResponse:
+    """Get the result of a finished background job."""
+    job = await _get_job_or_404(job_id, queue)
+    if not job.status.is_finished:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} is {job.status.value}",
+        )
+    return JobResultResponse(
+        id=job.id,
+        status=job.status.value,
+        result=job.result,
+        error=job.error,
+    )
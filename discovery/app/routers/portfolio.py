@@ -0,0 +1,78 @@
+"""Organization portfolio router for the Discovery module."""
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+
+from app.routers.analysis import _convert_priority_tier
+from app.schemas.analysis import PriorityTier
+from app.schemas.portfolio import (
+    PortfolioGroup,
+    PortfolioResponse,
+    PortfolioTierSummary,
+    PortfolioTotals,
+)
+from app.services.portfolio_service import (
+    PortfolioService,
+    get_portfolio_service,
+)
+
+router = APIRouter(
+    prefix="/discovery/organizations",
+    tags=["discovery-portfolio"],
+)
+
+
+def _dict_to_portfolio_group(data: dict) -> PortfolioGroup:
+    """Convert a portfolio group dictionary to PortfolioGroup.
+
+    Args:
+        data: Dictionary containing an occupation or LOB summary.
+
+    Returns:
+        PortfolioGroup instance.
+    """
+    tiers = {tier: 0 for tier in PriorityTier}
+    for db_tier, count in data["tiers"].items():
+        tiers[_convert_priority_tier(db_tier)] += count
+
+    return PortfolioGroup(
+        value=data["value"],
+        label=data["label"],
+        role_count=data["role_count"],
+        headcount=data["headcount"],
+        ai_exposure_score=data["ai_exposure_score"],
+        priority_score=data["priority_score"],
+        tiers=tiers,
+    )
+
+
+@router.get(
+    "/{organization_id}/portfolio",
+    response_model=PortfolioResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get organization portfolio",
+    description="Aggregates the latest analysis of every discovery session in an organization "
+    "by O*NET occupation, line of business and priority tier. Served from rollup tables "
+    "maintained by each analysis run.",
+)
+async def get_portfolio(
+    organization_id: UUID,
+    service: PortfolioService = Depends(get_portfolio_service),
+) -> PortfolioResponse:
+    """Get an organization's portfolio across its discovery sessions."""
+    result = await service.get_portfolio(organization_id=organization_id)
+
+    tiers = {tier: PortfolioTierSummary(role_count=0, headcount=0) for tier in PriorityTier}
+    for db_tier, summary in result["tiers"].items():
+        tier = tiers[_convert_priority_tier(db_tier)]
+        tier.role_count += summary["role_count"]
+        tier.headcount += summary["headcount"]
+
+    return PortfolioResponse(
+        organization_id=result["organization_id"],
+        session_count=result["session_count"],
+        totals=PortfolioTotals(**result["totals"]),
+        tiers=tiers,
+        occupations=[_dict_to_portfolio_group(g) for g in result["occupations"]],
+        lobs=[_dict_to_portfolio_group(g) for g in result["lobs"]],
+    )
@@ -1,15 +1,22 @@
 """Role mappings router for the Discovery module."""
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Annotated, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError
 
+from app.jobs.handlers import ROLE_MAPPING_JOB
+from app.jobs.queue import JobQueue, get_job_queue
 from app.repositories.role_mapping_repository import UNIQUE_CONSTRAINT_NAME
 
 logger = logging.getLogger(__name__)
 
+from app.routers.jobs import job_to_response
+from app.schemas.job import JobResponse
 from app.schemas.role_mapping import (
     BulkConfirmRequest,
     BulkConfirmResponse,
@@ -34,6 +41,7 @@ from app.services.role_mapping_service import (
     get_role_mapping_service,
 )
 from app.services.session_service import SessionService, get_session_service
+from app.services.upload_service import UploadService, get_upload_service
 
 
 router = APIRouter(
@@ -212,40 +220,40 @@ async def generate_role_mappings(
     )
 
 
-@router.post(
-    "/sessions/{session_id}/role-mappings",
-    response_model=CreateMappingsResponse,
-    status_code=status.HTTP_201_CREATED,
-    summary="Create role mappings from upload",
-    description="Triggers LLM-powered role mapping for roles in the uploaded file. Extracts unique roles and maps them to O*NET occupations.",
-)
-async def create_role_mappings(
+async def _get_upload_mapping_kwargs(
     session_id: UUID,
-    request: CreateMappingsRequest,
-    service: RoleMappingService = Depends(get_role_mapping_service),
-    session_service: SessionService = Depends(get_session_service),
-) -> CreateMappingsResponse:
-    """Create role mappings from uploaded workforce data.
+    upload_id: UUID,
+    upload_service: UploadService | None,
+    session_service: SessionService,
+) -> dict:
+    """Validate an upload and build create-mappings arguments for it.
 
-    This endpoint triggers the LLM-powered role mapping process:
-    1. Reads the uploaded file content
-    2. Extracts unique role titles from the mapped role column
-    3. Uses Claude to semantically map each role to O*NET occupations
-    4. Applies industry boosting if session has industry set
-    5. Persists the mappings with confidence scores and reasoning
+    Args:
+        session_id: Discovery session ID.
+        upload_id: Upload ID containing the workforce file.
+        upload_service: Upload service, for the upload's column mappings.
+        session_service: Session service, for the session's industry.
+
+    Returns:
+        Keyword arguments for RoleMappingService.create_mappings_from_upload
+        and stream_mappings_from_upload.
+
+    Raises:
+        HTTPException: If the upload or session is missing, the upload
+            belongs to another session, or no role column is mapped.
     """
     # Get upload to find the role column mapping
-    if not service.upload_service:
+    if not upload_service:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Upload service not configured",
         )
 
-    upload = await service.upload_service.repository.get_by_id(request.upload_id)
+    upload = await upload_service.repository.get_by_id(upload_id)
     if not upload:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Upload with ID {request.upload_id} not found",
+            detail=f"Upload with ID {upload_id} not found",
         )
 
     if upload.session_id != session_id:
@@ -278,18 +286,47 @@ async def create_role_mappings(
         )
     industry_naics_sector = session_data.get("industry_naics_sector")
 
+    return {
+        "session_id": session_id,
+        "upload_id": upload_id,
+        "role_column": role_column,
+        "lob_column": lob_column,
+        "headcount_column": headcount_column,
+        "industry_naics_sector": industry_naics_sector,
+        "department_column": department_column,
+        "geography_column": geography_column,
+    }
+
+
+@router.post(
+    "/sessions/{session_id}/role-mappings",
+    response_model=CreateMappingsResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create role mappings from upload",
+    description="Triggers LLM-powered role mapping for roles in the uploaded file. Extracts unique roles and maps them to O*NET occupations.",
+)
+async def create_role_mappings(
+    session_id: UUID,
+    request: CreateMappingsRequest,
+    service: RoleMappingService = Depends(get_role_mapping_service),
+    session_service: SessionService = Depends(get_session_service),
+) -> CreateMappingsResponse:
+    """Create role mappings from uploaded workforce data.
+
+    This endpoint triggers the LLM-powered role mapping process:
+    1. Reads the uploaded file content
+    2. Extracts unique role titles from the mapped role column
+    3. Uses Claude to semantically map each role to O*NET occupations
+    4. Applies industry boosting if session has industry set
+    5. Persists the mappings with confidence scores and reasoning
+    """
+    mapping_kwargs = await _get_upload_mapping_kwargs(
+        session_id, request.upload_id, service.upload_service, session_service
+    )
+
     # Create mappings using LLM agent with optional industry boosting, LOB grouping, and headcount summing
     try:
-        result = await service.create_mappings_from_upload(
-            session_id=session_id,
-            upload_id=request.upload_id,
-            role_column=role_column,
-            lob_column=lob_column,
-            headcount_column=headcount_column,
-            industry_naics_sector=industry_naics_sector,
-            department_column=department_column,
-            geography_column=geography_column,
-        )
+        result = await service.create_mappings_from_upload(**mapping_kwargs)
     except IntegrityError as e:
         # Only catch the specific unique constraint violation for duplicate role mappings
         if UNIQUE_CONSTRAINT_NAME in str(e.orig):
@@ -320,6 +357,87 @@ async def create_role_mappings(
     )
 
 
+@router.post(
+    "/sessions/{session_id}/role-mappings/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Create role mappings from upload with streamed progress",
+    description="Streaming variant of role mapping creation. Emits Server-Sent Events as each batch of roles is mapped and persisted, followed by a summary event.",
+)
+async def stream_role_mappings(
+    session_id: UUID,
+    request: CreateMappingsRequest,
+    service: RoleMappingService = Depends(get_role_mapping_service),
+    session_service: SessionService = Depends(get_session_service),
+) -> StreamingResponse:
+    """Create role mappings from uploaded workforce data via SSE.
+
+    Events (JSON in the SSE data field, discriminated by "type"):
+    - started: total_roles
+    - batch: mappings persisted for a completed batch, completed_roles, total_roles
+    - done: created_count and confidence tier counts
+    - error: message (the stream ends after an error)
+    """
+    mapping_kwargs = await _get_upload_mapping_kwargs(
+        session_id, request.upload_id, service.upload_service, session_service
+    )
+
+    async def sse_generator() -> AsyncIterator[str]:
+        """Format mapping progress events as SSE."""
+        try:
+            async for event in service.stream_mappings_from_upload(**mapping_kwargs):
+                yield f"data: {json.dumps(event)}\n\n"
+        except IntegrityError as e:
+            logger.error(f"Database integrity error during role mapping for session {session_id}: {e}")
+            message = (
+                "Role mapping is already in progress for this session. Please wait and try again."
+                if UNIQUE_CONSTRAINT_NAME in str(e.orig)
+                else "Database error while saving role mappings."
+            )
+            yield f"data: {json.dumps({'type': 'error', 'message': message})}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming role mappings for session {session_id}: {e}")
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+
+    return StreamingResponse(
+        sse_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.post(
+    "/sessions/{session_id}/role-mappings/jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Create role mappings from upload in the background",
+    description="Enqueues role mapping creation as a background job and returns immediately. "
+    "Poll GET /discovery/jobs/{job_id} for progress and /discovery/jobs/{job_id}/result for the summary.",
+)
+async def enqueue_role_mappings_job(
+    session_id: UUID,
+    request: CreateMappingsRequest,
+    # Validation only reads the upload; the worker builds the full mapping service
+    upload_service: UploadService = Depends(get_upload_service),
+    session_service: SessionService = Depends(get_session_service),
+    queue: JobQueue = Depends(get_job_queue),
+) -> JobResponse:
+    """Validate the upload and enqueue a role mapping job."""
+    mapping_kwargs = await _get_upload_mapping_kwargs(
+        session_id, request.upload_id, upload_service, session_service
+    )
+    params = {
+        **mapping_kwargs,
+        "session_id": str(session_id),
+        "upload_id": str(request.upload_id),
+    }
+    job = await queue.enqueue(ROLE_MAPPING_JOB, params)
+    return job_to_response(job)
+
+
 @router.get(
     "/sessions/{session_id}/role-mappings/grouped",
     response_model=GroupedRoleMappingsResponse,
@@ -330,13 +448,21 @@ async def create_role_mappings(
 async def get_grouped_mappings(
     session_id: UUID,
     service: RoleMappingService = Depends(get_role_mapping_service),
+    page: Annotated[
+        int | None, Query(ge=1, description="Page of mappings; omit to return all")
+    ] = None,
+    per_page: Annotated[int, Query(ge=1, le=5000, description="Mappings per page")] = 500,
 ) -> GroupedRoleMappingsResponse:
     """Get role mappings grouped by LOB for aggregated review.
 
     Returns role mappings organized by Line of Business with summary statistics
-    for each group, enabling efficient review of large datasets.
+    for each group, enabling efficient review of large datasets. Summaries
+    always cover the whole session; with page set, only that page of
+    mappings (ordered by LOB, then role) is included.
     """
-    result = await service.get_grouped_mappings(session_id=session_id)
+    result = await service.get_grouped_mappings(
+        session_id=session_id, page=page, per_page=per_page
+    )
 
     return GroupedRoleMappingsResponse(
         session_id=UUID(result["session_id"]) if isinstance(result["session_id"], str) else result["session_id"],
@@ -372,6 +498,8 @@ async def get_grouped_mappings(
             )
             for m in result["ungrouped_mappings"]
         ],
+        page=result.get("page"),
+        per_page=result.get("per_page"),
     )
 
 
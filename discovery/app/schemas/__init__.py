@@ -8,9 +8,13 @@ from app.schemas.activity import (
     SelectionCountResponse,
 )
 from app.schemas.admin import (
+    DwaExposureOverrideRequest,
+    DwaExposureOverrideResponse,
+    LLMCacheStats,
     OnetSyncRequest,
     OnetSyncResponse,
     OnetSyncStatus,
+    RoleMappingCacheStats,
 )
 from app.schemas.analysis import (
     AllDimensionsResponse,
@@ -19,6 +23,12 @@ from app.schemas.analysis import (
     DimensionAnalysisResponse,
     DimensionSummary,
     PriorityTier,
+    ScenarioComparisonResponse,
+    ScenarioDimensionScore,
+    ScenarioRequest,
+    ScenarioResult,
+    ScenarioRoleScore,
+    ScoringScenario,
     TriggerAnalysisResponse,
 )
 from app.schemas.chat import (
@@ -37,6 +47,16 @@ from app.schemas.handoff import (
     HandoffStatus,
     ValidationResult,
 )
+from app.schemas.job import (
+    JobResponse,
+    JobResultResponse,
+)
+from app.schemas.portfolio import (
+    PortfolioGroup,
+    PortfolioResponse,
+    PortfolioTierSummary,
+    PortfolioTotals,
+)
 from app.schemas.roadmap import (
     BulkPhaseUpdate,
     BulkUpdateRequest,
@@ -81,6 +101,7 @@ from app.schemas.upload import (
 __all__ = [
     "ActivitySelectionUpdate",
     "AllDimensionsResponse",
+    "LLMCacheStats",
     "OnetSyncRequest",
     "OnetSyncResponse",
     "OnetSyncStatus",
@@ -100,6 +121,8 @@ __all__ = [
     "DimensionAnalysisResponse",
     "DimensionSummary",
     "DWAResponse",
+    "DwaExposureOverrideRequest",
+    "DwaExposureOverrideResponse",
     "EstimatedEffort",
     "GWAGroupResponse",
     "HandoffBundle",
@@ -107,9 +130,15 @@ __all__ = [
     "HandoffRequest",
     "HandoffResponse",
     "HandoffStatus",
+    "JobResponse",
+    "JobResultResponse",
     "OnetOccupation",
     "OnetSearchResult",
     "PhaseUpdate",
+    "PortfolioGroup",
+    "PortfolioResponse",
+    "PortfolioTierSummary",
+    "PortfolioTotals",
     "PriorityTier",
     "QuickAction",
     "QuickActionRequest",
@@ -119,8 +148,15 @@ __all__ = [
     "RoadmapItem",
     "RoadmapItemsResponse",
     "RoadmapPhase",
+    "RoleMappingCacheStats",
     "RoleMappingResponse",
     "RoleMappingUpdate",
+    "ScenarioComparisonResponse",
+    "ScenarioDimensionScore",
+    "ScenarioRequest",
+    "ScenarioResult",
+    "ScenarioRoleScore",
+    "ScoringScenario",
     "SelectionCountResponse",
     "SessionCreate",
     "SessionResponse",
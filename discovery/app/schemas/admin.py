@@ -1,6 +1,6 @@
 """Admin schemas for the Discovery module."""
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, Field
 
@@ -78,3 +78,106 @@ class OnetSyncStatus(BaseModel):
         ge=0,
         description="Number of occupations in database",
     )
+
+
+class LLMCacheStats(BaseModel):
+    """LLM response cache metrics for this process."""
+
+    enabled: bool = Field(
+        ...,
+        description="Whether LLM response caching is enabled",
+    )
+    backend: Optional[str] = Field(
+        default=None,
+        description="Cache backend class (if enabled)",
+    )
+    hits: int = Field(
+        default=0,
+        ge=0,
+        description="Requests served from the cache",
+    )
+    misses: int = Field(
+        default=0,
+        ge=0,
+        description="Requests not found in the cache",
+    )
+    errors: int = Field(
+        default=0,
+        ge=0,
+        description="Cache backend operations that failed",
+    )
+    hit_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of lookups served from the cache",
+    )
+
+
+class RoleMappingCacheStats(BaseModel):
+    """Cross-session role mapping cache metrics."""
+
+    enabled: bool = Field(
+        ...,
+        description="Whether the role mapping cache is enabled",
+    )
+    onet_version: Optional[str] = Field(
+        default=None,
+        description="O*NET version the cache is scoped to (if enabled)",
+    )
+    model: Optional[str] = Field(
+        default=None,
+        description="LLM model the cache is scoped to (if enabled)",
+    )
+    total_entries: int = Field(
+        default=0,
+        ge=0,
+        description="Entries stored for any version or model",
+    )
+    current_entries: int = Field(
+        default=0,
+        ge=0,
+        description="Entries for the current version and model",
+    )
+    total_hits: int = Field(
+        default=0,
+        ge=0,
+        description="Persisted hit count of current entries, across processes",
+    )
+    hits: int = Field(
+        default=0,
+        ge=0,
+        description="Roles served from the cache by this process",
+    )
+    misses: int = Field(
+        default=0,
+        ge=0,
+        description="Roles not found in the cache by this process",
+    )
+    hit_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of this process's lookups served from the cache",
+    )
+
+
+class DwaExposureOverrideRequest(BaseModel):
+    """Request to set or clear AI exposure overrides on DWAs."""
+
+    overrides: dict[str, Annotated[float, Field(ge=0.0, le=1.0)] | None] = Field(
+        ...,
+        min_length=1,
+        description="DWA ID to override score (0.0-1.0); null clears the override "
+        "so the DWA inherits its GWA's score",
+    )
+
+
+class DwaExposureOverrideResponse(BaseModel):
+    """Response from a DWA exposure override update."""
+
+    updated: int = Field(
+        ...,
+        ge=0,
+        description="Number of DWA overrides written",
+    )
@@ -1,5 +1,6 @@
 """Analysis schemas for the Discovery module."""
 from enum import Enum
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field, RootModel
@@ -131,3 +132,171 @@ class TriggerAnalysisResponse(BaseModel):
     model_config = {
         "from_attributes": True,
     }
+
+
+class ScoringScenario(BaseModel):
+    """Schema for one what-if scoring scenario.
+
+    Fields left unset keep the ScoringEngine defaults.
+    """
+
+    name: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Scenario name, echoed in the result",
+    )
+    exposure_weight: float | None = Field(
+        default=None,
+        ge=0.0,
+        description="Weight of AI exposure in priority",
+    )
+    impact_weight: float | None = Field(
+        default=None,
+        ge=0.0,
+        description="Weight of impact in priority",
+    )
+    ease_weight: float | None = Field(
+        default=None,
+        ge=0.0,
+        description="Weight of ease (1 - complexity) in priority",
+    )
+    now_priority_threshold: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum priority for the HIGH tier",
+    )
+    now_complexity_threshold: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Complexity the HIGH tier must stay below",
+    )
+    next_quarter_priority_threshold: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum priority for the MEDIUM tier",
+    )
+
+
+class ScenarioRequest(BaseModel):
+    """Schema for a what-if scoring request."""
+
+    source: Literal["tasks", "activities"] = Field(
+        default="tasks",
+        description="Selections providing exposure: 'tasks' or 'activities'",
+    )
+    scenarios: list[ScoringScenario] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="Scenarios to score and compare side by side",
+    )
+
+
+class ScenarioRoleScore(AnalysisResult):
+    """Schema for a role scored under a scenario.
+
+    Priority is unbounded above, since scenario weights need not sum to 1.
+    """
+
+    priority_score: float = Field(
+        ...,
+        ge=0.0,
+        description="Priority score under the scenario's weights",
+    )
+
+
+class ScenarioDimensionScore(BaseModel):
+    """Schema for a dimension value aggregated under a scenario."""
+
+    name: str = Field(
+        ...,
+        description="Dimension value (e.g., LOB name)",
+    )
+    ai_exposure_score: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Headcount-weighted AI exposure score (0.0-1.0)",
+    )
+    impact_score: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Headcount-weighted impact score (0.0-1.0)",
+    )
+    complexity_score: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Headcount-weighted complexity score (0.0-1.0)",
+    )
+    priority_score: float = Field(
+        ...,
+        ge=0.0,
+        description="Headcount-weighted priority score",
+    )
+    priority_tier: PriorityTier = Field(
+        ...,
+        description="Priority tier classification",
+    )
+    row_count: int = Field(
+        ...,
+        ge=0,
+        description="Total employees in the dimension value",
+    )
+    role_count: int = Field(
+        ...,
+        ge=0,
+        description="Number of roles in the dimension value",
+    )
+
+
+class ScenarioResult(BaseModel):
+    """Schema for the scores of a session under one scenario."""
+
+    name: str = Field(
+        ...,
+        description="Scenario name",
+    )
+    weights: dict[str, float] = Field(
+        ...,
+        description="Effective priority weights (exposure, impact, ease)",
+    )
+    thresholds: dict[str, float] = Field(
+        ...,
+        description="Effective tier thresholds (now_priority, now_complexity, "
+        "next_quarter_priority)",
+    )
+    tier_counts: dict[PriorityTier, int] = Field(
+        ...,
+        description="Number of roles per priority tier",
+    )
+    roles: list[ScenarioRoleScore] = Field(
+        ...,
+        description="Roles sorted by priority score, highest first",
+    )
+    dimensions: dict[AnalysisDimension, list[ScenarioDimensionScore]] = Field(
+        ...,
+        description="Aggregates per grouping dimension, highest priority first",
+    )
+
+
+class ScenarioComparisonResponse(BaseModel):
+    """Schema for a what-if scoring response."""
+
+    session_id: UUID = Field(
+        ...,
+        description="Discovery session ID",
+    )
+    source: str = Field(
+        ...,
+        description="Selections that provided exposure",
+    )
+    scenarios: list[ScenarioResult] = Field(
+        ...,
+        description="Scenario results, in request order",
+    )
@@ -0,0 +1,78 @@
+"""Background job schemas for the Discovery module."""
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobResponse(BaseModel):
+    """Status of a background job."""
+
+    id: str = Field(
+        ...,
+        description="Job ID",
+    )
+    type: str = Field(
+        ...,
+        description="Job type (role_mapping, analysis, or onet_sync)",
+    )
+    status: str = Field(
+        ...,
+        description="Job status (queued, running, succeeded, or failed)",
+    )
+    progress: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Completion fraction between 0 and 1",
+    )
+    message: Optional[str] = Field(
+        default=None,
+        description="Latest progress message",
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Error from the last failed attempt",
+    )
+    attempts: int = Field(
+        ...,
+        ge=0,
+        description="Number of attempts started",
+    )
+    max_attempts: int = Field(
+        ...,
+        ge=1,
+        description="Attempts allowed before the job fails",
+    )
+    created_at: str = Field(
+        ...,
+        description="When the job was enqueued (ISO 8601)",
+    )
+    started_at: Optional[str] = Field(
+        default=None,
+        description="When the latest attempt started (ISO 8601)",
+    )
+    finished_at: Optional[str] = Field(
+        default=None,
+        description="When the job succeeded or failed (ISO 8601)",
+    )
+
+
+class JobResultResponse(BaseModel):
+    """Result of a finished background job."""
+
+    id: str = Field(
+        ...,
+        description="Job ID",
+    )
+    status: str = Field(
+        ...,
+        description="Final job status (succeeded or failed)",
+    )
+    result: Any = Field(
+        default=None,
+        description="Job result if the job succeeded",
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Error message if the job failed",
+    )
@@ -0,0 +1,115 @@
+"""Organization portfolio schemas for the Discovery module."""
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.schemas.analysis import PriorityTier
+
+
+class PortfolioTierSummary(BaseModel):
+    """Schema for the roles of a portfolio in one priority tier."""
+
+    role_count: int = Field(
+        ...,
+        ge=0,
+        description="Number of roles in the tier",
+    )
+    headcount: int = Field(
+        ...,
+        ge=0,
+        description="Employees in roles of the tier",
+    )
+
+
+class PortfolioTotals(BaseModel):
+    """Schema for portfolio-wide totals."""
+
+    role_count: int = Field(
+        ...,
+        ge=0,
+        description="Number of analyzed roles across all sessions",
+    )
+    headcount: int = Field(
+        ...,
+        ge=0,
+        description="Employees in analyzed roles across all sessions",
+    )
+    ai_exposure_score: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Headcount-weighted AI exposure score (0.0-1.0)",
+    )
+    priority_score: float = Field(
+        ...,
+        ge=0.0,
+        description="Headcount-weighted priority score",
+    )
+
+
+class PortfolioGroup(BaseModel):
+    """Schema for an occupation or LOB across an organization's sessions."""
+
+    value: str | None = Field(
+        default=None,
+        description="O*NET code or LOB name; null for unmapped roles or roles without a LOB",
+    )
+    label: str | None = Field(
+        default=None,
+        description="O*NET occupation title, for occupations",
+    )
+    role_count: int = Field(
+        ...,
+        ge=0,
+        description="Number of roles",
+    )
+    headcount: int = Field(
+        ...,
+        ge=0,
+        description="Employees in the roles",
+    )
+    ai_exposure_score: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Headcount-weighted AI exposure score (0.0-1.0)",
+    )
+    priority_score: float = Field(
+        ...,
+        ge=0.0,
+        description="Headcount-weighted priority score",
+    )
+    tiers: dict[PriorityTier, int] = Field(
+        ...,
+        description="Number of roles per priority tier",
+    )
+
+
+class PortfolioResponse(BaseModel):
+    """Schema for an organization's portfolio across discovery sessions."""
+
+    organization_id: UUID = Field(
+        ...,
+        description="Organization ID",
+    )
+    session_count: int = Field(
+        ...,
+        ge=0,
+        description="Number of analyzed sessions",
+    )
+    totals: PortfolioTotals = Field(
+        ...,
+        description="Totals across all analyzed roles",
+    )
+    tiers: dict[PriorityTier, PortfolioTierSummary] = Field(
+        ...,
+        description="Roles and headcount per priority tier",
+    )
+    occupations: list[PortfolioGroup] = Field(
+        ...,
+        description="Roles grouped by O*NET occupation, largest headcount first",
+    )
+    lobs: list[PortfolioGroup] = Field(
+        ...,
+        description="Roles grouped by line of business, largest headcount first",
+    )
@@ -307,6 +307,14 @@ class GroupedRoleMappingsResponse(BaseModel):
         default_factory=list,
         description="Role mappings without LOB assignment",
     )
+    page: Optional[int] = Field(
+        default=None,
+        description="Page of mappings returned, or None when unpaginated",
+    )
+    per_page: Optional[int] = Field(
+        default=None,
+        description="Mappings per page, or None when unpaginated",
+    )
 
 
 class CreateMappingsRequest(BaseModel):
@@ -11,6 +11,8 @@ from app.services.chat_service import ChatService, get_chat_service
 from app.services.context_service import ContextService, get_context_service
 from app.services.export_service import ExportService, get_export_service
 from app.services.handoff_service import HandoffService, get_handoff_service
+from app.services.llm_cache import LLMResponseCache, get_llm_cache
+from app.services.llm_client import LLMClientPool, get_llm_client_pool
 from app.services.llm_service import LLMService, get_llm_service
 from app.services.lob_mapping_service import LobMappingService, LobNaicsResult
 from app.services.memory_service import AgentMemoryService
@@ -22,7 +24,12 @@ from app.services.onet_file_sync_service import (
     OnetSyncError,
     SyncResult,
 )
+from app.services.onet_industry_index import OnetIndustryIndex, get_onet_industry_index
+from app.services.onet_search_index import OnetSearchIndex, get_onet_search_index
+from app.services.onet_title_index import OnetTitleIndex, get_onet_title_index
+from app.services.portfolio_service import PortfolioService, get_portfolio_service
 from app.services.roadmap_service import RoadmapService, get_roadmap_service
+from app.services.role_mapping_cache import RoleMappingCache, normalize_role_title
 from app.services.role_mapping_service import (
     OnetService,
     RoleMappingService,
@@ -43,6 +50,8 @@ __all__ = [
     "ContextService",
     "ExportService",
     "HandoffService",
+    "LLMClientPool",
+    "LLMResponseCache",
     "LLMService",
     "LobMappingService",
     "LobNaicsResult",
@@ -50,10 +59,15 @@ __all__ = [
     "OnetDownloadError",
     "OnetFileSyncService",
     "OnetParseError",
+    "OnetIndustryIndex",
+    "OnetSearchIndex",
+    "OnetTitleIndex",
     "OnetService",
     "OnetSyncError",
     "SyncResult",
+    "PortfolioService",
     "RoadmapService",
+    "RoleMappingCache",
     "RoleMappingService",
     "ScoringService",
     "SessionService",
@@ -65,12 +79,19 @@ __all__ = [
     "get_context_service",
     "get_export_service",
     "get_handoff_service",
+    "get_llm_cache",
+    "get_llm_client_pool",
     "get_llm_service",
+    "get_onet_industry_index",
+    "get_onet_search_index",
+    "get_onet_title_index",
     "get_onet_service",
+    "get_portfolio_service",
     "get_roadmap_service",
     "get_role_mapping_service",
     "get_scoring_service",
     "get_session_service",
     "get_task_service",
     "get_upload_service",
+    "normalize_role_title",
 ]
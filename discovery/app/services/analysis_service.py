@@ -1,20 +1,312 @@
 # discovery/app/services/analysis_service.py
 """Analysis service for scoring and aggregation."""
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.analysis_repository import AnalysisRepository
 from app.repositories.role_mapping_repository import RoleMappingRepository
-from app.repositories.activity_selection_repository import ActivitySelectionRepository
+from app.repositories.activity_selection_repository import (
+    DEFAULT_DWA_EXPOSURE,
+    ActivitySelectionRepository,
+)
 from app.repositories.task_selection_repository import TaskSelectionRepository
 from app.repositories.onet_repository import OnetRepository
+from app.services.score_cache import (
+    SessionScoreArrays,
+    SessionScoreCache,
+    get_session_score_cache,
+)
 from app.services.scoring_engine import ScoringEngine
 from app.schemas.analysis import AnalysisDimension, PriorityTier
 from app.models.discovery_analysis import AnalysisDimension as DBDimension
-from app.models.onet_work_activities import OnetDWA, OnetIWA, OnetGWA
+
+# Number of DWA exposure scores kept in each result's breakdown
+DWA_SCORE_SAMPLE_SIZE = 5
+
+# Dimensions aggregated from role results, with the mapping attribute grouped on
+AGGREGATE_DIMENSIONS = (
+    (DBDimension.LOB, "lob_value"),
+    (DBDimension.DEPARTMENT, "department_value"),
+    (DBDimension.GEOGRAPHY, "geography_value"),
+)
+
+# Role result score fields, in the column order used for aggregation
+SCORE_FIELDS = ("ai_exposure_score", "impact_score", "complexity_score", "priority_score")
+
+
+def _select_mappings(
+    mappings: Sequence[Any],
+    role_mapping_ids: list[UUID] | None,
+) -> Sequence[Any]:
+    """Keep the mappings to re-score; None keeps all of them."""
+    if role_mapping_ids is None:
+        return mappings
+    wanted = set(role_mapping_ids)
+    return [m for m in mappings if m.id in wanted]
+
+
+def _aggregate_task_edges(
+    mappings: Sequence[Any],
+    edges: Sequence[Row],
+) -> dict[str, Any]:
+    """Reduce selected-task → DWA edges to per-mapping inputs.
+
+    Tasks and DWAs are de-duplicated within each mapping, so a DWA reached
+    through several selected tasks counts once.
+
+    Args:
+        mappings: Role mappings, in result order.
+        edges: Rows of (role_mapping_id, task_id, dwa_id, exposure).
+
+    Returns:
+        Dict with per-mapping arrays task_count, dwa_count and exposure
+        (DEFAULT_DWA_EXPOSURE without DWAs), and dwa_scores, a list of the
+        first DWA_SCORE_SAMPLE_SIZE exposures by DWA ID per mapping.
+    """
+    n = len(mappings)
+    index = {mapping.id: i for i, mapping in enumerate(mappings)}
+
+    groups = np.array([index.get(e.role_mapping_id, -1) for e in edges], dtype=np.int64)
+    task_ids = np.array([e.task_id for e in edges], dtype=np.int64)
+    dwa_ids = np.array([e.dwa_id or "" for e in edges], dtype=str)
+    exposures = np.array([e.exposure for e in edges], dtype=np.float64)
+
+    known = groups >= 0
+    task_pairs = np.unique(
+        np.stack([groups[known], task_ids[known]], axis=1), axis=0
+    ).reshape(-1, 2)
+    task_count = np.bincount(task_pairs[:, 0], minlength=n)
+
+    has_dwa = known & (dwa_ids != "")
+    _, dwa_codes = np.unique(dwa_ids[has_dwa], return_inverse=True)
+    dwa_pairs, first = np.unique(
+        np.stack([groups[has_dwa], dwa_codes.reshape(-1)], axis=1),
+        axis=0,
+        return_index=True,
+    )
+    dwa_pairs = dwa_pairs.reshape(-1, 2)
+    dwa_groups = dwa_pairs[:, 0]
+    dwa_exposures = exposures[has_dwa][first]
+
+    dwa_count = np.bincount(dwa_groups, minlength=n)
+    exposure_sum = np.bincount(dwa_groups, weights=dwa_exposures, minlength=n)
+    exposure = np.full(n, DEFAULT_DWA_EXPOSURE)
+    np.divide(exposure_sum, dwa_count, out=exposure, where=dwa_count > 0)
+
+    # Pairs are sorted by (mapping, DWA ID), so each mapping's DWAs are contiguous
+    starts = np.searchsorted(dwa_groups, np.arange(n))
+    dwa_scores = [
+        dwa_exposures[start:start + min(count, DWA_SCORE_SAMPLE_SIZE)].tolist()
+        or [DEFAULT_DWA_EXPOSURE]
+        for start, count in zip(starts.tolist(), dwa_count.tolist())
+    ]
+
+    return {
+        "task_count": task_count,
+        "dwa_count": dwa_count,
+        "exposure": exposure,
+        "dwa_scores": dwa_scores,
+    }
+
+
+def _group_codes(mappings: Sequence[Any], attribute: str) -> tuple[list[str], np.ndarray]:
+    """Integer-code role mappings by a grouping attribute.
+
+    Args:
+        mappings: Role mappings.
+        attribute: Mapping attribute holding the group value.
+
+    Returns:
+        Tuple of the sorted group names and each mapping's group code
+        (-1 for mappings without a value).
+    """
+    values = np.array([getattr(m, attribute) or "" for m in mappings], dtype=str)
+    grouped = values != ""
+    names, inverse = np.unique(values[grouped], return_inverse=True)
+    codes = np.full(len(mappings), -1, dtype=np.int64)
+    codes[grouped] = inverse.reshape(-1)
+    return names.tolist(), codes
+
+
+def _reduce_groups(
+    names: list[str],
+    codes: np.ndarray,
+    weights: np.ndarray,
+    scores: np.ndarray,
+    scoring_engine: ScoringEngine,
+) -> list[dict[str, Any]]:
+    """Headcount-weighted means of role scores per group, in one grouped pass.
+
+    Roles with code -1 are left out. Groups whose roles have no headcount
+    fall back to a plain mean.
+
+    Args:
+        names: Group names, indexed by code.
+        codes: Group code per role.
+        weights: Headcount per role.
+        scores: Array of shape (roles, 4) with each role's SCORE_FIELDS.
+        scoring_engine: Engine classifying the aggregate priority tiers.
+
+    Returns:
+        One dict per group with name, the SCORE_FIELDS, row_count
+        (total headcount), role_count and priority_tier.
+    """
+    grouped = codes >= 0
+    if not grouped.any():
+        return []
+
+    n = len(names)
+    group_codes = codes[grouped]
+    group_weights = weights[grouped]
+    group_scores = scores[grouped]
+
+    role_count = np.bincount(group_codes, minlength=n)
+    headcount = np.bincount(group_codes, weights=group_weights, minlength=n)
+    weighted = np.stack([
+        np.bincount(group_codes, weights=group_scores[:, k] * group_weights, minlength=n)
+        for k in range(len(SCORE_FIELDS))
+    ], axis=1)
+    plain = np.stack([
+        np.bincount(group_codes, weights=group_scores[:, k], minlength=n)
+        for k in range(len(SCORE_FIELDS))
+    ], axis=1)
+    present = role_count > 0
+    means = np.where(
+        (headcount > 0)[:, None],
+        weighted / np.maximum(headcount, 1)[:, None],
+        plain / np.maximum(role_count, 1)[:, None],
+    ).round(3)
+    tiers = scoring_engine.classify_priority_tiers(means[:, 3], means[:, 2])
+
+    return [
+        {
+            "name": name,
+            **dict(zip(SCORE_FIELDS, row)),
+            "row_count": count,
+            "role_count": roles,
+            "priority_tier": str(tier),
+        }
+        for name, row, count, roles, tier, keep in zip(
+            names,
+            means.tolist(),
+            headcount.astype(np.int64).tolist(),
+            role_count.tolist(),
+            tiers.tolist(),
+            present.tolist(),
+        )
+        if keep
+    ]
+
+
+def _aggregate_dimensions(
+    session_id: UUID,
+    mappings: Sequence[Any],
+    scores: np.ndarray,
+    scoring_engine: ScoringEngine,
+) -> list[dict[str, Any]]:
+    """Headcount-weighted aggregates of role scores for every grouping dimension.
+
+    Each dimension is reduced in one grouped pass over the mappings;
+    mappings without a value for a dimension are left out of it.
+
+    Args:
+        session_id: Discovery session ID.
+        mappings: Scored role mappings.
+        scores: Array of shape (len(mappings), 4) with each mapping's
+            SCORE_FIELDS.
+        scoring_engine: Engine classifying the aggregate priority tiers.
+
+    Returns:
+        Result dicts for the AGGREGATE_DIMENSIONS, ready to insert.
+    """
+    if not mappings:
+        return []
+
+    weights = np.array([m.row_count or 0 for m in mappings], dtype=np.float64)
+    results = []
+    for dimension, attribute in AGGREGATE_DIMENSIONS:
+        names, codes = _group_codes(mappings, attribute)
+        results.extend(
+            {
+                "session_id": session_id,
+                "role_mapping_id": None,
+                "dimension": dimension,
+                "dimension_value": group["name"],
+                **{field: group[field] for field in SCORE_FIELDS},
+                "row_count": group["row_count"],
+                "breakdown": {
+                    "role_count": group["role_count"],
+                    "priority_tier": group["priority_tier"],
+                },
+            }
+            for group in _reduce_groups(names, codes, weights, scores, scoring_engine)
+        )
+
+    return results
+
+
+def _score_scenario(
+    arrays: SessionScoreArrays,
+    scoring_engine: ScoringEngine,
+) -> dict[str, Any]:
+    """Score and tier every role and grouping dimension under one scenario.
+
+    Args:
+        arrays: Cached scoring inputs of the session.
+        scoring_engine: Engine configured with the scenario's weights and
+            tier thresholds.
+
+    Returns:
+        Dict with roles (sorted by priority, highest first), dimensions
+        (aggregates per grouping dimension value) and tier_counts (roles
+        per priority tier).
+    """
+    scores = scoring_engine.score_roles(
+        exposure=arrays.exposure,
+        row_counts=arrays.row_counts,
+        total_rows=int(arrays.row_counts.sum()),
+    )
+    tiers = scoring_engine.classify_priority_tiers(scores["priority"], scores["complexity"])
+    columns = np.stack(
+        [scores["ai_exposure"], scores["impact"], scores["complexity"], scores["priority"]],
+        axis=1,
+    ).reshape(-1, len(SCORE_FIELDS))
+
+    order = np.argsort(-columns[:, 3], kind="stable").tolist()
+    rows = columns.tolist()
+    tier_list = tiers.tolist()
+    row_counts = arrays.row_counts.tolist()
+    roles = [
+        {
+            "role_mapping_id": arrays.role_mapping_ids[i],
+            "name": arrays.role_names[i],
+            **dict(zip(SCORE_FIELDS, rows[i])),
+            "priority_tier": str(tier_list[i]),
+            "row_count": row_counts[i],
+        }
+        for i in order
+    ]
+
+    weights = arrays.row_counts.astype(np.float64)
+    dimensions = {
+        dimension: sorted(
+            _reduce_groups(names, codes, weights, columns, scoring_engine),
+            key=lambda group: group["priority_score"],
+            reverse=True,
+        )
+        for dimension, (names, codes) in arrays.groups.items()
+    }
+
+    tier_names, tier_counts = np.unique(tiers.astype(str), return_counts=True)
+    return {
+        "roles": roles,
+        "dimensions": dimensions,
+        "tier_counts": dict(zip(tier_names.tolist(), tier_counts.tolist())),
+    }
 
 
 class AnalysisService:
@@ -29,6 +321,7 @@ class AnalysisService:
         onet_repository: OnetRepository | None = None,
         scoring_engine: ScoringEngine | None = None,
         db: AsyncSession | None = None,
+        score_cache: SessionScoreCache | None = None,
     ) -> None:
         self.analysis_repository = analysis_repository
         self.role_mapping_repository = role_mapping_repository
@@ -37,90 +330,113 @@ class AnalysisService:
         self.onet_repository = onet_repository
         self.scoring_engine = scoring_engine or ScoringEngine()
         self.db = db
+        self.score_cache = score_cache
 
-    async def _get_dwa_exposure_scores(
+    async def _plan_analysis(
         self,
-        dwa_ids: list[str],
-    ) -> list[float]:
-        """Get AI exposure scores for DWAs from the O*NET hierarchy.
-
-        For each DWA, uses ai_exposure_override if set, otherwise
-        inherits from the parent GWA's ai_exposure_score.
+        session_id: UUID,
+        mappings: Sequence[Any],
+        state: Any,
+        source: str,
+        incremental: bool,
+    ) -> list[UUID] | None:
+        """Pick the role mappings an analysis run must re-score.
+
+        An incremental run re-scores only mappings whose selections changed
+        since the stored analysis. It falls back to a full run when there is
+        no stored analysis from the same source, when the effective DWA
+        exposure data was refreshed since (GWA scores or DWA overrides
+        changed), or when mappings or their headcounts changed, since total
+        headcount feeds every impact score.
 
         Args:
-            dwa_ids: List of DWA IDs to get scores for.
+            session_id: Discovery session ID.
+            mappings: All role mappings of the session.
+            state: Session analysis state (see AnalysisRepository.get_analysis_state).
+            source: "tasks" or "activities".
+            incremental: Whether an incremental run was requested.
 
         Returns:
-            List of exposure scores (0-1). Returns 0.5 for missing data.
+            IDs of the mappings to re-score, or None for all of them.
         """
-        if not self.db or not dwa_ids:
-            return [0.5] * len(dwa_ids) if dwa_ids else [0.5]
-
-        # Query DWA -> IWA -> GWA to get exposure scores
-        stmt = (
-            select(
-                OnetDWA.id,
-                OnetDWA.ai_exposure_override,
-                OnetGWA.ai_exposure_score,
-            )
-            .select_from(OnetDWA)
-            .join(OnetIWA, OnetDWA.iwa_id == OnetIWA.id)
-            .join(OnetGWA, OnetIWA.gwa_id == OnetGWA.id)
-            .where(OnetDWA.id.in_(dwa_ids))
-        )
+        if (
+            not incremental
+            or state.analyzed_version is None
+            or state.analysis_source != source
+            or state.analyzed_exposure_version != state.exposure_version
+        ):
+            return None
 
-        result = await self.db.execute(stmt)
-        rows = result.all()
-
-        # Build lookup of DWA ID -> exposure score
-        score_lookup: dict[str, float] = {}
-        for row in rows:
-            # Use DWA override if available, otherwise GWA score
-            if row.ai_exposure_override is not None:
-                score_lookup[row.id] = row.ai_exposure_override
-            elif row.ai_exposure_score is not None:
-                score_lookup[row.id] = row.ai_exposure_score
-            else:
-                score_lookup[row.id] = 0.5  # Default if no score available
+        scored_row_counts = await self.analysis_repository.get_role_row_counts(session_id)
+        if scored_row_counts != {m.id: m.row_count for m in mappings}:
+            return None
 
-        # Return scores in order of input dwa_ids
-        return [score_lookup.get(dwa_id, 0.5) for dwa_id in dwa_ids]
+        return [m.id for m in mappings if m.selection_version > state.analyzed_version]
 
-    async def trigger_analysis(self, session_id: UUID) -> dict[str, Any] | None:
+    async def trigger_analysis(
+        self,
+        session_id: UUID,
+        incremental: bool = False,
+    ) -> dict[str, Any] | None:
         """Trigger scoring analysis for a session.
 
-        Calculates scores for all role mappings and stores results.
-        Uses real AI exposure scores from O*NET GWA/DWA data.
+        Calculates scores for all role mappings and stores them with their
+        LOB, department and geography aggregates (see _store_results).
+        Uses real AI exposure scores from O*NET GWA/DWA data, aggregated
+        per mapping by a single session-wide query. With incremental=True
+        only mappings whose activity selections changed since the last
+        analysis are re-scored (see _plan_analysis).
         """
         if not self.role_mapping_repository or not self.activity_selection_repository:
             return {"status": "error", "message": "Missing dependencies"}
 
+        # Read the version first so writes made during the run stay dirty
+        state = await self.analysis_repository.get_analysis_state(session_id)
+        if state is None:
+            return None
+
         # Get all role mappings
         mappings = await self.role_mapping_repository.get_for_session(session_id)
         if not mappings:
             return {"status": "error", "message": "No mappings found"}
 
+        dirty_ids = await self._plan_analysis(
+            session_id, mappings, state, "activities", incremental
+        )
+        if dirty_ids is not None and not dirty_ids:
+            return await self._store_results(
+                session_id, mappings, [], state, "activities", dirty_ids
+            )
+
         # Calculate total rows
         total_rows = sum(m.row_count or 0 for m in mappings)
+        all_mappings = mappings
+        mappings = _select_mappings(mappings, dirty_ids)
+
+        # Exposure of every mapping's selected DWAs, aggregated in one query
+        summaries = {
+            row.role_mapping_id: row
+            for row in await self.activity_selection_repository.get_exposure_summaries(
+                session_id, role_mapping_ids=dirty_ids
+            )
+        }
 
         results_to_save = []
         for mapping in mappings:
-            # Get selected DWAs for this mapping
-            selections = await self.activity_selection_repository.get_for_role_mapping(
-                mapping.id
-            )
-            selected_dwas = [s for s in selections if s.selected]
-
-            # Get real AI exposure scores from O*NET hierarchy
-            if selected_dwas:
-                dwa_ids = [s.dwa_id for s in selected_dwas]
-                dwa_scores = await self._get_dwa_exposure_scores(dwa_ids)
+            summary = summaries.get(mapping.id)
+            if summary is not None:
+                exposure = float(summary.avg_exposure)
+                dwa_count = summary.dwa_count
+                dwa_scores = [float(s) for s in summary.sample_scores]
             else:
-                dwa_scores = [0.5]  # Default when no activities selected
+                # Default when no activities selected
+                exposure = DEFAULT_DWA_EXPOSURE
+                dwa_count = 0
+                dwa_scores = [DEFAULT_DWA_EXPOSURE]
 
             # Calculate scores
-            scores = self.scoring_engine.score_role(
-                dwa_scores=dwa_scores,
+            scores = self.scoring_engine.score_exposure(
+                exposure=exposure,
                 row_count=mapping.row_count or 0,
                 total_rows=total_rows,
             )
@@ -140,100 +456,280 @@ class AnalysisService:
                 "priority_score": scores["priority"],
                 "row_count": mapping.row_count,
                 "breakdown": {
-                    "dwa_count": len(selected_dwas),
+                    "dwa_count": dwa_count,
                     "priority_tier": priority_tier,
-                    "dwa_scores": dwa_scores[:5],  # Include first 5 for debugging
+                    "dwa_scores": dwa_scores,  # First 5 (by DWA ID) for debugging
                 },
             })
 
-        await self.analysis_repository.save_results(results_to_save)
-        return {"status": "completed", "count": len(results_to_save)}
+        return await self._store_results(
+            session_id, all_mappings, results_to_save, state, "activities", dirty_ids
+        )
+
+    async def _store_results(
+        self,
+        session_id: UUID,
+        mappings: Sequence[Any],
+        role_results: list[dict[str, Any]],
+        state: Any,
+        source: str,
+        dirty_ids: list[UUID] | None,
+    ) -> dict[str, Any]:
+        """Replace the re-scored role results and every dimension aggregate.
+
+        Aggregates always cover all mappings: on incremental runs the
+        stored scores of unchanged mappings are combined with the new ones.
+
+        Args:
+            session_id: Discovery session ID.
+            mappings: All role mappings of the session.
+            role_results: New ROLE results.
+            state: Session analysis state read before scoring.
+            source: "tasks" or "activities".
+            dirty_ids: Re-scored mapping IDs, or None for a full run.
+
+        Returns:
+            Status dict with the role result count and run mode.
+        """
+        if dirty_ids is not None and not dirty_ids:
+            # Nothing changed since the stored analysis
+            return {"status": "completed", "count": 0, "mode": "incremental"}
+
+        scores = {
+            r["role_mapping_id"]: [r[field] for field in SCORE_FIELDS]
+            for r in role_results
+        }
+        if dirty_ids is not None:
+            for r in await self.analysis_repository.get_for_session(
+                session_id, DBDimension.ROLE
+            ):
+                scores.setdefault(r.role_mapping_id, [getattr(r, f) for f in SCORE_FIELDS])
+        scored = [m for m in mappings if m.id in scores]
+        dimension_results = _aggregate_dimensions(
+            session_id,
+            scored,
+            np.array([scores[m.id] for m in scored], dtype=np.float64).reshape(-1, len(SCORE_FIELDS)),
+            self.scoring_engine,
+        )
+
+        await self.analysis_repository.replace_results(
+            session_id,
+            role_results,
+            dimension_results,
+            analyzed_version=state.selection_version,
+            analysis_source=source,
+            role_mapping_ids=dirty_ids,
+            analyzed_exposure_version=state.exposure_version,
+        )
+        return {
+            "status": "completed",
+            "count": len(role_results),
+            "mode": "full" if dirty_ids is None else "incremental",
+        }
 
     async def trigger_analysis_from_tasks(
-        self, session_id: UUID
+        self,
+        session_id: UUID,
+        incremental: bool = False,
     ) -> dict[str, Any] | None:
         """Trigger scoring analysis for a session using task selections.
 
         Uses Task → DWA mapping to derive DWA exposure scores.
         This is the preferred method when using task-based workflows.
+
+        All selected-task → DWA → exposure edges of the session are loaded
+        in one query and every mapping is scored at once with NumPy group
+        reductions, matching ScoringEngine.score_role per mapping. With
+        incremental=True only mappings whose task selections changed since
+        the last analysis are re-scored (see _plan_analysis).
         """
-        if (
-            not self.role_mapping_repository
-            or not self.task_selection_repository
-            or not self.onet_repository
-        ):
+        if not self.role_mapping_repository or not self.task_selection_repository:
             return {"status": "error", "message": "Missing dependencies"}
 
+        # Read the version first so writes made during the run stay dirty
+        state = await self.analysis_repository.get_analysis_state(session_id)
+        if state is None:
+            return None
+
         # Get all role mappings
         mappings = await self.role_mapping_repository.get_for_session(session_id)
         if not mappings:
             return {"status": "error", "message": "No mappings found"}
 
-        # Calculate total rows
-        total_rows = sum(m.row_count or 0 for m in mappings)
+        dirty_ids = await self._plan_analysis(
+            session_id, mappings, state, "tasks", incremental
+        )
+        if dirty_ids is not None and not dirty_ids:
+            return await self._store_results(session_id, mappings, [], state, "tasks", dirty_ids)
 
-        results_to_save = []
-        for mapping in mappings:
-            # Get selected tasks for this mapping
-            selections = await self.task_selection_repository.get_for_role_mapping(
-                mapping.id
-            )
-            selected_tasks = [s for s in selections if s.selected]
-
-            # Get DWA IDs for the selected tasks
-            if selected_tasks:
-                task_ids = [s.task_id for s in selected_tasks]
-                task_to_dwas = await self.onet_repository.get_dwas_for_tasks(task_ids)
-
-                # Flatten to unique DWA IDs
-                dwa_ids = list(
-                    set(
-                        dwa_id
-                        for dwa_list in task_to_dwas.values()
-                        for dwa_id in dwa_list
-                    )
-                )
+        total_rows = sum(m.row_count or 0 for m in mappings)
+        all_mappings = mappings
+        mappings = _select_mappings(mappings, dirty_ids)
 
-                # Get exposure scores for the DWAs
-                if dwa_ids:
-                    dwa_scores = await self._get_dwa_exposure_scores(dwa_ids)
-                else:
-                    dwa_scores = [0.5]  # Default when no DWAs mapped
-            else:
-                dwa_scores = [0.5]  # Default when no tasks selected
-                dwa_ids = []
+        edges = await self.task_selection_repository.get_dwa_exposure_edges(
+            session_id, role_mapping_ids=dirty_ids
+        )
+        aggregates = _aggregate_task_edges(mappings, edges)
 
-            # Calculate scores
-            scores = self.scoring_engine.score_role(
-                dwa_scores=dwa_scores,
-                row_count=mapping.row_count or 0,
-                total_rows=total_rows,
-            )
+        row_counts = np.array([m.row_count or 0 for m in mappings], dtype=np.int64)
+        scores = self.scoring_engine.score_roles(
+            exposure=aggregates["exposure"],
+            row_counts=row_counts,
+            total_rows=total_rows,
+        )
+        priority_tiers = self.scoring_engine.classify_priority_tiers(
+            scores["priority"], scores["complexity"]
+        )
 
-            priority_tier = self.scoring_engine.classify_priority_tier(
-                scores["priority"], scores["complexity"]
-            )
+        ai_exposure = scores["ai_exposure"].tolist()
+        impact = scores["impact"].tolist()
+        complexity = scores["complexity"].tolist()
+        priority = scores["priority"].tolist()
+        task_counts = aggregates["task_count"].tolist()
+        dwa_counts = aggregates["dwa_count"].tolist()
 
-            results_to_save.append({
+        results_to_save = [
+            {
                 "session_id": session_id,
                 "role_mapping_id": mapping.id,
                 "dimension": DBDimension.ROLE,
                 "dimension_value": mapping.source_role,
-                "ai_exposure_score": scores["ai_exposure"],
-                "impact_score": scores["impact"],
-                "complexity_score": scores["complexity"],
-                "priority_score": scores["priority"],
+                "ai_exposure_score": ai_exposure[i],
+                "impact_score": impact[i],
+                "complexity_score": complexity[i],
+                "priority_score": priority[i],
                 "row_count": mapping.row_count,
                 "breakdown": {
-                    "task_count": len(selected_tasks),
-                    "dwa_count": len(dwa_ids),
-                    "priority_tier": priority_tier,
-                    "dwa_scores": dwa_scores[:5],  # Include first 5 for debugging
+                    "task_count": task_counts[i],
+                    "dwa_count": dwa_counts[i],
+                    "priority_tier": str(priority_tiers[i]),
+                    "dwa_scores": aggregates["dwa_scores"][i],  # First 5 for debugging
                 },
-            })
+            }
+            for i, mapping in enumerate(mappings)
+        ]
+
+        return await self._store_results(
+            session_id, all_mappings, results_to_save, state, "tasks", dirty_ids
+        )
+
+    async def _load_score_arrays(
+        self,
+        session_id: UUID,
+        source: str,
+    ) -> SessionScoreArrays | None:
+        """Get a session's scoring inputs, from the score cache when current.
+
+        On a miss, exposure is computed exactly as the analysis run for the
+        same source does and the arrays are cached under the session's
+        current data version: its selection_version, the exposure version
+        and a fingerprint of its role mappings.
+
+        Args:
+            session_id: Discovery session ID.
+            source: "tasks" or "activities".
+
+        Returns:
+            Scoring inputs of every role mapping, or None if the session
+            doesn't exist.
+        """
+        state = await self.analysis_repository.get_analysis_state(session_id)
+        if state is None:
+            return None
+
+        fingerprint = await self.role_mapping_repository.get_fingerprint(session_id)
+        version = (state.selection_version, state.exposure_version, *fingerprint)
+        cache = self.score_cache or get_session_score_cache()
+        arrays = cache.get(session_id, source, version)
+        if arrays is not None:
+            return arrays
+
+        mappings = await self.role_mapping_repository.get_for_session(session_id)
+        if source == "tasks":
+            edges = await self.task_selection_repository.get_dwa_exposure_edges(session_id)
+            exposure = _aggregate_task_edges(mappings, edges)["exposure"]
+        else:
+            summaries = {
+                row.role_mapping_id: float(row.avg_exposure)
+                for row in await self.activity_selection_repository.get_exposure_summaries(
+                    session_id
+                )
+            }
+            exposure = np.array(
+                [summaries.get(m.id, DEFAULT_DWA_EXPOSURE) for m in mappings],
+                dtype=np.float64,
+            )
 
-        await self.analysis_repository.save_results(results_to_save)
-        return {"status": "completed", "count": len(results_to_save)}
+        arrays = SessionScoreArrays(
+            version=version,
+            source=source,
+            role_mapping_ids=[m.id for m in mappings],
+            role_names=[m.source_role for m in mappings],
+            row_counts=np.array([m.row_count or 0 for m in mappings], dtype=np.int64),
+            exposure=np.asarray(exposure, dtype=np.float64),
+            groups={
+                dimension: _group_codes(mappings, attribute)
+                for dimension, attribute in AGGREGATE_DIMENSIONS
+            },
+        )
+        cache.put(session_id, arrays)
+        return arrays
+
+    async def score_scenarios(
+        self,
+        session_id: UUID,
+        scenarios: list[dict[str, Any]],
+        source: str = "tasks",
+    ) -> list[dict[str, Any]] | None:
+        """Score a session under alternative weights and tier thresholds.
+
+        Nothing is written: every scenario is computed in memory from the
+        cached scoring inputs (see _load_score_arrays), so repeated what-if
+        requests cost no queries until the session's selections change.
+
+        Args:
+            session_id: Discovery session ID.
+            scenarios: Scenario dicts with a name plus any ScoringEngine
+                keyword arguments to override; missing or None values keep
+                the engine defaults.
+            source: "tasks" or "activities" - which selections provide
+                the exposure scores.
+
+        Returns:
+            One result per scenario, in request order, with its name,
+            effective weights and thresholds, and the roles, dimensions and
+            tier_counts of _score_scenario; or None if the session doesn't
+            exist.
+        """
+        if not self.role_mapping_repository or not (
+            self.task_selection_repository if source == "tasks"
+            else self.activity_selection_repository
+        ):
+            raise RuntimeError("Missing dependencies for scenario scoring")
+
+        arrays = await self._load_score_arrays(session_id, source)
+        if arrays is None:
+            return None
+
+        results = []
+        for scenario in scenarios:
+            overrides = {k: v for k, v in scenario.items() if k != "name"}
+            engine = ScoringEngine(**overrides)
+            results.append({
+                "name": scenario["name"],
+                "weights": {
+                    "exposure": engine.EXPOSURE_WEIGHT,
+                    "impact": engine.IMPACT_WEIGHT,
+                    "ease": engine.EASE_WEIGHT,
+                },
+                "thresholds": {
+                    "now_priority": engine.NOW_PRIORITY_THRESHOLD,
+                    "now_complexity": engine.NOW_COMPLEXITY_THRESHOLD,
+                    "next_quarter_priority": engine.NEXT_QUARTER_PRIORITY_THRESHOLD,
+                },
+                **_score_scenario(arrays, engine),
+            })
+        return results
 
     async def get_by_dimension(
         self,
@@ -12,6 +12,7 @@ from app.config import Settings, get_settings
 from app.models.base import async_session_maker
 from app.repositories.chat_message_repository import ChatMessageRepository
 from app.services.context_service import ContextService, get_context_service
+from app.services.llm_client import get_llm_client_pool
 from app.services.llm_service import LLMService
 
 logger = logging.getLogger(__name__)
@@ -359,14 +360,14 @@ Help the user complete this step of the discovery process."""
 async def get_chat_service() -> AsyncGenerator[ChatService, None]:
     """Dependency to get chat service.
 
-    Creates LLMService, ContextService, and ChatMessageRepository,
-    then injects them into ChatService.
+    Creates LLMService (on the process-wide client pool), ContextService,
+    and ChatMessageRepository, then injects them into ChatService.
 
     Yields:
         A ChatService instance with all dependencies configured.
     """
     settings = get_settings()
-    llm_service = LLMService(settings=settings)
+    llm_service = LLMService(settings=settings, client_pool=get_llm_client_pool())
 
     async with async_session_maker() as db:
         context_service = await get_context_service(db)
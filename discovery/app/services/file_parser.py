@@ -183,11 +183,14 @@ class FileParser:
         role_column: str,
         lob_column: str | None = None,
         headcount_column: str | None = None,
+        department_column: str | None = None,
+        geography_column: str | None = None,
     ) -> list[dict[str, Any]]:
         """Extract unique role values with optional LOB association.
 
         Groups rows by role (and LOB if provided). If headcount_column is provided,
-        sums those values; otherwise counts the number of rows.
+        sums those values; otherwise counts the number of rows. Department and
+        geography take the first non-empty value within each group.
 
         Args:
             content: File content.
@@ -195,9 +198,12 @@ class FileParser:
             role_column: Column name containing roles.
             lob_column: Optional column name containing LOB values.
             headcount_column: Optional column name containing employee counts to sum.
+            department_column: Optional column name containing department values.
+            geography_column: Optional column name containing geography values.
 
         Returns:
-            List of dicts with role, count, and optionally lob.
+            List of dicts with role, lob, count, department, and geography
+            (None when the column is not provided or the value is empty).
 
         Raises:
             FileParseException: If columns don't exist or file can't be parsed.
@@ -231,13 +237,14 @@ class FileParser:
                 filename=filename,
             )
 
-        # Validate headcount column exists if provided
-        if headcount_column and headcount_column not in df.columns:
-            available_columns = ", ".join(df.columns.tolist())
-            raise FileParseException(
-                f"Column '{headcount_column}' not found in file. Available columns: {available_columns}",
-                filename=filename,
-            )
+        # Validate optional columns exist if provided
+        for optional_column in (headcount_column, department_column, geography_column):
+            if optional_column and optional_column not in df.columns:
+                available_columns = ", ".join(df.columns.tolist())
+                raise FileParseException(
+                    f"Column '{optional_column}' not found in file. Available columns: {available_columns}",
+                    filename=filename,
+                )
 
         # Determine grouping columns
         group_cols = [role_column]
@@ -248,16 +255,35 @@ class FileParser:
         if headcount_column:
             # Sum headcount column - convert to numeric, coerce errors to NaN, fill NaN with 1
             df[headcount_column] = pd.to_numeric(df[headcount_column], errors="coerce").fillna(1)
-            grouped = df.groupby(group_cols, dropna=False)[headcount_column].sum().reset_index(name="count")
+        groups = df.groupby(group_cols, dropna=False)
+        if headcount_column:
+            grouped = groups[headcount_column].sum().reset_index(name="count")
         else:
             # Count rows (original behavior)
-            grouped = df.groupby(group_cols, dropna=False).size().reset_index(name="count")
+            grouped = groups.size().reset_index(name="count")
+
+        # Attach the first non-empty department/geography of each group
+        attribute_columns = {
+            key: column
+            for key, column in (("department", department_column), ("geography", geography_column))
+            if column and column not in group_cols
+        }
+        if attribute_columns:
+            firsts = groups[list(set(attribute_columns.values()))].first().reset_index()
+            grouped = grouped.merge(firsts, on=group_cols, how="left")
+
+        def _value(row: Any, column: str | None) -> str | None:
+            if not column or pd.isna(row[column]) or str(row[column]) == "":
+                return None
+            return str(row[column])
 
         return [
             {
                 "role": str(row[role_column]),
-                "lob": str(row[lob_column]) if lob_column and pd.notna(row[lob_column]) else None,
+                "lob": _value(row, lob_column),
                 "count": int(row["count"]),
+                "department": _value(row, department_column),
+                "geography": _value(row, geography_column),
             }
             for _, row in grouped.iterrows()
         ]
@@ -0,0 +1,328 @@
+"""Content-addressed cache for LLM responses.
+
+Responses are keyed by a SHA-256 hash of everything that determines the
+completion (model, temperature, max_tokens, system prompt and messages),
+so identical requests from re-runs, remaps and retries are served without
+an API call. Backends are pluggable: an in-process LRU, an on-disk SQLite
+file shared by processes on one host, or Redis shared across hosts.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str,
+    messages: list[dict[str, Any]],
+) -> str:
+    """Hash an LLM request into a cache key.
+
+    Args:
+        model: Model name.
+        temperature: Sampling temperature.
+        max_tokens: Maximum response tokens.
+        system_prompt: System prompt.
+        messages: Conversation messages, including the final user message.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON request.
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "system": system_prompt,
+            "messages": messages,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCacheBackend(ABC):
+    """Storage for cached responses."""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Get a cached response, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a response for ttl_seconds."""
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+class MemoryLLMCacheBackend(LLMCacheBackend):
+    """In-process LRU cache bounded by entry count."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._entries[key] = (time.time() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SQLiteLLMCacheBackend(LLMCacheBackend):
+    """On-disk cache in a SQLite file, evicting least recently used entries.
+
+    Queries run in a worker thread so the event loop is never blocked.
+    """
+
+    def __init__(self, path: str, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = asyncio.Lock()
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed_at ON llm_cache (accessed_at)"
+            )
+
+    def _get(self, key: str) -> str | None:
+        now = time.time()
+        with self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return row[0]
+
+    def _set(self, key: str, value: str, ttl_seconds: int) -> None:
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl_seconds, now),
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    async def get(self, key: str) -> str | None:
+        async with self._lock:
+            return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._set, key, value, ttl_seconds)
+
+    async def close(self) -> None:
+        self._conn.close()
+
+
+class RedisLLMCacheBackend(LLMCacheBackend):
+    """Redis cache shared across processes and hosts.
+
+    Entries expire via Redis TTLs; size-based eviction is left to the
+    server's maxmemory policy (e.g., allkeys-lru).
+    """
+
+    KEY_PREFIX = "discovery:llm_cache:"
+
+    def __init__(self, redis_url: str) -> None:
+        """Initialize the backend.
+
+        Args:
+            redis_url: Redis connection URL.
+
+        Raises:
+            RuntimeError: If the redis package is not installed.
+        """
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis package is required for LLM_CACHE_BACKEND=redis"
+            ) from e
+
+        self._redis = redis.from_url(redis_url)
+
+    async def get(self, key: str) -> str | None:
+        value = await self._redis.get(self.KEY_PREFIX + key)
+        if value is None:
+            return None
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self._redis.set(self.KEY_PREFIX + key, value, ex=ttl_seconds)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class LLMResponseCache:
+    """LLM response cache with hit-rate metrics.
+
+    Backend failures are logged and treated as misses, so the cache can
+    never fail an LLM call.
+
+    Attributes:
+        backend: Storage backend.
+        ttl_seconds: How long responses are kept.
+        hits: Lookups served from the cache.
+        misses: Lookups not found in the cache.
+        errors: Backend operations that failed.
+    """
+
+    def __init__(self, backend: LLMCacheBackend, ttl_seconds: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend.
+            ttl_seconds: How long responses are kept.
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> str | None:
+        """Look up a response, recording a hit or miss.
+
+        Args:
+            key: Cache key from make_cache_key.
+
+        Returns:
+            Cached response text, or None.
+        """
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"LLM cache lookup failed: {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from make_cache_key.
+            value: Response text.
+        """
+        try:
+            await self.backend.set(key, value, self.ttl_seconds)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"LLM cache write failed: {e}")
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache metrics.
+
+        Returns:
+            Dict with backend, hits, misses, errors and hit_rate.
+        """
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        await self.backend.close()
+
+
+def create_llm_cache(settings: Settings) -> LLMResponseCache | None:
+    """Create an LLM response cache for the configured backend.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        LLMResponseCache, or None when LLM_CACHE_BACKEND is "none".
+    """
+    backend: LLMCacheBackend
+    if settings.llm_cache_backend == "memory":
+        backend = MemoryLLMCacheBackend(settings.llm_cache_max_entries)
+    elif settings.llm_cache_backend == "sqlite":
+        backend = SQLiteLLMCacheBackend(
+            settings.llm_cache_sqlite_path,
+            settings.llm_cache_max_entries,
+        )
+    elif settings.llm_cache_backend == "redis":
+        backend = RedisLLMCacheBackend(settings.redis_url)
+    else:
+        return None
+    return LLMResponseCache(backend, ttl_seconds=settings.llm_cache_ttl_seconds)
+
+
+_llm_cache: LLMResponseCache | None = None
+_llm_cache_initialized = False
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """Get the process-wide LLM response cache.
+
+    Returns:
+        Shared LLMResponseCache, or None if caching is disabled.
+    """
+    global _llm_cache, _llm_cache_initialized
+    if not _llm_cache_initialized:
+        _llm_cache = create_llm_cache(get_settings())
+        _llm_cache_initialized = True
+    return _llm_cache
@@ -0,0 +1,310 @@
+"""Process-wide Anthropic client pool with rate limiting and retries.
+
+Every LLMService created through the FastAPI dependencies shares one
+LLMClientPool, so concurrent sessions share a single HTTP connection pool
+and one set of limits instead of each opening its own client and
+independently hitting the API's rate limits:
+
+- a concurrency semaphore bounds in-flight requests;
+- requests-per-minute and tokens-per-minute token buckets pace requests;
+- rate-limit and connection errors are retried with jittered exponential
+  backoff (honoring retry-after when the API sends one).
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from anthropic import AsyncAnthropic
+
+from app.config import Settings, get_settings
+from app.exceptions import LLMConnectionError, LLMRateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rough characters-per-token ratio used to estimate request size before sending
+CHARS_PER_TOKEN = 4
+
+# Errors worth retrying; everything else is raised immediately
+RETRYABLE_ERRORS: tuple[type[Exception], ...] = (LLMRateLimitError, LLMConnectionError)
+
+
+def estimate_tokens(system_prompt: str, messages: list[dict[str, str]]) -> int:
+    """Estimate the input tokens of a request from its character count.
+
+    Args:
+        system_prompt: System prompt text.
+        messages: Conversation messages.
+
+    Returns:
+        Estimated input token count (at least 1).
+    """
+    chars = len(system_prompt) + sum(len(m.get("content", "")) for m in messages)
+    return max(1, chars // CHARS_PER_TOKEN)
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at a per-minute rate.
+
+    The balance may go negative when actual usage turns out higher than
+    what was acquired (see adjust); later acquirers then wait for the debt
+    to be repaid.
+
+    Attributes:
+        capacity: Maximum tokens held, equal to the per-minute rate.
+        refill_per_second: Tokens added per second.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Tokens replenished per minute; also the burst size.
+        """
+        self.capacity = float(per_minute)
+        self.refill_per_second = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> float:
+        """Current token balance."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.refill_per_second,
+        )
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until amount tokens are available, then take them.
+
+        Requests larger than the capacity are clamped to it so they can
+        still proceed once the bucket is full. Waiters are served in order.
+
+        Args:
+            amount: Tokens to take.
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.refill_per_second)
+
+    def adjust(self, delta: float) -> None:
+        """Take (positive) or return (negative) tokens without waiting.
+
+        Args:
+            delta: Tokens to take; negative values refund tokens.
+        """
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - delta)
+
+
+class LLMClientPool:
+    """Shared Anthropic clients plus process-wide request limits.
+
+    Attributes:
+        max_retries: Retries after a rate-limit or connection error.
+        retry_backoff_base: First retry delay in seconds; doubles per retry.
+        retry_backoff_max: Upper bound for a single retry delay in seconds.
+        request_bucket: Requests-per-minute bucket, or None if unlimited.
+        token_bucket: Tokens-per-minute bucket, or None if unlimited.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_retries: int = 3,
+        retry_backoff_base: float = 1.0,
+        retry_backoff_max: float = 30.0,
+        client_factory: Callable[..., AsyncAnthropic] = AsyncAnthropic,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_concurrency: Maximum in-flight requests across the process.
+            requests_per_minute: Request rate limit; None or 0 disables it.
+            tokens_per_minute: Estimated token rate limit; None or 0 disables it.
+            max_retries: Retries after a rate-limit or connection error.
+            retry_backoff_base: First retry delay in seconds; doubles per retry.
+            retry_backoff_max: Upper bound for a single retry delay in seconds.
+            client_factory: Creates the Anthropic client for an API key.
+        """
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff_base = retry_backoff_base
+        self.retry_backoff_max = retry_backoff_max
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._client_factory = client_factory
+        self._clients: dict[str, AsyncAnthropic] = {}
+
+    def get_client(self, api_key: str) -> AsyncAnthropic:
+        """Get the shared client for an API key, creating it on first use.
+
+        The SDK's own retries are disabled so that every attempt goes
+        through this pool's limits.
+
+        Args:
+            api_key: Anthropic API key.
+
+        Returns:
+            Shared AsyncAnthropic client.
+        """
+        client = self._clients.get(api_key)
+        if client is None:
+            client = self._client_factory(api_key=api_key, max_retries=0)
+            self._clients[api_key] = client
+        return client
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a request slot, pacing by the rate limits first.
+
+        Args:
+            estimated_tokens: Estimated tokens the request will use.
+        """
+        if self.request_bucket is not None:
+            await self.request_bucket.acquire(1)
+        if self.token_bucket is not None and estimated_tokens > 0:
+            await self.token_bucket.acquire(estimated_tokens)
+        async with self._semaphore:
+            yield
+
+    def record_usage(self, estimated_tokens: int, response: Any) -> None:
+        """Correct the token bucket with the usage the API reported.
+
+        Args:
+            estimated_tokens: Tokens taken when the request was admitted.
+            response: Anthropic message response with a usage attribute.
+        """
+        usage = getattr(response, "usage", None)
+        self.record_token_usage(
+            estimated_tokens,
+            getattr(usage, "input_tokens", None),
+            getattr(usage, "output_tokens", None),
+        )
+
+    def record_token_usage(
+        self,
+        estimated_tokens: int,
+        input_tokens: int | None,
+        output_tokens: int | None,
+    ) -> None:
+        """Correct the token bucket with reported input and output tokens.
+
+        Args:
+            estimated_tokens: Tokens taken when the request was admitted.
+            input_tokens: Input tokens the API reported, if any.
+            output_tokens: Output tokens the API reported, if any.
+        """
+        if self.token_bucket is None:
+            return
+        if not isinstance(input_tokens, int) or not isinstance(output_tokens, int):
+            return
+        self.token_bucket.adjust(input_tokens + output_tokens - min(
+            estimated_tokens, self.token_bucket.capacity,
+        ))
+
+    def retry_delay(self, attempt: int, error: Exception) -> float | None:
+        """Delay before retrying a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed (1-based).
+            error: The error it raised.
+
+        Returns:
+            Seconds to wait, or None if the error should be raised.
+        """
+        if not isinstance(error, RETRYABLE_ERRORS) or attempt > self.max_retries:
+            return None
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after:
+            return min(self.retry_backoff_max, float(retry_after))
+        delay = min(self.retry_backoff_max, self.retry_backoff_base * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def run(self, call: Callable[[], Awaitable[T]], estimated_tokens: int = 0) -> T:
+        """Run an API call under the pool's limits, retrying transient errors.
+
+        Args:
+            call: Zero-argument coroutine function making one API request and
+                raising LLMError subclasses on failure.
+            estimated_tokens: Estimated tokens the request will use.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            LLMError: The last error once retries are exhausted, or any
+                non-retryable error immediately.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with self.acquire(estimated_tokens):
+                    result = await call()
+            except RETRYABLE_ERRORS as e:
+                delay = self.retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"LLM request failed ({e}); retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.max_retries + 1})"
+                )
+                await asyncio.sleep(delay)
+                continue
+            self.record_usage(estimated_tokens, result)
+            return result
+
+
+def create_llm_client_pool(settings: Settings) -> LLMClientPool:
+    """Create a client pool from settings.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        LLMClientPool with the configured limits.
+    """
+    return LLMClientPool(
+        max_concurrency=settings.llm_max_concurrency,
+        requests_per_minute=settings.llm_requests_per_minute,
+        tokens_per_minute=settings.llm_tokens_per_minute,
+        max_retries=settings.llm_max_retries,
+        retry_backoff_base=settings.llm_retry_backoff_base,
+        retry_backoff_max=settings.llm_retry_backoff_max,
+    )
+
+
+_llm_client_pool: LLMClientPool | None = None
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """Get the process-wide LLM client pool.
+
+    Returns:
+        Shared LLMClientPool for the configured limits.
+    """
+    global _llm_client_pool
+    if _llm_client_pool is None:
+        _llm_client_pool = create_llm_client_pool(get_settings())
+    return _llm_client_pool
@@ -6,14 +6,18 @@ to generate responses for the Discovery chat/orchestrator.
 Uses the Anthropic Python SDK with AsyncAnthropic for async operations.
 """
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 
 import anthropic
 from anthropic import AsyncAnthropic
 
 from app.config import Settings
 from app.exceptions import LLMAuthError, LLMConnectionError, LLMError, LLMRateLimitError
+from app.services.llm_cache import LLMResponseCache, get_llm_cache, make_cache_key
+from app.services.llm_client import LLMClientPool, estimate_tokens, get_llm_client_pool
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +33,21 @@ class LLMService:
         model: The Claude model to use for completions.
         max_tokens: Maximum tokens in generated responses.
         temperature: Temperature for response generation (0-1).
+        cache: Optional response cache for generate_response.
+        client_pool: Optional shared client pool providing rate limits and
+            retries.
     """
 
+    # System prompt for single-prompt completions via complete()
+    COMPLETION_SYSTEM_PROMPT = "Follow the instructions exactly and respond only in the requested format."
+
     def __init__(
         self,
         settings: Settings,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        cache: LLMResponseCache | None = None,
+        client_pool: LLMClientPool | None = None,
     ) -> None:
         """Initialize the LLM service.
 
@@ -43,6 +55,13 @@ class LLMService:
             settings: Application settings with anthropic_api_key and anthropic_model.
             max_tokens: Maximum tokens for generated responses. Defaults to 4096.
             temperature: Temperature for generation (0-1). Defaults to 0.7.
+            cache: Optional response cache. Identical requests (same model,
+                temperature, max_tokens, system prompt and messages) are
+                served from it without an API call.
+            client_pool: Optional shared client pool. When given, the pool's
+                client is reused and requests go through its concurrency
+                limit, rate limits and retries; otherwise the service owns a
+                standalone client and makes a single attempt per request.
 
         Raises:
             ValueError: If the API key is empty or missing.
@@ -56,7 +75,12 @@ class LLMService:
         self.model = settings.anthropic_model
         self.max_tokens = max_tokens
         self.temperature = temperature
-        self._client = AsyncAnthropic(api_key=api_key)
+        self.cache = cache
+        self.client_pool = client_pool
+        if client_pool is not None:
+            self._client = client_pool.get_client(api_key)
+        else:
+            self._client = AsyncAnthropic(api_key=api_key)
 
     async def generate_response(
         self,
@@ -83,27 +107,60 @@ class LLMService:
         """
         messages = self._build_messages(user_message, conversation_history)
 
-        try:
-            response = await self._client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=messages,
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                self.model, self.temperature, self.max_tokens, system_prompt, messages,
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async def call():
+            try:
+                return await self._client.messages.create(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    system=system_prompt,
+                    messages=messages,
+                )
+            except anthropic.APIError as e:
+                raise self._translate_error(e) from e
+
+        if self.client_pool is not None:
+            response = await self.client_pool.run(
+                call, estimated_tokens=estimate_tokens(system_prompt, messages),
             )
-            return self._extract_text_content(response)
-        except anthropic.AuthenticationError as e:
-            logger.error(f"Authentication error: {e}")
-            raise LLMAuthError("LLM API authentication failed") from e
-        except anthropic.RateLimitError as e:
-            logger.warning(f"Rate limit exceeded: {e}")
-            raise LLMRateLimitError("LLM API rate limit exceeded") from e
-        except anthropic.APIConnectionError as e:
-            logger.error(f"Connection error: {e}")
-            raise LLMConnectionError("Failed to connect to LLM API") from e
-        except anthropic.APIError as e:
-            logger.error(f"API error: {e}")
-            raise LLMError(f"LLM API error: {e}") from e
+        else:
+            response = await call()
+        text = self._extract_text_content(response)
+
+        # Truncated responses would be replayed truncated forever
+        if cache_key is not None and text and getattr(response, "stop_reason", None) != "max_tokens":
+            await self.cache.set(cache_key, text)
+        return text
+
+    async def complete(self, prompt: str) -> str:
+        """Generate a response to a single self-contained prompt.
+
+        Used for short structured lookups (e.g., LOB-to-NAICS mapping,
+        column detection). Goes through generate_response, so results are
+        cached when a cache is configured.
+
+        Args:
+            prompt: Instructions and input for the model.
+
+        Returns:
+            The generated response text.
+
+        Raises:
+            LLMError: Or a subclass, as raised by generate_response.
+        """
+        return await self.generate_response(
+            system_prompt=self.COMPLETION_SYSTEM_PROMPT,
+            user_message=prompt,
+        )
 
     async def stream_response(
         self,
@@ -113,6 +170,10 @@ class LLMService:
     ) -> AsyncIterator[str]:
         """Stream a response from the LLM.
 
+        With a cache configured, a cached response is yielded as a single
+        chunk, and completed streams are stored like generate_response
+        results. Streams cut off at max_tokens are not cached.
+
         Args:
             system_prompt: The system prompt to set context for the assistant.
             user_message: The user's message to respond to.
@@ -129,31 +190,98 @@ class LLMService:
             LLMError: For other API errors.
         """
         messages = self._build_messages(user_message, conversation_history)
+        estimated_tokens = estimate_tokens(system_prompt, messages)
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                self.model, self.temperature, self.max_tokens, system_prompt, messages,
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        attempt = 0
+        while True:
+            attempt += 1
+            started = False
+            chunks: list[str] = []
+            stop_reason = None
+            input_tokens = output_tokens = None
+            try:
+                async with self._request_slot(estimated_tokens):
+                    async with self._client.messages.stream(
+                        model=self.model,
+                        max_tokens=self.max_tokens,
+                        temperature=self.temperature,
+                        system=system_prompt,
+                        messages=messages,
+                    ) as stream:
+                        async for event in stream:
+                            if event.type == "content_block_delta":
+                                if hasattr(event.delta, "text"):
+                                    started = True
+                                    chunks.append(event.delta.text)
+                                    yield event.delta.text
+                            elif event.type == "message_start":
+                                usage = getattr(event.message, "usage", None)
+                                input_tokens = getattr(usage, "input_tokens", None)
+                            elif event.type == "message_delta":
+                                stop_reason = getattr(event.delta, "stop_reason", None)
+                                usage = getattr(event, "usage", None)
+                                output_tokens = getattr(usage, "output_tokens", None)
+                text = "".join(chunks)
+                if cache_key is not None and text and stop_reason != "max_tokens":
+                    await self.cache.set(cache_key, text)
+                return
+            except anthropic.APIError as e:
+                error = self._translate_error(e)
+                # Only retry before any text reached the caller
+                delay = (
+                    self.client_pool.retry_delay(attempt, error)
+                    if self.client_pool is not None and not started
+                    else None
+                )
+                if delay is None:
+                    raise error from e
+                logger.warning(f"LLM stream failed ({error}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            finally:
+                # Reconcile pacing with what the stream actually used
+                if self.client_pool is not None:
+                    self.client_pool.record_token_usage(estimated_tokens, input_tokens, output_tokens)
+
+    def _request_slot(self, estimated_tokens: int) -> AbstractAsyncContextManager:
+        """Hold a slot in the client pool, or nothing without a pool."""
+        if self.client_pool is None:
+            return nullcontext()
+        return self.client_pool.acquire(estimated_tokens)
+
+    @staticmethod
+    def _translate_error(error: anthropic.APIError) -> LLMError:
+        """Map an Anthropic SDK error to the service's LLMError hierarchy.
 
-        try:
-            async with self._client.messages.stream(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=messages,
-            ) as stream:
-                async for event in stream:
-                    if event.type == "content_block_delta":
-                        if hasattr(event.delta, "text"):
-                            yield event.delta.text
-        except anthropic.AuthenticationError as e:
-            logger.error(f"Authentication error: {e}")
-            raise LLMAuthError("LLM API authentication failed") from e
-        except anthropic.RateLimitError as e:
-            logger.warning(f"Rate limit exceeded: {e}")
-            raise LLMRateLimitError("LLM API rate limit exceeded") from e
-        except anthropic.APIConnectionError as e:
-            logger.error(f"Connection error: {e}")
-            raise LLMConnectionError("Failed to connect to LLM API") from e
-        except anthropic.APIError as e:
-            logger.error(f"API error: {e}")
-            raise LLMError(f"LLM API error: {e}") from e
+        Args:
+            error: Error raised by the Anthropic client.
+
+        Returns:
+            The corresponding LLMError subclass instance.
+        """
+        if isinstance(error, anthropic.AuthenticationError):
+            logger.error(f"Authentication error: {error}")
+            return LLMAuthError("LLM API authentication failed")
+        if isinstance(error, anthropic.RateLimitError):
+            logger.warning(f"Rate limit exceeded: {error}")
+            return LLMRateLimitError(
+                "LLM API rate limit exceeded",
+                retry_after=_retry_after_seconds(error),
+            )
+        if isinstance(error, anthropic.APIConnectionError):
+            logger.error(f"Connection error: {error}")
+            return LLMConnectionError("Failed to connect to LLM API")
+        logger.error(f"API error: {error}")
+        return LLMError(f"LLM API error: {error}")
 
     def _build_messages(
         self,
@@ -197,6 +325,18 @@ class LLMService:
         return "".join(text_parts)
 
 
+def _retry_after_seconds(error: anthropic.APIError) -> float | None:
+    """Read the retry-after header of a rate-limit response, if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
 def get_llm_service(settings: Settings) -> LLMService:
     """FastAPI dependency for getting an LLMService instance.
 
@@ -204,6 +344,11 @@ def get_llm_service(settings: Settings) -> LLMService:
         settings: Application settings (injected by FastAPI).
 
     Returns:
-        An LLMService instance configured with the provided settings.
+        An LLMService instance configured with the provided settings, the
+        process-wide client pool and the response cache, if enabled.
     """
-    return LLMService(settings=settings)
+    return LLMService(
+        settings=settings,
+        cache=get_llm_cache(),
+        client_pool=get_llm_client_pool(),
+    )
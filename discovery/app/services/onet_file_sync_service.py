@@ -145,6 +145,9 @@ class OnetFileSyncService:
             # Sync task-to-DWA mappings (must come after tasks and DWAs)
             task_to_dwa_count = await self._sync_task_to_dwa_mappings(tasks_to_dwas)
 
+            # Recompute effective DWA exposure for the new hierarchy
+            await self.repository.refresh_dwa_effective_exposure()
+
             # Log sync success
             await self.repository.log_sync(
                 version=display_version,
@@ -0,0 +1,175 @@
+"""In-memory occupation→NAICS index for industry boosting.
+
+Replaces per-occupation industry queries in role mapping. Every prefix of
+every NAICS code an occupation is employed in is indexed once per O*NET
+version, so scoring a NAICS set against all occupations is a handful of
+dictionary lookups and array updates instead of one query per mapping.
+Scores match OnetRepository.calculate_industry_score.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+
+import numpy as np
+
+from app.repositories.onet_repository import OnetRepository
+
+logger = logging.getLogger(__name__)
+
+
+def naics_prefix_score(prefix_length: int) -> float:
+    """Score for two different NAICS codes sharing a prefix.
+
+    Args:
+        prefix_length: Length of the longest common prefix.
+
+    Returns:
+        0.8 for 4+ digits, 0.6 for 3, 0.4 for 2 (sector), otherwise 0.0.
+    """
+    if prefix_length >= 4:
+        return 0.8
+    if prefix_length == 3:
+        return 0.6
+    if prefix_length == 2:
+        return 0.4
+    return 0.0
+
+
+class OnetIndustryIndex:
+    """Occupation→NAICS prefix index with batch scoring.
+
+    Attributes:
+        version: O*NET version the index was built from.
+    """
+
+    # NAICS sets scored against all occupations are kept for reuse
+    MAX_CACHED_SCORE_VECTORS = 256
+
+    def __init__(
+        self,
+        industries: Iterable[tuple[str, str]],
+        version: str | None = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            industries: (occupation_code, naics_code) pairs.
+            version: O*NET version the data belongs to.
+        """
+        self.version = version
+        self._rows: dict[str, int] = {}
+        prefix_rows: dict[str, set[int]] = defaultdict(set)
+        exact_rows: dict[str, set[int]] = defaultdict(set)
+
+        for occupation_code, naics_code in industries:
+            if not naics_code:
+                continue
+            row = self._rows.setdefault(occupation_code, len(self._rows))
+            exact_rows[naics_code].add(row)
+            for length in range(2, len(naics_code) + 1):
+                prefix_rows[naics_code[:length]].add(row)
+
+        self._prefix_rows = {p: np.fromiter(r, dtype=np.intp) for p, r in prefix_rows.items()}
+        self._exact_rows = {c: np.fromiter(r, dtype=np.intp) for c, r in exact_rows.items()}
+        self._score_cache: dict[frozenset[str], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _score_vector(self, naics_codes: frozenset[str]) -> np.ndarray:
+        """Best match score of every indexed occupation against a NAICS set.
+
+        Args:
+            naics_codes: Target NAICS codes or prefixes.
+
+        Returns:
+            Array of scores indexed by occupation row.
+        """
+        cached = self._score_cache.get(naics_codes)
+        if cached is not None:
+            return cached
+
+        scores = np.zeros(len(self._rows), dtype=np.float64)
+        for target in naics_codes:
+            # Rows with an industry sharing target[:length]; longer prefixes score higher
+            for length in range(2, len(target) + 1):
+                rows = self._prefix_rows.get(target[:length])
+                if rows is not None:
+                    scores[rows] = np.maximum(scores[rows], naics_prefix_score(length))
+            rows = self._exact_rows.get(target)
+            if rows is not None:
+                scores[rows] = 1.0
+
+        if len(self._score_cache) >= self.MAX_CACHED_SCORE_VECTORS:
+            self._score_cache.clear()
+        self._score_cache[naics_codes] = scores
+        return scores
+
+    def score(self, occupation_code: str, naics_codes: Iterable[str]) -> float:
+        """Industry match score for one occupation.
+
+        Args:
+            occupation_code: O*NET occupation code.
+            naics_codes: NAICS codes to match against.
+
+        Returns:
+            Score from 0.0 (no match) to 1.0 (exact match).
+        """
+        return self.score_batch([occupation_code], naics_codes)[occupation_code]
+
+    def score_batch(
+        self,
+        occupation_codes: Iterable[str],
+        naics_codes: Iterable[str],
+    ) -> dict[str, float]:
+        """Industry match scores for many occupations against one NAICS set.
+
+        Args:
+            occupation_codes: O*NET occupation codes.
+            naics_codes: NAICS codes to match against.
+
+        Returns:
+            Dict of occupation code to score. Occupations without industry
+            data score 0.0.
+        """
+        targets = frozenset(code for code in naics_codes if code)
+        codes = list(dict.fromkeys(occupation_codes))
+        if not targets:
+            return {code: 0.0 for code in codes}
+
+        scores = self._score_vector(targets)
+        return {
+            code: float(scores[self._rows[code]]) if code in self._rows else 0.0
+            for code in codes
+        }
+
+
+_index: OnetIndustryIndex | None = None
+_index_lock = asyncio.Lock()
+
+
+async def get_onet_industry_index(onet_repository: OnetRepository) -> OnetIndustryIndex:
+    """Get the process-wide industry index, rebuilding it when O*NET changes.
+
+    Args:
+        onet_repository: Repository used to check the version and load data.
+
+    Returns:
+        OnetIndustryIndex for the current O*NET version.
+    """
+    global _index
+
+    latest = await onet_repository.get_latest_sync()
+    version = latest.version if latest else None
+
+    async with _index_lock:
+        if _index is None or _index.version != version:
+            industries = await onet_repository.get_all_industries()
+            # Building is CPU-bound; keep it off the event loop
+            _index = await asyncio.to_thread(OnetIndustryIndex, industries, version=version)
+            logger.info(
+                f"Built O*NET industry index for version {version}: "
+                f"{len(_index)} occupations, {len(industries)} industry rows"
+            )
+        return _index
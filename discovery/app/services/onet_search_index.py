@@ -0,0 +1,344 @@
+"""In-memory O*NET candidate retrieval index.
+
+Provides a database-free alternative to PostgreSQL full-text search for
+role mapping candidate generation. Occupations are indexed once per O*NET
+version in an inverted index scored with BM25 (title and alternate titles
+weighted above descriptions). Queries that find too few term matches, e.g.
+misspelled titles, are backfilled from a character-trigram title index.
+"""
+import asyncio
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+import numpy as np
+
+from app.models.onet_occupation import OnetOccupation
+from app.repositories.onet_repository import OnetRepository
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Common English words that carry no signal in job titles or descriptions
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "into", "is", "it", "of", "on", "or", "such", "that", "the", "their",
+    "to", "with",
+})
+
+
+def _stem(token: str) -> str:
+    """Reduce a token to a crude singular form.
+
+    Only plural suffixes are stripped, which is enough to match
+    "Engineers" to "Engineer" without a full stemmer.
+
+    Args:
+        token: Lowercase token.
+
+    Returns:
+        Stemmed token.
+    """
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into stemmed, lowercase terms without stopwords.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        List of terms in input order.
+    """
+    return [
+        _stem(token)
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in _STOPWORDS
+    ]
+
+
+def trigrams(text: str) -> set[str]:
+    """Get the character trigrams of text, padded per word like pg_trgm.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        Set of trigrams.
+    """
+    grams: set[str] = set()
+    for word in _TOKEN_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class OnetSearchIndex:
+    """Inverted BM25 index with trigram fallback over O*NET occupations.
+
+    Attributes:
+        version: O*NET version the index was built from.
+    """
+
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    # Title terms (including alternate titles) count more than description terms
+    TITLE_WEIGHT = 3.0
+    DESCRIPTION_WEIGHT = 1.0
+
+    # Minimum trigram similarity for fallback matches (pg_trgm default)
+    TRIGRAM_THRESHOLD = 0.3
+
+    def __init__(
+        self,
+        occupations: Iterable[OnetOccupation],
+        alternate_titles: Iterable[tuple[str, str]] = (),
+        version: str | None = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            occupations: Occupations to index. Only code, title and
+                description are read; detached copies are kept so results
+                stay usable after the loading session closes.
+            alternate_titles: (onet_code, title) pairs.
+            version: O*NET version the data belongs to.
+        """
+        self.version = version
+        self._occupations: dict[str, OnetOccupation] = {}
+        titles_by_code: dict[str, list[str]] = defaultdict(list)
+        descriptions: dict[str, str] = {}
+
+        for occ in occupations:
+            self._occupations[occ.code] = OnetOccupation(
+                code=occ.code,
+                title=occ.title,
+                description=occ.description,
+            )
+            titles_by_code[occ.code].append(occ.title)
+            descriptions[occ.code] = occ.description or ""
+
+        for code, title in alternate_titles:
+            if code in self._occupations:
+                titles_by_code[code].append(title)
+
+        self._fields = {
+            "title": (
+                self.TITLE_WEIGHT,
+                self._build_field({code: " ".join(t) for code, t in titles_by_code.items()}),
+            ),
+            "description": (
+                self.DESCRIPTION_WEIGHT,
+                self._build_field(descriptions),
+            ),
+        }
+        self._build_trigram_index(titles_by_code)
+
+    def __len__(self) -> int:
+        return len(self._occupations)
+
+    def search(self, query: str, limit: int = 20) -> list[tuple[str, float]]:
+        """Rank occupations for a query.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            List of (onet_code, score) tuples, best first. BM25 matches
+            come before trigram backfill.
+        """
+        terms = tokenize(query)
+        scores: dict[str, float] = defaultdict(float)
+
+        for weight, field in self._fields.values():
+            postings, idf, doc_lengths, avg_length = field
+            for term in set(terms):
+                if term not in postings:
+                    continue
+                term_idf = idf[term]
+                for code, tf in postings[term].items():
+                    norm = self.K1 * (1 - self.B + self.B * doc_lengths[code] / avg_length)
+                    scores[code] += weight * term_idf * tf * (self.K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+        if len(ranked) < limit:
+            seen = {code for code, _ in ranked}
+            for code, similarity in self._trigram_matches(query):
+                if code in seen:
+                    continue
+                ranked.append((code, similarity))
+                seen.add(code)
+                if len(ranked) >= limit:
+                    break
+
+        return ranked
+
+    def search_batch(
+        self,
+        queries: list[str],
+        limit: int = 20,
+    ) -> dict[str, list[OnetOccupation]]:
+        """Retrieve top-k candidate occupations for many queries.
+
+        Same contract as OnetRepository.search_with_full_text_batch.
+
+        Args:
+            queries: Search query strings.
+            limit: Maximum number of results per query.
+
+        Returns:
+            Dict mapping each input query to its ranked OnetOccupation objects.
+        """
+        return {
+            query: [self._occupations[code] for code, _ in self.search(query, limit)]
+            if query and query.strip() else []
+            for query in queries
+        }
+
+    def _build_field(
+        self,
+        documents: dict[str, str],
+    ) -> tuple[dict[str, dict[str, int]], dict[str, float], dict[str, int], float]:
+        """Build BM25 statistics for one field.
+
+        Args:
+            documents: Mapping of occupation code to field text.
+
+        Returns:
+            Tuple of (postings, idf, doc_lengths, avg_length) where postings
+            maps term -> {code: term frequency}.
+        """
+        postings: dict[str, dict[str, int]] = defaultdict(dict)
+        doc_lengths: dict[str, int] = {}
+
+        for code, text in documents.items():
+            terms = tokenize(text)
+            doc_lengths[code] = len(terms)
+            for term, tf in Counter(terms).items():
+                postings[term][code] = tf
+
+        doc_count = len(documents)
+        avg_length = (sum(doc_lengths.values()) / doc_count) if doc_count else 0.0
+        idf = {
+            term: math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in postings.items()
+        }
+        return dict(postings), idf, doc_lengths, avg_length or 1.0
+
+    def _build_trigram_index(self, titles_by_code: dict[str, list[str]]) -> None:
+        """Index the trigrams of every occupation and alternate title.
+
+        Postings are stored as NumPy arrays of title ids so that a query's
+        shared-trigram counts can be accumulated with a single bincount.
+
+        Args:
+            titles_by_code: Mapping of occupation code to its titles.
+        """
+        self._codes = list(titles_by_code)
+        title_code_ids: list[int] = []
+        title_sizes: list[int] = []
+        postings: dict[str, list[int]] = defaultdict(list)
+
+        for code_id, titles in enumerate(titles_by_code.values()):
+            for title in titles:
+                grams = trigrams(title)
+                if not grams:
+                    continue
+                title_id = len(title_code_ids)
+                title_code_ids.append(code_id)
+                title_sizes.append(len(grams))
+                for gram in grams:
+                    postings[gram].append(title_id)
+
+        self._title_code_ids = np.array(title_code_ids, dtype=np.int32)
+        self._title_sizes = np.array(title_sizes, dtype=np.float64)
+        self._trigram_postings = {
+            gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()
+        }
+
+    def _trigram_matches(self, query: str) -> list[tuple[str, float]]:
+        """Find occupations whose titles are trigram-similar to the query.
+
+        Similarity is shared trigrams over the union of both trigram sets,
+        as in pg_trgm.
+
+        Args:
+            query: Search query string.
+
+        Returns:
+            List of (onet_code, similarity) tuples above TRIGRAM_THRESHOLD,
+            best first, one per occupation.
+        """
+        query_grams = trigrams(query)
+        hits = [
+            self._trigram_postings[gram]
+            for gram in query_grams
+            if gram in self._trigram_postings
+        ]
+        if not hits:
+            return []
+
+        shared = np.bincount(np.concatenate(hits), minlength=len(self._title_sizes))
+        similarity = shared / (len(query_grams) + self._title_sizes - shared)
+
+        matched = np.flatnonzero(similarity >= self.TRIGRAM_THRESHOLD)
+        if not matched.size:
+            return []
+
+        # Best title per occupation, ordered by similarity
+        ordered = matched[np.argsort(-similarity[matched], kind="stable")]
+        _, first = np.unique(self._title_code_ids[ordered], return_index=True)
+        best = ordered[np.sort(first)]
+
+        return [
+            (self._codes[self._title_code_ids[title_id]], float(similarity[title_id]))
+            for title_id in best
+        ]
+
+
+_index: OnetSearchIndex | None = None
+_index_lock = asyncio.Lock()
+
+
+async def get_onet_search_index(onet_repository: OnetRepository) -> OnetSearchIndex:
+    """Get the process-wide search index, rebuilding it when O*NET changes.
+
+    The index is built on first use and reused until a sync with a
+    different version is recorded.
+
+    Args:
+        onet_repository: Repository used to check the version and load data.
+
+    Returns:
+        OnetSearchIndex for the current O*NET version.
+    """
+    global _index
+
+    latest = await onet_repository.get_latest_sync()
+    version = latest.version if latest else None
+
+    async with _index_lock:
+        if _index is None or _index.version != version:
+            occupations = await onet_repository.get_all()
+            alternate_titles = await onet_repository.get_all_alternate_titles()
+            # Building is CPU-bound; keep it off the event loop
+            _index = await asyncio.to_thread(
+                OnetSearchIndex, occupations, alternate_titles, version=version
+            )
+            logger.info(
+                f"Built O*NET search index for version {version}: "
+                f"{len(_index)} occupations, {len(alternate_titles)} alternate titles"
+            )
+        return _index
@@ -0,0 +1,165 @@
+"""Exact title lookup over O*NET occupation and alternate titles.
+
+Lets role mapping resolve uploaded titles that already name an O*NET
+occupation without an LLM call. Titles are compared after normalization
+(case, punctuation, plurals and stopwords ignored), so "Registered Nurse"
+matches the occupation title "Registered Nurses".
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.models.onet_occupation import OnetOccupation
+from app.repositories.onet_repository import OnetRepository
+from app.services.onet_search_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title for exact matching.
+
+    Args:
+        title: Job or occupation title.
+
+    Returns:
+        Space-joined stemmed terms without stopwords.
+    """
+    return " ".join(tokenize(title))
+
+
+@dataclass(frozen=True)
+class TitleMatch:
+    """An unambiguous exact title match.
+
+    Attributes:
+        occupation: Matched occupation.
+        matched_title: O*NET title that matched.
+        alternate: Whether the match was on an alternate title.
+    """
+
+    occupation: OnetOccupation
+    matched_title: str
+    alternate: bool
+
+
+class OnetTitleIndex:
+    """Normalized title → occupation lookup.
+
+    Occupation titles take precedence over alternate titles. Titles that
+    normalize to more than one occupation at the same level are ambiguous
+    and never match.
+
+    Attributes:
+        version: O*NET version the index was built from.
+    """
+
+    def __init__(
+        self,
+        occupations: Iterable[OnetOccupation],
+        alternate_titles: Iterable[tuple[str, str]] = (),
+        version: str | None = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            occupations: Occupations to index. Detached copies of code,
+                title and description are kept.
+            alternate_titles: (onet_code, title) pairs.
+            version: O*NET version the data belongs to.
+        """
+        self.version = version
+        occupations_by_code: dict[str, OnetOccupation] = {}
+        primary: dict[str, dict[str, str]] = defaultdict(dict)
+        alternate: dict[str, dict[str, str]] = defaultdict(dict)
+
+        for occ in occupations:
+            occupations_by_code[occ.code] = OnetOccupation(
+                code=occ.code,
+                title=occ.title,
+                description=occ.description,
+            )
+            key = normalize_title(occ.title)
+            if key:
+                primary[key][occ.code] = occ.title
+
+        for code, title in alternate_titles:
+            key = normalize_title(title)
+            if key and code in occupations_by_code:
+                alternate[key].setdefault(code, title)
+
+        self._matches: dict[str, TitleMatch] = {}
+        for is_alternate, titles in ((True, alternate), (False, primary)):
+            for key, codes in titles.items():
+                if len(codes) == 1:
+                    # Primary titles are applied last and override alternates
+                    code, matched_title = next(iter(codes.items()))
+                    self._matches[key] = TitleMatch(
+                        occupation=occupations_by_code[code],
+                        matched_title=matched_title,
+                        alternate=is_alternate,
+                    )
+                elif not is_alternate:
+                    self._matches.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def match(self, title: str) -> TitleMatch | None:
+        """Find the occupation a title names exactly.
+
+        Args:
+            title: Job title.
+
+        Returns:
+            TitleMatch, or None if there is no unambiguous exact match.
+        """
+        return self._matches.get(normalize_title(title))
+
+    def match_batch(self, titles: Iterable[str]) -> dict[str, TitleMatch]:
+        """Find exact matches for many titles.
+
+        Args:
+            titles: Job titles.
+
+        Returns:
+            Dict of title to TitleMatch for titles that matched.
+        """
+        matches = {}
+        for title in titles:
+            found = self.match(title)
+            if found is not None:
+                matches[title] = found
+        return matches
+
+
+_index: OnetTitleIndex | None = None
+_index_lock = asyncio.Lock()
+
+
+async def get_onet_title_index(onet_repository: OnetRepository) -> OnetTitleIndex:
+    """Get the process-wide title index, rebuilding it when O*NET changes.
+
+    Args:
+        onet_repository: Repository used to check the version and load data.
+
+    Returns:
+        OnetTitleIndex for the current O*NET version.
+    """
+    global _index
+
+    latest = await onet_repository.get_latest_sync()
+    version = latest.version if latest else None
+
+    async with _index_lock:
+        if _index is None or _index.version != version:
+            occupations = await onet_repository.get_all()
+            alternate_titles = await onet_repository.get_all_alternate_titles()
+            # Building is CPU-bound; keep it off the event loop
+            _index = await asyncio.to_thread(
+                OnetTitleIndex, occupations, alternate_titles, version=version
+            )
+            logger.info(f"Built O*NET title index for version {version}: {len(_index)} titles")
+        return _index
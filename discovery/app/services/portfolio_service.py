@@ -0,0 +1,146 @@
+# discovery/app/services/portfolio_service.py
+"""Portfolio service for organization-wide analysis rollups."""
+from collections.abc import AsyncGenerator
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import Row
+
+from app.models.portfolio_rollup import RollupDimension
+from app.repositories.portfolio_repository import PortfolioRepository
+
+# Tiers in reporting order (database values, see ScoringEngine)
+PRIORITY_TIERS = ("now", "next_quarter", "future")
+
+
+def _mean(weighted_sum: float, plain_sum: float, headcount: int, role_count: int) -> float:
+    """Headcount-weighted mean, or the plain mean when there is no headcount."""
+    if headcount > 0:
+        return round(weighted_sum / headcount, 3)
+    if role_count > 0:
+        return round(plain_sum / role_count, 3)
+    return 0.0
+
+
+def _summarize(rows: Sequence[Row]) -> list[dict[str, Any]]:
+    """Combine per-tier rollup rows into one summary per dimension value.
+
+    Args:
+        rows: Organization rollup rows of a single dimension.
+
+    Returns:
+        Summaries with value, label, role_count, headcount,
+        ai_exposure_score, priority_score and role counts per tier, largest
+        headcount first.
+    """
+    groups: dict[str | None, dict[str, Any]] = {}
+    for row in rows:
+        group = groups.setdefault(row.dimension_value, {
+            "value": row.dimension_value,
+            "label": row.label,
+            "role_count": 0,
+            "headcount": 0,
+            "tiers": dict.fromkeys(PRIORITY_TIERS, 0),
+            "_sums": [0.0, 0.0, 0.0, 0.0],
+        })
+        group["label"] = group["label"] or row.label
+        group["role_count"] += row.role_count
+        group["headcount"] += row.headcount
+        group["tiers"][row.priority_tier] = (
+            group["tiers"].get(row.priority_tier, 0) + row.role_count
+        )
+        sums = group["_sums"]
+        sums[0] += row.exposure_weighted_sum
+        sums[1] += row.priority_weighted_sum
+        sums[2] += row.exposure_sum
+        sums[3] += row.priority_sum
+
+    summaries = []
+    for group in groups.values():
+        exposure_weighted, priority_weighted, exposure, priority = group.pop("_sums")
+        group["ai_exposure_score"] = _mean(
+            exposure_weighted, exposure, group["headcount"], group["role_count"]
+        )
+        group["priority_score"] = _mean(
+            priority_weighted, priority, group["headcount"], group["role_count"]
+        )
+        summaries.append(group)
+
+    summaries.sort(key=lambda g: (-g["headcount"], -g["role_count"], g["value"] or ""))
+    return summaries
+
+
+class PortfolioService:
+    """Service for organization portfolio analytics across discovery sessions."""
+
+    def __init__(self, portfolio_repository: PortfolioRepository) -> None:
+        self.portfolio_repository = portfolio_repository
+
+    async def get_portfolio(self, organization_id: UUID) -> dict[str, Any]:
+        """Get an organization's portfolio by occupation, LOB and tier.
+
+        Reads the rollup rows kept current by every analysis run, so the
+        cost depends on the number of distinct occupations and LOBs, not
+        on the number of sessions or roles.
+
+        Args:
+            organization_id: Organization ID.
+
+        Returns:
+            Dict with session_count, totals (role_count, headcount,
+            ai_exposure_score, priority_score), tiers (role_count and
+            headcount per tier), occupations and lobs (see _summarize).
+        """
+        rows = await self.portfolio_repository.get_organization_rollup(organization_id)
+        session_count = (
+            await self.portfolio_repository.count_sessions(organization_id) if rows else 0
+        )
+
+        by_dimension: dict[str, list[Row]] = {d.value: [] for d in RollupDimension}
+        for row in rows:
+            by_dimension.setdefault(row.dimension, []).append(row)
+
+        # Every role has exactly one occupation row (unmapped roles included)
+        roles = by_dimension[RollupDimension.OCCUPATION.value]
+        tiers = {tier: {"role_count": 0, "headcount": 0} for tier in PRIORITY_TIERS}
+        for row in roles:
+            tier = tiers.setdefault(row.priority_tier, {"role_count": 0, "headcount": 0})
+            tier["role_count"] += row.role_count
+            tier["headcount"] += row.headcount
+
+        role_count = sum(r.role_count for r in roles)
+        headcount = sum(r.headcount for r in roles)
+        return {
+            "organization_id": organization_id,
+            "session_count": session_count,
+            "totals": {
+                "role_count": role_count,
+                "headcount": headcount,
+                "ai_exposure_score": _mean(
+                    sum(r.exposure_weighted_sum for r in roles),
+                    sum(r.exposure_sum for r in roles),
+                    headcount,
+                    role_count,
+                ),
+                "priority_score": _mean(
+                    sum(r.priority_weighted_sum for r in roles),
+                    sum(r.priority_sum for r in roles),
+                    headcount,
+                    role_count,
+                ),
+            },
+            "tiers": tiers,
+            "occupations": _summarize(roles),
+            "lobs": _summarize(by_dimension[RollupDimension.LOB.value]),
+        }
+
+
+async def get_portfolio_service() -> AsyncGenerator[PortfolioService, None]:
+    """Get portfolio service dependency for FastAPI.
+
+    Yields a PortfolioService with its repository.
+    """
+    from app.models.base import async_session_maker
+
+    async with async_session_maker() as db:
+        yield PortfolioService(portfolio_repository=PortfolioRepository(db))
@@ -0,0 +1,240 @@
+"""Persistent cross-session cache for LLM role mapping results.
+
+Repeat customers upload the same job titles session after session. This
+cache stores confident LLM answers keyed by normalized title so they can
+be reused without another LLM round trip. Entries are scoped to the
+current O*NET release and LLM model; entries from any other version are
+evicted the first time a new version is seen.
+"""
+import logging
+import re
+from collections.abc import AsyncGenerator
+from typing import Any, ClassVar
+
+from app.agents.role_mapping_agent import ConfidenceTier, RoleMappingResult
+from app.config import get_settings
+from app.repositories.onet_repository import OnetRepository
+from app.repositories.role_mapping_cache_repository import RoleMappingCacheRepository
+
+logger = logging.getLogger(__name__)
+
+# Characters kept when normalizing titles; everything else becomes a space
+_TITLE_STRIP_PATTERN = re.compile(r"[^\w&/+#]+")
+
+# Maximum normalized title length (matches the database column)
+MAX_NORMALIZED_TITLE_LENGTH = 255
+
+
+def normalize_role_title(title: str) -> str:
+    """Normalize a role title into a cache key.
+
+    Lowercases, replaces punctuation with spaces, and collapses whitespace
+    so "Sr. Software Engineer" and "sr software  engineer" share a key.
+
+    Args:
+        title: Raw role title.
+
+    Returns:
+        Normalized title.
+    """
+    normalized = _TITLE_STRIP_PATTERN.sub(" ", title.lower())
+    return " ".join(normalized.split())[:MAX_NORMALIZED_TITLE_LENGTH]
+
+
+class RoleMappingCache:
+    """Cross-session cache of role-to-O*NET mapping results.
+
+    The repositories should use a database session of their own: the cache
+    commits its writes and rolls back its failures (see rollback), which
+    must not affect the caller's transaction.
+
+    Attributes:
+        repository: Repository for cache persistence.
+        onet_repository: Repository used to resolve the current O*NET version.
+        model: LLM model whose answers are cached.
+    """
+
+    # Only confident answers are worth reusing across sessions
+    CACHEABLE_TIERS = frozenset({ConfidenceTier.HIGH, ConfidenceTier.MEDIUM})
+    UNKNOWN_VERSION = "unknown"
+
+    # (onet_version, model) pairs already evicted in this process
+    _evicted_versions: ClassVar[set[tuple[str, str]]] = set()
+
+    # Roles served from / not found in the cache by any instance in this process
+    hits: ClassVar[int] = 0
+    misses: ClassVar[int] = 0
+
+    def __init__(
+        self,
+        repository: RoleMappingCacheRepository,
+        onet_repository: OnetRepository,
+        model: str,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            repository: Repository for cache persistence.
+            onet_repository: Repository used to resolve the O*NET version.
+            model: LLM model whose answers are cached.
+        """
+        self.repository = repository
+        self.onet_repository = onet_repository
+        self.model = model
+        self._onet_version: str | None = None
+
+    async def get_onet_version(self) -> str:
+        """Get the O*NET release the cache is currently scoped to.
+
+        Returns:
+            Version of the latest successful O*NET sync, or "unknown".
+        """
+        if self._onet_version is None:
+            latest = await self.onet_repository.get_latest_sync()
+            self._onet_version = latest.version if latest else self.UNKNOWN_VERSION
+        return self._onet_version
+
+    async def lookup(self, roles: list[str]) -> dict[str, RoleMappingResult]:
+        """Look up cached mapping results for roles.
+
+        Args:
+            roles: Original role titles.
+
+        Returns:
+            Dict mapping original role title to its cached result (hits only).
+        """
+        if not roles:
+            return {}
+
+        onet_version = await self.get_onet_version()
+        await self._evict_stale_once(onet_version)
+
+        keys = {role: normalize_role_title(role) for role in roles}
+        entries = await self.repository.get_entries(
+            list({key for key in keys.values() if key}),
+            onet_version,
+            self.model,
+        )
+
+        results: dict[str, RoleMappingResult] = {}
+        for role, key in keys.items():
+            entry = entries.get(key)
+            if entry is None:
+                continue
+            results[role] = RoleMappingResult(
+                source_role=role,
+                onet_code=entry.onet_code,
+                onet_title=entry.onet_title,
+                confidence=ConfidenceTier(entry.confidence),
+                reasoning=entry.reasoning or "",
+            )
+
+        RoleMappingCache.hits += len(results)
+        RoleMappingCache.misses += len(keys) - len(results)
+        logger.info(f"Role mapping cache: {len(results)} hits, {len(keys) - len(results)} misses")
+
+        if results:
+            await self.repository.record_hits(
+                list({entries[keys[role]].id for role in results})
+            )
+
+        return results
+
+    async def store(self, results: list[RoleMappingResult]) -> int:
+        """Store confident, non-fallback results in the cache.
+
+        Args:
+            results: Mapping results returned by the agent.
+
+        Returns:
+            Number of entries written.
+        """
+        onet_version = await self.get_onet_version()
+
+        entries: dict[str, dict[str, Any]] = {}
+        for result in results:
+            if (
+                result.fallback
+                or not result.onet_code
+                or result.confidence not in self.CACHEABLE_TIERS
+            ):
+                continue
+            key = normalize_role_title(result.source_role)
+            if not key:
+                continue
+            entries[key] = {
+                "normalized_title": key,
+                "onet_version": onet_version,
+                "model": self.model,
+                "onet_code": result.onet_code,
+                "onet_title": result.onet_title,
+                "confidence": result.confidence.value,
+                "reasoning": result.reasoning,
+            }
+
+        return await self.repository.upsert_entries(list(entries.values()))
+
+    async def evict_stale(self) -> int:
+        """Delete entries from other O*NET versions or models.
+
+        Returns:
+            Number of entries deleted.
+        """
+        onet_version = await self.get_onet_version()
+        deleted = await self.repository.delete_stale(onet_version, self.model)
+        self._evicted_versions.add((onet_version, self.model))
+        return deleted
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with the cache scope, persisted entry/hit counts and this
+            process's hit/miss counters.
+        """
+        onet_version = await self.get_onet_version()
+        stats = await self.repository.get_stats(onet_version, self.model)
+        lookups = self.hits + self.misses
+        return {
+            "onet_version": onet_version,
+            "model": self.model,
+            **stats,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    async def rollback(self) -> None:
+        """Discard the cache session's transaction after a failed operation."""
+        await self.repository.session.rollback()
+
+    async def _evict_stale_once(self, onet_version: str) -> None:
+        """Evict stale entries the first time a version/model pair is used.
+
+        Args:
+            onet_version: Current O*NET release.
+        """
+        if (onet_version, self.model) in self._evicted_versions:
+            return
+        await self.evict_stale()
+
+
+async def get_role_mapping_cache() -> AsyncGenerator[RoleMappingCache | None, None]:
+    """Get the role mapping cache dependency.
+
+    Yields a RoleMappingCache on a database session of its own, or None if
+    ROLE_MAPPING_CACHE_ENABLED is off.
+    """
+    from app.models.base import async_session_maker
+
+    settings = get_settings()
+    if not settings.role_mapping_cache_enabled:
+        yield None
+        return
+
+    async with async_session_maker() as db:
+        yield RoleMappingCache(
+            repository=RoleMappingCacheRepository(db),
+            onet_repository=OnetRepository(db),
+            model=settings.anthropic_model,
+        )
@@ -3,7 +3,8 @@
 Uses LLM-powered semantic mapping via RoleMappingAgent.
 """
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
@@ -11,11 +12,14 @@ from app.config import get_settings
 from app.repositories.onet_repository import OnetRepository
 from app.repositories.role_mapping_repository import RoleMappingRepository
 from app.services.file_parser import FileParser
+from app.services.onet_industry_index import get_onet_industry_index
 from app.services.upload_service import UploadService
 
 if TYPE_CHECKING:
-    from app.agents.role_mapping_agent import RoleMappingAgent
+    from app.agents.role_mapping_agent import RoleMappingAgent, RoleMappingResult
     from app.services.lob_mapping_service import LobMappingService
+    from app.services.onet_industry_index import OnetIndustryIndex
+    from app.services.role_mapping_cache import RoleMappingCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,7 @@ class RoleMappingService:
         role_mapping_agent: LLM-powered mapping agent.
         onet_repository: Repository for O*NET data (optional).
         lob_service: Service for LOB-to-NAICS mapping (optional).
+        mapping_cache: Cross-session cache of mapping results (optional).
     """
 
     INDUSTRY_BOOST_FACTOR = 0.25  # Max 25% boost for industry match
@@ -43,6 +48,9 @@ class RoleMappingService:
         upload_service: UploadService | None = None,
         onet_repository: OnetRepository | None = None,
         lob_service: "LobMappingService | None" = None,
+        mapping_cache: "RoleMappingCache | None" = None,
+        industry_index: "OnetIndustryIndex | None" = None,
+        use_industry_index: bool = False,
     ) -> None:
         """Initialize the role mapping service.
 
@@ -52,14 +60,121 @@ class RoleMappingService:
             upload_service: Service for file uploads.
             onet_repository: Repository for O*NET data (optional, for industry matching).
             lob_service: Service for LOB-to-NAICS mapping (optional).
+            mapping_cache: Cross-session cache of mapping results (optional).
+            industry_index: In-memory occupation→NAICS index for industry
+                scoring (optional; falls back to per-occupation queries).
+            use_industry_index: If True and no industry_index is given, the
+                process-wide index is resolved on the first industry scoring,
+                so requests that never score industries don't pay for it.
         """
         self.repository = repository
         self.role_mapping_agent = role_mapping_agent
         self.upload_service = upload_service
         self.onet_repository = onet_repository
         self.lob_service = lob_service
+        self.mapping_cache = mapping_cache
+        self.industry_index = industry_index
+        self.use_industry_index = use_industry_index
         self._file_parser = FileParser()
 
+    async def _score_industries(
+        self,
+        occupation_codes: list[str],
+        naics_codes: list[str],
+    ) -> dict[str, float]:
+        """Industry match scores for occupations against a NAICS set.
+
+        Args:
+            occupation_codes: O*NET occupation codes.
+            naics_codes: NAICS codes or prefixes to match against.
+
+        Returns:
+            Dict of occupation code to score from 0.0 to 1.0.
+        """
+        if self.industry_index is None and self.use_industry_index and self.onet_repository:
+            self.industry_index = await get_onet_industry_index(self.onet_repository)
+        if self.industry_index is not None:
+            return self.industry_index.score_batch(occupation_codes, naics_codes)
+
+        scores = {}
+        for code in dict.fromkeys(occupation_codes):
+            scores[code] = await self.onet_repository.calculate_industry_score(code, naics_codes)
+        return scores
+
+    async def _map_roles_cached(self, role_names: list[str]) -> list["RoleMappingResult"]:
+        """Map roles, serving repeat titles from the cross-session cache.
+
+        Only cache misses are sent to the agent; confident agent results
+        are written back. Cache failures are logged and never fail the
+        mapping itself.
+
+        Args:
+            role_names: Role titles to map.
+
+        Returns:
+            List of RoleMappingResult objects, one per role.
+        """
+        if not self.mapping_cache:
+            return await self.role_mapping_agent.map_roles(role_names)
+
+        cached: dict[str, "RoleMappingResult"] = {}
+        try:
+            cached = await self.mapping_cache.lookup(role_names)
+        except Exception as e:
+            logger.warning(f"Role mapping cache lookup failed: {e}")
+            await self.mapping_cache.rollback()
+
+        misses = [role for role in role_names if role not in cached]
+        fresh = await self.role_mapping_agent.map_roles(misses) if misses else []
+
+        if fresh:
+            try:
+                await self.mapping_cache.store(fresh)
+            except Exception as e:
+                logger.warning(f"Role mapping cache store failed: {e}")
+                await self.mapping_cache.rollback()
+
+        return list(cached.values()) + fresh
+
+    async def _map_roles_cached_stream(
+        self,
+        role_names: list[str],
+    ) -> AsyncIterator[list["RoleMappingResult"]]:
+        """Streaming variant of _map_roles_cached.
+
+        Yields all cache hits first as one batch, then agent results as
+        they stream in, writing confident agent results back to the cache.
+
+        Args:
+            role_names: Role titles to map.
+
+        Yields:
+            Lists of RoleMappingResult objects.
+        """
+        cached: dict[str, "RoleMappingResult"] = {}
+        if self.mapping_cache:
+            try:
+                cached = await self.mapping_cache.lookup(role_names)
+            except Exception as e:
+                logger.warning(f"Role mapping cache lookup failed: {e}")
+                await self.mapping_cache.rollback()
+
+        if cached:
+            yield list(cached.values())
+
+        misses = [role for role in role_names if role not in cached]
+        if not misses:
+            return
+
+        async for results in self.role_mapping_agent.map_roles_stream(misses):
+            if self.mapping_cache:
+                try:
+                    await self.mapping_cache.store(results)
+                except Exception as e:
+                    logger.warning(f"Role mapping cache store failed: {e}")
+                    await self.mapping_cache.rollback()
+            yield results
+
     async def create_mappings_from_upload(
         self,
         session_id: UUID,
@@ -92,6 +207,137 @@ class RoleMappingService:
         Returns:
             List of created mapping dicts.
         """
+        role_entries = await self._load_upload_role_entries(
+            session_id,
+            upload_id,
+            role_column,
+            lob_column,
+            headcount_column,
+            department_column,
+            geography_column,
+        )
+        if not role_entries:
+            return []
+
+        # Get unique role names for LLM mapping (deduplicated)
+        unique_role_names = list(set(e["role"] for e in role_entries))
+
+        logger.info(f"Using LLM agent to map {len(unique_role_names)} unique roles")
+
+        # Map all unique roles, reusing cached results from earlier sessions
+        results = await self._map_roles_cached(unique_role_names)
+
+        return await self._persist_mapping_results(
+            session_id, results, role_entries, industry_naics_sector
+        )
+
+    async def stream_mappings_from_upload(
+        self,
+        session_id: UUID,
+        upload_id: UUID,
+        role_column: str,
+        lob_column: str | None = None,
+        headcount_column: str | None = None,
+        industry_naics_sector: str | None = None,
+        department_column: str | None = None,
+        geography_column: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Create role mappings from uploaded file, yielding progress events.
+
+        Streaming variant of create_mappings_from_upload. Cached roles are
+        persisted and emitted first; LLM results are then persisted and
+        emitted as soon as the agent parses them from the streamed response.
+
+        Events are dicts with a "type" key:
+            - "started": total_roles
+            - "batch": mappings (as in create_mappings_from_upload),
+              completed_roles, total_roles
+            - "done": created_count and confidence tier counts
+
+        Args:
+            session_id: Discovery session ID.
+            upload_id: Upload ID containing the file.
+            role_column: Column name containing roles.
+            lob_column: Optional column name containing LOB values for grouping.
+            headcount_column: Optional column name containing employee counts to sum.
+            industry_naics_sector: Optional 2-digit NAICS sector for industry boosting.
+            department_column: Optional column name containing department values.
+            geography_column: Optional column name containing geography/location values.
+
+        Yields:
+            Progress event dicts.
+        """
+        role_entries = await self._load_upload_role_entries(
+            session_id,
+            upload_id,
+            role_column,
+            lob_column,
+            headcount_column,
+            department_column,
+            geography_column,
+        )
+
+        unique_role_names = list(dict.fromkeys(e["role"] for e in role_entries))
+        total_roles = len(unique_role_names)
+        yield {"type": "started", "total_roles": total_roles}
+
+        completed_roles = 0
+        created_count = 0
+        tier_counts = {tier: 0 for tier in ("HIGH", "MEDIUM", "LOW")}
+
+        async for results in self._map_roles_cached_stream(unique_role_names):
+            mappings = await self._persist_mapping_results(
+                session_id, results, role_entries, industry_naics_sector
+            )
+            completed_roles += len(results)
+            created_count += len(mappings)
+            for result in results:
+                tier_counts[result.confidence.value] += 1
+
+            yield {
+                "type": "batch",
+                "mappings": mappings,
+                "completed_roles": completed_roles,
+                "total_roles": total_roles,
+            }
+
+        yield {
+            "type": "done",
+            "created_count": created_count,
+            "total_roles": total_roles,
+            "high_confidence_count": tier_counts["HIGH"],
+            "medium_confidence_count": tier_counts["MEDIUM"],
+            "low_confidence_count": tier_counts["LOW"],
+        }
+
+    async def _load_upload_role_entries(
+        self,
+        session_id: UUID,
+        upload_id: UUID,
+        role_column: str,
+        lob_column: str | None,
+        headcount_column: str | None,
+        department_column: str | None,
+        geography_column: str | None,
+    ) -> list[dict[str, Any]]:
+        """Reset the session's mappings and extract unique role+LOB entries.
+
+        Note: This method deletes any existing mappings for the session
+        before reading the upload to ensure clean state.
+
+        Args:
+            session_id: Discovery session ID.
+            upload_id: Upload ID containing the file.
+            role_column: Column name containing roles.
+            lob_column: Optional column name containing LOB values.
+            headcount_column: Optional column name containing employee counts.
+            department_column: Optional column name containing department values.
+            geography_column: Optional column name containing geography values.
+
+        Returns:
+            List of entry dicts with role, lob, count, department, and geography,
+            one per unique (role, lob) combination.
+        """
         if not self.upload_service:
             raise ValueError("upload_service required")
 
@@ -145,14 +391,28 @@ class RoleMappingService:
             f"Deduplication: {len(role_lob_data)} raw entries -> {len(role_entries)} unique role+LOB combinations"
         )
 
-        # Get unique role names for LLM mapping (deduplicated)
-        unique_role_names = list(set(e["role"] for e in role_entries))
+        return role_entries
 
-        logger.info(f"Using LLM agent to map {len(unique_role_names)} unique roles")
+    async def _persist_mapping_results(
+        self,
+        session_id: UUID,
+        results: list["RoleMappingResult"],
+        role_entries: list[dict[str, Any]],
+        industry_naics_sector: str | None,
+    ) -> list[dict[str, Any]]:
+        """Apply industry boosting to mapping results and persist them.
+
+        Every role+LOB entry whose role has a result is written.
 
-        # Call agent to map all unique roles
-        results = await self.role_mapping_agent.map_roles(unique_role_names)
+        Args:
+            session_id: Discovery session ID.
+            results: Mapping results for some or all of the entries' roles.
+            role_entries: Unique role+LOB entries from the upload.
+            industry_naics_sector: Optional 2-digit NAICS sector for industry boosting.
 
+        Returns:
+            List of created mapping dicts.
+        """
         # Build lookup from role name to mapping result
         result_by_role = {r.source_role: r for r in results}
 
@@ -161,6 +421,14 @@ class RoleMappingService:
         mapping_dicts = []
         entry_metadata = {}  # Store additional data for response building
 
+        # Score each mapped occupation against the session industry once
+        industry_scores: dict[str, float] = {}
+        if industry_naics_sector and self.onet_repository:
+            industry_scores = await self._score_industries(
+                [r.onet_code for r in results if r.onet_code],
+                [industry_naics_sector],  # 2-digit prefix matching
+            )
+
         for entry in role_entries:
             role_name = entry["role"]
             lob_value = entry["lob"]
@@ -176,11 +444,8 @@ class RoleMappingService:
             industry_match_score = None
             final_confidence = result.confidence_score
 
-            if industry_naics_sector and result.onet_code and self.onet_repository:
-                industry_match_score = await self.onet_repository.calculate_industry_score(
-                    result.onet_code,
-                    [industry_naics_sector],  # 2-digit prefix matching
-                )
+            if result.onet_code in industry_scores:
+                industry_match_score = industry_scores[result.onet_code]
                 # Apply boost to confidence score
                 if industry_match_score > 0:
                     final_confidence = min(
@@ -219,8 +484,11 @@ class RoleMappingService:
                 "reasoning": result.reasoning,
             }
 
+        if not mapping_dicts:
+            return []
+
         # Use bulk_upsert to create all mappings in a single transaction
-        # This uses SELECT FOR UPDATE to prevent duplicate key violations
+        # This uses INSERT ... ON CONFLICT to prevent duplicate key violations
         logger.info(f"Creating {len(mapping_dicts)} role mappings via bulk_upsert")
         created_mappings = await self.repository.bulk_upsert(
             mapping_dicts,
@@ -347,6 +615,9 @@ class RoleMappingService:
     ) -> dict[str, Any]:
         """Bulk confirm mappings above confidence threshold.
 
+        Qualifying mappings are confirmed by a single UPDATE in the
+        repository.
+
         Args:
             session_id: Discovery session ID.
             threshold: Minimum confidence threshold for auto-confirmation.
@@ -356,27 +627,12 @@ class RoleMappingService:
         Returns:
             Dict with confirmed_count.
         """
-        mappings = await self.repository.get_for_session(session_id)
-        confirmed = 0
-
-        for mapping in mappings:
-            # Skip if specific mapping_ids provided and this isn't one of them
-            if mapping_ids is not None and mapping.id not in mapping_ids:
-                continue
-
-            # Skip if LOB filter provided and mapping doesn't match
-            mapping_lob = getattr(mapping, "lob_value", None)
-            if lob is not None and mapping_lob != lob:
-                continue
-
-            if (
-                not mapping.user_confirmed
-                and mapping.onet_code
-                and mapping.confidence_score >= threshold
-            ):
-                await self.repository.confirm(mapping.id, mapping.onet_code)
-                confirmed += 1
-
+        confirmed = await self.repository.bulk_confirm(
+            session_id,
+            threshold=threshold,
+            lob_value=lob,
+            mapping_ids=mapping_ids,
+        )
         return {"confirmed_count": confirmed}
 
     async def bulk_remap(
@@ -409,41 +665,43 @@ class RoleMappingService:
         if not to_remap:
             return {"remapped_count": 0, "mappings": []}
 
-        # Extract role names for re-mapping
-        role_names = [m.source_role for m in to_remap]
-        mapping_by_role = {m.source_role: m for m in to_remap}
+        # Extract role names for re-mapping; a role can have one mapping per LOB
+        mappings_by_role: dict[str, list] = {}
+        for m in to_remap:
+            mappings_by_role.setdefault(m.source_role, []).append(m)
+        role_names = list(mappings_by_role)
 
         logger.info(f"Re-mapping {len(role_names)} low-confidence roles via LLM agent")
 
-        # Call agent to re-map roles
-        results = await self.role_mapping_agent.map_roles(role_names)
+        # Re-map roles; low-confidence answers are never cached, so cache
+        # hits here can only come from confident mappings in other sessions
+        results = await self._map_roles_cached(role_names)
 
-        # Update mappings with new results
+        # Write all new results back in one batched update
+        updates = []
         updated_mappings = []
         for result in results:
-            mapping = mapping_by_role.get(result.source_role)
-            if mapping:
-                # Update the mapping in the database
-                updated = await self.repository.update(
-                    mapping.id,
-                    onet_code=result.onet_code,
-                    confidence_score=result.confidence_score,
-                )
-
-                if updated:
-                    updated_mappings.append({
-                        "id": str(updated.id),
-                        "source_role": updated.source_role,
-                        "onet_code": result.onet_code,
-                        "onet_title": result.onet_title,
-                        "confidence_score": result.confidence_score,
-                        "confidence_tier": result.confidence.value,
-                        "reasoning": result.reasoning,
-                        "is_confirmed": updated.user_confirmed,
-                    })
+            for mapping in mappings_by_role.get(result.source_role, []):
+                updates.append({
+                    "id": mapping.id,
+                    "onet_code": result.onet_code,
+                    "confidence_score": result.confidence_score,
+                })
+                updated_mappings.append({
+                    "id": str(mapping.id),
+                    "source_role": mapping.source_role,
+                    "onet_code": result.onet_code,
+                    "onet_title": result.onet_title,
+                    "confidence_score": result.confidence_score,
+                    "confidence_tier": result.confidence.value,
+                    "reasoning": result.reasoning,
+                    "is_confirmed": mapping.user_confirmed,
+                })
+
+        remapped = await self.repository.bulk_update(session_id, updates)
 
         return {
-            "remapped_count": len(updated_mappings),
+            "remapped_count": remapped,
             "mappings": updated_mappings,
         }
 
@@ -494,11 +752,12 @@ class RoleMappingService:
             return results
 
         # Score candidates with industry boost
+        industry_scores = await self._score_industries(
+            [result["code"] for result in results],
+            naics_codes,
+        )
         for result in results:
-            industry_score = await self.onet_repository.calculate_industry_score(
-                result["code"],
-                naics_codes,
-            )
+            industry_score = industry_scores[result["code"]]
 
             original_score = result["score"]
             boosted_score = original_score * (1 + self.INDUSTRY_BOOST_FACTOR * industry_score)
@@ -514,140 +773,88 @@ class RoleMappingService:
         self,
         session_id: UUID,
         low_confidence_threshold: float = 0.6,
+        page: int | None = None,
+        per_page: int = 500,
     ) -> dict[str, Any]:
         """Get role mappings grouped by Line of Business.
 
         Organizes role mappings by LOB with summary statistics for each group.
         Mappings without LOB assignment are returned separately.
-        Duplicate roles within the same LOB are aggregated.
+        Duplicate roles within the same LOB are aggregated. Aggregation and
+        counting happen in the database; summaries always cover the whole
+        session, while mappings can be paginated.
 
         Args:
             session_id: Discovery session ID.
             low_confidence_threshold: Threshold below which mappings are considered low confidence.
+            page: Optional 1-based page of mappings (ordered by LOB, then
+                role). None returns all mappings.
+            per_page: Mappings per page when page is given.
 
         Returns:
-            Dict with session_id, overall_summary, lob_groups, and ungrouped_mappings.
+            Dict with session_id, overall_summary, lob_groups,
+            ungrouped_mappings, page and per_page.
         """
-        mappings = await self.repository.get_for_session(session_id)
-
-        # Build mapping data with employee counts
-        mapping_data = []
-        for m in mappings:
-            mapping_data.append({
-                "id": str(m.id),
-                "source_role": m.source_role,
-                "onet_code": m.onet_code,
-                "onet_title": getattr(m, "onet_title", None),
-                "confidence_score": m.confidence_score or 0,
-                "is_confirmed": m.user_confirmed,
-                "employee_count": getattr(m, "row_count", 1) or 1,
-                "lob": getattr(m, "lob_value", None),
-            })
-
-        # Group by LOB first, then aggregate by source_role within each LOB
-        lob_groups_dict: dict[str | None, list[dict]] = {}
-
-        for m in mapping_data:
-            lob = m.get("lob")
-            if lob not in lob_groups_dict:
-                lob_groups_dict[lob] = []
-            lob_groups_dict[lob].append(m)
-
-        def aggregate_by_role(mappings_list: list[dict]) -> list[dict]:
-            """Aggregate mappings with the same source_role."""
-            role_groups: dict[str, list[dict]] = {}
-            for m in mappings_list:
-                role = m["source_role"]
-                if role not in role_groups:
-                    role_groups[role] = []
-                role_groups[role].append(m)
-
-            aggregated = []
-            for role, role_mappings in role_groups.items():
-                if len(role_mappings) == 1:
-                    # No aggregation needed
-                    aggregated.append(role_mappings[0])
-                else:
-                    # Aggregate multiple mappings with same role
-                    # Prefer confirmed mapping for O*NET info, otherwise highest confidence
-                    confirmed = [m for m in role_mappings if m["is_confirmed"]]
-                    if confirmed:
-                        primary = confirmed[0]
-                    else:
-                        # Sort by confidence score descending
-                        sorted_by_conf = sorted(
-                            role_mappings,
-                            key=lambda x: x["confidence_score"],
-                            reverse=True
-                        )
-                        primary = sorted_by_conf[0]
-
-                    aggregated.append({
-                        "id": primary["id"],  # Use primary ID for API operations
-                        "source_role": role,
-                        "onet_code": primary["onet_code"],
-                        "onet_title": primary["onet_title"],
-                        "confidence_score": primary["confidence_score"],
-                        "is_confirmed": any(m["is_confirmed"] for m in role_mappings),
-                        "employee_count": sum(m["employee_count"] for m in role_mappings),
-                        "lob": primary["lob"],
-                    })
-            return aggregated
-
-        # Aggregate within each LOB and build groups
-        lob_groups = []
-        ungrouped = []
-
-        for lob, group_mappings in sorted(
-            lob_groups_dict.items(),
-            key=lambda x: (x[0] is None, x[0] or ""),  # None goes last
-        ):
-            aggregated_mappings = aggregate_by_role(group_mappings)
-
-            if lob is None:
-                ungrouped.extend(aggregated_mappings)
-            else:
-                group_summary = {
-                    "total_roles": len(aggregated_mappings),
-                    "confirmed_count": sum(1 for m in aggregated_mappings if m["is_confirmed"]),
-                    "pending_count": sum(1 for m in aggregated_mappings if not m["is_confirmed"]),
-                    "low_confidence_count": sum(
-                        1 for m in aggregated_mappings
-                        if m["confidence_score"] < low_confidence_threshold and not m["is_confirmed"]
-                    ),
-                    "total_employees": sum(m["employee_count"] for m in aggregated_mappings),
-                }
-                lob_groups.append({
-                    "lob": lob,
-                    "summary": group_summary,
-                    "mappings": aggregated_mappings,
-                })
-
-        # Aggregate ungrouped as well
-        ungrouped = aggregate_by_role(ungrouped) if ungrouped else []
+        limit = per_page if page is not None else None
+        offset = (page - 1) * per_page if page is not None else 0
 
-        # Calculate overall summary from aggregated data
-        all_aggregated = []
-        for g in lob_groups:
-            all_aggregated.extend(g["mappings"])
-        all_aggregated.extend(ungrouped)
+        summaries = await self.repository.get_group_summaries(
+            session_id, low_confidence_threshold
+        )
+        rows = await self.repository.get_grouped_rows(session_id, limit=limit, offset=offset)
+
+        def to_summary(row) -> dict[str, int]:
+            return {
+                "total_roles": row.total_roles,
+                "confirmed_count": row.confirmed_count,
+                "pending_count": row.pending_count,
+                "low_confidence_count": row.low_confidence_count,
+                "total_employees": int(row.total_employees),
+            }
 
         overall_summary = {
-            "total_roles": len(all_aggregated),
-            "confirmed_count": sum(1 for m in all_aggregated if m["is_confirmed"]),
-            "pending_count": sum(1 for m in all_aggregated if not m["is_confirmed"]),
-            "low_confidence_count": sum(
-                1 for m in all_aggregated
-                if m["confidence_score"] < low_confidence_threshold and not m["is_confirmed"]
-            ),
-            "total_employees": sum(m["employee_count"] for m in all_aggregated),
+            "total_roles": 0,
+            "confirmed_count": 0,
+            "pending_count": 0,
+            "low_confidence_count": 0,
+            "total_employees": 0,
         }
+        groups_by_lob: dict[str, dict[str, Any]] = {}
+        for row in summaries:
+            if row.is_overall:
+                overall_summary = to_summary(row)
+            elif row.lob is not None:
+                groups_by_lob[row.lob] = {
+                    "lob": row.lob,
+                    "summary": to_summary(row),
+                    "mappings": [],
+                }
+
+        ungrouped = []
+        for row in rows:
+            mapping = {
+                "id": str(row.id),
+                "source_role": row.source_role,
+                "onet_code": row.onet_code,
+                "onet_title": row.onet_title,
+                "confidence_score": row.confidence_score,
+                "is_confirmed": row.is_confirmed,
+                "employee_count": int(row.employee_count),
+                "lob": row.lob,
+            }
+            group = groups_by_lob.get(row.lob) if row.lob is not None else None
+            if group is not None:
+                group["mappings"].append(mapping)
+            else:
+                ungrouped.append(mapping)
 
         return {
             "session_id": str(session_id),
             "overall_summary": overall_summary,
-            "lob_groups": lob_groups,
+            "lob_groups": [groups_by_lob[lob] for lob in sorted(groups_by_lob)],
             "ungrouped_mappings": ungrouped,
+            "page": page,
+            "per_page": per_page if page is not None else None,
         }
 
 
@@ -718,12 +925,16 @@ async def get_role_mapping_service() -> AsyncGenerator[RoleMappingService, None]
     from app.repositories.upload_repository import UploadRepository
     from app.services.llm_service import get_llm_service
     from app.services.lob_mapping_service import LobMappingService
+    from app.services.onet_search_index import get_onet_search_index
+    from app.services.role_mapping_cache import get_role_mapping_cache
     from app.services.s3_client import S3Client
     from app.services.upload_service import UploadService
 
     settings = get_settings()
 
-    async with async_session_maker() as db:
+    # The cache commits on a session of its own, never the request's
+    cache_context = asynccontextmanager(get_role_mapping_cache)()
+    async with async_session_maker() as db, cache_context as mapping_cache:
         repository = RoleMappingRepository(db)
         onet_repo = OnetRepository(db)
         lob_repo = LobMappingRepository(db)
@@ -753,10 +964,19 @@ async def get_role_mapping_service() -> AsyncGenerator[RoleMappingService, None]
             llm_service=llm_service,
         )
 
+        # Use the in-memory candidate index instead of database search if configured
+        search_index = None
+        if settings.role_mapping_candidate_source == "memory":
+            search_index = await get_onet_search_index(onet_repo)
+
         # Create role mapping agent
         agent = RoleMappingAgent(
             llm_service=llm_service,
             onet_repository=onet_repo,
+            max_concurrency=settings.role_mapping_max_concurrency,
+            search_index=search_index,
+            prompt_token_budget=settings.role_mapping_prompt_token_budget,
+            use_title_index=settings.role_mapping_exact_match_enabled,
         )
 
         service = RoleMappingService(
@@ -765,6 +985,8 @@ async def get_role_mapping_service() -> AsyncGenerator[RoleMappingService, None]
             upload_service=upload_service,
             onet_repository=onet_repo,
             lob_service=lob_service,
+            mapping_cache=mapping_cache,
+            use_industry_index=True,
         )
         yield service
 
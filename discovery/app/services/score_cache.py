@@ -0,0 +1,125 @@
+"""In-memory cache of per-session scoring inputs for what-if scenarios.
+
+Scenario scoring re-runs the ScoringEngine formulas with different weights
+and tier thresholds over the same inputs: each role's average DWA
+exposure, its headcount and its LOB/department/geography group. Those
+inputs change with selections, with the session's role mappings and with
+refreshes of effective DWA exposure, so they are kept here as NumPy
+arrays per (session, source), tagged with a data version built from the
+session's selection_version, the exposure version and a fingerprint of
+its mappings (see RoleMappingRepository.get_fingerprint). The version is
+read from the database on every lookup and a mismatch misses, so writes
+from any process invalidate the entry without any explicit call.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+from uuid import UUID
+
+import numpy as np
+
+from app.config import Settings, get_settings
+from app.models.discovery_analysis import AnalysisDimension
+
+
+@dataclass
+class SessionScoreArrays:
+    """Scoring inputs of every role mapping in a session.
+
+    Attributes:
+        version: Data version the arrays reflect, compared by equality.
+        source: "tasks" or "activities".
+        role_mapping_ids: Role mapping IDs, in array order.
+        role_names: Source role titles, in array order.
+        row_counts: Headcount per role (0 when unknown).
+        exposure: Average selected-DWA exposure per role.
+        groups: Per grouping dimension, the group names and each role's
+            group code (-1 for roles without a value).
+    """
+
+    version: Hashable
+    source: str
+    role_mapping_ids: list[UUID]
+    role_names: list[str]
+    row_counts: np.ndarray
+    exposure: np.ndarray
+    groups: dict[AnalysisDimension, tuple[list[str], np.ndarray]]
+
+
+class SessionScoreCache:
+    """LRU cache of SessionScoreArrays keyed by session and source."""
+
+    def __init__(self, max_sessions: int = 128) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_sessions: Entries kept before the least recently used is evicted.
+        """
+        self.max_sessions = max(1, max_sessions)
+        self._entries: OrderedDict[tuple[UUID, str], SessionScoreArrays] = OrderedDict()
+
+    def get(
+        self,
+        session_id: UUID,
+        source: str,
+        version: Hashable,
+    ) -> SessionScoreArrays | None:
+        """Get cached arrays if they reflect the given data version.
+
+        Args:
+            session_id: Discovery session ID.
+            source: "tasks" or "activities".
+            version: Current data version of the session.
+
+        Returns:
+            The cached arrays, or None if missing or stale.
+        """
+        key = (session_id, source)
+        arrays = self._entries.get(key)
+        if arrays is None:
+            return None
+        if arrays.version != version:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return arrays
+
+    def put(self, session_id: UUID, arrays: SessionScoreArrays) -> None:
+        """Store arrays for a session, evicting the least recently used entry.
+
+        Args:
+            session_id: Discovery session ID.
+            arrays: Scoring inputs to cache.
+        """
+        key = (session_id, arrays.source)
+        self._entries[key] = arrays
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_sessions:
+            self._entries.popitem(last=False)
+
+
+def create_session_score_cache(settings: Settings) -> SessionScoreCache:
+    """Create a score cache from settings.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        SessionScoreCache bounded by scenario_cache_max_sessions.
+    """
+    return SessionScoreCache(max_sessions=settings.scenario_cache_max_sessions)
+
+
+_session_score_cache: SessionScoreCache | None = None
+
+
+def get_session_score_cache() -> SessionScoreCache:
+    """Get the process-wide session score cache.
+
+    Returns:
+        Shared SessionScoreCache.
+    """
+    global _session_score_cache
+    if _session_score_cache is None:
+        _session_score_cache = create_session_score_cache(get_settings())
+    return _session_score_cache
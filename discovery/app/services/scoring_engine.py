@@ -2,6 +2,8 @@
 """Scoring engine for AI exposure and priority calculations."""
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class RoleScores:
@@ -27,6 +29,44 @@ class ScoringEngine:
     IMPACT_WEIGHT = 0.4
     EASE_WEIGHT = 0.2  # (1 - complexity)
 
+    # Priority tier thresholds
+    NOW_PRIORITY_THRESHOLD = 0.75
+    NOW_COMPLEXITY_THRESHOLD = 0.3  # "now" also needs complexity below this
+    NEXT_QUARTER_PRIORITY_THRESHOLD = 0.60
+
+    def __init__(
+        self,
+        exposure_weight: float | None = None,
+        impact_weight: float | None = None,
+        ease_weight: float | None = None,
+        now_priority_threshold: float | None = None,
+        now_complexity_threshold: float | None = None,
+        next_quarter_priority_threshold: float | None = None,
+    ) -> None:
+        """Initialize the engine, optionally overriding weights and thresholds.
+
+        Arguments left as None keep the class defaults.
+
+        Args:
+            exposure_weight: Weight of exposure in priority.
+            impact_weight: Weight of impact in priority.
+            ease_weight: Weight of ease (1 - complexity) in priority.
+            now_priority_threshold: Minimum priority for the "now" tier.
+            now_complexity_threshold: Complexity the "now" tier must stay below.
+            next_quarter_priority_threshold: Minimum priority for "next_quarter".
+        """
+        overrides = {
+            "EXPOSURE_WEIGHT": exposure_weight,
+            "IMPACT_WEIGHT": impact_weight,
+            "EASE_WEIGHT": ease_weight,
+            "NOW_PRIORITY_THRESHOLD": now_priority_threshold,
+            "NOW_COMPLEXITY_THRESHOLD": now_complexity_threshold,
+            "NEXT_QUARTER_PRIORITY_THRESHOLD": next_quarter_priority_threshold,
+        }
+        for name, value in overrides.items():
+            if value is not None:
+                setattr(self, name, value)
+
     def calculate_ai_exposure(self, dwa_scores: list[float]) -> float:
         """Calculate AI exposure from DWA scores.
 
@@ -120,7 +160,26 @@ class ScoringEngine:
         Returns:
             Dict with ai_exposure, impact, complexity, priority.
         """
-        exposure = self.calculate_ai_exposure(dwa_scores)
+        return self.score_exposure(
+            self.calculate_ai_exposure(dwa_scores), row_count, total_rows
+        )
+
+    def score_exposure(
+        self,
+        exposure: float,
+        row_count: int,
+        total_rows: int,
+    ) -> dict[str, float]:
+        """Calculate all scores for a role from its aggregated AI exposure.
+
+        Args:
+            exposure: Average exposure of the role's selected DWAs.
+            row_count: Employees in this role.
+            total_rows: Total employees.
+
+        Returns:
+            Dict with ai_exposure, impact, complexity, priority.
+        """
         impact = self.calculate_impact(exposure, row_count, total_rows)
         complexity = self.calculate_complexity(exposure)
         priority = self.calculate_priority(exposure, impact, complexity)
@@ -132,6 +191,69 @@ class ScoringEngine:
             "priority": round(priority, 3),
         }
 
+    def score_roles(
+        self,
+        exposure: np.ndarray,
+        row_counts: np.ndarray,
+        total_rows: int,
+    ) -> dict[str, np.ndarray]:
+        """Vectorized score_exposure for many roles at once.
+
+        Applies the same formulas element-wise, so each element matches
+        what score_exposure returns for that role.
+
+        Args:
+            exposure: Average DWA exposure per role.
+            row_counts: Employees per role.
+            total_rows: Total employees.
+
+        Returns:
+            Dict of arrays with ai_exposure, impact, complexity, priority.
+        """
+        exposure = np.asarray(exposure, dtype=np.float64)
+        if total_rows == 0:
+            impact = np.zeros_like(exposure)
+        else:
+            coverage = np.asarray(row_counts, dtype=np.float64) / total_rows
+            impact = np.minimum(1.0, exposure * 0.6 + coverage * 0.4)
+        complexity = 1.0 - exposure
+        ease = 1.0 - complexity
+        priority = (
+            exposure * self.EXPOSURE_WEIGHT
+            + impact * self.IMPACT_WEIGHT
+            + ease * self.EASE_WEIGHT
+        )
+
+        return {
+            "ai_exposure": np.round(exposure, 3),
+            "impact": np.round(impact, 3),
+            "complexity": np.round(complexity, 3),
+            "priority": np.round(priority, 3),
+        }
+
+    def classify_priority_tiers(
+        self,
+        priority: np.ndarray,
+        complexity: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized classify_priority_tier.
+
+        Args:
+            priority: Priority score per role.
+            complexity: Complexity score per role.
+
+        Returns:
+            Array of 'now', 'next_quarter', or 'future'.
+        """
+        return np.where(
+            (priority >= self.NOW_PRIORITY_THRESHOLD)
+            & (complexity < self.NOW_COMPLEXITY_THRESHOLD),
+            "now",
+            np.where(
+                priority >= self.NEXT_QUARTER_PRIORITY_THRESHOLD, "next_quarter", "future"
+            ),
+        )
+
     def classify_priority_tier(self, priority: float, complexity: float) -> str:
         """Classify into priority tier.
 
@@ -142,9 +264,12 @@ class ScoringEngine:
         Returns:
             'now', 'next_quarter', or 'future'.
         """
-        if priority >= 0.75 and complexity < 0.3:
+        if (
+            priority >= self.NOW_PRIORITY_THRESHOLD
+            and complexity < self.NOW_COMPLEXITY_THRESHOLD
+        ):
             return "now"
-        elif priority >= 0.60:
+        elif priority >= self.NEXT_QUARTER_PRIORITY_THRESHOLD:
             return "next_quarter"
         else:
             return "future"
@@ -0,0 +1,60 @@
+"""Create cross-session role mapping cache table.
+
+Revision ID: 019_role_mapping_cache
+Revises: 018_role_mapping_unique
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "019_role_mapping_cache"
+down_revision: Union[str, None] = "018_role_mapping_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create role_mapping_cache table keyed by (title, O*NET version, model)."""
+    op.create_table(
+        "role_mapping_cache",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("normalized_title", sa.String(255), nullable=False),
+        sa.Column("onet_version", sa.String(20), nullable=False),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("onet_code", sa.String(10), nullable=False),
+        sa.Column("onet_title", sa.String(255), nullable=True),
+        sa.Column("confidence", sa.String(10), nullable=False),
+        sa.Column("reasoning", sa.Text(), nullable=True),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("last_hit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["onet_code"],
+            ["onet_occupations.code"],
+            ondelete="CASCADE",
+        ),
+        sa.UniqueConstraint(
+            "normalized_title",
+            "onet_version",
+            "model",
+            name="uq_role_mapping_cache_key",
+        ),
+    )
+    op.create_index(
+        "idx_role_mapping_cache_version",
+        "role_mapping_cache",
+        ["onet_version", "model"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_role_mapping_cache_version", table_name="role_mapping_cache")
+    op.drop_table("role_mapping_cache")
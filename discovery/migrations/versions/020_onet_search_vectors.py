@@ -0,0 +1,68 @@
+"""Add stored tsvector columns for O*NET full-text search.
+
+Revision ID: 020_onet_search_vectors
+Revises: 019_role_mapping_cache
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "020_onet_search_vectors"
+down_revision: Union[str, None] = "019_role_mapping_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace expression GIN indexes with stored, weighted search vectors.
+
+    Occupation titles are weighted A and descriptions B so ts_rank prefers
+    title matches. The generated columns are maintained by PostgreSQL, so
+    O*NET syncs need no changes.
+    """
+    op.execute("""
+        ALTER TABLE onet_occupations
+        ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+    """)
+    op.execute("""
+        ALTER TABLE onet_alternate_titles
+        ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            to_tsvector('english', title)
+        ) STORED
+    """)
+
+    op.execute("DROP INDEX IF EXISTS idx_onet_occupation_search")
+    op.execute("DROP INDEX IF EXISTS idx_onet_alt_title_search")
+
+    op.execute("""
+        CREATE INDEX idx_onet_occupation_search_vector
+        ON onet_occupations USING gin(search_vector)
+    """)
+    op.execute("""
+        CREATE INDEX idx_onet_alt_title_search_vector
+        ON onet_alternate_titles USING gin(search_vector)
+    """)
+
+
+def downgrade() -> None:
+    """Restore expression GIN indexes and drop the stored columns."""
+    op.execute("DROP INDEX IF EXISTS idx_onet_alt_title_search_vector")
+    op.execute("DROP INDEX IF EXISTS idx_onet_occupation_search_vector")
+    op.execute("ALTER TABLE onet_alternate_titles DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE onet_occupations DROP COLUMN IF EXISTS search_vector")
+
+    op.execute("""
+        CREATE INDEX idx_onet_occupation_search
+        ON onet_occupations
+        USING gin(to_tsvector('english', title || ' ' || COALESCE(description, '')))
+    """)
+    op.execute("""
+        CREATE INDEX idx_onet_alt_title_search
+        ON onet_alternate_titles
+        USING gin(to_tsvector('english', title))
+    """)
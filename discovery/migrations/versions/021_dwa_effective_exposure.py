@@ -0,0 +1,42 @@
+"""Add materialized effective DWA exposure view.
+
+Revision ID: 021_dwa_effective_exposure
+Revises: 020_onet_search_vectors
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "021_dwa_effective_exposure"
+down_revision: Union[str, None] = "020_onet_search_vectors"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Materialize each DWA's override, else its parent GWA's exposure.
+
+    The unique index on dwa_id serves lookups and lets the view be
+    refreshed concurrently (see OnetRepository.refresh_dwa_effective_exposure).
+    """
+    op.execute("""
+        CREATE MATERIALIZED VIEW dwa_effective_exposure AS
+        SELECT
+            d.id AS dwa_id,
+            i.gwa_id AS gwa_id,
+            COALESCE(d.ai_exposure_override, g.ai_exposure_score) AS exposure
+        FROM onet_dwa d
+        LEFT JOIN onet_iwa i ON i.id = d.iwa_id
+        LEFT JOIN onet_gwa g ON g.id = i.gwa_id
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX idx_dwa_effective_exposure_dwa
+        ON dwa_effective_exposure (dwa_id)
+    """)
+
+
+def downgrade() -> None:
+    """Drop the effective DWA exposure view."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS dwa_effective_exposure")
@@ -0,0 +1,56 @@
+"""Track selection changes for incremental re-analysis.
+
+Revision ID: 022_selection_dirty_tracking
+Revises: 021_dwa_effective_exposure
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "022_selection_dirty_tracking"
+down_revision: Union[str, None] = "021_dwa_effective_exposure"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add selection version counters to sessions and role mappings.
+
+    Every task/activity selection write bumps the session's
+    selection_version and stamps it on the affected role mappings; the
+    session's analyzed_version records which version the stored analysis
+    reflects, so mappings stamped later are the dirty ones.
+    """
+    op.add_column(
+        "discovery_sessions",
+        sa.Column("selection_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "discovery_sessions",
+        sa.Column("analyzed_version", sa.BigInteger(), nullable=True),
+    )
+    op.add_column(
+        "discovery_sessions",
+        sa.Column("analysis_source", sa.String(20), nullable=True),
+    )
+    op.add_column(
+        "discovery_role_mappings",
+        sa.Column("selection_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "idx_analysis_results_session_mapping",
+        "discovery_analysis_results",
+        ["session_id", "role_mapping_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop selection version counters."""
+    op.drop_index("idx_analysis_results_session_mapping", table_name="discovery_analysis_results")
+    op.drop_column("discovery_role_mappings", "selection_version")
+    op.drop_column("discovery_sessions", "analysis_source")
+    op.drop_column("discovery_sessions", "analyzed_version")
+    op.drop_column("discovery_sessions", "selection_version")
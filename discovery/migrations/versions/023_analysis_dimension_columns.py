@@ -0,0 +1,45 @@
+"""Add department and geography to role mappings for dimension analysis.
+
+Revision ID: 023_analysis_dimension_columns
+Revises: 022_selection_dirty_tracking
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "023_analysis_dimension_columns"
+down_revision: Union[str, None] = "022_selection_dirty_tracking"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add grouping columns and an index for per-dimension result reads.
+
+    Analysis runs persist LOB, department and geography aggregates next to
+    the role results; dimension views read them by (session, dimension)
+    in priority order.
+    """
+    op.add_column(
+        "discovery_role_mappings",
+        sa.Column("department_value", sa.String(255), nullable=True),
+    )
+    op.add_column(
+        "discovery_role_mappings",
+        sa.Column("geography_value", sa.String(255), nullable=True),
+    )
+    op.create_index(
+        "idx_analysis_results_session_dimension",
+        "discovery_analysis_results",
+        ["session_id", "dimension", sa.text("priority_score DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop grouping columns and the dimension index."""
+    op.drop_index("idx_analysis_results_session_dimension", table_name="discovery_analysis_results")
+    op.drop_column("discovery_role_mappings", "geography_value")
+    op.drop_column("discovery_role_mappings", "department_value")
@@ -0,0 +1,112 @@
+"""Create organization portfolio rollup table.
+
+Revision ID: 024_portfolio_rollups
+Revises: 023_analysis_dimension_columns
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "024_portfolio_rollups"
+down_revision: Union[str, None] = "023_analysis_dimension_columns"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same grouping as PortfolioRepository.refresh_session, for every session
+BACKFILL_DIMENSION_SQL = """
+    INSERT INTO discovery_portfolio_rollups (
+        organization_id, session_id, dimension, dimension_value, label,
+        priority_tier, role_count, headcount, exposure_weighted_sum,
+        priority_weighted_sum, exposure_sum, priority_sum
+    )
+    SELECT
+        s.organization_id,
+        r.session_id,
+        '{dimension}',
+        {value},
+        {label},
+        COALESCE(r.breakdown->>'priority_tier', 'future'),
+        count(*),
+        sum(COALESCE(r.row_count, 0)),
+        sum(r.ai_exposure_score * COALESCE(r.row_count, 0)),
+        sum(COALESCE(r.priority_score, 0) * COALESCE(r.row_count, 0)),
+        sum(r.ai_exposure_score),
+        sum(COALESCE(r.priority_score, 0))
+    FROM discovery_analysis_results r
+    JOIN discovery_role_mappings m ON m.id = r.role_mapping_id
+    JOIN discovery_sessions s ON s.id = r.session_id
+    LEFT JOIN onet_occupations o ON o.code = m.onet_code
+    WHERE r.dimension = 'role'
+    GROUP BY s.organization_id, r.session_id, {value}, {label},
+        COALESCE(r.breakdown->>'priority_tier', 'future')
+"""
+
+
+def upgrade() -> None:
+    """Create the rollup table and backfill it from stored analyses.
+
+    Rows are additive per-session partial sums keyed by (session,
+    dimension, value, tier); the organization index serves portfolio
+    reads and the session index serves per-session rebuilds.
+    """
+    op.create_table(
+        "discovery_portfolio_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("session_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("dimension", sa.String(20), nullable=False),
+        sa.Column("dimension_value", sa.String(255), nullable=True),
+        sa.Column("label", sa.String(255), nullable=True),
+        sa.Column("priority_tier", sa.String(20), nullable=False),
+        sa.Column("role_count", sa.Integer(), nullable=False),
+        sa.Column("headcount", sa.Integer(), nullable=False),
+        sa.Column("exposure_weighted_sum", sa.Float(), nullable=False),
+        sa.Column("priority_weighted_sum", sa.Float(), nullable=False),
+        sa.Column("exposure_sum", sa.Float(), nullable=False),
+        sa.Column("priority_sum", sa.Float(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["session_id"],
+            ["discovery_sessions.id"],
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index(
+        "idx_portfolio_rollups_org_dimension",
+        "discovery_portfolio_rollups",
+        ["organization_id", "dimension"],
+    )
+    op.create_index(
+        "ix_discovery_portfolio_rollups_session_id",
+        "discovery_portfolio_rollups",
+        ["session_id"],
+    )
+
+    op.execute(BACKFILL_DIMENSION_SQL.format(
+        dimension="occupation", value="m.onet_code", label="o.title"
+    ))
+    op.execute(BACKFILL_DIMENSION_SQL.format(
+        dimension="lob", value="NULLIF(m.lob_value, '')", label="NULL::varchar"
+    ))
+
+
+def downgrade() -> None:
+    """Drop the rollup table."""
+    op.drop_index(
+        "ix_discovery_portfolio_rollups_session_id",
+        table_name="discovery_portfolio_rollups",
+    )
+    op.drop_index(
+        "idx_portfolio_rollups_org_dimension",
+        table_name="discovery_portfolio_rollups",
+    )
+    op.drop_table("discovery_portfolio_rollups")
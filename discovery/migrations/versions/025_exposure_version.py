@@ -0,0 +1,49 @@
+"""Version effective DWA exposure refreshes for analysis staleness.
+
+Revision ID: 025_exposure_version
+Revises: 024_portfolio_rollups
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "025_exposure_version"
+down_revision: Union[str, None] = "024_portfolio_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a single-row exposure version and record it on analyses.
+
+    OnetRepository.refresh_dwa_effective_exposure bumps the version with
+    every refresh of dwa_effective_exposure. Sessions store the version
+    their analysis was scored against, so incremental runs can tell when
+    GWA scores or DWA overrides changed underneath them.
+    """
+    op.create_table(
+        "onet_exposure_state",
+        sa.Column("id", sa.SmallInteger(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint("id = 1", name="ck_onet_exposure_state_single_row"),
+    )
+    op.execute("INSERT INTO onet_exposure_state (id, version) VALUES (1, 0)")
+    op.add_column(
+        "discovery_sessions",
+        sa.Column("analyzed_exposure_version", sa.BigInteger(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the exposure version."""
+    op.drop_column("discovery_sessions", "analyzed_exposure_version")
+    op.drop_table("onet_exposure_state")
@@ -0,0 +1,40 @@
+"""Track when role mappings last changed.
+
+Revision ID: 026_role_mapping_updated_at
+Revises: 025_exposure_version
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "026_role_mapping_updated_at"
+down_revision: Union[str, None] = "025_exposure_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add updated_at to role mappings.
+
+    Together with the mapping count it fingerprints a session's mappings,
+    so the scenario score cache can tell when uploads, remaps or deletes
+    changed them without a selection_version bump.
+    """
+    op.add_column(
+        "discovery_role_mappings",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.execute("UPDATE discovery_role_mappings SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    """Drop updated_at from role mappings."""
+    op.drop_column("discovery_role_mappings", "updated_at")
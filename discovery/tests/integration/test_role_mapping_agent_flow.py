@@ -16,6 +16,16 @@ from app.repositories.onet_repository import OnetRepository
 from app.services.llm_service import LLMService
 
 
+def _stream_of(respond):
+    """Mock stream_response that streams respond()'s text in small chunks."""
+    async def stream_response(*args, **kwargs):
+        text = respond(*args, **kwargs)
+        for i in range(0, len(text), 16):
+            yield text[i:i + 16]
+
+    return MagicMock(side_effect=stream_response)
+
+
 class TestRoleMappingAgentIntegration:
     """Integration tests for role mapping agent."""
 
@@ -24,7 +34,7 @@ class TestRoleMappingAgentIntegration:
         """Test complete flow from roles to mappings."""
         # Create mock LLM that returns valid JSON
         mock_llm = AsyncMock(spec=LLMService)
-        mock_llm.generate_response.return_value = """[
+        mock_llm.stream_response = _stream_of(lambda *args, **kwargs: """[
             {
                 "role": "Software Engineer",
                 "onet_code": "15-1252.00",
@@ -39,7 +49,7 @@ class TestRoleMappingAgentIntegration:
                 "confidence": "MEDIUM",
                 "reasoning": "Data analysis is part of data science"
             }
-        ]"""
+        ]""")
 
         # Create mock occupation objects
         mock_occupations = [
@@ -59,7 +69,9 @@ class TestRoleMappingAgentIntegration:
 
         # Create mock repository that returns candidates
         mock_repo = AsyncMock(spec=OnetRepository)
-        mock_repo.search_with_full_text.return_value = mock_occupations
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: mock_occupations for q in queries
+        }
 
         # Create agent and run mapping
         agent = RoleMappingAgent(
@@ -85,7 +97,10 @@ class TestRoleMappingAgentIntegration:
     async def test_handles_llm_failure_gracefully(self):
         """Test that agent handles LLM failures with fallbacks."""
         mock_llm = AsyncMock(spec=LLMService)
-        mock_llm.generate_response.side_effect = Exception("LLM API error")
+        def fail(*args, **kwargs):
+            raise Exception("LLM API error")
+
+        mock_llm.stream_response = _stream_of(fail)
 
         mock_occupation = MagicMock(
             spec=OnetOccupation,
@@ -95,7 +110,9 @@ class TestRoleMappingAgentIntegration:
         )
 
         mock_repo = AsyncMock(spec=OnetRepository)
-        mock_repo.search_with_full_text.return_value = [mock_occupation]
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [mock_occupation] for q in queries
+        }
 
         agent = RoleMappingAgent(
             llm_service=mock_llm,
@@ -113,7 +130,7 @@ class TestRoleMappingAgentIntegration:
     async def test_handles_no_candidates_found(self):
         """Test handling when no O*NET candidates are found."""
         mock_llm = AsyncMock(spec=LLMService)
-        mock_llm.generate_response.return_value = """[
+        mock_llm.stream_response = _stream_of(lambda *args, **kwargs: """[
             {
                 "role": "Obscure Job Title",
                 "onet_code": null,
@@ -121,10 +138,12 @@ class TestRoleMappingAgentIntegration:
                 "confidence": "LOW",
                 "reasoning": "No matching occupation found"
             }
-        ]"""
+        ]""")
 
         mock_repo = AsyncMock(spec=OnetRepository)
-        mock_repo.search_with_full_text.return_value = []  # No candidates
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }  # No candidates
 
         agent = RoleMappingAgent(
             llm_service=mock_llm,
@@ -166,7 +185,7 @@ class TestRoleMappingAgentIntegration:
                 })
             return json.dumps(results)
 
-        mock_llm.generate_response.side_effect = generate_batch_response
+        mock_llm.stream_response = _stream_of(generate_batch_response)
 
         mock_occupation = MagicMock(
             spec=OnetOccupation,
@@ -175,7 +194,9 @@ class TestRoleMappingAgentIntegration:
             description="Develop software",
         )
         mock_repo = AsyncMock(spec=OnetRepository)
-        mock_repo.search_with_full_text.return_value = [mock_occupation]
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [mock_occupation] for q in queries
+        }
 
         # Use batch_size of 5 for testing
         agent = RoleMappingAgent(
@@ -191,13 +212,13 @@ class TestRoleMappingAgentIntegration:
         # Should have 12 results
         assert len(results) == 12
         # LLM should be called 3 times (3 batches)
-        assert mock_llm.generate_response.call_count == 3
+        assert mock_llm.stream_response.call_count == 3
 
     @pytest.mark.asyncio
     async def test_handles_malformed_llm_response(self):
         """Test handling of malformed JSON from LLM."""
         mock_llm = AsyncMock(spec=LLMService)
-        mock_llm.generate_response.return_value = "This is not valid JSON"
+        mock_llm.stream_response = _stream_of(lambda *args, **kwargs: "This is not valid JSON")
 
         mock_occupation = MagicMock(
             spec=OnetOccupation,
@@ -206,7 +227,9 @@ class TestRoleMappingAgentIntegration:
             description="Develop software",
         )
         mock_repo = AsyncMock(spec=OnetRepository)
-        mock_repo.search_with_full_text.return_value = [mock_occupation]
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [mock_occupation] for q in queries
+        }
 
         agent = RoleMappingAgent(
             llm_service=mock_llm,
@@ -223,7 +246,7 @@ class TestRoleMappingAgentIntegration:
     async def test_handles_markdown_code_blocks(self):
         """Test parsing JSON wrapped in markdown code blocks."""
         mock_llm = AsyncMock(spec=LLMService)
-        mock_llm.generate_response.return_value = """```json
+        mock_llm.stream_response = _stream_of(lambda *args, **kwargs: """```json
 [
     {
         "role": "Project Manager",
@@ -233,7 +256,7 @@ class TestRoleMappingAgentIntegration:
         "reasoning": "General management role"
     }
 ]
-```"""
+```""")
 
         mock_occupation = MagicMock(
             spec=OnetOccupation,
@@ -242,7 +265,9 @@ class TestRoleMappingAgentIntegration:
             description="Management duties",
         )
         mock_repo = AsyncMock(spec=OnetRepository)
-        mock_repo.search_with_full_text.return_value = [mock_occupation]
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [mock_occupation] for q in queries
+        }
 
         agent = RoleMappingAgent(
             llm_service=mock_llm,
@@ -267,8 +292,8 @@ class TestRoleMappingAgentIntegration:
         results = await agent.map_roles([])
 
         assert results == []
-        mock_llm.generate_response.assert_not_called()
-        mock_repo.search_with_full_text.assert_not_called()
+        mock_llm.stream_response.assert_not_called()
+        mock_repo.search_with_full_text_batch.assert_not_called()
 
 
 class TestRoleMappingServiceIntegration:
@@ -3,6 +3,16 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 
+def _streamed(generate, chunk_size=16):
+    """Adapt a generate_response-style coroutine to a stream_response mock."""
+    async def stream_response(system_prompt, user_message):
+        text = await generate(system_prompt, user_message)
+        for i in range(0, len(text), chunk_size):
+            yield text[i:i + chunk_size]
+
+    return MagicMock(side_effect=stream_response)
+
+
 class TestConfidenceTier:
     """Tests for ConfidenceTier enum."""
 
@@ -118,17 +128,39 @@ class TestRoleMappingAgentGetCandidates:
 
     @pytest.mark.asyncio
     async def test_get_candidates_searches_repository(self):
-        """Should search repository for each role."""
+        """Should search repository once for all roles."""
         from app.agents.role_mapping_agent import RoleMappingAgent
 
         mock_llm = MagicMock()
         mock_repo = AsyncMock()
-        mock_repo.search_with_full_text.return_value = []
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
 
         agent = RoleMappingAgent(mock_llm, mock_repo)
         await agent._get_candidates(["Software Engineer", "Data Analyst"])
 
+        mock_repo.search_with_full_text_batch.assert_awaited_once_with(
+            queries=["Software Engineer", "Data Analyst"],
+            limit=agent.candidates_per_role,
+        )
+        mock_repo.search_with_full_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_candidates_falls_back_to_per_role_search(self):
+        """Should search each role individually if the batch query fails."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        mock_llm = MagicMock()
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = Exception("DB error")
+        mock_repo.search_with_full_text.return_value = []
+
+        agent = RoleMappingAgent(mock_llm, mock_repo)
+        candidates = await agent._get_candidates(["Software Engineer", "Data Analyst"])
+
         assert mock_repo.search_with_full_text.call_count == 2
+        assert candidates == {"Software Engineer": [], "Data Analyst": []}
 
     @pytest.mark.asyncio
     async def test_get_candidates_returns_dict(self):
@@ -137,7 +169,9 @@ class TestRoleMappingAgentGetCandidates:
 
         mock_llm = MagicMock()
         mock_repo = AsyncMock()
-        mock_repo.search_with_full_text.return_value = []
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
 
         agent = RoleMappingAgent(mock_llm, mock_repo)
         candidates = await agent._get_candidates(["Software Engineer"])
@@ -196,6 +230,112 @@ class TestRoleMappingAgentChunkRoles:
         assert len(batches) == 0
 
 
+class TestRoleMappingAgentPromptPacking:
+    """Tests for token-budget batch packing and the shared candidate catalog."""
+
+    def _occupations(self, count, prefix="15-"):
+        from app.models.onet_occupation import OnetOccupation
+
+        return [
+            OnetOccupation(
+                code=f"{prefix}{i:04d}.00",
+                title=f"Occupation {i}",
+                description="Performs duties related to the occupation. " * 5,
+            )
+            for i in range(count)
+        ]
+
+    def test_shared_candidates_listed_once(self):
+        """Occupations shared by roles appear once in the catalog."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock())
+        shared = self._occupations(3)
+
+        prompt = agent._build_prompt([("Analyst", shared), ("Senior Analyst", shared[:2])])
+
+        assert prompt.count("15-0000.00: Occupation 0") == 1
+        assert 'Role 2: "Senior Analyst"\nCandidates: 15-0000.00, 15-0001.00' in prompt
+
+    def test_default_budget_fits_full_batch_of_distinct_candidates(self):
+        """Typical roles still fill DEFAULT_BATCH_SIZE under the default budget."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.models.onet_occupation import OnetOccupation
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock())
+        roles = [f"Role {i}" for i in range(agent.DEFAULT_BATCH_SIZE)]
+        candidates = {
+            role: [
+                OnetOccupation(
+                    code=f"{i + 10}-{j:04d}.00",
+                    title="Computer and Information Systems Managers",
+                    description="x" * agent.DESCRIPTION_MAX_CHARS,
+                )
+                for j in range(agent.DEFAULT_CANDIDATES_PER_ROLE)
+            ]
+            for i, role in enumerate(roles)
+        }
+
+        batches = agent._chunk_roles(roles, candidates)
+
+        assert [len(batch) for batch in batches] == [agent.DEFAULT_BATCH_SIZE]
+
+    def test_budget_closes_batches_early(self):
+        """Batches close when the next role would exceed the token budget."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(
+            MagicMock(), MagicMock(), batch_size=50, candidates_per_role=5, prompt_token_budget=400,
+        )
+        roles = [f"Role {i}" for i in range(6)]
+        candidates = {r: self._occupations(5, prefix=f"{i + 10}-") for i, r in enumerate(roles)}
+
+        batches = agent._chunk_roles(roles, candidates)
+
+        assert len(batches) > 1
+        assert [role for batch in batches for role, _ in batch] == roles
+        for batch in batches:
+            assert len(batch) == 1 or agent._estimate_tokens(agent._build_prompt(batch)) <= 400
+
+    def test_shared_candidates_pack_more_roles(self):
+        """Roles with overlapping candidates fit more per batch."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(
+            MagicMock(), MagicMock(), batch_size=50, candidates_per_role=5, prompt_token_budget=400,
+        )
+        roles = [f"Role {i}" for i in range(6)]
+        shared = self._occupations(5)
+        distinct = {r: self._occupations(5, prefix=f"{i + 10}-") for i, r in enumerate(roles)}
+
+        shared_batches = agent._chunk_roles(roles, {r: shared for r in roles})
+        distinct_batches = agent._chunk_roles(roles, distinct)
+
+        assert len(shared_batches) < len(distinct_batches)
+
+    def test_exact_title_match_keeps_fewer_candidates(self):
+        """Roles whose top candidate title covers the role send fewer candidates."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.models.onet_occupation import OnetOccupation
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock(), candidates_per_role=20)
+        top = OnetOccupation(code="15-1252.00", title="Software Developers", description="")
+        candidates = [top] + self._occupations(19)
+
+        assert len(agent._select_candidates("Software Developer", candidates)) == agent.MIN_CANDIDATES_PER_ROLE
+        assert len(agent._select_candidates("Platform Engineer", candidates)) == 20
+
+    def test_oversized_role_is_trimmed_to_fit(self):
+        """A role too large for the budget keeps fewer candidates, not below the floor."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock(), candidates_per_role=20, prompt_token_budget=300)
+
+        selected = agent._select_candidates("Platform Engineer", self._occupations(20))
+
+        assert agent.MIN_CANDIDATES_PER_ROLE <= len(selected) < 20
+
+
 class TestRoleMappingAgentMapRoles:
     """Tests for map_roles method."""
 
@@ -217,25 +357,31 @@ class TestRoleMappingAgentMapRoles:
         """Should return RoleMappingResult objects."""
         from app.agents.role_mapping_agent import RoleMappingAgent
 
-        mock_llm = AsyncMock()
-        mock_llm.generate_response.return_value = """[
-            {
-                "role": "Software Engineer",
-                "onet_code": "15-1252.00",
-                "onet_title": "Software Developers",
-                "confidence": "HIGH",
-                "reasoning": "Clear match"
-            }
-        ]"""
+        async def generate(system_prompt, user_message):
+            return """[
+                {
+                    "role": "Software Engineer",
+                    "onet_code": "15-1252.00",
+                    "onet_title": "Software Developers",
+                    "confidence": "HIGH",
+                    "reasoning": "Clear match"
+                }
+            ]"""
+
+        mock_llm = MagicMock()
+        mock_llm.stream_response = _streamed(generate)
 
         mock_repo = AsyncMock()
-        mock_repo.search_with_full_text.return_value = []
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
 
         agent = RoleMappingAgent(mock_llm, mock_repo)
         results = await agent.map_roles(["Software Engineer"])
 
         assert len(results) == 1
         assert results[0].source_role == "Software Engineer"
+        assert results[0].onet_code == "15-1252.00"
 
 
 class TestRoleMappingAgentParseResponse:
@@ -312,3 +458,460 @@ class TestRoleMappingAgentParseResponse:
         assert len(results) == 1
         assert results[0].confidence == ConfidenceTier.LOW
         assert "Parse error" in results[0].reasoning
+
+
+class TestJsonArrayStreamParser:
+    """Tests for incremental parsing of streamed JSON arrays."""
+
+    def test_objects_complete_as_their_braces_close(self):
+        """Objects are returned by the chunk that closes them."""
+        from app.agents.role_mapping_agent import _JsonArrayStreamParser
+
+        parser = _JsonArrayStreamParser()
+
+        assert parser.feed('```json\n[{"role": "A", "n": {"x": 1}') == []
+        assert parser.feed('}, {"role": "B"') == [{"role": "A", "n": {"x": 1}}]
+        assert parser.feed("}]\n```") == [{"role": "B"}]
+
+    def test_braces_and_quotes_inside_strings(self):
+        """Braces and escaped quotes inside strings do not end objects."""
+        from app.agents.role_mapping_agent import _JsonArrayStreamParser
+
+        parser = _JsonArrayStreamParser()
+        text = '[{"role": "A}", "reasoning": "says \\"{hi}\\" and \\\\"}]'
+
+        objects = [obj for char in text for obj in parser.feed(char)]
+
+        assert objects == [{"role": "A}", "reasoning": 'says "{hi}" and \\'}]
+
+    def test_malformed_object_is_skipped(self):
+        """A broken object does not prevent later objects from parsing."""
+        from app.agents.role_mapping_agent import _JsonArrayStreamParser
+
+        parser = _JsonArrayStreamParser()
+
+        assert parser.feed('[{"role": "A",}, {"role": "B"}]') == [{"role": "B"}]
+
+    def test_text_without_array(self):
+        """Prose without an array yields nothing."""
+        from app.agents.role_mapping_agent import _JsonArrayStreamParser
+
+        parser = _JsonArrayStreamParser()
+
+        assert parser.feed("I cannot help with that.") == []
+        assert parser.found_array is False
+
+    def test_bracket_inside_leading_prose_is_not_the_array(self):
+        """A '[' in prose before the answer does not start parsing."""
+        from app.agents.role_mapping_agent import _JsonArrayStreamParser
+
+        parser = _JsonArrayStreamParser()
+
+        assert parser.feed('Roles [see below] map as {"role": "X"}: ') == []
+        assert parser.feed('[{"role": "A"}]') == []
+        assert parser.found_array is False
+
+    def test_array_start_split_across_chunks(self):
+        """Whitespace and a fence split over chunks still find the array."""
+        from app.agents.role_mapping_agent import _JsonArrayStreamParser
+
+        parser = _JsonArrayStreamParser()
+
+        assert parser.feed("\n `") == []
+        assert parser.feed("``js") == []
+        assert parser.feed("on\n") == []
+        assert parser.feed('[{"role": "A"}]') == [{"role": "A"}]
+        assert parser.found_array is True
+
+
+class TestRoleMappingAgentMissingRoles:
+    """Tests for roles missing from the LLM response."""
+
+    def test_missing_role_gets_targeted_fallback(self):
+        """Only the roles absent from the response fall back."""
+        from app.agents.role_mapping_agent import ConfidenceTier, RoleMappingAgent
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock())
+        occ = MagicMock()
+        occ.code = "43-4051.00"
+        occ.title = "Customer Service Representatives"
+
+        response = '[{"role": "Teller", "onet_code": "43-3071.00", "onet_title": "Tellers", "confidence": "HIGH", "reasoning": "r"}]'
+        results = agent._parse_response(response, [("Teller", []), ("Agent", [occ])])
+
+        by_role = {r.source_role: r for r in results}
+        assert by_role["Teller"].confidence == ConfidenceTier.HIGH
+        assert by_role["Teller"].fallback is False
+        assert by_role["Agent"].onet_code == "43-4051.00"
+        assert by_role["Agent"].fallback is True
+        assert "missing" in by_role["Agent"].reasoning
+
+    def test_echoed_role_matched_case_insensitively(self):
+        """Roles echoed with different case or spacing map to the input role."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock())
+
+        response = '[{"role": " software engineer", "onet_code": "15-1252.00", "confidence": "HIGH"}, {"role": "Unknown", "onet_code": "1"}]'
+        results = agent._parse_response(response, [("Software Engineer", [])])
+
+        assert [(r.source_role, r.onet_code) for r in results] == [("Software Engineer", "15-1252.00")]
+
+    @pytest.mark.asyncio
+    async def test_failure_mid_stream_keeps_completed_roles(self):
+        """Roles parsed before a failure keep their LLM result."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.exceptions import LLMConnectionError
+
+        async def stream_response(system_prompt, user_message):
+            yield '[{"role": "A", "onet_code": "1", "confidence": "HIGH"}, {"role": "B"'
+            raise LLMConnectionError()
+
+        llm = MagicMock()
+        llm.stream_response = stream_response
+        agent = RoleMappingAgent(llm, MagicMock())
+
+        results = [r async for r in agent._stream_batch([("A", []), ("B", [])])]
+
+        assert [(r.source_role, r.fallback) for r in results] == [("A", False), ("B", True)]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retry_resends_only_pending_roles(self, monkeypatch):
+        """A batch rate-limited part-way re-requests only unanswered roles."""
+        import json
+        import re
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.exceptions import LLMRateLimitError
+
+        async def fake_sleep(delay):
+            pass
+
+        monkeypatch.setattr("app.agents.role_mapping_agent.asyncio.sleep", fake_sleep)
+
+        prompts: list[list[str]] = []
+
+        async def stream_response(system_prompt, user_message):
+            roles = re.findall(r'Role \d+: "(.+)"', user_message)
+            prompts.append(roles)
+            for i, role in enumerate(roles):
+                prefix = "[" if i == 0 else ", "
+                yield prefix + json.dumps({"role": role, "onet_code": "1", "confidence": "HIGH"})
+                if len(prompts) == 1:
+                    raise LLMRateLimitError(retry_after=1.0)
+            yield "]"
+
+        llm = MagicMock()
+        llm.stream_response = stream_response
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+        agent = RoleMappingAgent(llm, mock_repo, batch_size=3)
+
+        results = await agent.map_roles(["A", "B", "C"])
+
+        assert prompts == [["A", "B", "C"], ["B", "C"]]
+        assert [(r.source_role, r.fallback) for r in results] == [
+            ("A", False), ("B", False), ("C", False),
+        ]
+
+
+class TestRoleMappingAgentConcurrentDispatch:
+    """Tests for concurrent batch dispatch in map_roles."""
+
+    @staticmethod
+    def _response_for(prompt: str) -> str:
+        """Build a valid LLM response echoing every role in the prompt."""
+        import json
+        import re
+
+        roles = re.findall(r'Role \d+: "(.+)"', prompt)
+        return json.dumps([
+            {
+                "role": role,
+                "onet_code": "15-1252.00",
+                "onet_title": "Software Developers",
+                "confidence": "HIGH",
+                "reasoning": "Match",
+            }
+            for role in roles
+        ])
+
+    def test_init_default_max_concurrency(self):
+        """Agent should use default max concurrency."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock())
+
+        assert agent.max_concurrency == RoleMappingAgent.DEFAULT_MAX_CONCURRENCY
+
+    def test_init_clamps_max_concurrency(self):
+        """Agent should never run with fewer than one concurrent batch."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock(), max_concurrency=0)
+
+        assert agent.max_concurrency == 1
+
+    @pytest.mark.asyncio
+    async def test_results_preserve_input_order(self):
+        """Results should follow input order even if later batches finish first."""
+        import asyncio
+        import re
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        async def generate(system_prompt, user_message):
+            # First batch finishes last
+            index = int(re.search(r'"Role(\d+)"', user_message).group(1))
+            await asyncio.sleep(0.01 * (10 - index))
+            return self._response_for(user_message)
+
+        mock_llm = MagicMock()
+        mock_llm.stream_response = _streamed(generate)
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+
+        agent = RoleMappingAgent(mock_llm, mock_repo, batch_size=1, max_concurrency=5)
+        roles = [f"Role{i}" for i in range(5)]
+        results = await agent.map_roles(roles)
+
+        assert [r.source_role for r in results] == roles
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self):
+        """No more than max_concurrency batches should be in flight."""
+        import asyncio
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        in_flight = 0
+        peak = 0
+
+        async def generate(system_prompt, user_message):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._response_for(user_message)
+
+        mock_llm = MagicMock()
+        mock_llm.stream_response = _streamed(generate)
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+
+        agent = RoleMappingAgent(mock_llm, mock_repo, batch_size=1, max_concurrency=3)
+        results = await agent.map_roles([f"Role{i}" for i in range(10)])
+
+        assert len(results) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_retries_batch_after_rate_limit(self, monkeypatch):
+        """Rate-limited batches should be retried after backing off."""
+        from app.agents.role_mapping_agent import ConfidenceTier, RoleMappingAgent
+        from app.exceptions import LLMRateLimitError
+
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("app.agents.role_mapping_agent.asyncio.sleep", fake_sleep)
+
+        calls = 0
+
+        async def generate(system_prompt, user_message):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise LLMRateLimitError(retry_after=2.0)
+            return self._response_for(user_message)
+
+        mock_llm = MagicMock()
+        mock_llm.stream_response = _streamed(generate)
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+
+        agent = RoleMappingAgent(mock_llm, mock_repo)
+        results = await agent.map_roles(["Software Engineer"])
+
+        assert calls == 2
+        assert sleeps == [2.0]
+        assert results[0].confidence == ConfidenceTier.HIGH
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_rate_limit_persists(self, monkeypatch):
+        """Batches should fall back to LOW confidence once retries are exhausted."""
+        from app.agents.role_mapping_agent import ConfidenceTier, RoleMappingAgent
+        from app.exceptions import LLMRateLimitError
+
+        async def fake_sleep(delay):
+            pass
+
+        monkeypatch.setattr("app.agents.role_mapping_agent.asyncio.sleep", fake_sleep)
+
+        async def generate(system_prompt, user_message):
+            raise LLMRateLimitError()
+
+        mock_llm = MagicMock()
+        mock_llm.stream_response = _streamed(generate)
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+
+        agent = RoleMappingAgent(mock_llm, mock_repo)
+        results = await agent.map_roles(["Software Engineer"])
+
+        assert mock_llm.stream_response.call_count == RoleMappingAgent.MAX_RATE_LIMIT_RETRIES + 1
+        assert len(results) == 1
+        assert results[0].confidence == ConfidenceTier.LOW
+
+    @pytest.mark.asyncio
+    async def test_pooled_llm_service_is_the_only_retry_layer(self, monkeypatch):
+        """With a retrying client pool, the agent does not retry on top."""
+        from app.agents.role_mapping_agent import ConfidenceTier, RoleMappingAgent
+        from app.exceptions import LLMRateLimitError
+        from app.services.llm_client import LLMClientPool
+
+        async def generate(system_prompt, user_message):
+            raise LLMRateLimitError()
+
+        mock_llm = MagicMock()
+        mock_llm.client_pool = LLMClientPool(max_retries=3, client_factory=lambda **kwargs: MagicMock())
+        mock_llm.stream_response = _streamed(generate)
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+
+        agent = RoleMappingAgent(mock_llm, mock_repo)
+        results = await agent.map_roles(["Software Engineer"])
+
+        assert agent.rate_limit_retries == 0
+        assert mock_llm.stream_response.call_count == 1
+        assert results[0].confidence == ConfidenceTier.LOW
+
+    def test_backoff_delay_is_capped(self):
+        """Exponential backoff should never exceed the configured maximum."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(MagicMock(), MagicMock())
+
+        assert agent._backoff_delay(20, None) <= RoleMappingAgent.RATE_LIMIT_BACKOFF_MAX
+        assert agent._backoff_delay(0, 7.5) == 7.5
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for the adaptive concurrency limiter."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_halves_limit(self):
+        """A rate-limited release should halve the permit count."""
+        from app.agents.role_mapping_agent import _AdaptiveConcurrencyLimiter
+
+        limiter = _AdaptiveConcurrencyLimiter(8)
+        await limiter.acquire()
+        await limiter.release(rate_limited=True)
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_success_recovers_limit(self):
+        """Successful releases should grow the limit back to the maximum."""
+        from app.agents.role_mapping_agent import _AdaptiveConcurrencyLimiter
+
+        limiter = _AdaptiveConcurrencyLimiter(2)
+        await limiter.acquire()
+        await limiter.release(rate_limited=True)
+        assert limiter.limit == 1
+
+        for _ in range(3):
+            await limiter.acquire()
+            await limiter.release()
+
+        assert limiter.limit == 2
+
+
+class TestRoleMappingAgentMapRolesStream:
+    """Tests for map_roles_stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_every_role_once(self):
+        """Results from all batches are yielded, each role exactly once."""
+        from app.agents.role_mapping_agent import (
+            ConfidenceTier,
+            RoleMappingAgent,
+            RoleMappingResult,
+        )
+
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+        agent = RoleMappingAgent(MagicMock(), mock_repo, batch_size=2)
+
+        async def stream_batch(batch):
+            for role, _ in batch:
+                yield RoleMappingResult(
+                    source_role=role,
+                    onet_code=None,
+                    onet_title=None,
+                    confidence=ConfidenceTier.LOW,
+                    reasoning="none",
+                )
+
+        agent._stream_batch = stream_batch
+
+        roles = ["A", "B", "C", "D", "E"]
+        batches = [batch async for batch in agent.map_roles_stream(roles)]
+
+        assert all(batches)
+        assert sorted(r.source_role for b in batches for r in b) == roles
+
+    @pytest.mark.asyncio
+    async def test_yields_roles_before_batch_completes(self):
+        """A role is yielded as soon as its object closes in the stream."""
+        import asyncio
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        second_requested = asyncio.Event()
+
+        async def stream_response(system_prompt, user_message):
+            yield '[{"role": "A", "onet_code": "1", "onet_title": "One", '
+            yield '"confidence": "HIGH", "reasoning": "r"}, '
+            # Hold the rest of the batch until the first role was consumed
+            await second_requested.wait()
+            yield '{"role": "B", "onet_code": "2", "onet_title": "Two", '
+            yield '"confidence": "LOW", "reasoning": "r"}]'
+
+        mock_llm = MagicMock()
+        mock_llm.stream_response = stream_response
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+        agent = RoleMappingAgent(mock_llm, mock_repo, batch_size=2)
+
+        stream = agent.map_roles_stream(["A", "B"])
+        first = await stream.__anext__()
+        second_requested.set()
+        rest = [batch async for batch in stream]
+
+        assert [r.source_role for r in first] == ["A"]
+        assert [r.source_role for b in rest for r in b] == ["B"]
+
+    @pytest.mark.asyncio
+    async def test_empty_roles_yields_nothing(self):
+        """No batches are produced for an empty role list."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+
+        agent = RoleMappingAgent(MagicMock(), AsyncMock())
+
+        assert [batch async for batch in agent.map_roles_stream([])] == []
@@ -0,0 +1,89 @@
+# discovery/tests/unit/jobs/test_job_handlers.py
+"""Unit tests for background job handlers."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+
+def _dependency(service):
+    async def dependency():
+        yield service
+    return dependency
+
+
+class TestRoleMappingJob:
+    """Tests for the role mapping job handler."""
+
+    @pytest.mark.asyncio
+    async def test_reports_batch_progress_and_returns_summary(self):
+        """Batch events become progress; the done event is the result."""
+        from app.jobs.handlers import run_role_mapping_job
+
+        session_id, upload_id = uuid4(), uuid4()
+        service = MagicMock()
+
+        async def stream(**kwargs):
+            service.stream_kwargs = kwargs
+            yield {"type": "started", "total_roles": 4}
+            yield {"type": "batch", "mappings": [], "completed_roles": 1, "total_roles": 4}
+            yield {"type": "done", "created_count": 4, "total_roles": 4}
+
+        service.stream_mappings_from_upload = stream
+        report_progress = AsyncMock()
+
+        with patch(
+            "app.services.role_mapping_service.get_role_mapping_service",
+            _dependency(service),
+        ):
+            result = await run_role_mapping_job(
+                {"session_id": str(session_id), "upload_id": str(upload_id), "role_column": "Title"},
+                report_progress,
+            )
+
+        assert result == {"created_count": 4, "total_roles": 4}
+        assert service.stream_kwargs["session_id"] == session_id
+        assert service.stream_kwargs["upload_id"] == upload_id
+        report_progress.assert_any_await(0.25, "Mapped 1 of 4 roles")
+
+
+class TestAnalysisJob:
+    """Tests for the analysis job handler."""
+
+    @pytest.mark.asyncio
+    async def test_missing_session_is_permanent_error(self):
+        """A missing session fails without retry."""
+        from app.jobs.handlers import PermanentJobError, run_analysis_job
+
+        service = MagicMock()
+        service.trigger_analysis_from_tasks = AsyncMock(return_value=None)
+
+        with patch(
+            "app.services.analysis_service.get_analysis_service",
+            _dependency(service),
+        ):
+            with pytest.raises(PermanentJobError):
+                await run_analysis_job({"session_id": str(uuid4())}, AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_generates_candidates_after_analysis(self):
+        """Completed analysis generates roadmap candidates."""
+        from app.jobs.handlers import run_analysis_job
+
+        service = MagicMock()
+        service.trigger_analysis = AsyncMock(return_value={"status": "completed"})
+        roadmap_service = MagicMock()
+        roadmap_service.generate_candidates = AsyncMock(return_value=[MagicMock(), MagicMock()])
+
+        with patch(
+            "app.services.analysis_service.get_analysis_service",
+            _dependency(service),
+        ), patch(
+            "app.services.roadmap_service.get_roadmap_service",
+            _dependency(roadmap_service),
+        ):
+            result = await run_analysis_job(
+                {"session_id": str(uuid4()), "source": "activities"}, AsyncMock()
+            )
+
+        assert result == {"status": "completed", "candidate_count": 2}
+        service.trigger_analysis.assert_awaited_once()
@@ -0,0 +1,233 @@
+# discovery/tests/unit/jobs/test_job_queue.py
+"""Unit tests for the background job queue."""
+import pytest
+
+
+def _queue(max_attempts=3):
+    from app.jobs.queue import InMemoryJobBackend, JobQueue
+
+    return JobQueue(InMemoryJobBackend(), default_max_attempts=max_attempts)
+
+
+class TestJob:
+    """Tests for Job serialization."""
+
+    def test_json_round_trip(self):
+        """Jobs survive a JSON round trip with their status enum."""
+        from app.jobs.queue import Job, JobStatus
+
+        job = Job(id="abc", type="analysis", params={"session_id": "s1"}, status=JobStatus.RUNNING)
+
+        restored = Job.from_json(job.to_json())
+
+        assert restored == job
+        assert restored.status is JobStatus.RUNNING
+
+    def test_is_finished(self):
+        """Only succeeded and failed are terminal."""
+        from app.jobs.queue import JobStatus
+
+        assert JobStatus.SUCCEEDED.is_finished
+        assert JobStatus.FAILED.is_finished
+        assert not JobStatus.QUEUED.is_finished
+        assert not JobStatus.RUNNING.is_finished
+
+
+class TestJobQueue:
+    """Tests for JobQueue with the in-memory backend."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_stores_and_queues_job(self):
+        """Enqueued jobs are retrievable and pending."""
+        from app.jobs.queue import JobStatus
+
+        queue = _queue(max_attempts=5)
+
+        job = await queue.enqueue("analysis", {"session_id": "s1"})
+
+        stored = await queue.get(job.id)
+        assert stored.status is JobStatus.QUEUED
+        assert stored.params == {"session_id": "s1"}
+        assert stored.max_attempts == 5
+        assert await queue.next_job_id(timeout=0.01) == job.id
+        assert await queue.next_job_id(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_get_unknown_job_returns_none(self):
+        """Unknown job IDs return None."""
+        queue = _queue()
+
+        assert await queue.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_report_progress_clamps_and_keeps_message(self):
+        """Progress is clamped to [0, 1] and message is optional."""
+        queue = _queue()
+        job = await queue.enqueue("analysis")
+
+        await queue.report_progress(job.id, 0.5, "Halfway")
+        await queue.report_progress(job.id, 1.5)
+
+        stored = await queue.get(job.id)
+        assert stored.progress == 1.0
+        assert stored.message == "Halfway"
+
+    @pytest.mark.asyncio
+    async def test_requeue_pushes_job_again(self):
+        """Requeued jobs are queued and pending again."""
+        from app.jobs.queue import JobStatus
+
+        queue = _queue()
+        job = await queue.enqueue("analysis")
+        await queue.next_job_id(timeout=0.01)
+        job.status = JobStatus.RUNNING
+
+        await queue.requeue(job)
+
+        assert (await queue.get(job.id)).status is JobStatus.QUEUED
+        assert await queue.next_job_id(timeout=0.01) == job.id
+
+
+class TestRecoverExpired:
+    """Tests for requeueing jobs whose worker lease expired."""
+
+    @pytest.mark.asyncio
+    async def test_requeues_running_job_with_attempts_left(self):
+        """A lost attempt is requeued while attempts remain."""
+        from unittest.mock import AsyncMock
+
+        from app.jobs.queue import JobStatus
+
+        queue = _queue(max_attempts=3)
+        job = await queue.enqueue("analysis")
+        await queue.next_job_id(timeout=0.01)
+        job.status = JobStatus.RUNNING
+        job.attempts = 1
+        await queue.save(job)
+        queue.backend.reap_expired = AsyncMock(return_value=[job.id])
+
+        recovered = await queue.recover_expired()
+
+        assert [j.id for j in recovered] == [job.id]
+        assert (await queue.get(job.id)).status is JobStatus.QUEUED
+        assert await queue.next_job_id(timeout=0.01) == job.id
+
+    @pytest.mark.asyncio
+    async def test_fails_job_lost_on_last_attempt(self):
+        """A job lost on its last attempt is failed, not requeued."""
+        from unittest.mock import AsyncMock
+
+        from app.jobs.queue import JobStatus
+
+        queue = _queue(max_attempts=1)
+        job = await queue.enqueue("analysis")
+        await queue.next_job_id(timeout=0.01)
+        job.status = JobStatus.RUNNING
+        job.attempts = 1
+        await queue.save(job)
+        queue.backend.reap_expired = AsyncMock(return_value=[job.id, "finished-or-expired"])
+
+        await queue.recover_expired()
+
+        stored = await queue.get(job.id)
+        assert stored.status is JobStatus.FAILED
+        assert stored.error == "Worker lease expired"
+        assert await queue.next_job_id(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_never_expires_jobs(self):
+        """The in-memory backend has no leases to expire."""
+        queue = _queue()
+        await queue.enqueue("analysis")
+        await queue.next_job_id(timeout=0.01)
+
+        assert await queue.recover_expired() == []
+
+
+def _redis_backend():
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.jobs.queue import RedisJobBackend
+
+    backend = RedisJobBackend.__new__(RedisJobBackend)
+    backend._redis = AsyncMock()
+    backend._redis.pipeline = MagicMock()
+    backend._ttl_seconds = 3600
+    backend._lease_seconds = 60
+    return backend
+
+
+class TestRedisJobBackend:
+    """Tests for the Redis processing list and leases."""
+
+    @pytest.mark.asyncio
+    async def test_pop_moves_job_to_processing_and_leases_it(self):
+        """Taken jobs move atomically to the processing list and get a lease."""
+        backend = _redis_backend()
+        backend._redis.blmove.return_value = b"job-1"
+
+        job_id = await backend.pop(timeout=0.5)
+
+        assert job_id == "job-1"
+        args, kwargs = backend._redis.blmove.await_args
+        assert args == (backend.QUEUE_KEY, backend.PROCESSING_KEY)
+        assert kwargs["timeout"] == 1
+        lease_key, leases = backend._redis.zadd.await_args.args
+        assert lease_key == backend.LEASES_KEY
+        assert set(leases) == {"job-1"}
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_only_extends_existing_lease(self):
+        """Heartbeats never re-lease a reaped job."""
+        backend = _redis_backend()
+
+        await backend.heartbeat("job-1")
+
+        assert backend._redis.zadd.await_args.kwargs == {"xx": True}
+
+    @pytest.mark.asyncio
+    async def test_ack_releases_processing_entry_and_lease(self):
+        """Acked jobs leave the processing list and the lease set."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        backend = _redis_backend()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        backend._redis.pipeline.return_value = pipe
+
+        await backend.ack("job-1")
+
+        pipe.lrem.assert_called_once_with(backend.PROCESSING_KEY, 0, "job-1")
+        pipe.zrem.assert_called_once_with(backend.LEASES_KEY, "job-1")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reap_releases_expired_jobs_it_claims(self):
+        """Expired leases are released once; unleased entries get a lease."""
+        backend = _redis_backend()
+        backend._redis.lrange.return_value = [b"orphan", b"live"]
+        backend._redis.zrangebyscore.return_value = [b"dead", b"raced"]
+        # Another reaper already claimed "raced"
+        backend._redis.zrem.side_effect = [1, 0]
+
+        reaped = await backend.reap_expired()
+
+        assert reaped == ["dead"]
+        adopt = backend._redis.zadd.await_args
+        assert set(adopt.args[1]) == {b"orphan", b"live"}
+        assert adopt.kwargs == {"nx": True}
+        backend._redis.lrem.assert_awaited_once_with(backend.PROCESSING_KEY, 0, b"dead")
+
+
+class TestCreateJobQueue:
+    """Tests for backend selection."""
+
+    def test_memory_backend_by_default(self):
+        """The in-memory backend is used unless redis is configured."""
+        from app.config import Settings
+        from app.jobs.queue import InMemoryJobBackend, create_job_queue
+
+        queue = create_job_queue(Settings(job_backend="memory", job_max_attempts=4))
+
+        assert isinstance(queue.backend, InMemoryJobBackend)
+        assert queue.default_max_attempts == 4
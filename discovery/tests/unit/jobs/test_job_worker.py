@@ -0,0 +1,242 @@
+# discovery/tests/unit/jobs/test_job_worker.py
+"""Unit tests for the background job worker."""
+import asyncio
+
+import pytest
+
+
+def _queue(max_attempts=3):
+    from app.jobs.queue import InMemoryJobBackend, JobQueue
+
+    return JobQueue(InMemoryJobBackend(), default_max_attempts=max_attempts)
+
+
+class TestJobWorkerExecute:
+    """Tests for running single job attempts."""
+
+    @pytest.mark.asyncio
+    async def test_success_stores_result(self):
+        """A successful handler stores its result and reported progress."""
+        from app.jobs.queue import JobStatus
+        from app.jobs.worker import JobWorker
+
+        async def handler(params, report_progress):
+            await report_progress(0.5, "Working")
+            return {"doubled": params["value"] * 2}
+
+        queue = _queue()
+        job = await queue.enqueue("double", {"value": 21})
+        worker = JobWorker(queue, handlers={"double": handler})
+
+        result = await worker.execute(job.id)
+
+        assert result.status is JobStatus.SUCCEEDED
+        assert result.result == {"doubled": 42}
+        assert result.progress == 1.0
+        assert result.message == "Working"
+        assert result.attempts == 1
+        assert result.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_type_fails(self):
+        """Jobs without a registered handler fail immediately."""
+        from app.jobs.queue import JobStatus
+        from app.jobs.worker import JobWorker
+
+        queue = _queue()
+        job = await queue.enqueue("nope")
+        worker = JobWorker(queue, handlers={})
+
+        result = await worker.execute(job.id)
+
+        assert result.status is JobStatus.FAILED
+        assert "Unknown job type" in result.error
+
+    @pytest.mark.asyncio
+    async def test_failure_schedules_retry(self):
+        """A failed attempt below max_attempts is requeued after a delay."""
+        from app.jobs.queue import JobStatus
+        from app.jobs.worker import JobWorker
+
+        async def handler(params, report_progress):
+            raise ConnectionError("database unavailable")
+
+        queue = _queue(max_attempts=3)
+        job = await queue.enqueue("flaky")
+        await queue.next_job_id(timeout=0.01)
+        worker = JobWorker(queue, handlers={"flaky": handler})
+        worker.RETRY_BACKOFF_BASE = 0.0
+
+        result = await worker.execute(job.id)
+        await asyncio.gather(*worker._tasks)
+
+        assert result.status is JobStatus.QUEUED
+        assert result.error == "database unavailable"
+        assert await queue.next_job_id(timeout=0.01) == job.id
+
+    @pytest.mark.asyncio
+    async def test_failure_on_last_attempt_fails_job(self):
+        """The job fails once max_attempts is reached."""
+        from app.jobs.queue import JobStatus
+        from app.jobs.worker import JobWorker
+
+        async def handler(params, report_progress):
+            raise ConnectionError("database unavailable")
+
+        queue = _queue(max_attempts=1)
+        job = await queue.enqueue("flaky")
+        worker = JobWorker(queue, handlers={"flaky": handler})
+
+        result = await worker.execute(job.id)
+
+        assert result.status is JobStatus.FAILED
+        assert result.attempts == 1
+        assert not worker._tasks
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_is_not_retried(self):
+        """PermanentJobError fails the job without retrying."""
+        from app.jobs.handlers import PermanentJobError
+        from app.jobs.queue import JobStatus
+        from app.jobs.worker import JobWorker
+
+        async def handler(params, report_progress):
+            raise PermanentJobError("Session not found")
+
+        queue = _queue(max_attempts=3)
+        job = await queue.enqueue("missing")
+        worker = JobWorker(queue, handlers={"missing": handler})
+
+        result = await worker.execute(job.id)
+
+        assert result.status is JobStatus.FAILED
+        assert result.error == "Session not found"
+
+    @pytest.mark.asyncio
+    async def test_finished_job_is_not_rerun(self):
+        """Executing an already finished job is a no-op."""
+        from app.jobs.queue import JobStatus
+        from app.jobs.worker import JobWorker
+
+        calls = []
+
+        async def handler(params, report_progress):
+            calls.append(params)
+            return None
+
+        queue = _queue()
+        job = await queue.enqueue("once")
+        worker = JobWorker(queue, handlers={"once": handler})
+        await worker.execute(job.id)
+
+        result = await worker.execute(job.id)
+
+        assert result.status is JobStatus.SUCCEEDED
+        assert len(calls) == 1
+
+
+class TestJobWorkerRun:
+    """Tests for the worker loop."""
+
+    @pytest.mark.asyncio
+    async def test_run_processes_queued_jobs_until_stopped(self):
+        """The run loop consumes queued jobs; stop() ends it."""
+        from app.jobs.queue import JobStatus
+        from app.jobs.worker import JobWorker
+
+        done = asyncio.Event()
+
+        async def handler(params, report_progress):
+            done.set()
+            return "ok"
+
+        queue = _queue()
+        job = await queue.enqueue("quick")
+        worker = JobWorker(queue, handlers={"quick": handler}, poll_timeout=0.01)
+
+        run_task = asyncio.create_task(worker.run())
+        await asyncio.wait_for(done.wait(), timeout=1)
+        await worker.stop()
+        await asyncio.wait_for(run_task, timeout=1)
+
+        assert (await queue.get(job.id)).status is JobStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_run_recovers_expired_jobs_and_acks_finished_ones(self):
+        """The loop reaps expired leases and releases each job it ran."""
+        from unittest.mock import AsyncMock
+
+        from app.jobs.worker import JobWorker
+
+        done = asyncio.Event()
+
+        async def handler(params, report_progress):
+            return "ok"
+
+        queue = _queue()
+        job = await queue.enqueue("quick")
+        queue.recover_expired = AsyncMock(return_value=[])
+        queue.ack = AsyncMock(side_effect=lambda job_id: done.set())
+        worker = JobWorker(queue, handlers={"quick": handler}, poll_timeout=0.01)
+
+        run_task = asyncio.create_task(worker.run())
+        await asyncio.wait_for(done.wait(), timeout=1)
+        await worker.stop()
+        await asyncio.wait_for(run_task, timeout=1)
+
+        queue.recover_expired.assert_awaited()
+        queue.ack.assert_awaited_once_with(job.id)
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_while_handler_runs(self):
+        """Long-running handlers keep their lease alive."""
+        from unittest.mock import AsyncMock
+
+        from app.jobs.worker import JobWorker
+
+        queue = _queue()
+        job = await queue.enqueue("slow")
+        queue.heartbeat = AsyncMock()
+
+        async def handler(params, report_progress):
+            await asyncio.sleep(0.05)
+
+        worker = JobWorker(queue, handlers={"slow": handler}, lease_seconds=0.03)
+
+        await worker.execute(job.id)
+
+        assert queue.heartbeat.await_count >= 2
+        queue.heartbeat.assert_awaited_with(job.id)
+
+    @pytest.mark.asyncio
+    async def test_stop_requeues_pending_retries(self):
+        """Retries waiting out their delay are requeued on stop."""
+        from app.jobs.worker import JobWorker
+
+        async def handler(params, report_progress):
+            raise ConnectionError("boom")
+
+        queue = _queue(max_attempts=3)
+        job = await queue.enqueue("flaky")
+        await queue.next_job_id(timeout=0.01)
+        worker = JobWorker(queue, handlers={"flaky": handler})
+        worker.RETRY_BACKOFF_BASE = 60.0
+
+        await worker.execute(job.id)
+        await asyncio.wait_for(worker.stop(), timeout=1)
+
+        assert await queue.next_job_id(timeout=0.01) == job.id
+
+
+class TestRetryDelay:
+    """Tests for retry backoff."""
+
+    def test_delay_grows_and_is_capped(self):
+        """Delay doubles per attempt with jitter and never exceeds the cap."""
+        from app.jobs.worker import JobWorker
+
+        worker = JobWorker(_queue())
+
+        assert 1.0 <= worker._retry_delay(1) <= 2.0
+        assert 4.0 <= worker._retry_delay(3) <= 8.0
+        assert worker._retry_delay(20) <= worker.RETRY_BACKOFF_MAX
@@ -52,3 +52,30 @@ async def test_get_for_session():
     repo = ActivitySelectionRepository(mock_session)
 
     assert hasattr(repo, "get_for_session")
+
+
+@pytest.mark.asyncio
+async def test_get_exposure_summaries_single_grouped_query():
+    """Test exposure summaries are aggregated per mapping in one query."""
+    from unittest.mock import MagicMock
+    from uuid import uuid4
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories.activity_selection_repository import ActivitySelectionRepository
+
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = MagicMock()
+    repo = ActivitySelectionRepository(mock_session)
+
+    await repo.get_exposure_summaries(uuid4())
+
+    mock_session.execute.assert_awaited_once()
+    sql = str(
+        mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+    )
+    assert "coalesce(dwa_effective_exposure.exposure" in sql
+    assert "LEFT OUTER JOIN dwa_effective_exposure" in sql
+    assert "onet_gwa" not in sql
+    assert "selected IS true" in sql
+    assert "GROUP BY discovery_activity_selections.role_mapping_id" in sql
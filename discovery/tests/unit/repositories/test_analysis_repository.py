@@ -40,3 +40,95 @@ async def test_get_by_role_mapping():
     repo = AnalysisRepository(mock_session)
 
     assert hasattr(repo, "get_by_role_mapping")
+
+
+@pytest.mark.asyncio
+async def test_replace_results_scoped_to_mappings():
+    """Test incremental replace keeps unchanged mappings' role rows."""
+    from uuid import uuid4
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories.analysis_repository import AnalysisRepository
+
+    mock_session = AsyncMock()
+    repo = AnalysisRepository(mock_session)
+    session_id = uuid4()
+    mapping_id = uuid4()
+    role_results = [{"session_id": session_id, "role_mapping_id": mapping_id}]
+    dimension_results = [{"session_id": session_id, "role_mapping_id": None}]
+
+    count = await repo.replace_results(
+        session_id,
+        role_results,
+        dimension_results,
+        analyzed_version=7,
+        analysis_source="tasks",
+        role_mapping_ids=[mapping_id],
+    )
+
+    assert count == 2
+    delete_call, insert_call, update_call, *rollup_calls = mock_session.execute.call_args_list
+    delete_sql = str(delete_call[0][0].compile(dialect=postgresql.dialect()))
+    assert delete_sql.startswith("DELETE FROM discovery_analysis_results")
+    assert "dimension != " in delete_sql
+    assert "role_mapping_id IN" in delete_sql
+    assert insert_call[0][1] == role_results + dimension_results
+    update_sql = str(update_call[0][0].compile(dialect=postgresql.dialect()))
+    assert "analyzed_version" in update_sql
+    assert "analyzed_exposure_version" in update_sql
+    rollup_sql = [
+        str(c[0][0].compile(dialect=postgresql.dialect())) for c in rollup_calls
+    ]
+    assert rollup_sql[0].startswith("DELETE FROM discovery_portfolio_rollups")
+    assert all(
+        sql.startswith("INSERT INTO discovery_portfolio_rollups") for sql in rollup_sql[1:]
+    )
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_replace_results_full_run_skips_empty_insert():
+    """Test a full replace deletes every result and inserts nothing when empty."""
+    from uuid import uuid4
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories.analysis_repository import AnalysisRepository
+
+    mock_session = AsyncMock()
+    repo = AnalysisRepository(mock_session)
+
+    await repo.replace_results(
+        uuid4(), [], [], analyzed_version=1, analysis_source="activities"
+    )
+
+    # Delete and version update, then the rollup delete and one insert per dimension
+    assert mock_session.execute.await_count == 5
+    delete_sql = str(
+        mock_session.execute.call_args_list[0][0][0].compile(dialect=postgresql.dialect())
+    )
+    assert "role_mapping_id IN" not in delete_sql
+    assert "dimension" not in delete_sql
+
+
+@pytest.mark.asyncio
+async def test_get_analysis_state_includes_exposure_versions():
+    """Test the state row carries the stored and current exposure versions."""
+    from unittest.mock import MagicMock
+    from uuid import uuid4
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories.analysis_repository import AnalysisRepository
+
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = MagicMock()
+    repo = AnalysisRepository(mock_session)
+
+    await repo.get_analysis_state(uuid4())
+
+    sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+    assert "discovery_sessions.analyzed_exposure_version" in sql
+    assert "(SELECT onet_exposure_state.version" in sql
+    assert "AS exposure_version" in sql
@@ -269,3 +269,149 @@ class TestOnetRepositoryInputValidation:
 
         assert hasattr(OnetRepository, "MAX_QUERY_LENGTH")
         assert OnetRepository.MAX_QUERY_LENGTH == 500
+
+
+class TestOnetRepositoryBatchSearch:
+    """Tests for search_with_full_text_batch."""
+
+    @pytest.mark.asyncio
+    async def test_empty_queries_return_empty_lists_without_database_call(self):
+        """Empty and whitespace-only queries should not hit the database."""
+        from app.repositories.onet_repository import OnetRepository
+
+        mock_session = AsyncMock()
+        repo = OnetRepository(mock_session)
+
+        result = await repo.search_with_full_text_batch(["", "   "])
+        assert result == {"": [], "   ": []}
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_too_long_raises_error(self):
+        """Any query exceeding max length should raise ValueError."""
+        from app.repositories.onet_repository import OnetRepository
+
+        repo = OnetRepository(AsyncMock())
+
+        with pytest.raises(ValueError, match="exceeds maximum length"):
+            await repo.search_with_full_text_batch(["Nurse", "x" * 501])
+
+    @pytest.mark.asyncio
+    async def test_groups_rows_per_query_in_two_statements(self):
+        """Rows are grouped per query, main matches before backfill, by rank."""
+        from app.repositories.onet_repository import OnetRepository
+
+        developer = MagicMock(code="15-1252.00")
+        programmer = MagicMock(code="15-1299.00")
+        tester = MagicMock(code="15-1253.00")
+        nurse = MagicMock(code="29-1141.00")
+
+        search_result = MagicMock()
+        search_result.all.return_value = [
+            (1, "15-1253.00", 1, 0.9),  # alternate-title backfill
+            (1, "15-1299.00", 0, 0.2),
+            (1, "15-1252.00", 0, 0.6),
+            (1, "15-1252.00", 1, 0.8),  # duplicate of a main match
+            (2, "29-1141.00", 0, 0.5),
+        ]
+        occupation_result = MagicMock()
+        occupation_result.scalars.return_value.all.return_value = [
+            developer, programmer, tester, nurse,
+        ]
+
+        mock_session = AsyncMock()
+        mock_session.execute.side_effect = [search_result, occupation_result]
+        repo = OnetRepository(mock_session)
+
+        result = await repo.search_with_full_text_batch(
+            ["Software Engineer", " Nurse ", "Astronaut"], limit=5
+        )
+
+        assert mock_session.execute.await_count == 2
+        assert result["Software Engineer"] == [developer, programmer, tester]
+        assert result[" Nurse "] == [nurse]
+        assert result["Astronaut"] == []
+
+    @pytest.mark.asyncio
+    async def test_respects_limit_per_query(self):
+        """Each query returns at most `limit` occupations."""
+        from app.repositories.onet_repository import OnetRepository
+
+        occupations = [MagicMock(code=f"15-125{i}.00") for i in range(3)]
+        search_result = MagicMock()
+        search_result.all.return_value = [(1, occ.code, 0, 1.0) for occ in occupations]
+        occupation_result = MagicMock()
+        occupation_result.scalars.return_value.all.return_value = occupations
+
+        mock_session = AsyncMock()
+        mock_session.execute.side_effect = [search_result, occupation_result]
+        repo = OnetRepository(mock_session)
+
+        result = await repo.search_with_full_text_batch(["Developer"], limit=2)
+
+        assert result["Developer"] == occupations[:2]
+
+
+class TestOnetRepositoryEffectiveExposure:
+    """Tests for the dwa_effective_exposure materialized view."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_dwa_effective_exposure_refreshes_concurrently(self):
+        """Refresh should not block readers of the view."""
+        from app.repositories.onet_repository import OnetRepository
+
+        mock_session = AsyncMock()
+        repo = OnetRepository(mock_session)
+
+        await repo.refresh_dwa_effective_exposure()
+
+        refresh_call, version_call = mock_session.execute.call_args_list
+        assert str(refresh_call[0][0]) == "REFRESH MATERIALIZED VIEW CONCURRENTLY dwa_effective_exposure"
+        version_sql = str(version_call[0][0])
+        assert version_sql.startswith("UPDATE onet_exposure_state SET version=(onet_exposure_state.version +")
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_exposure_version(self):
+        """The exposure version reads the single state row, defaulting to 0."""
+        from unittest.mock import MagicMock
+
+        from app.repositories.onet_repository import OnetRepository
+
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock()
+        mock_session.execute.return_value.scalar_one_or_none.return_value = None
+        repo = OnetRepository(mock_session)
+
+        assert await repo.get_exposure_version() == 0
+        assert "FROM onet_exposure_state" in str(mock_session.execute.call_args[0][0])
+
+    @pytest.mark.asyncio
+    async def test_update_dwa_exposure_overrides_refreshes_view(self):
+        """Overrides are written in one statement, then the view is refreshed."""
+        from app.repositories.onet_repository import OnetRepository
+
+        mock_session = AsyncMock()
+        repo = OnetRepository(mock_session)
+
+        count = await repo.update_dwa_exposure_overrides({"4.A.1": 0.9, "4.A.2": None})
+
+        assert count == 2
+        assert mock_session.execute.await_count == 3
+        update_call, refresh_call, _ = mock_session.execute.call_args_list
+        assert update_call[0][1] == [
+            {"b_id": "4.A.1", "b_override": 0.9},
+            {"b_id": "4.A.2", "b_override": None},
+        ]
+        assert "REFRESH MATERIALIZED VIEW" in str(refresh_call[0][0])
+
+    @pytest.mark.asyncio
+    async def test_update_dwa_exposure_overrides_empty_skips_database(self):
+        """No overrides means no update and no refresh."""
+        from app.repositories.onet_repository import OnetRepository
+
+        mock_session = AsyncMock()
+        repo = OnetRepository(mock_session)
+
+        assert await repo.update_dwa_exposure_overrides({}) == 0
+        mock_session.execute.assert_not_called()
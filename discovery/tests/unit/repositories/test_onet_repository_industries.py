@@ -60,6 +60,20 @@ class TestGetIndustriesForOccupation:
         assert len(result) == 0
 
 
+class TestGetAllIndustries:
+    """Test loading all occupation-industry pairs."""
+
+    @pytest.mark.asyncio
+    async def test_returns_code_pairs(self, repository, mock_session):
+        """Test rows are returned as (occupation_code, naics_code) tuples."""
+        mock_result = mock_session.execute.return_value
+        mock_result.all.return_value = [("13-2051.00", "522110"), ("29-1141.00", "622110")]
+
+        result = await repository.get_all_industries()
+
+        assert result == [("13-2051.00", "522110"), ("29-1141.00", "622110")]
+
+
 class TestCalculateIndustryScore:
     """Test industry match score calculation."""
 
@@ -0,0 +1,57 @@
+"""Unit tests for portfolio rollup repository."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_rebuilds_rows_in_database():
+    """Test a refresh deletes the session's rows and re-inserts them per dimension."""
+    from uuid import uuid4
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories.portfolio_repository import PortfolioRepository
+
+    mock_session = AsyncMock()
+    repo = PortfolioRepository(mock_session)
+
+    await repo.refresh_session(uuid4())
+
+    delete_call, occupation_call, lob_call = mock_session.execute.call_args_list
+    delete_sql = str(delete_call[0][0].compile(dialect=postgresql.dialect()))
+    assert delete_sql.startswith("DELETE FROM discovery_portfolio_rollups")
+    assert "session_id" in delete_sql
+
+    occupation_sql = str(occupation_call[0][0].compile(dialect=postgresql.dialect()))
+    assert occupation_sql.startswith("INSERT INTO discovery_portfolio_rollups")
+    assert "SELECT" in occupation_sql
+    assert "discovery_role_mappings.onet_code" in occupation_sql
+    assert "onet_occupations.title" in occupation_sql
+    assert "GROUP BY" in occupation_sql
+
+    lob_sql = str(lob_call[0][0].compile(dialect=postgresql.dialect()))
+    assert "nullif(discovery_role_mappings.lob_value" in lob_sql
+    mock_session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_organization_rollup_sums_per_value_and_tier():
+    """Test the organization read groups rollup rows without touching results."""
+    from uuid import uuid4
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories.portfolio_repository import PortfolioRepository
+
+    mock_session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute.return_value = mock_result
+    repo = PortfolioRepository(mock_session)
+
+    assert await repo.get_organization_rollup(uuid4()) == []
+
+    sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+    assert "FROM discovery_portfolio_rollups" in sql
+    assert "discovery_analysis_results" not in sql
+    assert "GROUP BY discovery_portfolio_rollups.dimension" in sql
@@ -0,0 +1,59 @@
+"""Tests for the role mapping cache repository."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+def _entry(title, code):
+    return {
+        "normalized_title": title,
+        "onet_version": "30.1",
+        "model": "test-model",
+        "onet_code": code,
+        "onet_title": "Title",
+        "confidence": "HIGH",
+        "reasoning": "Match",
+    }
+
+
+class TestUpsertEntries:
+    """Tests for RoleMappingCacheRepository.upsert_entries."""
+
+    @pytest.mark.asyncio
+    async def test_skips_unknown_onet_codes(self):
+        """Entries with unknown codes are dropped; the rest of the batch is written."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.repositories.role_mapping_cache_repository import RoleMappingCacheRepository
+
+        known_result = MagicMock()
+        known_result.scalars.return_value.all.return_value = ["29-1141.00"]
+        mock_session = AsyncMock()
+        mock_session.execute.side_effect = [known_result, MagicMock()]
+        repo = RoleMappingCacheRepository(mock_session)
+
+        written = await repo.upsert_entries([
+            _entry("nurse", "29-1141.00"),
+            _entry("wizard", "99-9999.99"),
+        ])
+
+        assert written == 1
+        insert_stmt = mock_session.execute.await_args_list[1].args[0]
+        params = insert_stmt.compile(dialect=postgresql.dialect()).params
+        assert "99-9999.99" not in params.values()
+        assert "29-1141.00" in params.values()
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_all_unknown_codes_skip_insert(self):
+        """A batch with no known codes writes nothing."""
+        from app.repositories.role_mapping_cache_repository import RoleMappingCacheRepository
+
+        known_result = MagicMock()
+        known_result.scalars.return_value.all.return_value = []
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = known_result
+        repo = RoleMappingCacheRepository(mock_session)
+
+        assert await repo.upsert_entries([_entry("wizard", "99-9999.99")]) == 0
+        assert mock_session.execute.await_count == 1
+        mock_session.commit.assert_not_awaited()
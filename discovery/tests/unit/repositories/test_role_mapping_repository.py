@@ -1,6 +1,16 @@
 """Unit tests for role mapping repository."""
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+
+
+def _mock_portfolio(monkeypatch):
+    """Replace PortfolioRepository so rollup refreshes don't hit execute."""
+    from app.repositories import role_mapping_repository
+
+    portfolio = MagicMock()
+    portfolio.return_value.refresh_session = AsyncMock()
+    monkeypatch.setattr(role_mapping_repository, "PortfolioRepository", portfolio)
+    return portfolio.return_value
 
 
 def test_role_mapping_repository_exists():
@@ -82,6 +92,28 @@ async def test_get_by_id_accepts_session_id_parameter():
     assert "session_id" in params
 
 
+@pytest.mark.asyncio
+async def test_get_fingerprint():
+    """Test the fingerprint is the session's mapping count and latest update."""
+    from datetime import datetime, timezone
+    from unittest.mock import MagicMock
+    from uuid import uuid4
+    from sqlalchemy.dialects import postgresql
+    from app.repositories.role_mapping_repository import RoleMappingRepository
+
+    updated_at = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    mock_result = MagicMock()
+    mock_result.one.return_value = (3, updated_at)
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = mock_result
+    repo = RoleMappingRepository(mock_session)
+
+    assert await repo.get_fingerprint(uuid4()) == (3, updated_at)
+    sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+    assert "count(discovery_role_mappings.id)" in sql
+    assert "max(discovery_role_mappings.updated_at)" in sql
+
+
 @pytest.mark.asyncio
 async def test_delete_for_session():
     """Test delete_for_session method exists."""
@@ -91,3 +123,331 @@ async def test_delete_for_session():
     repo = RoleMappingRepository(mock_session)
 
     assert hasattr(repo, "delete_for_session")
+
+
+@pytest.mark.asyncio
+async def test_delete_for_session_refreshes_rollups(monkeypatch):
+    """Test deleting mappings rebuilds the rollups their results fed, before commit."""
+    from uuid import uuid4
+    from app.repositories.role_mapping_repository import RoleMappingRepository
+
+    portfolio = _mock_portfolio(monkeypatch)
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = MagicMock(rowcount=3)
+    repo = RoleMappingRepository(mock_session)
+    session_id = uuid4()
+
+    assert await repo.delete_for_session(session_id) == 3
+    portfolio.refresh_session.assert_awaited_once_with(session_id)
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_refreshes_rollups_only_for_onet_code(monkeypatch):
+    """Test only O*NET code changes rebuild the session's rollups."""
+    from uuid import uuid4
+    from app.repositories.role_mapping_repository import RoleMappingRepository
+
+    portfolio = _mock_portfolio(monkeypatch)
+    mapping = MagicMock(session_id=uuid4())
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = mapping
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = mock_result
+    repo = RoleMappingRepository(mock_session)
+
+    await repo.update(uuid4(), confidence_score=0.9)
+    portfolio.refresh_session.assert_not_awaited()
+
+    await repo.update(uuid4(), onet_code="29-1141.00")
+    portfolio.refresh_session.assert_awaited_once_with(mapping.session_id)
+
+
+class TestMergeDuplicateMappings:
+    """Tests for folding duplicate keys before a set-based upsert."""
+
+    def test_null_and_empty_lob_share_a_key(self):
+        """NULL and '' LOB values merge, matching the COALESCE index."""
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import _merge_duplicate_mappings
+
+        session_id = uuid4()
+        rows = _merge_duplicate_mappings(
+            [
+                {"session_id": session_id, "source_role": "Nurse", "lob_value": "", "row_count": 2},
+                {"session_id": session_id, "source_role": "Nurse", "lob_value": None, "row_count": 3},
+                {"session_id": session_id, "source_role": "Nurse", "lob_value": "Retail", "row_count": 1},
+            ],
+            replace_counts=False,
+        )
+
+        assert [(r["lob_value"], r["row_count"]) for r in rows] == [(None, 5), ("Retail", 1)]
+
+    def test_replace_counts_keeps_last_value(self):
+        """With replace_counts, later counts and provided fields win."""
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import _merge_duplicate_mappings
+
+        session_id = uuid4()
+        rows = _merge_duplicate_mappings(
+            [
+                {"session_id": session_id, "source_role": "Nurse", "onet_code": "29-1141.00", "row_count": 2},
+                {"session_id": session_id, "source_role": "Nurse", "onet_code": None, "row_count": 7},
+            ],
+            replace_counts=True,
+        )
+
+        assert len(rows) == 1
+        assert rows[0]["onet_code"] == "29-1141.00"
+        assert rows[0]["row_count"] == 7
+
+    def test_row_count_is_capped(self):
+        """Summed counts are capped at the INTEGER maximum."""
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import MAX_ROW_COUNT, _merge_duplicate_mappings
+
+        session_id = uuid4()
+        rows = _merge_duplicate_mappings(
+            [
+                {"session_id": session_id, "source_role": "Nurse", "row_count": MAX_ROW_COUNT},
+                {"session_id": session_id, "source_role": "Nurse", "row_count": 10},
+            ],
+            replace_counts=False,
+        )
+
+        assert rows[0]["row_count"] == MAX_ROW_COUNT
+
+
+class TestFillMissingColumns:
+    """Tests for giving multi-row INSERT rows one key set."""
+
+    def test_missing_keys_get_defaults_or_none(self):
+        """Keys present in any row are added to all, using scalar defaults."""
+        from app.repositories.role_mapping_repository import _fill_missing_columns
+
+        rows = _fill_missing_columns([
+            {"session_id": "s", "source_role": "Nurse"},
+            {"session_id": "s", "source_role": "Clerk", "onet_code": "43-9061.00", "user_confirmed": True},
+        ])
+
+        assert rows[0] == {
+            "session_id": "s",
+            "source_role": "Nurse",
+            "onet_code": None,
+            "user_confirmed": False,
+        }
+        assert rows[1]["onet_code"] == "43-9061.00"
+        assert rows[1]["user_confirmed"] is True
+
+
+class TestBulkUpsert:
+    """Tests for the set-based bulk_upsert."""
+
+    def _compile(self, stmt):
+        from sqlalchemy.dialects import postgresql
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    def test_upsert_targets_coalesce_index(self):
+        """ON CONFLICT infers the (session_id, source_role, COALESCE(lob_value, '')) index."""
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        repo = RoleMappingRepository(AsyncMock())
+        sql = self._compile(repo._build_upsert_stmt(
+            [{"session_id": uuid4(), "source_role": "Nurse", "lob_value": None, "onet_code": "29-1141.00"}],
+            replace_counts=True,
+        ))
+
+        assert "ON CONFLICT (session_id, source_role, coalesce(lob_value, ''))" in sql
+        assert "onet_code = coalesce(excluded.onet_code, discovery_role_mappings.onet_code)" in sql
+        assert "RETURNING discovery_role_mappings.id" in sql
+        assert "updated_at = now()" in sql
+
+    def test_add_counts_sums_existing_row_count(self):
+        """Without replace_counts, conflicts add to the stored row_count."""
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        repo = RoleMappingRepository(AsyncMock())
+        sql = self._compile(repo._build_upsert_stmt(
+            [{"session_id": uuid4(), "source_role": "Nurse", "lob_value": None, "row_count": 4}],
+            replace_counts=False,
+        ))
+
+        assert "coalesce(discovery_role_mappings.row_count" in sql
+        assert "AS BIGINT) + excluded.row_count" in sql
+
+    @pytest.mark.asyncio
+    async def test_keys_only_in_later_rows_are_written(self, monkeypatch):
+        """A field first provided by a later row still reaches the INSERT."""
+        from unittest.mock import MagicMock
+        from uuid import uuid4
+        from sqlalchemy.dialects import postgresql
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        session_id = uuid4()
+        upsert_result = MagicMock()
+        upsert_result.all.return_value = [
+            (uuid4(), session_id, "Clerk", None),
+            (uuid4(), session_id, "Nurse", None),
+        ]
+        mock_session = AsyncMock()
+        mock_session.execute.side_effect = [upsert_result, MagicMock()]
+        _mock_portfolio(monkeypatch)
+        repo = RoleMappingRepository(mock_session)
+
+        await repo.bulk_upsert([
+            {"session_id": session_id, "source_role": "Clerk"},
+            {"session_id": session_id, "source_role": "Nurse", "onet_code": "29-1141.00"},
+        ])
+
+        stmt = mock_session.execute.await_args_list[0].args[0]
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert sorted(v for k, v in params.items() if k.startswith("onet_code") and v) == ["29-1141.00"]
+        assert len([k for k in params if k.startswith("onet_code")]) == 2
+
+    @pytest.mark.asyncio
+    async def test_uses_constant_number_of_statements(self, monkeypatch):
+        """Many mappings are written with one upsert and one reload."""
+        from unittest.mock import MagicMock
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        session_id = uuid4()
+        mappings = [
+            {"session_id": session_id, "source_role": f"Role {i}", "lob_value": None, "row_count": 1}
+            for i in range(50)
+        ]
+        ids = {m["source_role"]: uuid4() for m in mappings}
+        loaded = [MagicMock(id=ids[m["source_role"]]) for m in mappings]
+
+        upsert_result = MagicMock()
+        upsert_result.all.return_value = [
+            (ids[m["source_role"]], session_id, m["source_role"], None) for m in mappings
+        ]
+        load_result = MagicMock()
+        load_result.unique.return_value.scalars.return_value.all.return_value = list(reversed(loaded))
+
+        mock_session = AsyncMock()
+        mock_session.execute.side_effect = [upsert_result, load_result]
+        portfolio = _mock_portfolio(monkeypatch)
+        repo = RoleMappingRepository(mock_session)
+
+        result = await repo.bulk_upsert(mappings)
+
+        assert mock_session.execute.await_count == 2
+        portfolio.refresh_session.assert_awaited_once_with(session_id)
+        mock_session.commit.assert_awaited_once()
+        assert result == loaded
+
+    @pytest.mark.asyncio
+    async def test_missing_required_field_raises(self):
+        """Mappings without session_id or source_role are rejected."""
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        repo = RoleMappingRepository(AsyncMock())
+
+        with pytest.raises(ValueError, match="source_role"):
+            await repo.bulk_upsert([{"session_id": "s"}])
+
+
+class TestBulkConfirm:
+    """Tests for the set-based bulk_confirm."""
+
+    def _compile(self, stmt):
+        from sqlalchemy.dialects import postgresql
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_single_update_with_threshold_predicate(self):
+        """Qualifying mappings are confirmed by one UPDATE and the rowcount returned."""
+        from uuid import uuid4
+        from unittest.mock import MagicMock
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=7)
+        repo = RoleMappingRepository(session)
+
+        confirmed = await repo.bulk_confirm(uuid4(), threshold=0.85, lob_value="Retail")
+
+        assert confirmed == 7
+        assert session.execute.await_count == 1
+        session.commit.assert_awaited_once()
+        sql = self._compile(session.execute.call_args.args[0])
+        assert sql.startswith("UPDATE discovery_role_mappings SET user_confirmed=")
+        assert "confidence_score >= " in sql
+        assert "onet_code IS NOT NULL" in sql
+        assert "lob_value = " in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_id_filter_confirms_nothing(self):
+        """An explicit empty ID list matches no mappings."""
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        session = AsyncMock()
+        repo = RoleMappingRepository(session)
+
+        assert await repo.bulk_confirm(uuid4(), threshold=0.5, mapping_ids=[]) == 0
+        session.execute.assert_not_called()
+
+
+class TestBulkUpdate:
+    """Tests for UPDATE ... FROM (VALUES ...) in bulk_update."""
+
+    def _compile(self, stmt):
+        from sqlalchemy.dialects import postgresql
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    def test_update_joins_values_list(self):
+        """Updates join a VALUES list and keep existing values for None."""
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        repo = RoleMappingRepository(AsyncMock())
+        sql = self._compile(repo._build_update_stmt(uuid4(), [
+            {"id": uuid4(), "onet_code": "15-1252.00", "confidence_score": 0.95},
+            {"id": uuid4(), "onet_code": None, "confidence_score": 0.5},
+        ]))
+
+        assert "FROM (VALUES" in sql
+        assert "AS v (id, onet_code, confidence_score)" in sql
+        assert "coalesce(CAST(v.onet_code AS VARCHAR), discovery_role_mappings.onet_code)" in sql
+        assert "discovery_role_mappings.session_id = " in sql
+
+    @pytest.mark.asyncio
+    async def test_chunks_statements(self, monkeypatch):
+        """Large updates are split into UPDATE_CHUNK_SIZE statements and committed once."""
+        from uuid import uuid4
+        from unittest.mock import MagicMock
+        from app.repositories import role_mapping_repository
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        monkeypatch.setattr(role_mapping_repository, "UPDATE_CHUNK_SIZE", 2)
+        portfolio = _mock_portfolio(monkeypatch)
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=2)
+        repo = RoleMappingRepository(session)
+        session_id = uuid4()
+
+        updated = await repo.bulk_update(session_id, [
+            {"id": uuid4(), "onet_code": "1", "confidence_score": 0.5} for _ in range(4)
+        ])
+
+        assert updated == 4
+        assert session.execute.await_count == 2
+        portfolio.refresh_session.assert_awaited_once_with(session_id)
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_updates_skips_database(self):
+        """An empty update list does not touch the database."""
+        from uuid import uuid4
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        session = AsyncMock()
+        repo = RoleMappingRepository(session)
+
+        assert await repo.bulk_update(uuid4(), []) == 0
+        session.execute.assert_not_called()
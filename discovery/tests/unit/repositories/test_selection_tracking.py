@@ -0,0 +1,82 @@
+# discovery/tests/unit/repositories/test_selection_tracking.py
+"""Unit tests for selection dirty tracking."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+
+def _compiled(mock_session, index=-1):
+    stmt = mock_session.execute.call_args_list[index][0][0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_mark_selections_changed_single_statement():
+    """Bumping the session version and stamping mappings is one statement."""
+    from app.repositories.selection_tracking import mark_selections_changed
+
+    mock_session = AsyncMock()
+    mapping_id = uuid4()
+
+    await mark_selections_changed(mock_session, [mapping_id, mapping_id])
+
+    mock_session.execute.assert_awaited_once()
+    sql = _compiled(mock_session)
+    assert sql.startswith("WITH bumped_sessions AS")
+    assert "SET selection_version=(discovery_sessions.selection_version +" in sql
+    assert "UPDATE discovery_role_mappings SET selection_version=bumped_sessions.selection_version" in sql
+    mock_session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_mark_selections_changed_without_mappings_is_noop():
+    """No mappings means no statement."""
+    from app.repositories.selection_tracking import mark_selections_changed
+
+    mock_session = AsyncMock()
+    await mark_selections_changed(mock_session, [])
+
+    mock_session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_task_selection_update_marks_mapping_dirty():
+    """Toggling a task selection stamps its role mapping before committing."""
+    from app.repositories.task_selection_repository import TaskSelectionRepository
+
+    selection = MagicMock()
+    selection.role_mapping_id = uuid4()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = selection
+
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = result
+    repo = TaskSelectionRepository(mock_session)
+
+    await repo.update_selection(uuid4(), selected=False)
+
+    assert mock_session.execute.await_count == 2
+    assert "bumped_sessions" in _compiled(mock_session)
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_activity_selection_update_marks_mapping_dirty():
+    """Toggling an activity selection stamps its role mapping before committing."""
+    from app.repositories.activity_selection_repository import ActivitySelectionRepository
+
+    selection = MagicMock()
+    selection.role_mapping_id = uuid4()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = selection
+
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = result
+    repo = ActivitySelectionRepository(mock_session)
+
+    await repo.update_selection(uuid4(), selected=True)
+
+    assert mock_session.execute.await_count == 2
+    assert "bumped_sessions" in _compiled(mock_session)
@@ -0,0 +1,27 @@
+# discovery/tests/unit/repositories/test_task_selection_repository.py
+"""Unit tests for task selection repository."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+
+@pytest.mark.asyncio
+async def test_get_dwa_exposure_edges_single_query():
+    """Test selected task → DWA exposure edges are loaded in one query."""
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories.task_selection_repository import TaskSelectionRepository
+
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = MagicMock()
+    repo = TaskSelectionRepository(mock_session)
+
+    await repo.get_dwa_exposure_edges(uuid4())
+
+    mock_session.execute.assert_awaited_once()
+    sql = str(
+        mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+    )
+    assert "LEFT OUTER JOIN onet_task_to_dwa" in sql
+    assert "coalesce(dwa_effective_exposure.exposure" in sql
+    assert "discovery_task_selections.selected IS true" in sql
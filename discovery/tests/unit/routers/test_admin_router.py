@@ -0,0 +1,87 @@
+"""Tests for the admin router."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.repositories.onet_repository import OnetRepository
+from app.routers.admin import get_onet_repository, router
+from app.services.role_mapping_cache import RoleMappingCache, get_role_mapping_cache
+
+
+@pytest.fixture
+def mock_onet_repository():
+    """Mock O*NET repository for testing."""
+    repository = MagicMock(spec=OnetRepository)
+    repository.session = AsyncMock()
+    repository.update_dwa_exposure_overrides = AsyncMock(return_value=2)
+    return repository
+
+
+@pytest.fixture
+def client(mock_onet_repository):
+    """Create test client with mocked dependencies."""
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_onet_repository] = lambda: mock_onet_repository
+    return TestClient(app)
+
+
+def test_update_dwa_exposure_overrides_refreshes_and_commits(client, mock_onet_repository):
+    """Overrides are written through the refreshing repository path and committed."""
+    response = client.put(
+        "/discovery/admin/onet/dwa-exposure-overrides",
+        json={"overrides": {"4.A.1.a.1.I01.D01": 0.9, "4.A.2.a.1.I01.D02": None}},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"updated": 2}
+    mock_onet_repository.update_dwa_exposure_overrides.assert_awaited_once_with(
+        {"4.A.1.a.1.I01.D01": 0.9, "4.A.2.a.1.I01.D02": None}
+    )
+    mock_onet_repository.session.commit.assert_awaited_once()
+
+
+@pytest.mark.parametrize("body", [{"overrides": {}}, {"overrides": {"4.A.1": 1.5}}])
+def test_update_dwa_exposure_overrides_validates_request(client, mock_onet_repository, body):
+    """Empty override maps and out-of-range scores are rejected."""
+    response = client.put("/discovery/admin/onet/dwa-exposure-overrides", json=body)
+
+    assert response.status_code == 422
+    mock_onet_repository.update_dwa_exposure_overrides.assert_not_called()
+
+
+def test_role_mapping_cache_stats(client):
+    """Role mapping cache stats are exposed next to the LLM cache stats."""
+    cache = MagicMock(spec=RoleMappingCache)
+    cache.get_stats = AsyncMock(return_value={
+        "onet_version": "30.1",
+        "model": "test-model",
+        "total_entries": 12,
+        "current_entries": 10,
+        "total_hits": 40,
+        "hits": 3,
+        "misses": 1,
+        "hit_rate": 0.75,
+    })
+    client.app.dependency_overrides[get_role_mapping_cache] = lambda: cache
+
+    response = client.get("/discovery/admin/role-mapping-cache/stats")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is True
+    assert data["current_entries"] == 10
+    assert data["hit_rate"] == 0.75
+
+
+def test_role_mapping_cache_stats_when_disabled(client):
+    """A disabled cache reports enabled=False with empty counters."""
+    client.app.dependency_overrides[get_role_mapping_cache] = lambda: None
+
+    response = client.get("/discovery/admin/role-mapping-cache/stats")
+
+    assert response.status_code == 200
+    assert response.json()["enabled"] is False
+    assert response.json()["hits"] == 0
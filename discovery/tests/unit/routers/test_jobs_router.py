@@ -0,0 +1,162 @@
+"""Tests for background job endpoints."""
+import pytest
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+
+def _queue():
+    from app.jobs.queue import InMemoryJobBackend, JobQueue
+
+    return JobQueue(InMemoryJobBackend())
+
+
+class TestJobStatusEndpoints:
+    """Tests for GET /discovery/jobs/{job_id} and /result."""
+
+    @pytest.mark.asyncio
+    async def test_get_job_returns_status(self):
+        """Job status includes progress and attempts."""
+        from app.routers.jobs import get_job
+
+        queue = _queue()
+        job = await queue.enqueue("analysis", {"session_id": "s1"})
+        await queue.report_progress(job.id, 0.25, "Scoring roles")
+
+        response = await get_job(job_id=job.id, queue=queue)
+
+        assert response.id == job.id
+        assert response.status == "queued"
+        assert response.progress == 0.25
+        assert response.message == "Scoring roles"
+
+    @pytest.mark.asyncio
+    async def test_get_unknown_job_returns_404(self):
+        """Unknown jobs return 404."""
+        from app.routers.jobs import get_job
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_job(job_id="missing", queue=_queue())
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_result_of_unfinished_job_returns_409(self):
+        """Results are unavailable until the job finishes."""
+        from app.routers.jobs import get_job_result
+
+        queue = _queue()
+        job = await queue.enqueue("analysis")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_job_result(job_id=job.id, queue=queue)
+
+        assert exc_info.value.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_result_of_succeeded_job(self):
+        """Finished jobs return their result."""
+        from app.jobs.queue import JobStatus
+        from app.routers.jobs import get_job_result
+
+        queue = _queue()
+        job = await queue.enqueue("analysis")
+        job.status = JobStatus.SUCCEEDED
+        job.result = {"status": "completed", "candidate_count": 3}
+        await queue.save(job)
+
+        response = await get_job_result(job_id=job.id, queue=queue)
+
+        assert response.status == "succeeded"
+        assert response.result == {"status": "completed", "candidate_count": 3}
+
+
+class TestEnqueueEndpoints:
+    """Tests for endpoints that enqueue background jobs."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_role_mappings_job(self):
+        """Role mapping jobs carry validated upload arguments as strings."""
+        from app.jobs.handlers import ROLE_MAPPING_JOB
+        from app.routers.role_mappings import enqueue_role_mappings_job
+        from app.schemas.role_mapping import CreateMappingsRequest
+
+        session_id, upload_id = uuid4(), uuid4()
+        upload_service = MagicMock()
+        upload_service.repository.get_by_id = AsyncMock(
+            return_value=MagicMock(session_id=session_id, column_mappings={"role": "Job Title"})
+        )
+        session_service = AsyncMock()
+        session_service.get_by_id.return_value = {"industry_naics_sector": "52"}
+        queue = _queue()
+
+        response = await enqueue_role_mappings_job(
+            session_id=session_id,
+            request=CreateMappingsRequest(upload_id=upload_id),
+            upload_service=upload_service,
+            session_service=session_service,
+            queue=queue,
+        )
+
+        job = await queue.get(response.id)
+        assert job.type == ROLE_MAPPING_JOB
+        assert job.params["session_id"] == str(session_id)
+        assert job.params["upload_id"] == str(upload_id)
+        assert job.params["role_column"] == "Job Title"
+        assert job.params["industry_naics_sector"] == "52"
+
+    @pytest.mark.asyncio
+    async def test_enqueue_role_mappings_job_validates_upload(self):
+        """Missing uploads are rejected before a job is enqueued."""
+        from app.routers.role_mappings import enqueue_role_mappings_job
+        from app.schemas.role_mapping import CreateMappingsRequest
+
+        upload_service = MagicMock()
+        upload_service.repository.get_by_id = AsyncMock(return_value=None)
+        queue = _queue()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await enqueue_role_mappings_job(
+                session_id=uuid4(),
+                request=CreateMappingsRequest(upload_id=uuid4()),
+                upload_service=upload_service,
+                session_service=AsyncMock(),
+                queue=queue,
+            )
+
+        assert exc_info.value.status_code == 404
+        assert await queue.next_job_id(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_enqueue_analysis_job(self):
+        """Analysis jobs record the session and source."""
+        from app.jobs.handlers import ANALYSIS_JOB
+        from app.routers.analysis import enqueue_analysis_job
+
+        session_id = uuid4()
+        queue = _queue()
+
+        response = await enqueue_analysis_job(session_id=session_id, source="activities", queue=queue)
+
+        job = await queue.get(response.id)
+        assert job.type == ANALYSIS_JOB
+        assert job.params == {
+            "session_id": str(session_id),
+            "source": "activities",
+            "incremental": False,
+        }
+
+    @pytest.mark.asyncio
+    async def test_enqueue_onet_sync_job(self):
+        """O*NET sync jobs record the requested version."""
+        from app.jobs.handlers import ONET_SYNC_JOB
+        from app.routers.admin import enqueue_onet_sync_job
+        from app.schemas.admin import OnetSyncRequest
+
+        queue = _queue()
+
+        response = await enqueue_onet_sync_job(request=OnetSyncRequest(version="29_2"), queue=queue)
+
+        job = await queue.get(response.id)
+        assert job.type == ONET_SYNC_JOB
+        assert job.params == {"version": "29_2"}
@@ -0,0 +1,79 @@
+"""Tests for organization portfolio router."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers.portfolio import router
+from app.services.portfolio_service import PortfolioService, get_portfolio_service
+
+
+@pytest.fixture
+def mock_portfolio_service():
+    """Mock portfolio service for testing."""
+    service = MagicMock(spec=PortfolioService)
+    service.get_portfolio = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def client(mock_portfolio_service):
+    """Create test client with mocked dependencies."""
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_portfolio_service] = lambda: mock_portfolio_service
+    return TestClient(app)
+
+
+def test_get_portfolio_converts_tiers(client, mock_portfolio_service):
+    """Should return the portfolio with tiers in schema format."""
+    organization_id = uuid4()
+    mock_portfolio_service.get_portfolio.return_value = {
+        "organization_id": organization_id,
+        "session_count": 2,
+        "totals": {
+            "role_count": 3,
+            "headcount": 40,
+            "ai_exposure_score": 0.8,
+            "priority_score": 0.7,
+        },
+        "tiers": {
+            "now": {"role_count": 2, "headcount": 30},
+            "next_quarter": {"role_count": 0, "headcount": 0},
+            "future": {"role_count": 1, "headcount": 10},
+        },
+        "occupations": [
+            {
+                "value": "15-1252.00",
+                "label": "Software Developers",
+                "role_count": 3,
+                "headcount": 40,
+                "ai_exposure_score": 0.8,
+                "priority_score": 0.7,
+                "tiers": {"now": 2, "next_quarter": 0, "future": 1},
+            }
+        ],
+        "lobs": [],
+    }
+
+    response = client.get(f"/discovery/organizations/{organization_id}/portfolio")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["session_count"] == 2
+    assert data["tiers"]["HIGH"] == {"role_count": 2, "headcount": 30}
+    assert data["tiers"]["LOW"] == {"role_count": 1, "headcount": 10}
+    assert data["occupations"][0]["tiers"] == {"HIGH": 2, "MEDIUM": 0, "LOW": 1}
+    assert data["lobs"] == []
+    mock_portfolio_service.get_portfolio.assert_called_once_with(
+        organization_id=organization_id
+    )
+
+
+def test_get_portfolio_validates_uuid(client):
+    """Should validate organization ID is a valid UUID."""
+    response = client.get("/discovery/organizations/not-a-uuid/portfolio")
+
+    assert response.status_code == 422
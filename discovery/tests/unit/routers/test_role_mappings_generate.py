@@ -0,0 +1,108 @@
+"""Tests for the generate role mappings endpoint."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+
+def _mock_services(session_id, existing=None):
+    mock_upload = MagicMock(
+        id=uuid4(),
+        session_id=session_id,
+        column_mappings={"role": "Job Title", "lob": "LOB", "headcount": "Count"},
+    )
+    service = MagicMock()
+    service.get_by_session_id = AsyncMock(return_value=existing or [])
+    service.repository.delete_for_session = AsyncMock(return_value=len(existing or []))
+    service.upload_service.repository.get_for_session = AsyncMock(return_value=[mock_upload])
+    service.create_mappings_from_upload = AsyncMock(return_value=[{
+        "id": uuid4(),
+        "source_role": "Nurse",
+        "onet_code": "29-1141.00",
+        "onet_title": "Registered Nurses",
+        "confidence_score": 0.92,
+        "confidence_tier": "HIGH",
+        "reasoning": "Exact title match",
+        "is_confirmed": False,
+    }])
+
+    session_service = AsyncMock()
+    session_service.get_by_id.return_value = {"industry_naics_sector": "62"}
+    return service, session_service, mock_upload
+
+
+class TestGenerateRoleMappingsEndpoint:
+    """Tests for POST /sessions/{id}/role-mappings/generate."""
+
+    @pytest.mark.asyncio
+    async def test_generates_when_session_has_no_mappings(self):
+        """Without existing mappings, the latest upload is mapped."""
+        from app.routers.role_mappings import generate_role_mappings
+
+        session_id = uuid4()
+        service, session_service, upload = _mock_services(session_id)
+
+        response = await generate_role_mappings(
+            session_id=session_id,
+            force=False,
+            service=service,
+            session_service=session_service,
+        )
+
+        assert response.created_count == 1
+        assert response.mappings[0].onet_code == "29-1141.00"
+        service.repository.delete_for_session.assert_not_awaited()
+        kwargs = service.create_mappings_from_upload.await_args.kwargs
+        assert kwargs["upload_id"] == upload.id
+        assert kwargs["role_column"] == "Job Title"
+        assert kwargs["lob_column"] == "LOB"
+        assert kwargs["headcount_column"] == "Count"
+        assert kwargs["industry_naics_sector"] == "62"
+
+    @pytest.mark.asyncio
+    async def test_force_deletes_existing_mappings_and_regenerates(self):
+        """With force=true, existing mappings are deleted and regenerated."""
+        from app.routers.role_mappings import generate_role_mappings
+
+        session_id = uuid4()
+        existing = [{
+            "id": uuid4(),
+            "source_role": "Nurse",
+            "onet_code": "29-1141.00",
+            "confidence_score": 0.5,
+            "is_confirmed": False,
+        }]
+        service, session_service, _ = _mock_services(session_id, existing)
+
+        response = await generate_role_mappings(
+            session_id=session_id,
+            force=True,
+            service=service,
+            session_service=session_service,
+        )
+
+        assert response.created_count == 1
+        service.get_by_session_id.assert_not_awaited()
+        service.repository.delete_for_session.assert_awaited_once_with(session_id)
+        service.create_mappings_from_upload.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_upload_service_returns_500(self):
+        """A service without an upload service fails with a 500, not a NameError."""
+        from fastapi import HTTPException
+
+        from app.routers.role_mappings import generate_role_mappings
+
+        session_id = uuid4()
+        service, session_service, _ = _mock_services(session_id)
+        service.upload_service = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await generate_role_mappings(
+                session_id=session_id,
+                force=False,
+                service=service,
+                session_service=session_service,
+            )
+
+        assert exc_info.value.status_code == 500
+        service.create_mappings_from_upload.assert_not_awaited()
@@ -1,6 +1,6 @@
 """Test grouped role mappings endpoint."""
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 
@@ -181,3 +181,153 @@ class TestRoleMappingServiceGroupedMappings:
 
         assert hasattr(RoleMappingService, "get_grouped_mappings")
         assert callable(getattr(RoleMappingService, "get_grouped_mappings"))
+
+    @staticmethod
+    def _summary(lob, is_overall, total, confirmed, low, employees):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            lob=lob,
+            is_overall=is_overall,
+            total_roles=total,
+            confirmed_count=confirmed,
+            pending_count=total - confirmed,
+            low_confidence_count=low,
+            total_employees=employees,
+        )
+
+    @staticmethod
+    def _row(lob, role, confirmed=False, score=0.9, employees=1):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            lob=lob,
+            source_role=role,
+            id=uuid4(),
+            onet_code="15-1252.00",
+            onet_title="Software Developers",
+            confidence_score=score,
+            is_confirmed=confirmed,
+            employee_count=employees,
+        )
+
+    @pytest.mark.asyncio
+    async def test_assembles_groups_from_sql_rows(self):
+        """Groups and summaries come straight from the aggregate queries."""
+        from app.services.role_mapping_service import RoleMappingService
+
+        mock_repo = AsyncMock()
+        mock_repo.get_group_summaries.return_value = [
+            self._summary("Retail", False, 2, 1, 1, 30),
+            self._summary("Wealth", False, 1, 0, 0, 5),
+            self._summary(None, False, 1, 0, 0, 2),
+            self._summary(None, True, 4, 1, 1, 37),
+        ]
+        mock_repo.get_grouped_rows.return_value = [
+            self._row("Retail", "Analyst", employees=20),
+            self._row("Retail", "Teller", confirmed=True, employees=10),
+            self._row("Wealth", "Advisor", employees=5),
+            self._row(None, "Intern", employees=2),
+        ]
+        service = RoleMappingService(repository=mock_repo, role_mapping_agent=MagicMock())
+        session_id = uuid4()
+
+        result = await service.get_grouped_mappings(session_id)
+
+        mock_repo.get_group_summaries.assert_awaited_once_with(session_id, 0.6)
+        mock_repo.get_grouped_rows.assert_awaited_once_with(session_id, limit=None, offset=0)
+        mock_repo.get_for_session.assert_not_called()
+        assert result["overall_summary"] == {
+            "total_roles": 4,
+            "confirmed_count": 1,
+            "pending_count": 3,
+            "low_confidence_count": 1,
+            "total_employees": 37,
+        }
+        assert [g["lob"] for g in result["lob_groups"]] == ["Retail", "Wealth"]
+        assert [m["source_role"] for m in result["lob_groups"][0]["mappings"]] == ["Analyst", "Teller"]
+        assert result["lob_groups"][0]["summary"]["total_employees"] == 30
+        assert [m["source_role"] for m in result["ungrouped_mappings"]] == ["Intern"]
+        assert result["page"] is None
+
+    @pytest.mark.asyncio
+    async def test_paginates_mappings_but_not_summaries(self):
+        """A page limits mappings; every group keeps its full summary."""
+        from app.services.role_mapping_service import RoleMappingService
+
+        mock_repo = AsyncMock()
+        mock_repo.get_group_summaries.return_value = [
+            self._summary("Retail", False, 2, 0, 0, 2),
+            self._summary("Wealth", False, 1, 0, 0, 1),
+            self._summary(None, True, 3, 0, 0, 3),
+        ]
+        mock_repo.get_grouped_rows.return_value = [self._row("Wealth", "Advisor")]
+        service = RoleMappingService(repository=mock_repo, role_mapping_agent=MagicMock())
+        session_id = uuid4()
+
+        result = await service.get_grouped_mappings(session_id, page=3, per_page=1)
+
+        mock_repo.get_grouped_rows.assert_awaited_once_with(session_id, limit=1, offset=2)
+        retail, wealth = result["lob_groups"]
+        assert retail["mappings"] == [] and retail["summary"]["total_roles"] == 2
+        assert [m["source_role"] for m in wealth["mappings"]] == ["Advisor"]
+        assert (result["page"], result["per_page"]) == (3, 1)
+
+    @pytest.mark.asyncio
+    async def test_empty_session(self):
+        """A session without mappings yields zero summaries."""
+        from app.services.role_mapping_service import RoleMappingService
+
+        mock_repo = AsyncMock()
+        mock_repo.get_group_summaries.return_value = [self._summary(None, True, 0, 0, 0, 0)]
+        mock_repo.get_grouped_rows.return_value = []
+        service = RoleMappingService(repository=mock_repo, role_mapping_agent=MagicMock())
+
+        result = await service.get_grouped_mappings(uuid4())
+
+        assert result["overall_summary"]["total_roles"] == 0
+        assert result["lob_groups"] == []
+        assert result["ungrouped_mappings"] == []
+
+
+class TestRoleMappingRepositoryGrouping:
+    """Test the SQL behind the grouped view."""
+
+    @staticmethod
+    def _compile(stmt):
+        from sqlalchemy.dialects import postgresql
+
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_summaries_use_grouping_sets(self):
+        """Per-LOB and overall counts come from one GROUPING SETS query."""
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        repo = RoleMappingRepository(session)
+
+        await repo.get_group_summaries(uuid4(), 0.6)
+
+        sql = self._compile(session.execute.call_args.args[0])
+        assert "GROUP BY GROUPING SETS((role_groups.lob), ())" in sql
+        assert "count(*) FILTER (WHERE role_groups.is_confirmed IS true)" in sql
+        assert "GROUP BY nullif(discovery_role_mappings.lob_value, ''), discovery_role_mappings.source_role" in sql
+
+    @pytest.mark.asyncio
+    async def test_rows_are_ordered_and_paginated(self):
+        """Rows are ordered by LOB then role and limited in SQL."""
+        from app.repositories.role_mapping_repository import RoleMappingRepository
+
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        repo = RoleMappingRepository(session)
+
+        await repo.get_grouped_rows(uuid4(), limit=50, offset=100)
+
+        stmt = session.execute.call_args.args[0]
+        sql = self._compile(stmt)
+        assert "ORDER BY role_groups.lob ASC NULLS LAST, role_groups.source_role" in sql
+        assert "LIMIT" in sql and "OFFSET" in sql
+        assert "array_agg(discovery_role_mappings.id ORDER BY" in sql
@@ -0,0 +1,114 @@
+"""Tests for the streaming role mapping endpoint."""
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+
+def _mock_services(session_id, upload_id, events=None, error=None):
+    mock_upload = MagicMock(
+        id=upload_id,
+        session_id=session_id,
+        column_mappings={"role": "Job Title", "lob": "LOB"},
+    )
+    service = MagicMock()
+    service.upload_service.repository.get_by_id = AsyncMock(return_value=mock_upload)
+
+    async def stream(**kwargs):
+        service.stream_kwargs = kwargs
+        for event in events or []:
+            yield event
+        if error:
+            raise error
+
+    service.stream_mappings_from_upload = stream
+
+    session_service = AsyncMock()
+    session_service.get_by_id.return_value = {"industry_naics_sector": "52"}
+    return service, session_service
+
+
+async def _read_events(response):
+    events = []
+    async for chunk in response.body_iterator:
+        assert chunk.startswith("data: ") and chunk.endswith("\n\n")
+        events.append(json.loads(chunk[len("data: "):]))
+    return events
+
+
+class TestStreamRoleMappingsEndpoint:
+    """Tests for POST /sessions/{id}/role-mappings/stream."""
+
+    @pytest.mark.asyncio
+    async def test_streams_service_events_as_sse(self):
+        """Each service event is emitted as an SSE data line."""
+        from app.routers.role_mappings import stream_role_mappings
+        from app.schemas.role_mapping import CreateMappingsRequest
+
+        session_id, upload_id = uuid4(), uuid4()
+        events = [
+            {"type": "started", "total_roles": 2},
+            {"type": "batch", "mappings": [{"source_role": "Nurse"}], "completed_roles": 1, "total_roles": 2},
+            {"type": "done", "created_count": 1, "total_roles": 2},
+        ]
+        service, session_service = _mock_services(session_id, upload_id, events)
+
+        response = await stream_role_mappings(
+            session_id=session_id,
+            request=CreateMappingsRequest(upload_id=upload_id),
+            service=service,
+            session_service=session_service,
+        )
+
+        assert response.media_type == "text/event-stream"
+        assert response.headers["X-Accel-Buffering"] == "no"
+        assert await _read_events(response) == events
+        assert service.stream_kwargs["role_column"] == "Job Title"
+        assert service.stream_kwargs["lob_column"] == "LOB"
+        assert service.stream_kwargs["industry_naics_sector"] == "52"
+
+    @pytest.mark.asyncio
+    async def test_error_ends_stream_with_error_event(self):
+        """Failures mid-stream are reported as a final error event."""
+        from app.routers.role_mappings import stream_role_mappings
+        from app.schemas.role_mapping import CreateMappingsRequest
+
+        session_id, upload_id = uuid4(), uuid4()
+        service, session_service = _mock_services(
+            session_id,
+            upload_id,
+            events=[{"type": "started", "total_roles": 3}],
+            error=RuntimeError("LLM unavailable"),
+        )
+
+        response = await stream_role_mappings(
+            session_id=session_id,
+            request=CreateMappingsRequest(upload_id=upload_id),
+            service=service,
+            session_service=session_service,
+        )
+
+        events = await _read_events(response)
+        assert events[-1] == {"type": "error", "message": "LLM unavailable"}
+
+    @pytest.mark.asyncio
+    async def test_upload_from_other_session_rejected_before_streaming(self):
+        """Validation errors are raised as HTTP errors, not stream events."""
+        from fastapi import HTTPException
+
+        from app.routers.role_mappings import stream_role_mappings
+        from app.schemas.role_mapping import CreateMappingsRequest
+
+        upload_id = uuid4()
+        service, session_service = _mock_services(uuid4(), upload_id)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await stream_role_mappings(
+                session_id=uuid4(),
+                request=CreateMappingsRequest(upload_id=upload_id),
+                service=service,
+                session_service=session_service,
+            )
+
+        assert exc_info.value.status_code == 400
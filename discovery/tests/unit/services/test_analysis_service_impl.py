@@ -20,13 +20,18 @@ async def test_trigger_analysis():
     mock_mapping.source_role = "Engineer"
     mock_mapping.onet_code = "15-1252.00"
     mock_mapping.row_count = 50
+    mock_mapping.lob_value = None
+    mock_mapping.department_value = None
+    mock_mapping.geography_value = None
     mock_mapping_repo.get_for_session.return_value = [mock_mapping]
 
-    # Mock activity selections
-    mock_selection = MagicMock()
-    mock_selection.dwa_id = "4.A.1.a.1"
-    mock_selection.selected = True
-    mock_selection_repo.get_for_role_mapping.return_value = [mock_selection]
+    # Mock per-mapping exposure summary of selected activities
+    mock_summary = MagicMock()
+    mock_summary.role_mapping_id = mock_mapping.id
+    mock_summary.dwa_count = 2
+    mock_summary.avg_exposure = 0.8
+    mock_summary.sample_scores = [0.7, 0.9]
+    mock_selection_repo.get_exposure_summaries.return_value = [mock_summary]
 
     mock_analysis_repo.save_results.return_value = []
 
@@ -39,8 +44,50 @@ async def test_trigger_analysis():
     session_id = uuid4()
     result = await service.trigger_analysis(session_id)
 
-    assert result is not None
-    assert "status" in result
+    assert result == {"status": "completed", "count": 1, "mode": "full"}
+    mock_selection_repo.get_exposure_summaries.assert_awaited_once_with(
+        session_id, role_mapping_ids=None
+    )
+    mock_selection_repo.get_for_role_mapping.assert_not_called()
+
+    saved = mock_analysis_repo.replace_results.call_args[0][1]
+    assert len(saved) == 1
+    assert saved[0]["ai_exposure_score"] == 0.8
+    assert saved[0]["breakdown"]["dwa_count"] == 2
+    assert saved[0]["breakdown"]["dwa_scores"] == [0.7, 0.9]
+
+
+@pytest.mark.asyncio
+async def test_trigger_analysis_defaults_without_selections():
+    """Test mappings without selected activities get the default exposure."""
+    from app.services.analysis_service import AnalysisService
+
+    mock_analysis_repo = AsyncMock()
+    mock_mapping_repo = AsyncMock()
+    mock_selection_repo = AsyncMock()
+
+    mock_mapping = MagicMock()
+    mock_mapping.id = uuid4()
+    mock_mapping.source_role = "Analyst"
+    mock_mapping.row_count = 10
+    mock_mapping.lob_value = None
+    mock_mapping.department_value = None
+    mock_mapping.geography_value = None
+    mock_mapping_repo.get_for_session.return_value = [mock_mapping]
+    mock_selection_repo.get_exposure_summaries.return_value = []
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        activity_selection_repository=mock_selection_repo,
+    )
+
+    await service.trigger_analysis(uuid4())
+
+    saved = mock_analysis_repo.replace_results.call_args[0][1]
+    assert saved[0]["ai_exposure_score"] == 0.5
+    assert saved[0]["breakdown"]["dwa_count"] == 0
+    assert saved[0]["breakdown"]["dwa_scores"] == [0.5]
 
 
 @pytest.mark.asyncio
@@ -109,3 +156,528 @@ async def test_trigger_analysis_no_mappings():
 
     assert result is not None
     assert result["status"] == "error"
+
+
+def _task_edge(role_mapping_id, task_id, dwa_id, exposure):
+    edge = MagicMock()
+    edge.role_mapping_id = role_mapping_id
+    edge.task_id = task_id
+    edge.dwa_id = dwa_id
+    edge.exposure = exposure
+    return edge
+
+
+def _role_mapping(
+    source_role,
+    row_count,
+    selection_version=0,
+    lob_value=None,
+    department_value=None,
+    geography_value=None,
+):
+    mapping = MagicMock()
+    mapping.id = uuid4()
+    mapping.source_role = source_role
+    mapping.row_count = row_count
+    mapping.selection_version = selection_version
+    mapping.lob_value = lob_value
+    mapping.department_value = department_value
+    mapping.geography_value = geography_value
+    return mapping
+
+
+def _role_result(role_mapping_id, ai_exposure, impact, complexity, priority):
+    result = MagicMock()
+    result.role_mapping_id = role_mapping_id
+    result.ai_exposure_score = ai_exposure
+    result.impact_score = impact
+    result.complexity_score = complexity
+    result.priority_score = priority
+    return result
+
+
+def _analysis_state(
+    selection_version,
+    analyzed_version,
+    analysis_source,
+    analyzed_exposure_version=1,
+    exposure_version=1,
+):
+    state = MagicMock()
+    state.selection_version = selection_version
+    state.analyzed_version = analyzed_version
+    state.analysis_source = analysis_source
+    state.analyzed_exposure_version = analyzed_exposure_version
+    state.exposure_version = exposure_version
+    return state
+
+
+@pytest.mark.asyncio
+async def test_trigger_analysis_from_tasks_single_query():
+    """Test task-based analysis loads all edges once and de-duplicates DWAs."""
+    from app.services.analysis_service import AnalysisService
+
+    mock_analysis_repo = AsyncMock()
+    mock_mapping_repo = AsyncMock()
+    mock_task_repo = AsyncMock()
+
+    engineer = _role_mapping("Engineer", 30)
+    analyst = _role_mapping("Analyst", 10)
+    clerk = _role_mapping("Clerk", None)
+    mock_mapping_repo.get_for_session.return_value = [engineer, analyst, clerk]
+    mock_task_repo.get_dwa_exposure_edges.return_value = [
+        _task_edge(engineer.id, 1, "4.A.2", 0.9),
+        _task_edge(engineer.id, 1, "4.A.1", 0.7),
+        _task_edge(engineer.id, 2, "4.A.1", 0.7),  # Same DWA via another task
+        _task_edge(analyst.id, 3, None, 0.5),  # Task without DWAs
+    ]
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=mock_task_repo,
+    )
+
+    session_id = uuid4()
+    result = await service.trigger_analysis_from_tasks(session_id)
+
+    assert result == {"status": "completed", "count": 3, "mode": "full"}
+    mock_task_repo.get_dwa_exposure_edges.assert_awaited_once_with(
+        session_id, role_mapping_ids=None
+    )
+    mock_task_repo.get_for_role_mapping.assert_not_called()
+
+    saved = mock_analysis_repo.replace_results.call_args[0][1]
+    by_role = {r["dimension_value"]: r for r in saved}
+    assert by_role["Engineer"]["ai_exposure_score"] == 0.8
+    assert by_role["Engineer"]["breakdown"]["task_count"] == 2
+    assert by_role["Engineer"]["breakdown"]["dwa_count"] == 2
+    assert by_role["Engineer"]["breakdown"]["dwa_scores"] == [0.7, 0.9]
+    assert by_role["Analyst"]["ai_exposure_score"] == 0.5
+    assert by_role["Analyst"]["breakdown"]["task_count"] == 1
+    assert by_role["Analyst"]["breakdown"]["dwa_count"] == 0
+    assert by_role["Clerk"]["breakdown"]["task_count"] == 0
+    assert by_role["Clerk"]["breakdown"]["dwa_scores"] == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_trigger_analysis_from_tasks_matches_scalar_engine():
+    """Test batch task-based scores match ScoringEngine.score_role per mapping."""
+    import random
+
+    from app.services.analysis_service import AnalysisService
+    from app.services.scoring_engine import ScoringEngine
+
+    rng = random.Random(42)
+    mappings = [_role_mapping(f"Role {i}", rng.randint(0, 200)) for i in range(60)]
+    dwa_exposure = {f"DWA.{i}": round(rng.random(), 4) for i in range(40)}
+    edges = []
+    for mapping in mappings[:-5]:  # Last mappings have no selections
+        for task_id in rng.sample(range(100), rng.randint(1, 8)):
+            for dwa_id in rng.sample(sorted(dwa_exposure), rng.randint(0, 3)):
+                edges.append(_task_edge(mapping.id, task_id, dwa_id, dwa_exposure[dwa_id]))
+    rng.shuffle(edges)
+
+    mock_analysis_repo = AsyncMock()
+    mock_mapping_repo = AsyncMock()
+    mock_task_repo = AsyncMock()
+    mock_mapping_repo.get_for_session.return_value = mappings
+    mock_task_repo.get_dwa_exposure_edges.return_value = edges
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=mock_task_repo,
+    )
+    await service.trigger_analysis_from_tasks(uuid4())
+    saved = mock_analysis_repo.replace_results.call_args[0][1]
+
+    engine = ScoringEngine()
+    total_rows = sum(m.row_count for m in mappings)
+    for mapping, row in zip(mappings, saved):
+        dwa_ids = sorted({e.dwa_id for e in edges if e.role_mapping_id == mapping.id})
+        dwa_scores = [dwa_exposure[d] for d in dwa_ids] or [0.5]
+        expected = engine.score_role(dwa_scores, mapping.row_count, total_rows)
+
+        assert row["role_mapping_id"] == mapping.id
+        assert row["ai_exposure_score"] == pytest.approx(expected["ai_exposure"])
+        assert row["impact_score"] == pytest.approx(expected["impact"])
+        assert row["complexity_score"] == pytest.approx(expected["complexity"])
+        assert row["priority_score"] == pytest.approx(expected["priority"])
+        assert row["breakdown"]["priority_tier"] == engine.classify_priority_tier(
+            expected["priority"], expected["complexity"]
+        )
+        assert row["breakdown"]["dwa_count"] == len(dwa_ids)
+        assert row["breakdown"]["dwa_scores"] == dwa_scores[:5]
+
+
+@pytest.mark.asyncio
+async def test_incremental_analysis_rescores_only_dirty_mappings():
+    """Test incremental mode re-scores mappings changed since the last run."""
+    from app.services.analysis_service import AnalysisService
+
+    changed = _role_mapping("Engineer", 30, selection_version=6, lob_value="Retail")
+    unchanged = _role_mapping("Analyst", 10, selection_version=3, lob_value="Retail")
+
+    mock_analysis_repo = AsyncMock()
+    mock_analysis_repo.get_analysis_state.return_value = _analysis_state(7, 5, "tasks")
+    mock_analysis_repo.get_role_row_counts.return_value = {changed.id: 30, unchanged.id: 10}
+    mock_analysis_repo.get_for_session.return_value = [
+        _role_result(changed.id, 0.1, 0.1, 0.9, 0.1),  # Stale, replaced by the new score
+        _role_result(unchanged.id, 0.5, 0.4, 0.5, 0.4),
+    ]
+    mock_mapping_repo = AsyncMock()
+    mock_mapping_repo.get_for_session.return_value = [changed, unchanged]
+    mock_task_repo = AsyncMock()
+    mock_task_repo.get_dwa_exposure_edges.return_value = [
+        _task_edge(changed.id, 1, "4.A.1", 0.9),
+    ]
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=mock_task_repo,
+    )
+
+    session_id = uuid4()
+    result = await service.trigger_analysis_from_tasks(session_id, incremental=True)
+
+    assert result == {"status": "completed", "count": 1, "mode": "incremental"}
+    mock_task_repo.get_dwa_exposure_edges.assert_awaited_once_with(
+        session_id, role_mapping_ids=[changed.id]
+    )
+    args, kwargs = mock_analysis_repo.replace_results.call_args
+    assert [r["role_mapping_id"] for r in args[1]] == [changed.id]
+    # Impact still uses the headcount of the whole session
+    assert args[1][0]["impact_score"] == round(0.9 * 0.6 + 30 / 40 * 0.4, 3)
+    assert kwargs == {
+        "analyzed_version": 7,
+        "analysis_source": "tasks",
+        "role_mapping_ids": [changed.id],
+        "analyzed_exposure_version": 1,
+    }
+    # Aggregates combine the new score with the stored one of the unchanged mapping
+    (retail,) = args[2]
+    assert retail["dimension_value"] == "Retail"
+    assert retail["row_count"] == 40
+    assert retail["ai_exposure_score"] == round((0.9 * 30 + 0.5 * 10) / 40, 3)
+    assert retail["breakdown"]["role_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_incremental_analysis_nothing_changed_skips_writes():
+    """Test incremental mode writes nothing when no selection changed."""
+    from app.services.analysis_service import AnalysisService
+
+    mapping = _role_mapping("Engineer", 30, selection_version=2)
+
+    mock_analysis_repo = AsyncMock()
+    mock_analysis_repo.get_analysis_state.return_value = _analysis_state(5, 5, "activities")
+    mock_analysis_repo.get_role_row_counts.return_value = {mapping.id: 30}
+    mock_mapping_repo = AsyncMock()
+    mock_mapping_repo.get_for_session.return_value = [mapping]
+    mock_selection_repo = AsyncMock()
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        activity_selection_repository=mock_selection_repo,
+    )
+
+    result = await service.trigger_analysis(uuid4(), incremental=True)
+
+    assert result == {"status": "completed", "count": 0, "mode": "incremental"}
+    mock_selection_repo.get_exposure_summaries.assert_not_called()
+    mock_analysis_repo.replace_results.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "state,row_counts",
+    [
+        ((5, None, None), {}),  # Never analyzed
+        ((5, 4, "activities"), {"same": 30}),  # Last run used another source
+        ((5, 4, "tasks"), {"same": 99}),  # Headcount changed
+        ((5, 4, "tasks", 1, 2), {"same": 30}),  # Exposure data refreshed since
+    ],
+)
+async def test_incremental_analysis_falls_back_to_full(state, row_counts):
+    """Test incremental mode re-scores everything when it cannot be trusted."""
+    from app.services.analysis_service import AnalysisService
+
+    mapping = _role_mapping("Engineer", 30, selection_version=0)
+
+    mock_analysis_repo = AsyncMock()
+    mock_analysis_repo.get_analysis_state.return_value = _analysis_state(*state)
+    mock_analysis_repo.get_role_row_counts.return_value = {
+        mapping.id: count for count in row_counts.values()
+    }
+    mock_mapping_repo = AsyncMock()
+    mock_mapping_repo.get_for_session.return_value = [mapping]
+    mock_task_repo = AsyncMock()
+    mock_task_repo.get_dwa_exposure_edges.return_value = []
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=mock_task_repo,
+    )
+
+    result = await service.trigger_analysis_from_tasks(uuid4(), incremental=True)
+
+    assert result["mode"] == "full"
+    kwargs = mock_analysis_repo.replace_results.call_args[1]
+    assert kwargs["role_mapping_ids"] is None
+    assert kwargs["analyzed_exposure_version"] == mock_analysis_repo.get_analysis_state.return_value.exposure_version
+
+
+@pytest.mark.asyncio
+async def test_trigger_analysis_missing_session_returns_none():
+    """Test analysis of an unknown session returns None."""
+    from app.services.analysis_service import AnalysisService
+
+    mock_analysis_repo = AsyncMock()
+    mock_analysis_repo.get_analysis_state.return_value = None
+    mock_mapping_repo = AsyncMock()
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=AsyncMock(),
+    )
+
+    assert await service.trigger_analysis_from_tasks(uuid4()) is None
+    mock_mapping_repo.get_for_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trigger_analysis_persists_dimension_aggregates():
+    """Test a run stores headcount-weighted LOB, department and geography results."""
+    from app.models.discovery_analysis import AnalysisDimension as DBDimension
+    from app.services.analysis_service import AnalysisService
+
+    engineer = _role_mapping("Engineer", 30, lob_value="Retail", department_value="IT")
+    analyst = _role_mapping("Analyst", 10, lob_value="Retail", geography_value="EMEA")
+    clerk = _role_mapping("Clerk", 60, lob_value="Banking", department_value="IT")
+
+    mock_analysis_repo = AsyncMock()
+    mock_mapping_repo = AsyncMock()
+    mock_mapping_repo.get_for_session.return_value = [engineer, analyst, clerk]
+    mock_task_repo = AsyncMock()
+    mock_task_repo.get_dwa_exposure_edges.return_value = [
+        _task_edge(engineer.id, 1, "4.A.1", 0.9),
+        _task_edge(analyst.id, 2, "4.A.2", 0.5),
+        _task_edge(clerk.id, 3, "4.A.3", 0.2),
+    ]
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=mock_task_repo,
+    )
+    await service.trigger_analysis_from_tasks(uuid4())
+
+    args, _ = mock_analysis_repo.replace_results.call_args
+    roles = {r["dimension_value"]: r for r in args[1]}
+    aggregates = {(r["dimension"], r["dimension_value"]): r for r in args[2]}
+    assert set(aggregates) == {
+        (DBDimension.LOB, "Banking"),
+        (DBDimension.LOB, "Retail"),
+        (DBDimension.DEPARTMENT, "IT"),
+        (DBDimension.GEOGRAPHY, "EMEA"),
+    }
+
+    retail = aggregates[(DBDimension.LOB, "Retail")]
+    assert retail["role_mapping_id"] is None
+    assert retail["row_count"] == 40
+    assert retail["ai_exposure_score"] == round((0.9 * 30 + 0.5 * 10) / 40, 3)
+    assert retail["impact_score"] == round(
+        (roles["Engineer"]["impact_score"] * 30 + roles["Analyst"]["impact_score"] * 10) / 40, 3
+    )
+    assert retail["breakdown"]["role_count"] == 2
+
+    it = aggregates[(DBDimension.DEPARTMENT, "IT")]
+    assert it["row_count"] == 90
+    assert it["priority_score"] == round(
+        (roles["Engineer"]["priority_score"] * 30 + roles["Clerk"]["priority_score"] * 60) / 90, 3
+    )
+    assert aggregates[(DBDimension.GEOGRAPHY, "EMEA")]["ai_exposure_score"] == 0.5
+
+
+def test_aggregate_dimensions_without_headcount_uses_plain_mean():
+    """Test groups with no headcount average their roles unweighted."""
+    import numpy as np
+
+    from app.services.analysis_service import _aggregate_dimensions
+    from app.services.scoring_engine import ScoringEngine
+
+    mappings = [
+        _role_mapping("Engineer", None, department_value="IT"),
+        _role_mapping("Analyst", 0, department_value="IT"),
+    ]
+    scores = np.array([[0.9, 0.8, 0.1, 0.8], [0.5, 0.4, 0.5, 0.4]])
+
+    (it,) = _aggregate_dimensions(uuid4(), mappings, scores, ScoringEngine())
+
+    assert it["row_count"] == 0
+    assert it["ai_exposure_score"] == 0.7
+    assert it["complexity_score"] == 0.3
+    assert it["breakdown"] == {"role_count": 2, "priority_tier": "next_quarter"}
+
+
+@pytest.mark.asyncio
+async def test_score_scenarios_rescores_from_cache_without_writes():
+    """Test scenarios re-score from cached arrays and never touch stored results."""
+    from app.models.discovery_analysis import AnalysisDimension as DBDimension
+    from app.services.analysis_service import AnalysisService
+    from app.services.score_cache import SessionScoreCache
+    from app.services.scoring_engine import ScoringEngine
+
+    engineer = _role_mapping("Engineer", 30, lob_value="Retail")
+    clerk = _role_mapping("Clerk", 70, lob_value="Banking")
+
+    mock_analysis_repo = AsyncMock()
+    mock_analysis_repo.get_analysis_state.return_value = _analysis_state(3, 3, "tasks")
+    mock_mapping_repo = AsyncMock()
+    mock_mapping_repo.get_for_session.return_value = [engineer, clerk]
+    mock_mapping_repo.get_fingerprint.return_value = (2, None)
+    mock_task_repo = AsyncMock()
+    mock_task_repo.get_dwa_exposure_edges.return_value = [
+        _task_edge(engineer.id, 1, "4.A.1", 0.9),
+        _task_edge(clerk.id, 2, "4.A.2", 0.3),
+    ]
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=mock_task_repo,
+        score_cache=SessionScoreCache(),
+    )
+    session_id = uuid4()
+    scenarios = [
+        {"name": "baseline"},
+        {"name": "impact-heavy", "exposure_weight": 0.1, "impact_weight": 0.8, "ease_weight": 0.1},
+    ]
+
+    first = await service.score_scenarios(session_id, scenarios)
+    second = await service.score_scenarios(session_id, scenarios)
+
+    assert first == second
+    mock_mapping_repo.get_for_session.assert_awaited_once()
+    mock_task_repo.get_dwa_exposure_edges.assert_awaited_once()
+    mock_analysis_repo.replace_results.assert_not_called()
+
+    baseline, impact_heavy = first
+    assert baseline["weights"] == {"exposure": 0.4, "impact": 0.4, "ease": 0.2}
+    assert [r["name"] for r in baseline["roles"]] == ["Engineer", "Clerk"]
+    expected = ScoringEngine().score_exposure(0.9, 30, 100)
+    assert baseline["roles"][0]["priority_score"] == expected["priority"]
+    assert baseline["roles"][0]["role_mapping_id"] == engineer.id
+
+    expected = ScoringEngine(
+        exposure_weight=0.1, impact_weight=0.8, ease_weight=0.1
+    ).score_exposure(0.3, 70, 100)
+    clerk_score = next(r for r in impact_heavy["roles"] if r["name"] == "Clerk")
+    assert clerk_score["priority_score"] == expected["priority"]
+    assert sum(impact_heavy["tier_counts"].values()) == 2
+    assert {g["name"] for g in impact_heavy["dimensions"][DBDimension.LOB]} == {
+        "Retail", "Banking",
+    }
+    assert impact_heavy["dimensions"][DBDimension.DEPARTMENT] == []
+
+
+@pytest.mark.asyncio
+async def test_score_scenarios_reloads_after_selection_change():
+    """Test a newer selection_version misses the cache and reloads exposure."""
+    from app.services.analysis_service import AnalysisService
+    from app.services.score_cache import SessionScoreCache
+
+    engineer = _role_mapping("Engineer", 10)
+
+    mock_analysis_repo = AsyncMock()
+    mock_analysis_repo.get_analysis_state.side_effect = [
+        _analysis_state(1, 1, "tasks"),
+        _analysis_state(2, 1, "tasks"),
+    ]
+    mock_mapping_repo = AsyncMock()
+    mock_mapping_repo.get_for_session.return_value = [engineer]
+    mock_mapping_repo.get_fingerprint.return_value = (1, None)
+    mock_task_repo = AsyncMock()
+    mock_task_repo.get_dwa_exposure_edges.side_effect = [
+        [_task_edge(engineer.id, 1, "4.A.1", 0.2)],
+        [_task_edge(engineer.id, 1, "4.A.1", 0.8)],
+    ]
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=mock_task_repo,
+        score_cache=SessionScoreCache(),
+    )
+    session_id = uuid4()
+
+    (before,) = await service.score_scenarios(session_id, [{"name": "baseline"}])
+    (after,) = await service.score_scenarios(session_id, [{"name": "baseline"}])
+
+    assert before["roles"][0]["ai_exposure_score"] == 0.2
+    assert after["roles"][0]["ai_exposure_score"] == 0.8
+    assert mock_task_repo.get_dwa_exposure_edges.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_score_scenarios_reloads_after_mapping_change():
+    """Test a re-upload with an unchanged selection_version still reloads."""
+    from datetime import datetime, timezone
+
+    from app.services.analysis_service import AnalysisService
+    from app.services.score_cache import SessionScoreCache
+
+    before_upload = _role_mapping("Engineer", 10)
+    after_upload = _role_mapping("Engineer", 40)
+
+    mock_analysis_repo = AsyncMock()
+    mock_analysis_repo.get_analysis_state.return_value = _analysis_state(1, 1, "tasks")
+    mock_mapping_repo = AsyncMock()
+    mock_mapping_repo.get_for_session.side_effect = [[before_upload], [after_upload]]
+    mock_mapping_repo.get_fingerprint.side_effect = [
+        (1, datetime(2026, 10, 16, tzinfo=timezone.utc)),
+        (1, datetime(2026, 10, 17, tzinfo=timezone.utc)),
+    ]
+    mock_task_repo = AsyncMock()
+    mock_task_repo.get_dwa_exposure_edges.return_value = []
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=mock_task_repo,
+        score_cache=SessionScoreCache(),
+    )
+    session_id = uuid4()
+
+    (before,) = await service.score_scenarios(session_id, [{"name": "baseline"}])
+    (after,) = await service.score_scenarios(session_id, [{"name": "baseline"}])
+
+    assert before["roles"][0]["role_mapping_id"] == before_upload.id
+    assert after["roles"][0]["role_mapping_id"] == after_upload.id
+    assert mock_mapping_repo.get_for_session.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_score_scenarios_missing_session_returns_none():
+    """Test scenario scoring returns None for an unknown session."""
+    from app.services.analysis_service import AnalysisService
+    from app.services.score_cache import SessionScoreCache
+
+    mock_analysis_repo = AsyncMock()
+    mock_analysis_repo.get_analysis_state.return_value = None
+    mock_mapping_repo = AsyncMock()
+
+    service = AnalysisService(
+        analysis_repository=mock_analysis_repo,
+        role_mapping_repository=mock_mapping_repo,
+        task_selection_repository=AsyncMock(),
+        score_cache=SessionScoreCache(),
+    )
+
+    assert await service.score_scenarios(uuid4(), [{"name": "baseline"}]) is None
+    mock_mapping_repo.get_for_session.assert_not_called()
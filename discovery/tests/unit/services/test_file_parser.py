@@ -177,3 +177,48 @@ class TestUnsupportedFileType:
             assert "csv" in str(e.message)
             assert "xlsx" in str(e.message)
             assert "xls" in str(e.message)
+
+
+def test_extract_role_lob_values_with_department_and_geography():
+    """Test department and geography are attached to each role+LOB group."""
+    from app.services.file_parser import FileParser
+
+    csv_content = (
+        b"title,lob,dept,site,hc\n"
+        b"Engineer,Retail,,Austin,2\n"
+        b"Engineer,Retail,IT,Boston,3\n"
+        b"Analyst,,Finance,,1\n"
+    )
+    parser = FileParser()
+    result = parser.extract_role_lob_values(
+        csv_content,
+        "test.csv",
+        role_column="title",
+        lob_column="lob",
+        headcount_column="hc",
+        department_column="dept",
+        geography_column="site",
+    )
+
+    by_role = {r["role"]: r for r in result}
+    assert by_role["Engineer"] == {
+        "role": "Engineer",
+        "lob": "Retail",
+        "count": 5,
+        "department": "IT",
+        "geography": "Austin",
+    }
+    assert by_role["Analyst"]["lob"] is None
+    assert by_role["Analyst"]["department"] == "Finance"
+    assert by_role["Analyst"]["geography"] is None
+
+
+def test_extract_role_lob_values_missing_department_column():
+    """Test an unknown department column raises FileParseException."""
+    from app.services.file_parser import FileParser
+
+    parser = FileParser()
+    with pytest.raises(FileParseException):
+        parser.extract_role_lob_values(
+            b"title\nEngineer", "test.csv", role_column="title", department_column="dept"
+        )
@@ -0,0 +1,315 @@
+"""Unit tests for the LLM response cache."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.config import Settings
+
+
+def _mock_settings():
+    settings = MagicMock(spec=Settings)
+    settings.anthropic_api_key = MagicMock()
+    settings.anthropic_api_key.get_secret_value.return_value = "test_api_key"
+    settings.anthropic_model = "claude-sonnet-4-20250514"
+    return settings
+
+
+def _api_response(text):
+    block = MagicMock()
+    block.text = text
+    response = MagicMock()
+    response.content = [block]
+    return response
+
+
+class TestMakeCacheKey:
+    """Tests for cache key hashing."""
+
+    def test_identical_requests_share_key(self):
+        """The same request always hashes to the same key."""
+        from app.services.llm_cache import make_cache_key
+
+        messages = [{"role": "user", "content": "Map Retail Banking"}]
+
+        assert make_cache_key("m", 0.7, 100, "sys", messages) == make_cache_key(
+            "m", 0.7, 100, "sys", [dict(m) for m in messages]
+        )
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("other-model", 0.7, 100, "sys"),
+            ("m", 0.0, 100, "sys"),
+            ("m", 0.7, 200, "sys"),
+            ("m", 0.7, 100, "other system"),
+        ],
+    )
+    def test_any_parameter_changes_key(self, changed):
+        """Model, temperature, max_tokens and system prompt are all part of the key."""
+        from app.services.llm_cache import make_cache_key
+
+        messages = [{"role": "user", "content": "hi"}]
+
+        assert make_cache_key(*changed, messages) != make_cache_key("m", 0.7, 100, "sys", messages)
+
+
+class TestMemoryBackend:
+    """Tests for the in-process LRU backend."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted past max_entries."""
+        from app.services.llm_cache import MemoryLLMCacheBackend
+
+        backend = MemoryLLMCacheBackend(max_entries=2)
+        await backend.set("a", "1", 60)
+        await backend.set("b", "2", 60)
+        await backend.get("a")
+        await backend.set("c", "3", 60)
+
+        assert await backend.get("a") == "1"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == "3"
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self):
+        """Entries past their TTL are not returned."""
+        from app.services.llm_cache import MemoryLLMCacheBackend
+
+        backend = MemoryLLMCacheBackend(max_entries=10)
+        await backend.set("a", "1", 0)
+
+        assert await backend.get("a") is None
+
+
+class TestSQLiteBackend:
+    """Tests for the on-disk SQLite backend."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_persistence(self, tmp_path):
+        """Entries survive reopening the file."""
+        from app.services.llm_cache import SQLiteLLMCacheBackend
+
+        path = str(tmp_path / "cache.sqlite3")
+        backend = SQLiteLLMCacheBackend(path, max_entries=10)
+        await backend.set("a", "response", 60)
+        await backend.close()
+
+        reopened = SQLiteLLMCacheBackend(path, max_entries=10)
+        assert await reopened.get("a") == "response"
+        assert await reopened.get("missing") is None
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_size_and_ttl_eviction(self, tmp_path):
+        """Expired entries and entries beyond max_entries are removed."""
+        from app.services.llm_cache import SQLiteLLMCacheBackend
+
+        backend = SQLiteLLMCacheBackend(str(tmp_path / "cache.sqlite3"), max_entries=2)
+        await backend.set("expired", "x", 0)
+        await backend.set("a", "1", 60)
+        await backend.set("b", "2", 60)
+        await backend.set("c", "3", 60)
+
+        assert await backend.get("expired") is None
+        assert await backend.get("a") is None
+        assert await backend.get("c") == "3"
+        await backend.close()
+
+
+class TestLLMResponseCache:
+    """Tests for metrics and error handling."""
+
+    @pytest.mark.asyncio
+    async def test_hit_rate(self):
+        """Hits and misses are counted."""
+        from app.services.llm_cache import LLMResponseCache, MemoryLLMCacheBackend
+
+        cache = LLMResponseCache(MemoryLLMCacheBackend(10), ttl_seconds=60)
+        await cache.get("k")
+        await cache.set("k", "v")
+        await cache.get("k")
+        await cache.get("k")
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_are_misses(self):
+        """Backend failures are counted and never raised."""
+        from app.services.llm_cache import LLMResponseCache
+
+        backend = AsyncMock()
+        backend.get.side_effect = ConnectionError("down")
+        backend.set.side_effect = ConnectionError("down")
+        cache = LLMResponseCache(backend, ttl_seconds=60)
+
+        assert await cache.get("k") is None
+        await cache.set("k", "v")
+
+        assert cache.errors == 2
+        assert cache.misses == 1
+
+
+class TestCreateLLMCache:
+    """Tests for backend selection."""
+
+    def test_disabled_by_default(self):
+        """No cache is created for the default "none" backend."""
+        from app.services.llm_cache import create_llm_cache
+
+        assert create_llm_cache(Settings()) is None
+
+    def test_memory_backend(self):
+        """The memory backend honors max entries and TTL settings."""
+        from app.services.llm_cache import MemoryLLMCacheBackend, create_llm_cache
+
+        cache = create_llm_cache(Settings(
+            llm_cache_backend="memory", llm_cache_max_entries=5, llm_cache_ttl_seconds=30,
+        ))
+
+        assert isinstance(cache.backend, MemoryLLMCacheBackend)
+        assert cache.backend.max_entries == 5
+        assert cache.ttl_seconds == 30
+
+
+class TestLLMServiceCaching:
+    """Tests for caching in LLMService.generate_response."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_call_api_once(self):
+        """A repeated request is served from the cache."""
+        from app.services.llm_cache import LLMResponseCache, MemoryLLMCacheBackend
+        from app.services.llm_service import LLMService
+
+        cache = LLMResponseCache(MemoryLLMCacheBackend(10), ttl_seconds=60)
+        with patch("app.services.llm_service.AsyncAnthropic"):
+            service = LLMService(settings=_mock_settings(), cache=cache)
+        service._client.messages.create = AsyncMock(return_value=_api_response('["52"]'))
+
+        first = await service.generate_response("sys", "Map Retail Banking")
+        second = await service.generate_response("sys", "Map Retail Banking")
+        third = await service.generate_response("sys", "Map Healthcare")
+
+        assert first == second == third == '["52"]'
+        assert service._client.messages.create.await_count == 2
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Failed calls are retried against the API."""
+        import anthropic
+        from app.exceptions import LLMError
+        from app.services.llm_cache import LLMResponseCache, MemoryLLMCacheBackend
+        from app.services.llm_service import LLMService
+
+        cache = LLMResponseCache(MemoryLLMCacheBackend(10), ttl_seconds=60)
+        with patch("app.services.llm_service.AsyncAnthropic"):
+            service = LLMService(settings=_mock_settings(), cache=cache)
+        service._client.messages.create = AsyncMock(side_effect=[
+            anthropic.APIError(message="boom", request=MagicMock(), body=None),
+            _api_response("ok"),
+        ])
+
+        with pytest.raises(LLMError):
+            await service.generate_response("sys", "hello")
+        assert await service.generate_response("sys", "hello") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_truncated_responses_are_not_cached(self):
+        """Responses cut off at max_tokens are requested again."""
+        from app.services.llm_cache import LLMResponseCache, MemoryLLMCacheBackend
+        from app.services.llm_service import LLMService
+
+        truncated = _api_response('["52", "4')
+        truncated.stop_reason = "max_tokens"
+        cache = LLMResponseCache(MemoryLLMCacheBackend(10), ttl_seconds=60)
+        with patch("app.services.llm_service.AsyncAnthropic"):
+            service = LLMService(settings=_mock_settings(), cache=cache)
+        service._client.messages.create = AsyncMock(side_effect=[truncated, _api_response('["52"]')])
+
+        await service.generate_response("sys", "hello")
+        assert await service.generate_response("sys", "hello") == '["52"]'
+        assert service._client.messages.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_complete_uses_generate_response(self):
+        """complete() sends the prompt as the user message."""
+        from app.services.llm_service import LLMService
+
+        with patch("app.services.llm_service.AsyncAnthropic"):
+            service = LLMService(settings=_mock_settings())
+        service._client.messages.create = AsyncMock(return_value=_api_response("Job Title"))
+
+        assert await service.complete("Which column?") == "Job Title"
+        kwargs = service._client.messages.create.call_args.kwargs
+        assert kwargs["messages"] == [{"role": "user", "content": "Which column?"}]
+        assert kwargs["system"] == LLMService.COMPLETION_SYSTEM_PROMPT
+
+    @pytest.mark.asyncio
+    async def test_stream_response_is_cached(self):
+        """A completed stream is replayed from the cache as one chunk."""
+        from app.services.llm_cache import LLMResponseCache, MemoryLLMCacheBackend
+        from app.services.llm_service import LLMService
+
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return False
+
+            def __aiter__(self):
+                return self._events()
+
+            async def _events(self):
+                for text in ("[", "]"):
+                    event = MagicMock(type="content_block_delta")
+                    event.delta.text = text
+                    yield event
+
+        cache = LLMResponseCache(MemoryLLMCacheBackend(10), ttl_seconds=60)
+        with patch("app.services.llm_service.AsyncAnthropic"):
+            service = LLMService(settings=_mock_settings(), cache=cache)
+        service._client.messages.stream = MagicMock(side_effect=lambda **kwargs: Stream())
+
+        first = [chunk async for chunk in service.stream_response("sys", "map")]
+        second = [chunk async for chunk in service.stream_response("sys", "map")]
+
+        assert first == ["[", "]"]
+        assert second == ["[]"]
+        assert service._client.messages.stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream_is_not_cached(self):
+        """A stream that stopped at max_tokens is not replayed from the cache."""
+        from app.services.llm_cache import LLMResponseCache, MemoryLLMCacheBackend
+        from app.services.llm_service import LLMService
+
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return False
+
+            def __aiter__(self):
+                return self._events()
+
+            async def _events(self):
+                event = MagicMock(type="content_block_delta")
+                event.delta.text = '[{"role": '
+                yield event
+                event = MagicMock(type="message_delta")
+                event.delta.stop_reason = "max_tokens"
+                yield event
+
+        cache = LLMResponseCache(MemoryLLMCacheBackend(10), ttl_seconds=60)
+        with patch("app.services.llm_service.AsyncAnthropic"):
+            service = LLMService(settings=_mock_settings(), cache=cache)
+        service._client.messages.stream = MagicMock(side_effect=lambda **kwargs: Stream())
+
+        [chunk async for chunk in service.stream_response("sys", "map")]
+        [chunk async for chunk in service.stream_response("sys", "map")]
+
+        assert service._client.messages.stream.call_count == 2
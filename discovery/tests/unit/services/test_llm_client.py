@@ -0,0 +1,312 @@
+"""Unit tests for the shared LLM client pool."""
+import asyncio
+
+import anthropic
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.config import Settings
+from app.exceptions import LLMAuthError, LLMConnectionError, LLMRateLimitError
+
+
+def _mock_settings():
+    settings = MagicMock(spec=Settings)
+    settings.anthropic_api_key = MagicMock()
+    settings.anthropic_api_key.get_secret_value.return_value = "test_api_key"
+    settings.anthropic_model = "claude-sonnet-4-20250514"
+    return settings
+
+
+def _rate_limit_error(retry_after=None):
+    headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+    response = MagicMock(status_code=429, headers=headers)
+    return anthropic.RateLimitError(message="rate limited", response=response, body=None)
+
+
+def _api_response(text, input_tokens=10, output_tokens=5):
+    block = MagicMock()
+    block.text = text
+    response = MagicMock()
+    response.content = [block]
+    response.usage = MagicMock(input_tokens=input_tokens, output_tokens=output_tokens)
+    return response
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_capacity_does_not_wait(self):
+        """Tokens are taken immediately while available."""
+        from app.services.llm_client import TokenBucket
+
+        bucket = TokenBucket(per_minute=60)
+        with patch("app.services.llm_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            await bucket.acquire(60)
+
+        sleep.assert_not_awaited()
+        assert bucket.available < 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        """An empty bucket waits roughly deficit / refill rate."""
+        from app.services.llm_client import TokenBucket
+
+        bucket = TokenBucket(per_minute=6000)  # 100 tokens per second
+        await bucket.acquire(6000)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await bucket.acquire(5)
+
+        assert loop.time() - start >= 0.04
+
+    def test_adjust_allows_debt_and_caps_refunds(self):
+        """Overuse drives the balance negative; refunds never exceed capacity."""
+        from app.services.llm_client import TokenBucket
+
+        bucket = TokenBucket(per_minute=100)
+        bucket.adjust(150)
+        assert bucket.available < 0
+
+        bucket.adjust(-1000)
+        assert bucket.available == pytest.approx(100)
+
+
+class TestLLMClientPool:
+    """Tests for LLMClientPool."""
+
+    def test_clients_are_shared_per_api_key(self):
+        """One client per API key, with SDK retries disabled."""
+        from app.services.llm_client import LLMClientPool
+
+        factory = MagicMock(side_effect=lambda **kwargs: MagicMock())
+        pool = LLMClientPool(client_factory=factory)
+
+        assert pool.get_client("a") is pool.get_client("a")
+        assert pool.get_client("a") is not pool.get_client("b")
+        factory.assert_any_call(api_key="a", max_retries=0)
+        assert factory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_retries_rate_limit_and_connection_errors(self):
+        """Transient errors are retried until the call succeeds."""
+        from app.services.llm_client import LLMClientPool
+
+        pool = LLMClientPool(max_retries=3)
+        call = AsyncMock(side_effect=[LLMRateLimitError(), LLMConnectionError(), "ok"])
+
+        with patch("app.services.llm_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await pool.run(call)
+
+        assert result == "ok"
+        assert call.await_count == 3
+        assert sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_gives_up_after_max_retries(self):
+        """The last error is raised once retries are exhausted."""
+        from app.services.llm_client import LLMClientPool
+
+        pool = LLMClientPool(max_retries=2)
+        call = AsyncMock(side_effect=LLMRateLimitError())
+
+        with patch("app.services.llm_client.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(LLMRateLimitError):
+                await pool.run(call)
+
+        assert call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_retry_other_errors(self):
+        """Non-transient errors are raised immediately."""
+        from app.services.llm_client import LLMClientPool
+
+        pool = LLMClientPool(max_retries=3)
+        call = AsyncMock(side_effect=LLMAuthError())
+
+        with pytest.raises(LLMAuthError):
+            await pool.run(call)
+
+        assert call.await_count == 1
+
+    def test_retry_delay_is_jittered_exponential(self):
+        """Delays double per attempt, are jittered and capped."""
+        from app.services.llm_client import LLMClientPool
+
+        pool = LLMClientPool(max_retries=10, retry_backoff_base=1.0, retry_backoff_max=5.0)
+        error = LLMConnectionError()
+
+        assert 0.5 <= pool.retry_delay(1, error) <= 1.0
+        assert 2.0 <= pool.retry_delay(3, error) <= 4.0
+        assert 2.5 <= pool.retry_delay(8, error) <= 5.0
+        assert pool.retry_delay(11, error) is None
+
+    def test_retry_delay_honors_retry_after(self):
+        """A retry-after hint is used as the delay, capped at the maximum."""
+        from app.services.llm_client import LLMClientPool
+
+        pool = LLMClientPool(retry_backoff_max=30.0)
+
+        assert pool.retry_delay(1, LLMRateLimitError(retry_after=7)) == 7.0
+        assert pool.retry_delay(1, LLMRateLimitError(retry_after=120)) == 30.0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency calls run at once."""
+        from app.services.llm_client import LLMClientPool
+
+        pool = LLMClientPool(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def call():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "ok"
+
+        await asyncio.gather(*(pool.run(call) for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_run_reconciles_token_bucket_with_usage(self):
+        """Reported usage replaces the estimate in the token bucket."""
+        from app.services.llm_client import LLMClientPool
+
+        pool = LLMClientPool(tokens_per_minute=1000)
+        call = AsyncMock(return_value=_api_response("ok", input_tokens=300, output_tokens=200))
+
+        await pool.run(call, estimated_tokens=100)
+
+        assert pool.token_bucket.available == pytest.approx(500, abs=1)
+
+
+class TestCreateLLMClientPool:
+    """Tests for building the pool from settings."""
+
+    def test_pacing_disabled_by_default(self):
+        """Rate limits are per-account values, so pacing is opt-in."""
+        from app.services.llm_client import create_llm_client_pool
+
+        pool = create_llm_client_pool(Settings())
+
+        assert pool.request_bucket is None
+        assert pool.token_bucket is None
+
+    def test_zero_limits_disable_pacing(self):
+        """Rate limits of 0 disable the corresponding bucket."""
+        from app.services.llm_client import create_llm_client_pool
+
+        pool = create_llm_client_pool(Settings(
+            llm_requests_per_minute=0, llm_tokens_per_minute=0, llm_max_retries=1,
+        ))
+
+        assert pool.request_bucket is None
+        assert pool.token_bucket is None
+        assert pool.max_retries == 1
+
+
+class TestLLMServiceWithPool:
+    """Tests for LLMService requests routed through a pool."""
+
+    @pytest.mark.asyncio
+    async def test_generate_response_retries_rate_limit(self):
+        """A 429 is retried through the pool instead of failing the request."""
+        from app.services.llm_client import LLMClientPool
+        from app.services.llm_service import LLMService
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(side_effect=[_rate_limit_error(), _api_response("ok")])
+        pool = LLMClientPool(client_factory=lambda **kwargs: client)
+        service = LLMService(settings=_mock_settings(), client_pool=pool)
+
+        with patch("app.services.llm_client.asyncio.sleep", new=AsyncMock()):
+            assert await service.generate_response("sys", "hello") == "ok"
+
+        assert client.messages.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_services_share_the_pooled_client(self):
+        """Services on the same pool reuse one Anthropic client."""
+        from app.services.llm_client import LLMClientPool
+        from app.services.llm_service import LLMService
+
+        pool = LLMClientPool(client_factory=lambda **kwargs: MagicMock())
+
+        first = LLMService(settings=_mock_settings(), client_pool=pool)
+        second = LLMService(settings=_mock_settings(), client_pool=pool)
+
+        assert first._client is second._client
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_before_first_chunk(self):
+        """A stream that fails before yielding text is retried."""
+        from app.services.llm_client import LLMClientPool
+        from app.services.llm_service import LLMService
+
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return False
+
+            def __aiter__(self):
+                return self._events()
+
+            async def _events(self):
+                event = MagicMock(type="content_block_delta")
+                event.delta.text = "hi"
+                yield event
+
+        client = MagicMock()
+        client.messages.stream.side_effect = [_rate_limit_error(retry_after=1), Stream()]
+        pool = LLMClientPool(client_factory=lambda **kwargs: client)
+        service = LLMService(settings=_mock_settings(), client_pool=pool)
+
+        with patch("app.services.llm_service.asyncio.sleep", new=AsyncMock()) as sleep:
+            chunks = [chunk async for chunk in service.stream_response("sys", "hello")]
+
+        assert chunks == ["hi"]
+        sleep.assert_awaited_once_with(1.0)
+
+    @pytest.mark.asyncio
+    async def test_stream_reconciles_token_bucket_with_usage(self):
+        """Usage reported by stream events replaces the estimate."""
+        from app.services.llm_client import LLMClientPool
+        from app.services.llm_service import LLMService
+
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return False
+
+            def __aiter__(self):
+                return self._events()
+
+            async def _events(self):
+                event = MagicMock(type="message_start")
+                event.message.usage.input_tokens = 300
+                yield event
+                event = MagicMock(type="content_block_delta")
+                event.delta.text = "hi"
+                yield event
+                event = MagicMock(type="message_delta")
+                event.delta.stop_reason = "end_turn"
+                event.usage.output_tokens = 200
+                yield event
+
+        client = MagicMock()
+        client.messages.stream.return_value = Stream()
+        pool = LLMClientPool(tokens_per_minute=1000, client_factory=lambda **kwargs: client)
+        service = LLMService(settings=_mock_settings(), client_pool=pool)
+
+        [chunk async for chunk in service.stream_response("sys", "hello")]
+
+        assert pool.token_bucket.available == pytest.approx(500, abs=1)
@@ -0,0 +1,186 @@
+"""Tests for the in-memory O*NET industry index."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+def _industries():
+    return [
+        ("13-2051.00", "522110"),  # Financial Analysts - Commercial Banking
+        ("13-2051.00", "523110"),  # Financial Analysts - Investment Banking
+        ("29-1141.00", "622110"),  # Registered Nurses - Hospitals
+        ("43-3071.00", "52"),      # Tellers - sector-level row
+    ]
+
+
+class TestOnetIndustryIndex:
+    """Tests for OnetIndustryIndex scoring."""
+
+    @pytest.mark.parametrize(
+        "naics_codes,expected",
+        [
+            (["522110"], 1.0),
+            (["5221"], 0.8),
+            (["522"], 0.6),
+            (["52"], 0.4),
+            (["62"], 0.0),
+            (["62", "523110"], 1.0),
+            ([], 0.0),
+        ],
+    )
+    def test_scores_match_repository_prefix_rules(self, naics_codes, expected):
+        """Scores follow the NAICS prefix tiers of calculate_industry_score."""
+        from app.services.onet_industry_index import OnetIndustryIndex
+
+        index = OnetIndustryIndex(_industries())
+
+        assert index.score("13-2051.00", naics_codes) == expected
+
+    def test_agrees_with_repository_pairwise_score(self):
+        """Index scores equal the best pairwise _naics_match_score."""
+        from app.repositories.onet_repository import OnetRepository
+        from app.services.onet_industry_index import OnetIndustryIndex
+
+        index = OnetIndustryIndex(_industries())
+        repo = OnetRepository(MagicMock())
+        targets = ["5", "52", "522", "5221", "52211", "522110", "523999", "62", "622110"]
+
+        for code in {code for code, _ in _industries()}:
+            industry_codes = [n for c, n in _industries() if c == code]
+            for target in targets:
+                expected = max(repo._naics_match_score(n, target) for n in industry_codes)
+                assert index.score(code, [target]) == expected, (code, target)
+
+    def test_score_batch(self):
+        """Batch scoring returns a score per unique occupation."""
+        from app.services.onet_industry_index import OnetIndustryIndex
+
+        index = OnetIndustryIndex(_industries())
+
+        scores = index.score_batch(
+            ["13-2051.00", "29-1141.00", "43-3071.00", "99-9999.00", "13-2051.00"],
+            ["52"],
+        )
+
+        assert scores == {
+            "13-2051.00": 0.4,
+            "29-1141.00": 0.0,
+            "43-3071.00": 1.0,
+            "99-9999.00": 0.0,
+        }
+
+    def test_score_vectors_are_cached_per_naics_set(self):
+        """Repeated NAICS sets reuse the computed score vector."""
+        from app.services.onet_industry_index import OnetIndustryIndex
+
+        index = OnetIndustryIndex(_industries())
+
+        index.score_batch(["13-2051.00"], ["52", "62"])
+        index.score_batch(["29-1141.00"], ["62", "52"])
+
+        assert len(index._score_cache) == 1
+
+
+class TestGetOnetIndustryIndex:
+    """Tests for the process-wide index."""
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_only_when_version_changes(self, monkeypatch):
+        """Index is reused for the same O*NET version and rebuilt on change."""
+        from app.services import onet_industry_index
+
+        monkeypatch.setattr(onet_industry_index, "_index", None)
+
+        mock_repo = AsyncMock()
+        mock_repo.get_latest_sync.return_value = MagicMock(version="29.3")
+        mock_repo.get_all_industries.return_value = _industries()
+
+        first = await onet_industry_index.get_onet_industry_index(mock_repo)
+        second = await onet_industry_index.get_onet_industry_index(mock_repo)
+        assert first is second
+        assert mock_repo.get_all_industries.await_count == 1
+
+        mock_repo.get_latest_sync.return_value = MagicMock(version="30.1")
+        third = await onet_industry_index.get_onet_industry_index(mock_repo)
+        assert third is not first
+        assert third.version == "30.1"
+
+    @pytest.mark.asyncio
+    async def test_builds_in_worker_thread(self, monkeypatch):
+        """Index construction runs off the event loop."""
+        from app.services import onet_industry_index
+
+        monkeypatch.setattr(onet_industry_index, "_index", None)
+        to_thread = AsyncMock(return_value=MagicMock(version="29.3"))
+        monkeypatch.setattr(onet_industry_index.asyncio, "to_thread", to_thread)
+
+        mock_repo = AsyncMock()
+        mock_repo.get_latest_sync.return_value = MagicMock(version="29.3")
+        mock_repo.get_all_industries.return_value = _industries()
+
+        await onet_industry_index.get_onet_industry_index(mock_repo)
+
+        to_thread.assert_awaited_once()
+        assert to_thread.await_args.args[0] is onet_industry_index.OnetIndustryIndex
+
+
+class TestRoleMappingServiceIndustryIndex:
+    """Tests for RoleMappingService industry scoring via the index."""
+
+    @pytest.mark.asyncio
+    async def test_match_role_with_industry_uses_index(self):
+        """Candidates are scored in one batch without per-occupation queries."""
+        from app.services.lob_mapping_service import LobNaicsResult
+        from app.services.onet_industry_index import OnetIndustryIndex
+        from app.services.role_mapping_service import RoleMappingService
+
+        onet_repo = AsyncMock()
+        onet_repo.search_occupations.return_value = [
+            MagicMock(code="29-1141.00", title="Registered Nurses"),
+            MagicMock(code="13-2051.00", title="Financial Analysts"),
+        ]
+        lob_service = AsyncMock()
+        lob_service.map_lob_to_naics.return_value = LobNaicsResult(
+            lob="Retail Banking", naics_codes=["522110"], confidence=1.0, source="curated",
+        )
+        service = RoleMappingService(
+            repository=AsyncMock(),
+            role_mapping_agent=AsyncMock(),
+            onet_repository=onet_repo,
+            lob_service=lob_service,
+            industry_index=OnetIndustryIndex(_industries()),
+        )
+
+        result = await service.match_role_with_industry("Analyst", lob="Retail Banking")
+
+        assert [r["code"] for r in result] == ["13-2051.00", "29-1141.00"]
+        assert result[0]["industry_match"] == 1.0
+        assert result[1]["industry_match"] == 0.0
+        onet_repo.calculate_industry_score.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_index_resolved_lazily_on_first_scoring(self, monkeypatch):
+        """With use_industry_index, only industry scoring resolves the index, once."""
+        from app.services import role_mapping_service
+        from app.services.onet_industry_index import OnetIndustryIndex
+        from app.services.role_mapping_service import RoleMappingService
+
+        index = OnetIndustryIndex(_industries())
+        get_index = AsyncMock(return_value=index)
+        monkeypatch.setattr(role_mapping_service, "get_onet_industry_index", get_index)
+
+        onet_repo = AsyncMock()
+        service = RoleMappingService(
+            repository=AsyncMock(),
+            role_mapping_agent=AsyncMock(),
+            onet_repository=onet_repo,
+            use_industry_index=True,
+        )
+        get_index.assert_not_awaited()
+
+        first = await service._score_industries(["13-2051.00"], ["522110"])
+        second = await service._score_industries(["29-1141.00"], ["522110"])
+
+        assert first == {"13-2051.00": 1.0}
+        assert second == {"29-1141.00": 0.0}
+        get_index.assert_awaited_once_with(onet_repo)
+        onet_repo.calculate_industry_score.assert_not_called()
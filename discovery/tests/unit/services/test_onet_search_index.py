@@ -0,0 +1,179 @@
+"""Unit tests for the in-memory O*NET search index."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.onet_occupation import OnetOccupation
+
+
+def _occupations():
+    return [
+        OnetOccupation(
+            code="15-1252.00",
+            title="Software Developers",
+            description="Research, design, and develop computer and network software.",
+        ),
+        OnetOccupation(
+            code="29-1141.00",
+            title="Registered Nurses",
+            description="Assess patient health problems and needs.",
+        ),
+        OnetOccupation(
+            code="43-4051.00",
+            title="Customer Service Representatives",
+            description="Interact with customers to provide information about products.",
+        ),
+        OnetOccupation(
+            code="15-2051.00",
+            title="Data Scientists",
+            description="Develop and implement methods to analyze data.",
+        ),
+    ]
+
+
+def _alternate_titles():
+    return [
+        ("15-1252.00", "Software Engineer"),
+        ("15-1252.00", "Application Developer"),
+        ("43-4051.00", "Call Center Agent"),
+        ("99-9999.00", "Orphan Title"),  # occupation not loaded
+    ]
+
+
+class TestTokenize:
+    """Tests for tokenization helpers."""
+
+    def test_tokenize_drops_stopwords_and_plurals(self):
+        """Tokens are lowercased, singularized and stopword-free."""
+        from app.services.onet_search_index import tokenize
+
+        assert tokenize("Director of Facilities") == ["director", "facility"]
+        assert tokenize("Software Engineers") == ["software", "engineer"]
+
+    def test_trigrams_are_word_padded(self):
+        """Trigrams include pg_trgm-style word padding."""
+        from app.services.onet_search_index import trigrams
+
+        assert trigrams("cat") == {"  c", " ca", "cat", "at "}
+
+
+class TestOnetSearchIndex:
+    """Tests for OnetSearchIndex."""
+
+    def test_title_match_ranks_first(self):
+        """Title matches outrank description-only matches."""
+        from app.services.onet_search_index import OnetSearchIndex
+
+        index = OnetSearchIndex(_occupations(), _alternate_titles())
+
+        # "develop" appears in the Data Scientists description only as a verb
+        results = index.search("Software Developer", limit=3)
+
+        assert results[0][0] == "15-1252.00"
+
+    def test_alternate_titles_are_searchable(self):
+        """Alternate titles contribute to an occupation's title field."""
+        from app.services.onet_search_index import OnetSearchIndex
+
+        index = OnetSearchIndex(_occupations(), _alternate_titles())
+
+        assert index.search("Call Center Agent", limit=1)[0][0] == "43-4051.00"
+
+    def test_trigram_fallback_handles_misspellings(self):
+        """Misspelled titles with no term match are backfilled by trigram similarity."""
+        from app.services.onet_search_index import OnetSearchIndex
+
+        index = OnetSearchIndex(_occupations(), _alternate_titles())
+
+        results = index.search("Registred Nurces", limit=5)
+
+        assert results
+        assert results[0][0] == "29-1141.00"
+
+    def test_no_match_returns_empty(self):
+        """Queries unrelated to any occupation return nothing."""
+        from app.services.onet_search_index import OnetSearchIndex
+
+        index = OnetSearchIndex(_occupations(), _alternate_titles())
+
+        assert index.search("zzzz qqqq") == []
+
+    def test_search_batch_returns_detached_occupations(self):
+        """Batch search maps each query to ranked OnetOccupation copies."""
+        from app.services.onet_search_index import OnetSearchIndex
+
+        occupations = _occupations()
+        index = OnetSearchIndex(occupations, _alternate_titles())
+
+        results = index.search_batch(["Software Engineer", "Nurse", "  "], limit=2)
+
+        assert set(results) == {"Software Engineer", "Nurse", "  "}
+        assert results["Software Engineer"][0].code == "15-1252.00"
+        assert results["Software Engineer"][0] is not occupations[0]
+        assert results["Nurse"][0].title == "Registered Nurses"
+        assert results["  "] == []
+        assert all(len(v) <= 2 for v in results.values())
+
+
+class TestGetOnetSearchIndex:
+    """Tests for the process-wide index loader."""
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_only_when_version_changes(self, monkeypatch):
+        """Index is reused for the same O*NET version and rebuilt on change."""
+        from app.services import onet_search_index
+
+        monkeypatch.setattr(onet_search_index, "_index", None)
+
+        mock_repo = AsyncMock()
+        mock_repo.get_latest_sync.return_value = MagicMock(version="29.3")
+        mock_repo.get_all.return_value = _occupations()
+        mock_repo.get_all_alternate_titles.return_value = _alternate_titles()
+
+        first = await onet_search_index.get_onet_search_index(mock_repo)
+        second = await onet_search_index.get_onet_search_index(mock_repo)
+        assert first is second
+        assert mock_repo.get_all.await_count == 1
+
+        mock_repo.get_latest_sync.return_value = MagicMock(version="30.1")
+        third = await onet_search_index.get_onet_search_index(mock_repo)
+        assert third is not first
+        assert third.version == "30.1"
+
+    @pytest.mark.asyncio
+    async def test_builds_off_the_event_loop(self, monkeypatch):
+        """Index construction runs in a worker thread."""
+        from app.services import onet_search_index
+
+        monkeypatch.setattr(onet_search_index, "_index", None)
+        to_thread = AsyncMock(return_value=MagicMock(version="29.3"))
+        monkeypatch.setattr(onet_search_index.asyncio, "to_thread", to_thread)
+
+        mock_repo = AsyncMock()
+        mock_repo.get_latest_sync.return_value = MagicMock(version="29.3")
+        mock_repo.get_all.return_value = _occupations()
+        mock_repo.get_all_alternate_titles.return_value = _alternate_titles()
+
+        await onet_search_index.get_onet_search_index(mock_repo)
+
+        to_thread.assert_awaited_once()
+        assert to_thread.await_args.args[0] is onet_search_index.OnetSearchIndex
+
+
+class TestRoleMappingAgentSearchIndex:
+    """Tests for RoleMappingAgent candidate retrieval via the index."""
+
+    @pytest.mark.asyncio
+    async def test_agent_uses_index_instead_of_database(self):
+        """Agent skips database search when a search index is configured."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.services.onet_search_index import OnetSearchIndex
+
+        mock_repo = AsyncMock()
+        index = OnetSearchIndex(_occupations(), _alternate_titles())
+        agent = RoleMappingAgent(MagicMock(), mock_repo, search_index=index)
+
+        candidates = await agent._get_candidates(["Software Engineer"])
+
+        assert candidates["Software Engineer"][0].code == "15-1252.00"
+        mock_repo.search_with_full_text_batch.assert_not_called()
+        mock_repo.search_with_full_text.assert_not_called()
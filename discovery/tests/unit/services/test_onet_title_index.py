@@ -0,0 +1,237 @@
+"""Tests for exact O*NET title matching."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+def _occupations():
+    from app.models.onet_occupation import OnetOccupation
+
+    return [
+        OnetOccupation(code="29-1141.00", title="Registered Nurses", description="Assess patients."),
+        OnetOccupation(code="15-1252.00", title="Software Developers", description="Develop software."),
+        OnetOccupation(code="11-1021.00", title="General and Operations Managers", description="Plan."),
+        OnetOccupation(code="11-9111.00", title="Medical and Health Services Managers", description="Plan."),
+    ]
+
+
+def _alternate_titles():
+    return [
+        ("29-1141.00", "RN"),
+        ("15-1252.00", "Software Engineer"),
+        ("11-1021.00", "Operations Manager"),
+        ("11-1021.00", "Manager"),
+        ("11-9111.00", "Manager"),
+        ("11-9111.00", "Software Developer"),  # Conflicts with a primary title
+    ]
+
+
+class TestOnetTitleIndex:
+    """Tests for OnetTitleIndex."""
+
+    def test_normalized_occupation_title_matches(self):
+        """Case, punctuation and plurals are ignored."""
+        from app.services.onet_title_index import OnetTitleIndex
+
+        index = OnetTitleIndex(_occupations(), _alternate_titles())
+
+        match = index.match("registered  NURSE.")
+
+        assert match.occupation.code == "29-1141.00"
+        assert match.alternate is False
+
+    def test_alternate_title_matches(self):
+        """Alternate titles resolve to their occupation."""
+        from app.services.onet_title_index import OnetTitleIndex
+
+        index = OnetTitleIndex(_occupations(), _alternate_titles())
+
+        match = index.match("Software Engineer")
+
+        assert match.occupation.code == "15-1252.00"
+        assert match.matched_title == "Software Engineer"
+        assert match.alternate is True
+
+    def test_occupation_title_beats_alternate_title(self):
+        """Primary titles take precedence over another occupation's alternate title."""
+        from app.services.onet_title_index import OnetTitleIndex
+
+        index = OnetTitleIndex(_occupations(), _alternate_titles())
+
+        assert index.match("Software Developer").occupation.code == "15-1252.00"
+
+    def test_ambiguous_title_does_not_match(self):
+        """Titles shared by several occupations are left to the LLM."""
+        from app.services.onet_title_index import OnetTitleIndex
+
+        index = OnetTitleIndex(_occupations(), _alternate_titles())
+
+        assert index.match("Manager") is None
+        assert index.match("Senior Software Engineer") is None
+
+    def test_match_batch(self):
+        """Only matched titles are returned."""
+        from app.services.onet_title_index import OnetTitleIndex
+
+        index = OnetTitleIndex(_occupations(), _alternate_titles())
+
+        matches = index.match_batch(["RN", "Manager", "Operations Manager"])
+
+        assert set(matches) == {"RN", "Operations Manager"}
+
+
+class TestGetOnetTitleIndex:
+    """Tests for the process-wide index."""
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_only_when_version_changes(self, monkeypatch):
+        """Index is reused for the same O*NET version and rebuilt on change."""
+        from app.services import onet_title_index
+
+        monkeypatch.setattr(onet_title_index, "_index", None)
+
+        mock_repo = AsyncMock()
+        mock_repo.get_latest_sync.return_value = MagicMock(version="29.3")
+        mock_repo.get_all.return_value = _occupations()
+        mock_repo.get_all_alternate_titles.return_value = _alternate_titles()
+
+        first = await onet_title_index.get_onet_title_index(mock_repo)
+        second = await onet_title_index.get_onet_title_index(mock_repo)
+        assert first is second
+
+        mock_repo.get_latest_sync.return_value = MagicMock(version="30.1")
+        third = await onet_title_index.get_onet_title_index(mock_repo)
+        assert third is not first
+
+    @pytest.mark.asyncio
+    async def test_builds_in_worker_thread(self, monkeypatch):
+        """Index construction runs off the event loop."""
+        from app.services import onet_title_index
+
+        monkeypatch.setattr(onet_title_index, "_index", None)
+        to_thread = AsyncMock(return_value=MagicMock(version="29.3"))
+        monkeypatch.setattr(onet_title_index.asyncio, "to_thread", to_thread)
+
+        mock_repo = AsyncMock()
+        mock_repo.get_latest_sync.return_value = MagicMock(version="29.3")
+        mock_repo.get_all.return_value = _occupations()
+        mock_repo.get_all_alternate_titles.return_value = _alternate_titles()
+
+        await onet_title_index.get_onet_title_index(mock_repo)
+
+        to_thread.assert_awaited_once()
+        assert to_thread.await_args.args[0] is onet_title_index.OnetTitleIndex
+
+
+class TestRoleMappingAgentExactMatch:
+    """Tests for the agent's deterministic fast path."""
+
+    @pytest.mark.asyncio
+    async def test_exact_matches_skip_llm(self):
+        """Exact titles map HIGH without candidates or LLM calls."""
+        from app.agents.role_mapping_agent import (
+            DETERMINISTIC_REASONING_TAG,
+            ConfidenceTier,
+            RoleMappingAgent,
+        )
+        from app.services.onet_title_index import OnetTitleIndex
+
+        mock_llm = AsyncMock()
+        mock_repo = AsyncMock()
+        agent = RoleMappingAgent(
+            mock_llm, mock_repo, title_index=OnetTitleIndex(_occupations(), _alternate_titles()),
+        )
+
+        results = await agent.map_roles(["Registered Nurse", "RN"])
+
+        assert [r.onet_code for r in results] == ["29-1141.00", "29-1141.00"]
+        assert all(r.confidence == ConfidenceTier.HIGH for r in results)
+        assert results[1].reasoning.startswith(DETERMINISTIC_REASONING_TAG)
+        mock_llm.stream_response.assert_not_called()
+        mock_repo.search_with_full_text_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_only_unmatched_roles_go_to_llm(self):
+        """Roles without an exact match are sent to the LLM."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.services.onet_title_index import OnetTitleIndex
+
+        async def stream_response(system_prompt, user_message):
+            yield '[{"role": "Code Wrangler", "onet_code": "15-1252.00", '
+            yield '"onet_title": "Software Developers", "confidence": "MEDIUM", "reasoning": "Close"}]'
+
+        mock_llm = MagicMock()
+        mock_llm.stream_response = MagicMock(side_effect=stream_response)
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+        agent = RoleMappingAgent(
+            mock_llm, mock_repo, title_index=OnetTitleIndex(_occupations(), _alternate_titles()),
+        )
+
+        results = await agent.map_roles(["Software Engineer", "Code Wrangler"])
+
+        assert [r.source_role for r in results] == ["Software Engineer", "Code Wrangler"]
+        queried = mock_repo.search_with_full_text_batch.call_args.kwargs["queries"]
+        assert queried == ["Code Wrangler"]
+        assert "Software Engineer" not in mock_llm.stream_response.call_args.kwargs["user_message"]
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Exact and LLM results come back in the order the roles were given."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.services.onet_title_index import OnetTitleIndex
+
+        async def stream_response(system_prompt, user_message):
+            yield '[{"role": "Code Wrangler", "onet_code": "15-1252.00", '
+            yield '"onet_title": "Software Developers", "confidence": "MEDIUM", "reasoning": "Close"}]'
+
+        mock_llm = MagicMock()
+        mock_llm.stream_response = MagicMock(side_effect=stream_response)
+        mock_repo = AsyncMock()
+        mock_repo.search_with_full_text_batch.side_effect = lambda queries, limit: {
+            q: [] for q in queries
+        }
+        agent = RoleMappingAgent(
+            mock_llm, mock_repo, title_index=OnetTitleIndex(_occupations(), _alternate_titles()),
+        )
+
+        results = await agent.map_roles(["Code Wrangler", "RN", "Software Engineer"])
+
+        assert [r.source_role for r in results] == ["Code Wrangler", "RN", "Software Engineer"]
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_exact_matches_first(self):
+        """Streaming emits exact matches as the first batch."""
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.services.onet_title_index import OnetTitleIndex
+
+        agent = RoleMappingAgent(
+            AsyncMock(), AsyncMock(), title_index=OnetTitleIndex(_occupations(), _alternate_titles()),
+        )
+
+        batches = [batch async for batch in agent.map_roles_stream(["RN"])]
+
+        assert len(batches) == 1
+        assert batches[0][0].onet_code == "29-1141.00"
+
+    @pytest.mark.asyncio
+    async def test_index_resolved_only_when_mapping(self, monkeypatch):
+        """With use_title_index, the index is resolved on the first mapping, once."""
+        from app.agents import role_mapping_agent
+        from app.agents.role_mapping_agent import RoleMappingAgent
+        from app.services.onet_title_index import OnetTitleIndex
+
+        get_index = AsyncMock(return_value=OnetTitleIndex(_occupations(), _alternate_titles()))
+        monkeypatch.setattr(role_mapping_agent, "get_onet_title_index", get_index)
+
+        mock_repo = AsyncMock()
+        agent = RoleMappingAgent(AsyncMock(), mock_repo, use_title_index=True)
+        get_index.assert_not_awaited()
+
+        results = await agent.map_roles(["RN"])
+        batches = [batch async for batch in agent.map_roles_stream(["Registered Nurse"])]
+
+        assert results[0].onet_code == "29-1141.00"
+        assert batches[0][0].onet_code == "29-1141.00"
+        get_index.assert_awaited_once_with(mock_repo)
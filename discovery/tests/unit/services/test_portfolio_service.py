@@ -0,0 +1,105 @@
+"""Unit tests for the portfolio service."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+
+def _rollup_row(
+    dimension,
+    value,
+    tier,
+    role_count,
+    headcount,
+    exposure,
+    priority,
+    label=None,
+):
+    """Build an organization rollup row for roles sharing one score."""
+    row = MagicMock()
+    row.dimension = dimension
+    row.dimension_value = value
+    row.label = label
+    row.priority_tier = tier
+    row.role_count = role_count
+    row.headcount = headcount
+    row.exposure_weighted_sum = exposure * headcount
+    row.priority_weighted_sum = priority * headcount
+    row.exposure_sum = exposure * role_count
+    row.priority_sum = priority * role_count
+    return row
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_combines_tiers_per_occupation_and_lob():
+    """Test per-tier rows are combined into headcount-weighted summaries."""
+    from app.services.portfolio_service import PortfolioService
+
+    repo = AsyncMock()
+    repo.get_organization_rollup.return_value = [
+        _rollup_row("occupation", "15-1252.00", "now", 2, 30, 0.9, 0.8, "Software Developers"),
+        _rollup_row("occupation", "15-1252.00", "future", 1, 10, 0.5, 0.4, "Software Developers"),
+        _rollup_row("occupation", None, "future", 1, 60, 0.2, 0.3),
+        _rollup_row("lob", "Retail", "now", 2, 30, 0.9, 0.8),
+        _rollup_row("lob", "Retail", "future", 1, 10, 0.5, 0.4),
+    ]
+    repo.count_sessions.return_value = 3
+
+    organization_id = uuid4()
+    result = await PortfolioService(repo).get_portfolio(organization_id)
+
+    assert result["organization_id"] == organization_id
+    assert result["session_count"] == 3
+    assert result["totals"]["role_count"] == 4
+    assert result["totals"]["headcount"] == 100
+    assert result["totals"]["ai_exposure_score"] == round((0.9 * 30 + 0.5 * 10 + 0.2 * 60) / 100, 3)
+    assert result["tiers"] == {
+        "now": {"role_count": 2, "headcount": 30},
+        "next_quarter": {"role_count": 0, "headcount": 0},
+        "future": {"role_count": 2, "headcount": 70},
+    }
+
+    unmapped, developers = result["occupations"]
+    assert unmapped["value"] is None
+    assert developers["label"] == "Software Developers"
+    assert developers["role_count"] == 3
+    assert developers["headcount"] == 40
+    assert developers["priority_score"] == round((0.8 * 30 + 0.4 * 10) / 40, 3)
+    assert developers["tiers"] == {"now": 2, "next_quarter": 0, "future": 1}
+
+    (retail,) = result["lobs"]
+    assert retail["ai_exposure_score"] == developers["ai_exposure_score"]
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_without_headcount_uses_plain_mean():
+    """Test groups with no headcount average their roles unweighted."""
+    from app.services.portfolio_service import PortfolioService
+
+    repo = AsyncMock()
+    repo.get_organization_rollup.return_value = [
+        _rollup_row("lob", "Retail", "now", 1, 0, 0.9, 0.8),
+        _rollup_row("lob", "Retail", "future", 1, 0, 0.5, 0.4),
+    ]
+    repo.count_sessions.return_value = 1
+
+    result = await PortfolioService(repo).get_portfolio(uuid4())
+
+    assert result["lobs"][0]["ai_exposure_score"] == 0.7
+    assert result["occupations"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_empty_organization():
+    """Test an organization without analyzed sessions gets an empty portfolio."""
+    from app.services.portfolio_service import PortfolioService
+
+    repo = AsyncMock()
+    repo.get_organization_rollup.return_value = []
+
+    result = await PortfolioService(repo).get_portfolio(uuid4())
+
+    assert result["session_count"] == 0
+    assert result["totals"]["role_count"] == 0
+    assert result["totals"]["ai_exposure_score"] == 0.0
+    assert result["occupations"] == [] and result["lobs"] == []
+    repo.count_sessions.assert_not_called()
@@ -0,0 +1,214 @@
+"""Unit tests for the cross-session role mapping cache."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.agents.role_mapping_agent import ConfidenceTier, RoleMappingResult
+
+
+def _result(role, code="15-1252.00", confidence=ConfidenceTier.HIGH, fallback=False):
+    return RoleMappingResult(
+        source_role=role,
+        onet_code=code,
+        onet_title="Software Developers" if code else None,
+        confidence=confidence,
+        reasoning="Clear match",
+        fallback=fallback,
+    )
+
+
+def _make_cache(version="30.1", entries=None):
+    from app.services.role_mapping_cache import RoleMappingCache
+
+    repository = AsyncMock()
+    repository.get_entries.return_value = entries or {}
+    repository.upsert_entries.side_effect = lambda rows: len(rows)
+    repository.delete_stale.return_value = 0
+
+    onet_repository = AsyncMock()
+    onet_repository.get_latest_sync.return_value = (
+        MagicMock(version=version) if version else None
+    )
+
+    RoleMappingCache._evicted_versions.clear()
+    RoleMappingCache.hits = 0
+    RoleMappingCache.misses = 0
+    cache = RoleMappingCache(
+        repository=repository,
+        onet_repository=onet_repository,
+        model="test-model",
+    )
+    return cache, repository
+
+
+class TestNormalizeRoleTitle:
+    """Tests for normalize_role_title."""
+
+    def test_lowercases_and_strips_punctuation(self):
+        """Case, punctuation and whitespace differences share a key."""
+        from app.services.role_mapping_cache import normalize_role_title
+
+        assert normalize_role_title("Sr. Software Engineer") == "sr software engineer"
+        assert normalize_role_title("  sr software   ENGINEER ") == "sr software engineer"
+
+    def test_keeps_meaningful_symbols(self):
+        """Symbols that change meaning are preserved."""
+        from app.services.role_mapping_cache import normalize_role_title
+
+        assert normalize_role_title("C# Developer") == "c# developer"
+        assert normalize_role_title("Research & Development") == "research & development"
+
+
+class TestRoleMappingCache:
+    """Tests for RoleMappingCache."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_returns_hits_keyed_by_original_title(self):
+        """Cached entries are returned under the caller's role title."""
+        entry = MagicMock(
+            id=7,
+            onet_code="15-1252.00",
+            onet_title="Software Developers",
+            confidence="HIGH",
+            reasoning="Clear match",
+        )
+        cache, repository = _make_cache(entries={"software engineer": entry})
+
+        results = await cache.lookup(["Software Engineer", "Nurse"])
+
+        assert list(results) == ["Software Engineer"]
+        assert results["Software Engineer"].onet_code == "15-1252.00"
+        assert results["Software Engineer"].confidence == ConfidenceTier.HIGH
+        assert cache.hits == 1
+        assert cache.misses == 1
+        repository.record_hits.assert_awaited_once_with([7])
+        args = repository.get_entries.call_args.args
+        assert args[1:] == ("30.1", "test-model")
+
+    @pytest.mark.asyncio
+    async def test_lookup_evicts_stale_versions_once(self):
+        """Stale entries are evicted on the first lookup for a version."""
+        cache, repository = _make_cache()
+
+        await cache.lookup(["Nurse"])
+        await cache.lookup(["Nurse"])
+
+        repository.delete_stale.assert_awaited_once_with("30.1", "test-model")
+
+    @pytest.mark.asyncio
+    async def test_unknown_version_when_never_synced(self):
+        """Cache is scoped to 'unknown' when no O*NET sync exists."""
+        cache, _ = _make_cache(version=None)
+
+        assert await cache.get_onet_version() == "unknown"
+
+    @pytest.mark.asyncio
+    async def test_store_skips_low_confidence_and_fallbacks(self):
+        """Only confident LLM answers are written to the cache."""
+        cache, repository = _make_cache()
+
+        written = await cache.store([
+            _result("Software Engineer"),
+            _result("Analyst", confidence=ConfidenceTier.MEDIUM),
+            _result("Clerk", confidence=ConfidenceTier.LOW),
+            _result("Wizard", fallback=True),
+            _result("Unknown", code=None),
+        ])
+
+        assert written == 2
+        rows = repository.upsert_entries.call_args.args[0]
+        assert [r["normalized_title"] for r in rows] == ["software engineer", "analyst"]
+        assert rows[0]["onet_version"] == "30.1"
+        assert rows[0]["model"] == "test-model"
+        assert rows[1]["confidence"] == "MEDIUM"
+
+    @pytest.mark.asyncio
+    async def test_get_stats_includes_hit_rate(self):
+        """Stats combine persisted counts with process-wide counters."""
+        from app.services.role_mapping_cache import RoleMappingCache
+
+        cache, repository = _make_cache()
+        repository.get_stats.return_value = {
+            "total_entries": 5,
+            "current_entries": 4,
+            "total_hits": 10,
+        }
+        RoleMappingCache.hits = 3
+        RoleMappingCache.misses = 1
+
+        stats = await cache.get_stats()
+
+        assert stats["current_entries"] == 4
+        assert stats["hit_rate"] == 0.75
+        assert stats["onet_version"] == "30.1"
+
+
+class TestRoleMappingServiceCache:
+    """Tests for cache use in RoleMappingService."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_sent_to_agent(self):
+        """Cached roles skip the agent; fresh results are stored."""
+        from app.services.role_mapping_service import RoleMappingService
+
+        mock_agent = AsyncMock()
+        mock_agent.map_roles.return_value = [_result("Nurse", code="29-1141.00")]
+        mock_cache = AsyncMock()
+        mock_cache.lookup.return_value = {"Software Engineer": _result("Software Engineer")}
+
+        service = RoleMappingService(
+            repository=AsyncMock(),
+            role_mapping_agent=mock_agent,
+            mapping_cache=mock_cache,
+        )
+
+        results = await service._map_roles_cached(["Software Engineer", "Nurse"])
+
+        mock_agent.map_roles.assert_awaited_once_with(["Nurse"])
+        mock_cache.store.assert_awaited_once()
+        assert {r.source_role for r in results} == {"Software Engineer", "Nurse"}
+
+    @pytest.mark.asyncio
+    async def test_all_hits_skip_agent(self):
+        """No LLM call is made when every role is cached."""
+        from app.services.role_mapping_service import RoleMappingService
+
+        mock_agent = AsyncMock()
+        mock_cache = AsyncMock()
+        mock_cache.lookup.return_value = {"Software Engineer": _result("Software Engineer")}
+
+        service = RoleMappingService(
+            repository=AsyncMock(),
+            role_mapping_agent=mock_agent,
+            mapping_cache=mock_cache,
+        )
+
+        results = await service._map_roles_cached(["Software Engineer"])
+
+        mock_agent.map_roles.assert_not_called()
+        assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_failure_falls_back_to_agent(self):
+        """A failing cache never fails the mapping."""
+        from app.services.role_mapping_service import RoleMappingService
+
+        mock_agent = AsyncMock()
+        mock_agent.map_roles.return_value = [_result("Nurse")]
+        mock_cache = AsyncMock()
+        mock_cache.lookup.side_effect = RuntimeError("db down")
+        mock_cache.store.side_effect = RuntimeError("db down")
+        mock_repo = AsyncMock()
+
+        service = RoleMappingService(
+            repository=mock_repo,
+            role_mapping_agent=mock_agent,
+            mapping_cache=mock_cache,
+        )
+
+        results = await service._map_roles_cached(["Nurse"])
+
+        assert len(results) == 1
+        mock_agent.map_roles.assert_awaited_once_with(["Nurse"])
+        # Failures are rolled back on the cache's own session, not the request's
+        assert mock_cache.rollback.await_count == 2
+        mock_repo.session.rollback.assert_not_called()
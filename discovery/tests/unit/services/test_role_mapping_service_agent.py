@@ -132,28 +132,12 @@ class TestRoleMappingServiceWithAgent:
 
     @pytest.mark.asyncio
     async def test_bulk_confirm_uses_threshold(self):
-        """Service should bulk confirm mappings above threshold."""
+        """Service should bulk confirm mappings above threshold in the repository."""
         from app.services.role_mapping_service import RoleMappingService
 
         mock_repo = AsyncMock()
         mock_agent = MagicMock()
-
-        # Mock mappings - one above threshold, one below
-        mock_mappings = [
-            MagicMock(
-                id="1",
-                user_confirmed=False,
-                onet_code="15-1252.00",
-                confidence_score=0.95,
-            ),
-            MagicMock(
-                id="2",
-                user_confirmed=False,
-                onet_code="15-2051.00",
-                confidence_score=0.70,
-            ),
-        ]
-        mock_repo.get_for_session.return_value = mock_mappings
+        mock_repo.bulk_confirm.return_value = 1
 
         service = RoleMappingService(
             repository=mock_repo,
@@ -161,14 +145,57 @@ class TestRoleMappingServiceWithAgent:
         )
 
         import uuid
+        session_id = uuid.uuid4()
+        mapping_ids = [uuid.uuid4()]
         result = await service.bulk_confirm(
-            session_id=uuid.uuid4(),
+            session_id=session_id,
             threshold=0.85,
+            lob="Retail",
+            mapping_ids=mapping_ids,
         )
 
-        # Only one should be confirmed (above 0.85 threshold)
         assert result["confirmed_count"] == 1
-        mock_repo.confirm.assert_called_once()
+        mock_repo.bulk_confirm.assert_called_once_with(
+            session_id, threshold=0.85, lob_value="Retail", mapping_ids=mapping_ids,
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_remap_writes_results_in_one_batch(self):
+        """Re-mapped results are written with a single bulk_update, covering every LOB row."""
+        import uuid
+        from app.agents.role_mapping_agent import ConfidenceTier, RoleMappingResult
+        from app.services.role_mapping_service import RoleMappingService
+
+        retail = MagicMock(id=uuid.uuid4(), source_role="Analyst", user_confirmed=False, confidence_score=0.5)
+        wealth = MagicMock(id=uuid.uuid4(), source_role="Analyst", user_confirmed=False, confidence_score=0.4)
+        confident = MagicMock(id=uuid.uuid4(), source_role="Teller", user_confirmed=False, confidence_score=0.95)
+
+        mock_repo = AsyncMock()
+        mock_repo.get_for_session.return_value = [retail, wealth, confident]
+        mock_repo.bulk_update.return_value = 2
+        mock_agent = MagicMock()
+        mock_agent.map_roles = AsyncMock(return_value=[
+            RoleMappingResult(
+                source_role="Analyst",
+                onet_code="13-2051.00",
+                onet_title="Financial Analysts",
+                confidence=ConfidenceTier.MEDIUM,
+                reasoning="Closer match",
+            ),
+        ])
+
+        service = RoleMappingService(repository=mock_repo, role_mapping_agent=mock_agent)
+        session_id = uuid.uuid4()
+        result = await service.bulk_remap(session_id, threshold=0.6)
+
+        mock_agent.map_roles.assert_awaited_once_with(["Analyst"])
+        mock_repo.bulk_update.assert_awaited_once_with(session_id, [
+            {"id": retail.id, "onet_code": "13-2051.00", "confidence_score": 0.75},
+            {"id": wealth.id, "onet_code": "13-2051.00", "confidence_score": 0.75},
+        ])
+        mock_repo.update.assert_not_called()
+        assert result["remapped_count"] == 2
+        assert {m["id"] for m in result["mappings"]} == {str(retail.id), str(wealth.id)}
 
 
 class TestGetRoleMappingService:
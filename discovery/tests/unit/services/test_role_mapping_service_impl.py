@@ -137,18 +137,17 @@ async def test_bulk_confirm():
 
     mock_repo = AsyncMock()
     mock_agent = MagicMock()
-    mock_mapping = MagicMock()
-    mock_mapping.id = uuid4()
-    mock_mapping.onet_code = "15-1252.00"
-    mock_mapping.confidence_score = 0.90
-    mock_mapping.user_confirmed = False
-    mock_repo.get_for_session.return_value = [mock_mapping]
+    mock_repo.bulk_confirm.return_value = 1
 
     service = RoleMappingService(
         repository=mock_repo,
         role_mapping_agent=mock_agent,
     )
-    result = await service.bulk_confirm(uuid4(), threshold=0.85)
+    session_id = uuid4()
+    result = await service.bulk_confirm(session_id, threshold=0.85)
 
     assert result["confirmed_count"] == 1
-    mock_repo.confirm.assert_called_once()
+    mock_repo.bulk_confirm.assert_called_once_with(
+        session_id, threshold=0.85, lob_value=None, mapping_ids=None,
+    )
+    mock_repo.confirm.assert_not_called()
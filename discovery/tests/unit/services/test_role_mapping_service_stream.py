@@ -0,0 +1,124 @@
+"""Unit tests for streaming role mapping creation."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.agents.role_mapping_agent import ConfidenceTier, RoleMappingResult
+
+
+def _result(role, confidence=ConfidenceTier.HIGH):
+    return RoleMappingResult(
+        source_role=role,
+        onet_code="15-1252.00",
+        onet_title="Software Developers",
+        confidence=confidence,
+        reasoning="Match",
+    )
+
+
+def _make_service(batches, mapping_cache=None):
+    from app.services.role_mapping_service import RoleMappingService
+
+    mock_repo = AsyncMock()
+    mock_repo.delete_for_session.return_value = 0
+
+    def bulk_upsert(mapping_dicts, replace_counts=True):
+        return [
+            MagicMock(
+                id=uuid4(),
+                source_role=m["source_role"],
+                onet_code=m["onet_code"],
+                confidence_score=m["confidence_score"],
+                row_count=m["row_count"],
+                user_confirmed=False,
+                industry_match_score=None,
+                lob_value=m["lob_value"],
+                department_value=None,
+                geography_value=None,
+            )
+            for m in mapping_dicts
+        ]
+
+    mock_repo.bulk_upsert.side_effect = bulk_upsert
+
+    mock_upload_service = AsyncMock()
+    mock_upload_service.get_file_content.return_value = b"file content"
+    mock_upload_service.repository.get_by_id.return_value = MagicMock(file_name="roles.csv")
+
+    mock_agent = MagicMock()
+
+    async def map_roles_stream(roles):
+        mock_agent.streamed_roles = roles
+        for batch in batches:
+            yield batch
+
+    mock_agent.map_roles_stream = map_roles_stream
+
+    service = RoleMappingService(
+        repository=mock_repo,
+        role_mapping_agent=mock_agent,
+        upload_service=mock_upload_service,
+        mapping_cache=mapping_cache,
+    )
+    service._file_parser = MagicMock()
+    service._file_parser.extract_role_lob_values.return_value = [
+        {"role": "Software Engineer", "lob": "Retail", "count": 3},
+        {"role": "Nurse", "lob": "Health", "count": 5},
+        {"role": "Nurse", "lob": "Retail", "count": 1},
+    ]
+    return service, mock_repo, mock_agent
+
+
+class TestStreamMappingsFromUpload:
+    """Tests for RoleMappingService.stream_mappings_from_upload."""
+
+    @pytest.mark.asyncio
+    async def test_persists_and_emits_each_batch(self):
+        """Each agent batch is persisted before its event is yielded."""
+        service, mock_repo, _ = _make_service([
+            [_result("Nurse")],
+            [_result("Software Engineer", ConfidenceTier.LOW)],
+        ])
+
+        events = [
+            event async for event in service.stream_mappings_from_upload(
+                session_id=uuid4(),
+                upload_id=uuid4(),
+                role_column="role",
+                lob_column="lob",
+            )
+        ]
+
+        assert [e["type"] for e in events] == ["started", "batch", "batch", "done"]
+        assert events[0]["total_roles"] == 2
+        # Nurse appears under two LOBs, so its batch persists two mappings
+        assert {m["lob_value"] for m in events[1]["mappings"]} == {"Health", "Retail"}
+        assert events[2]["completed_roles"] == 2
+        assert mock_repo.bulk_upsert.await_count == 2
+        assert events[-1]["created_count"] == 3
+        assert events[-1]["high_confidence_count"] == 1
+        assert events[-1]["low_confidence_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_emitted_before_agent_batches(self):
+        """Cached roles form the first batch and skip the agent."""
+        mock_cache = AsyncMock()
+        mock_cache.lookup.return_value = {"Nurse": _result("Nurse")}
+        service, _, mock_agent = _make_service(
+            [[_result("Software Engineer")]],
+            mapping_cache=mock_cache,
+        )
+
+        events = [
+            event async for event in service.stream_mappings_from_upload(
+                session_id=uuid4(),
+                upload_id=uuid4(),
+                role_column="role",
+                lob_column="lob",
+            )
+        ]
+
+        batches = [e for e in events if e["type"] == "batch"]
+        assert {m["source_role"] for m in batches[0]["mappings"]} == {"Nurse"}
+        assert mock_agent.streamed_roles == ["Software Engineer"]
+        mock_cache.store.assert_awaited_once()
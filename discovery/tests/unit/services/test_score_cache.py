@@ -0,0 +1,75 @@
+"""Unit tests for the session score cache."""
+from uuid import uuid4
+
+import numpy as np
+
+
+def _arrays(version, source="tasks"):
+    from app.services.score_cache import SessionScoreArrays
+
+    return SessionScoreArrays(
+        version=version,
+        source=source,
+        role_mapping_ids=[uuid4()],
+        role_names=["Engineer"],
+        row_counts=np.array([10]),
+        exposure=np.array([0.5]),
+        groups={},
+    )
+
+
+def test_get_returns_entry_for_current_version():
+    """A lookup with the cached version hits."""
+    from app.services.score_cache import SessionScoreCache
+
+    cache = SessionScoreCache()
+    session_id = uuid4()
+    arrays = _arrays(2)
+    cache.put(session_id, arrays)
+
+    assert cache.get(session_id, "tasks", 2) is arrays
+    assert cache.get(session_id, "activities", 2) is None
+
+
+def test_other_version_drops_entry():
+    """A lookup with another version misses and drops the stale entry."""
+    from app.services.score_cache import SessionScoreCache
+
+    cache = SessionScoreCache()
+    session_id = uuid4()
+    cache.put(session_id, _arrays(2))
+
+    assert cache.get(session_id, "tasks", 3) is None
+    assert cache.get(session_id, "tasks", 2) is None
+
+
+def test_evicts_least_recently_used_session():
+    """The least recently used entry is evicted past max_sessions."""
+    from app.services.score_cache import SessionScoreCache
+
+    cache = SessionScoreCache(max_sessions=2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    cache.put(first, _arrays(1))
+    cache.put(second, _arrays(1))
+    cache.get(first, "tasks", 1)
+    cache.put(third, _arrays(1))
+
+    assert cache.get(first, "tasks", 1) is not None
+    assert cache.get(second, "tasks", 1) is None
+    assert cache.get(third, "tasks", 1) is not None
+
+
+def test_mapping_fingerprint_change_misses():
+    """A version differing only in its mapping fingerprint misses."""
+    from datetime import datetime, timezone
+
+    from app.services.score_cache import SessionScoreCache
+
+    cache = SessionScoreCache()
+    session_id = uuid4()
+    uploaded = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    cache.put(session_id, _arrays((2, 1, 5, uploaded)))
+
+    assert cache.get(session_id, "tasks", (2, 1, 5, uploaded)) is not None
+    reuploaded = datetime(2026, 10, 17, tzinfo=timezone.utc)
+    assert cache.get(session_id, "tasks", (2, 1, 5, reuploaded)) is None
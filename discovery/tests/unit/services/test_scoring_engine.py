@@ -102,3 +102,51 @@ def test_classify_priority_tier_future():
     engine = ScoringEngine()
     tier = engine.classify_priority_tier(priority=0.40, complexity=0.6)
     assert tier == "future"
+
+
+def test_score_exposure_matches_score_role():
+    """Test scoring a pre-aggregated exposure matches scoring the DWA list."""
+    from app.services.scoring_engine import ScoringEngine
+
+    engine = ScoringEngine()
+    dwa_scores = [0.8, 0.7, 0.9, 0.6]
+
+    assert engine.score_exposure(0.75, 40, 100) == engine.score_role(dwa_scores, 40, 100)
+
+
+def test_score_roles_matches_score_exposure():
+    """Test vectorized role scoring matches scalar scoring element-wise."""
+    import numpy as np
+
+    from app.services.scoring_engine import ScoringEngine
+
+    engine = ScoringEngine()
+    exposure = np.array([0.0, 0.25, 0.5, 0.8, 1.0])
+    row_counts = np.array([0, 10, 40, 25, 25])
+
+    scores = engine.score_roles(exposure, row_counts, total_rows=100)
+    tiers = engine.classify_priority_tiers(scores["priority"], scores["complexity"])
+
+    for i in range(len(exposure)):
+        expected = engine.score_exposure(exposure[i], int(row_counts[i]), 100)
+        assert {k: v[i] for k, v in scores.items()} == expected
+        assert tiers[i] == engine.classify_priority_tier(
+            expected["priority"], expected["complexity"]
+        )
+
+
+def test_engine_overrides_weights_and_thresholds():
+    """Test constructor overrides change priority and tiers; None keeps defaults."""
+    from app.services.scoring_engine import ScoringEngine
+
+    engine = ScoringEngine(
+        exposure_weight=1.0,
+        impact_weight=0.0,
+        ease_weight=0.0,
+        next_quarter_priority_threshold=0.5,
+    )
+
+    assert engine.calculate_priority(0.55, 0.9, 0.45) == 0.55
+    assert engine.classify_priority_tier(priority=0.55, complexity=0.45) == "next_quarter"
+    assert engine.NOW_PRIORITY_THRESHOLD == ScoringEngine.NOW_PRIORITY_THRESHOLD
+    assert ScoringEngine().classify_priority_tier(priority=0.55, complexity=0.45) == "future"
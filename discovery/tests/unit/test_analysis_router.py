@@ -24,6 +24,7 @@ def mock_analysis_service():
     service.trigger_analysis_from_tasks = AsyncMock()
     service.get_by_dimension = AsyncMock()
     service.get_all_dimensions = AsyncMock()
+    service.score_scenarios = AsyncMock()
     return service
 
 
@@ -66,7 +67,7 @@ class TestTriggerAnalysis:
         data = response.json()
         assert data["status"] == "processing"
         mock_analysis_service.trigger_analysis_from_tasks.assert_called_once_with(
-            session_id=session_id
+            session_id=session_id, incremental=False
         )
 
     def test_trigger_analysis_with_activities_source(self, client, mock_analysis_service):
@@ -78,7 +79,19 @@ class TestTriggerAnalysis:
 
         assert response.status_code == 202
         mock_analysis_service.trigger_analysis.assert_called_once_with(
-            session_id=session_id
+            session_id=session_id, incremental=False
+        )
+
+    def test_trigger_analysis_incremental(self, client, mock_analysis_service):
+        """Should pass incremental=true through to the service."""
+        session_id = uuid4()
+        mock_analysis_service.trigger_analysis_from_tasks.return_value = {"status": "processing"}
+
+        response = client.post(f"/discovery/sessions/{session_id}/analyze?incremental=true")
+
+        assert response.status_code == 202
+        mock_analysis_service.trigger_analysis_from_tasks.assert_called_once_with(
+            session_id=session_id, incremental=True
         )
 
     def test_trigger_analysis_session_not_found_returns_404(
@@ -100,6 +113,121 @@ class TestTriggerAnalysis:
         assert response.status_code == 422
 
 
+class TestScoreScenarios:
+    """Tests for POST /discovery/sessions/{session_id}/analysis/scenarios."""
+
+    def test_score_scenarios_returns_200(self, client, mock_analysis_service):
+        """Should pass scenarios through and convert tiers to schema values."""
+        from app.models.discovery_analysis import AnalysisDimension as DBDimension
+
+        session_id = uuid4()
+        role_id = uuid4()
+        mock_analysis_service.score_scenarios.return_value = [
+            {
+                "name": "impact-heavy",
+                "weights": {"exposure": 0.1, "impact": 0.8, "ease": 0.1},
+                "thresholds": {
+                    "now_priority": 0.75,
+                    "now_complexity": 0.3,
+                    "next_quarter_priority": 0.6,
+                },
+                "tier_counts": {"next_quarter": 1},
+                "roles": [
+                    {
+                        "role_mapping_id": role_id,
+                        "name": "Engineer",
+                        "ai_exposure_score": 0.9,
+                        "impact_score": 0.7,
+                        "complexity_score": 0.1,
+                        "priority_score": 0.74,
+                        "priority_tier": "next_quarter",
+                        "row_count": 30,
+                    }
+                ],
+                "dimensions": {
+                    DBDimension.LOB: [
+                        {
+                            "name": "Retail",
+                            "ai_exposure_score": 0.9,
+                            "impact_score": 0.7,
+                            "complexity_score": 0.1,
+                            "priority_score": 0.74,
+                            "priority_tier": "next_quarter",
+                            "row_count": 30,
+                            "role_count": 1,
+                        }
+                    ],
+                },
+            }
+        ]
+
+        response = client.post(
+            f"/discovery/sessions/{session_id}/analysis/scenarios",
+            json={
+                "scenarios": [
+                    {
+                        "name": "impact-heavy",
+                        "exposure_weight": 0.1,
+                        "impact_weight": 0.8,
+                        "ease_weight": 0.1,
+                    }
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == "tasks"
+        (scenario,) = data["scenarios"]
+        assert scenario["tier_counts"] == {"HIGH": 0, "MEDIUM": 1, "LOW": 0}
+        assert scenario["roles"][0]["id"] == str(role_id)
+        assert scenario["roles"][0]["priority_tier"] == "MEDIUM"
+        assert scenario["dimensions"]["lob"][0]["name"] == "Retail"
+        mock_analysis_service.score_scenarios.assert_called_once_with(
+            session_id=session_id,
+            scenarios=[
+                {
+                    "name": "impact-heavy",
+                    "exposure_weight": 0.1,
+                    "impact_weight": 0.8,
+                    "ease_weight": 0.1,
+                }
+            ],
+            source="tasks",
+        )
+
+    def test_score_scenarios_session_not_found_returns_404(
+        self, client, mock_analysis_service
+    ):
+        """Should return 404 if session not found."""
+        mock_analysis_service.score_scenarios.return_value = None
+
+        response = client.post(
+            f"/discovery/sessions/{uuid4()}/analysis/scenarios",
+            json={"scenarios": [{"name": "baseline"}]},
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"scenarios": []},
+            {"scenarios": [{"name": "bad", "now_priority_threshold": 1.5}]},
+            {"scenarios": [{"name": "bad", "impact_weight": -0.1}]},
+            {"source": "other", "scenarios": [{"name": "baseline"}]},
+        ],
+    )
+    def test_score_scenarios_validates_request(self, client, mock_analysis_service, body):
+        """Should reject empty scenario lists, out-of-range values and unknown sources."""
+        response = client.post(
+            f"/discovery/sessions/{uuid4()}/analysis/scenarios", json=body
+        )
+
+        assert response.status_code == 422
+        mock_analysis_service.score_scenarios.assert_not_called()
+
+
 class TestGetAnalysisByDimension:
     """Tests for GET /discovery/sessions/{session_id}/analysis/{dimension}."""
 